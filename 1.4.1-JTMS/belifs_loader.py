@@ -6,11 +6,13 @@ def load_beliefs(filename, jtms):
     with open(f"Beliefs/{filename}", 'r') as f:
         data = json.load(f)
 
-    for b in data["beliefs"]:
-        jtms.add_justification(b["in"], b["out"], b["conclusion"])
-    
-    for init in data.get("initial", []):
-        jtms.add_belief(init)
-        jtms.beliefs[init].valid = True
+    # A single propagation pass once the whole file is loaded
+    with jtms.batch():
+        for b in data["beliefs"]:
+            jtms.add_justification(b["in"], b["out"], b["conclusion"])
 
-    return jtms
\ No newline at end of file
+        for init in data.get("initial", []):
+            jtms.add_belief(init)
+            jtms.set_belief_validity(init, True)
+
+    return jtms
@@ -1,5 +1,8 @@
+from contextlib import contextmanager
+
 from pyvis.network import Network
-import networkx as nx
+
+from jtms_incremental import BELIEF_GRAPH, SCCIndex, relabel
 
 class Belief:
     def __init__(self, name):
@@ -33,24 +36,21 @@ class Belief:
         self.valid = value
         self.propagate()
 
-    def compute_truth_statement(self):
-        if self.non_monotonic:
-            self.valid = None
-            return
-
-        self.valid = None
+    def evaluate(self):
         for justification in self.justifications:
             if all([belief.valid for belief in justification.in_list]) \
                 and not any([belief.valid for belief in justification.out_list]):
-                self.valid = True
-                break
+                return True
+        return None
 
+    def compute_truth_statement(self):
+        self.valid = None if self.non_monotonic else self.evaluate()
         self.propagate()
             
         
     def propagate(self):
-        for justification in self.implications:
-            justification.conclusion.compute_truth_statement()
+        # Worklist relabeling of the downstream beliefs, each visited once
+        relabel([justification.conclusion for justification in self.implications], pinned=[self])
 
 
 
@@ -64,6 +64,44 @@ class JTMS:
     def __init__(self, strict=False):
         self.beliefs = {}
         self.strict = strict
+        self._graph = BELIEF_GRAPH
+        self._scc = SCCIndex(self._graph)
+        self._batch_depth = 0
+        self._pending = set()
+        self._pinned = set()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group mutations into one transaction: loop detection and truth
+        propagation are deferred until the outermost block exits, then done
+        in a single pass. Beliefs set explicitly inside the block keep the
+        value they were given.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._commit_batch()
+
+    def _commit_batch(self):
+        pinned = {b for b in self._pinned if self._is_live(b)}
+        starts = {b for b in self._pending if self._is_live(b)}
+        for belief in pinned:
+            starts |= self._graph.successors(belief)
+        self._pending, self._pinned = set(), set()
+
+        self._scc.rebuild(self._nodes())
+        starts |= {b for b in self._scc.drain_flipped() if self._is_live(b)}
+        relabel(starts, pinned=pinned, graph=self._graph)
+
+    def _is_live(self, belief):
+        return self.beliefs.get(belief.name) is belief
+
+    def _nodes(self):
+        return self.beliefs.values()
 
     def add_belief(self, name):
         if name not in self.beliefs:
@@ -72,16 +110,30 @@ class JTMS:
     def remove_belief(self, belief_name):
         if belief_name not in self.beliefs:
             raise KeyError(f"Unknown belief: {belief_name}")
-        
-        for justification in self.beliefs[belief_name].implications:
-            self.beliefs[repr(justification.conclusion)].remove_justification(justification)
+
+        belief = self.beliefs[belief_name]
+        impacted = []
+        for justification in dict.fromkeys(belief.implications):
+            self._detach_justification(justification)
+            impacted.append(justification.conclusion)
+        for justification in list(belief.justifications):
+            self._detach_justification(justification)
 
         self.beliefs.pop(belief_name)
+        if self._batch_depth:
+            self._pending.update(impacted)
+            return
+        self._scc.remove_belief(belief)
+        relabel([b for b in impacted if b is not belief] + list(self._scc.drain_flipped()))
         
     
     def set_belief_validity(self, belief_name, validity):
         if belief_name not in self.beliefs:
             raise KeyError(f"Unknown belief: {belief_name}")
+        if self._batch_depth:
+            self.beliefs[belief_name].valid = validity
+            self._pinned.add(self.beliefs[belief_name])
+            return
         self.beliefs[belief_name].set_truth_value(validity)
 
     def add_justification(self, in_list, out_list, conclusion_name):
@@ -93,26 +145,40 @@ class JTMS:
                     self.add_belief(b)
 
         justification = Justification([self.beliefs[in_item] for in_item in in_list], [self.beliefs[out_item] for out_item in out_list], self.beliefs[conclusion_name])
-        self.beliefs[conclusion_name].add_justification(justification)
-        for in_belief in justification.in_list:
-            self.beliefs[in_belief.name].add_implication(justification)
-        for out_belief in justification.out_list:
-            self.beliefs[out_belief.name].add_implication(justification)
+        justification.conclusion.justifications.append(justification)
+        for statement in justification.in_list + justification.out_list:
+            statement.add_implication(justification)
+            if not self._batch_depth:
+                self._scc.add_edge(statement, justification.conclusion)
 
-        self.update_non_monotonic_befielfs()
+        self._relabel_after_change(justification.conclusion)
+        return justification
+
+    def remove_justification(self, justification):
+        if justification not in justification.conclusion.justifications:
+            raise KeyError(f"Unknown justification for belief: {justification.conclusion.name}")
+        self._detach_justification(justification)
+        self._relabel_after_change(justification.conclusion)
+
+    def _relabel_after_change(self, conclusion):
+        if self._batch_depth:
+            self._pending.add(conclusion)
+        else:
+            relabel([conclusion, *self._scc.drain_flipped()])
+
+    def _detach_justification(self, justification):
+        justification.conclusion.justifications.remove(justification)
+        for statement in justification.in_list + justification.out_list:
+            if justification in statement.implications:
+                statement.remove_implication(justification)
+            if not self._batch_depth:
+                self._scc.remove_edge(statement, justification.conclusion)
 
     def update_non_monotonic_befielfs(self):
-        vertices = []
-        for belief in self.beliefs.values():
-            for justification in belief.justifications:
-                for statement in justification.in_list + justification.out_list:
-                    vertices.append((statement.name, belief.name))
-        graph = nx.DiGraph(vertices)
-        CFCs = nx.strongly_connected_components(graph)
-        for CFC in CFCs:
-            if len(CFC) != 1:
-                for belief in CFC:
-                    self.beliefs[belief].non_monotonic = True
+        # The SCC index is maintained incrementally; this resynchronises it
+        # from scratch for callers that mutated beliefs directly.
+        self._scc.rebuild(self._nodes())
+        relabel(self._scc.drain_flipped(), graph=self._graph)
 
     def show(self):
         for b in self.beliefs.values():
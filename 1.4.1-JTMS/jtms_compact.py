@@ -0,0 +1,444 @@
+"""
+Array-backed storage for the JTMS.
+
+``CompactJTMS`` exposes the same public API as ``JTMS`` but keeps no Python
+object per belief or per justification. Beliefs and justifications are
+integer ids into flat ``array``/``bytearray`` columns:
+
+* the premises of every justification are stored CSR-style in one flat slot
+  array (``start``/``split``/``end`` offsets, IN premises before OUT ones);
+* the justifications of a belief and the slots where a belief is used as a
+  premise (its implications) are chained through ``next``/``prev`` columns,
+  so insertion and removal are O(1) instead of ``list.index``.
+
+``jtms.beliefs`` is a read-only mapping returning lightweight ``__slots__``
+views, which is all that the services and agents rely on.
+"""
+
+from array import array
+from collections.abc import Mapping
+
+from jtms import JTMS
+from jtms_incremental import SCCIndex, relabel
+
+_NIL = -1
+_UNKNOWN, _VALID, _INVALID = 0, 1, 2
+_DECODE = (None, True, False)
+
+
+def _encode(value):
+    if value is None:
+        return _UNKNOWN
+    return _VALID if value else _INVALID
+
+
+class CompactBeliefStore:
+    """Columns holding the belief graph; also the graph adapter of the incremental engine."""
+
+    def __init__(self):
+        # Beliefs
+        self.ids = {}
+        self.names = []
+        self.free_ids = []
+        self.valid = bytearray()
+        self.looped = bytearray()
+        self.just_head = array('i')
+        self.just_count = array('i')
+        self.impl_head = array('i')
+        self.impl_count = array('i')
+        # Justifications
+        self.j_conclusion = array('i')
+        self.j_start = array('i')
+        self.j_split = array('i')
+        self.j_end = array('i')
+        self.j_next = array('i')
+        self.j_prev = array('i')
+        self.j_alive = bytearray()
+        # Premise slots (CSR payload of the justifications)
+        self.slot_belief = array('i')
+        self.slot_just = array('i')
+        self.slot_next = array('i')
+        self.slot_prev = array('i')
+        self.dead_slots = 0
+
+    # --- beliefs -------------------------------------------------------------
+
+    def new_belief(self, name):
+        if self.free_ids:
+            belief = self.free_ids.pop()
+            self.names[belief] = name
+            self.valid[belief] = _UNKNOWN
+            self.looped[belief] = 0
+            self.just_head[belief] = self.impl_head[belief] = _NIL
+            self.just_count[belief] = self.impl_count[belief] = 0
+        else:
+            belief = len(self.names)
+            self.names.append(name)
+            self.valid.append(_UNKNOWN)
+            self.looped.append(0)
+            self.just_head.append(_NIL)
+            self.just_count.append(0)
+            self.impl_head.append(_NIL)
+            self.impl_count.append(0)
+        self.ids[name] = belief
+        return belief
+
+    def free_belief(self, belief):
+        del self.ids[self.names[belief]]
+        self.names[belief] = None
+        self.free_ids.append(belief)
+
+    def justifications_of(self, belief):
+        justification = self.just_head[belief]
+        while justification != _NIL:
+            yield justification
+            justification = self.j_next[justification]
+
+    def implication_slots(self, belief):
+        slot = self.impl_head[belief]
+        while slot != _NIL:
+            yield slot
+            slot = self.slot_next[slot]
+
+    # --- justifications ------------------------------------------------------
+
+    def new_justification(self, in_ids, out_ids, conclusion):
+        # Justification ids are never reused, so stale views cannot alias a new one
+        start = len(self.slot_belief)
+        justification = len(self.j_conclusion)
+        self.j_conclusion.append(conclusion)
+        self.j_start.append(start)
+        self.j_split.append(start + len(in_ids))
+        self.j_end.append(start + len(in_ids) + len(out_ids))
+        self.j_next.append(_NIL)
+        self.j_prev.append(_NIL)
+        self.j_alive.append(1)
+
+        # Chain it in front of the conclusion's justifications
+        head = self.just_head[conclusion]
+        self.j_prev[justification] = _NIL
+        self.j_next[justification] = head
+        if head != _NIL:
+            self.j_prev[head] = justification
+        self.just_head[conclusion] = justification
+        self.just_count[conclusion] += 1
+
+        for premise in list(in_ids) + list(out_ids):
+            slot = len(self.slot_belief)
+            self.slot_belief.append(premise)
+            self.slot_just.append(justification)
+            head = self.impl_head[premise]
+            self.slot_prev.append(_NIL)
+            self.slot_next.append(head)
+            if head != _NIL:
+                self.slot_prev[head] = slot
+            self.impl_head[premise] = slot
+            self.impl_count[premise] += 1
+        return justification
+
+    def remove_justification(self, justification):
+        conclusion = self.j_conclusion[justification]
+        prev, following = self.j_prev[justification], self.j_next[justification]
+        if prev != _NIL:
+            self.j_next[prev] = following
+        else:
+            self.just_head[conclusion] = following
+        if following != _NIL:
+            self.j_prev[following] = prev
+        self.just_count[conclusion] -= 1
+
+        for slot in range(self.j_start[justification], self.j_end[justification]):
+            premise = self.slot_belief[slot]
+            prev, following = self.slot_prev[slot], self.slot_next[slot]
+            if prev != _NIL:
+                self.slot_next[prev] = following
+            else:
+                self.impl_head[premise] = following
+            if following != _NIL:
+                self.slot_prev[following] = prev
+            self.impl_count[premise] -= 1
+
+        self.dead_slots += self.j_end[justification] - self.j_start[justification]
+        self.j_alive[justification] = 0
+        if self.dead_slots * 2 > len(self.slot_belief):
+            self.compact_slots()
+
+    def premises(self, justification):
+        return self.slot_belief[self.j_start[justification]:self.j_end[justification]]
+
+    def compact_slots(self):
+        """Repack the slot columns once half of them belong to removed justifications."""
+        slot_belief, slot_just = array('i'), array('i')
+        for justification in range(len(self.j_conclusion)):
+            if not self.j_alive[justification]:
+                continue
+            start, split, end = self.j_start[justification], self.j_split[justification], self.j_end[justification]
+            new_start = len(slot_belief)
+            slot_belief.extend(self.slot_belief[start:end])
+            slot_just.extend([justification] * (end - start))
+            self.j_start[justification] = new_start
+            self.j_split[justification] = new_start + split - start
+            self.j_end[justification] = new_start + end - start
+
+        self.slot_belief, self.slot_just = slot_belief, slot_just
+        self.slot_next = array('i', [_NIL]) * len(slot_belief)
+        self.slot_prev = array('i', [_NIL]) * len(slot_belief)
+        for belief in range(len(self.names)):
+            self.impl_head[belief] = _NIL
+        for slot in range(len(slot_belief) - 1, -1, -1):
+            premise = slot_belief[slot]
+            head = self.impl_head[premise]
+            self.slot_next[slot] = head
+            if head != _NIL:
+                self.slot_prev[head] = slot
+            self.impl_head[premise] = slot
+        self.dead_slots = 0
+
+    # --- graph adapter for jtms_incremental ---------------------------------
+
+    def successors(self, belief):
+        return {self.j_conclusion[self.slot_just[slot]] for slot in self.implication_slots(belief)}
+
+    def predecessors(self, belief):
+        found = set()
+        for justification in self.justifications_of(belief):
+            found.update(self.premises(justification))
+        return found
+
+    def is_non_monotonic(self, belief):
+        return bool(self.looped[belief])
+
+    def set_non_monotonic(self, belief, flag):
+        self.looped[belief] = 1 if flag else 0
+
+    def value(self, belief):
+        return _DECODE[self.valid[belief]]
+
+    def set_value(self, belief, value):
+        self.valid[belief] = _encode(value)
+
+    def evaluate(self, belief):
+        valid, slot_belief = self.valid, self.slot_belief
+        for justification in self.justifications_of(belief):
+            split = self.j_split[justification]
+            if all(valid[slot_belief[slot]] == _VALID for slot in range(self.j_start[justification], split)) \
+                and not any(valid[slot_belief[slot]] == _VALID for slot in range(split, self.j_end[justification])):
+                return True
+        return None
+
+
+class BeliefRecord:
+    """View on one belief of a ``CompactJTMS``, mirroring ``Belief``."""
+
+    __slots__ = ('_jtms', '_id')
+
+    def __init__(self, jtms, belief_id):
+        self._jtms = jtms
+        self._id = belief_id
+
+    def __eq__(self, other):
+        return isinstance(other, BeliefRecord) and other._jtms is self._jtms and other._id == self._id
+
+    def __hash__(self):
+        return hash((id(self._jtms), self._id))
+
+    def __str__(self):
+        return f"{self.name} -> {'UNKNOWN' if self.valid == None else 'VALID' if self.valid else 'INVALID'}"
+
+    def __repr__(self):
+        return f"{self.name}"
+
+    @property
+    def name(self):
+        return self._jtms._store.names[self._id]
+
+    @property
+    def valid(self):
+        return self._jtms._store.value(self._id)
+
+    @valid.setter
+    def valid(self, value):
+        self._jtms._store.set_value(self._id, value)
+
+    @property
+    def non_monotonic(self):
+        return self._jtms._store.is_non_monotonic(self._id)
+
+    @property
+    def justifications(self):
+        store = self._jtms._store
+        return [JustificationRecord(self._jtms, j) for j in store.justifications_of(self._id)]
+
+    @property
+    def implications(self):
+        store = self._jtms._store
+        return [JustificationRecord(self._jtms, store.slot_just[s]) for s in store.implication_slots(self._id)]
+
+    def evaluate(self):
+        return self._jtms._store.evaluate(self._id)
+
+    def set_truth_value(self, value):
+        self.valid = value
+        self.propagate()
+
+    def compute_truth_statement(self):
+        store = self._jtms._store
+        store.set_value(self._id, None if store.is_non_monotonic(self._id) else store.evaluate(self._id))
+        self.propagate()
+
+    def propagate(self):
+        store = self._jtms._store
+        relabel(store.successors(self._id), pinned=[self._id], graph=store)
+
+
+class JustificationRecord:
+    """View on one justification of a ``CompactJTMS``, mirroring ``Justification``."""
+
+    __slots__ = ('_jtms', '_id')
+
+    def __init__(self, jtms, justification_id):
+        self._jtms = jtms
+        self._id = justification_id
+
+    def __eq__(self, other):
+        return isinstance(other, JustificationRecord) and other._jtms is self._jtms and other._id == self._id
+
+    def __hash__(self):
+        return hash((id(self._jtms), self._id))
+
+    @property
+    def in_list(self):
+        store = self._jtms._store
+        return [BeliefRecord(self._jtms, b) for b in store.slot_belief[store.j_start[self._id]:store.j_split[self._id]]]
+
+    @property
+    def out_list(self):
+        store = self._jtms._store
+        return [BeliefRecord(self._jtms, b) for b in store.slot_belief[store.j_split[self._id]:store.j_end[self._id]]]
+
+    @property
+    def conclusion(self):
+        return BeliefRecord(self._jtms, self._jtms._store.j_conclusion[self._id])
+
+
+class BeliefTable(Mapping):
+    """Read-only ``name -> BeliefRecord`` mapping standing in for ``JTMS.beliefs``."""
+
+    __slots__ = ('_jtms',)
+
+    def __init__(self, jtms):
+        self._jtms = jtms
+
+    def __getitem__(self, name):
+        return BeliefRecord(self._jtms, self._jtms._store.ids[name])
+
+    def __contains__(self, name):
+        return name in self._jtms._store.ids
+
+    def __iter__(self):
+        return iter(self._jtms._store.ids)
+
+    def __len__(self):
+        return len(self._jtms._store.ids)
+
+
+class CompactJTMS(JTMS):
+    """
+    Drop-in replacement for ``JTMS`` backed by ``CompactBeliefStore``.
+
+    Same methods and same semantics, including ``batch()``; only the memory
+    layout differs.
+    """
+
+    def __init__(self, strict=False):
+        super().__init__(strict)
+        self._store = CompactBeliefStore()
+        self._graph = self._store
+        self._scc = SCCIndex(self._store)
+        self.beliefs = BeliefTable(self)
+
+    def _belief_id(self, name):
+        if name not in self._store.ids:
+            raise KeyError(f"Unknown belief: {name}")
+        return self._store.ids[name]
+
+    def _is_live(self, belief):
+        return self._store.names[belief] is not None
+
+    def _nodes(self):
+        return self._store.ids.values()
+
+    def add_belief(self, name):
+        if name not in self._store.ids:
+            self._store.new_belief(name)
+
+    def remove_belief(self, belief_name):
+        store = self._store
+        belief = self._belief_id(belief_name)
+
+        impacted = set()
+        for justification in {store.slot_just[s] for s in store.implication_slots(belief)}:
+            impacted.add(store.j_conclusion[justification])
+            self._detach(justification)
+        for justification in list(store.justifications_of(belief)):
+            self._detach(justification)
+        impacted.discard(belief)
+
+        self._pinned.discard(belief)
+        self._pending.discard(belief)
+        if self._batch_depth:
+            store.free_belief(belief)
+            self._pending.update(impacted)
+            return
+        self._scc.remove_belief(belief)
+        store.free_belief(belief)
+        relabel(impacted | self._scc.drain_flipped(), graph=store)
+
+    def set_belief_validity(self, belief_name, validity):
+        belief = self._belief_id(belief_name)
+        self._store.set_value(belief, validity)
+        if self._batch_depth:
+            self._pinned.add(belief)
+            return
+        relabel(self._store.successors(belief), pinned=[belief], graph=self._store)
+
+    def add_justification(self, in_list, out_list, conclusion_name):
+        for b in in_list + out_list + [conclusion_name]:
+            if b not in self._store.ids:
+                if self.strict:
+                    raise KeyError(f"Unknown belief: {b}")
+                else:
+                    self.add_belief(b)
+
+        ids = self._store.ids
+        conclusion = ids[conclusion_name]
+        justification = self._store.new_justification(
+            [ids[name] for name in in_list], [ids[name] for name in out_list], conclusion
+        )
+        if self._batch_depth:
+            self._pending.add(conclusion)
+        else:
+            for premise in self._store.premises(justification):
+                self._scc.add_edge(premise, conclusion)
+            relabel([conclusion, *self._scc.drain_flipped()], graph=self._store)
+        return JustificationRecord(self, justification)
+
+    def remove_justification(self, justification):
+        store = self._store
+        if justification._jtms is not self or not store.j_alive[justification._id]:
+            raise KeyError(f"Unknown justification for belief: {justification.conclusion.name}")
+        conclusion = store.j_conclusion[justification._id]
+        self._detach(justification._id)
+        if self._batch_depth:
+            self._pending.add(conclusion)
+        else:
+            relabel([conclusion, *self._scc.drain_flipped()], graph=store)
+
+    def _detach(self, justification):
+        store = self._store
+        conclusion = store.j_conclusion[justification]
+        premises = set(store.premises(justification))
+        store.remove_justification(justification)
+        if not self._batch_depth:
+            for premise in premises:
+                self._scc.remove_edge(premise, conclusion)
@@ -0,0 +1,264 @@
+"""
+Incremental machinery for the JTMS: strongly connected components kept up to
+date as justifications come and go, and a worklist relabeling pass that only
+touches beliefs downstream of a change.
+
+Everything here is iterative so that long justification chains cannot hit the
+interpreter recursion limit. The algorithms only see beliefs through a graph
+adapter, so they work both on ``Belief`` objects and on the integer ids of the
+array-backed store in ``jtms_compact``.
+"""
+
+
+def successors(belief):
+    """Beliefs whose justifications mention ``belief`` (IN or OUT)."""
+    return {justification.conclusion for justification in belief.implications}
+
+
+def predecessors(belief):
+    """Beliefs mentioned (IN or OUT) by the justifications of ``belief``."""
+    return {
+        statement
+        for justification in belief.justifications
+        for statement in justification.in_list + justification.out_list
+    }
+
+
+class BeliefGraph:
+    """Graph adapter over ``Belief`` objects."""
+
+    successors = staticmethod(successors)
+    predecessors = staticmethod(predecessors)
+
+    @staticmethod
+    def is_non_monotonic(belief):
+        return belief.non_monotonic
+
+    @staticmethod
+    def set_non_monotonic(belief, flag):
+        belief.non_monotonic = flag
+
+    @staticmethod
+    def value(belief):
+        return belief.valid
+
+    @staticmethod
+    def set_value(belief, value):
+        belief.valid = value
+
+    @staticmethod
+    def evaluate(belief):
+        return belief.evaluate()
+
+
+BELIEF_GRAPH = BeliefGraph()
+
+
+def strongly_connected_components(nodes, successors_of):
+    """
+    Iterative Tarjan restricted to ``nodes``.
+
+    Components are returned in reverse topological order: a component is
+    always listed before every component that can reach it.
+    """
+    nodes = nodes if isinstance(nodes, (set, frozenset, dict)) else set(nodes)
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors_of(root)))]
+
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in nodes:
+                    continue
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors_of(child))))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+class SCCIndex:
+    """
+    Strongly connected components of the belief dependency graph, maintained
+    under edge insertion and deletion.
+
+    An edge ``premise -> conclusion`` exists for every belief appearing in the
+    IN or OUT list of one of the conclusion's justifications. Beliefs sharing
+    a component with at least one other belief are flagged ``non_monotonic``.
+    Adding an edge only explores what is reachable from its head; removing one
+    only re-splits the component that contained it. Beliefs whose flag flipped
+    are collected until :meth:`drain_flipped` so that they can be relabeled.
+
+    Only non-trivial components are stored; any belief absent from the index
+    is its own singleton component.
+    """
+
+    def __init__(self, graph=BELIEF_GRAPH):
+        self.graph = graph
+        self._component = {}
+        self._members = {}
+        self._next_id = 0
+        self._flipped = set()
+
+    def components(self):
+        return list(self._members.values())
+
+    def remove_belief(self, belief):
+        self._flipped.discard(belief)
+        component_id = self._component.pop(belief, None)
+        if component_id is None:
+            return
+        members = self._members.pop(component_id)
+        members.discard(belief)
+        self.graph.set_non_monotonic(belief, False)
+        self._split(members)
+
+    def add_edge(self, premise, conclusion):
+        if premise == conclusion:
+            return
+        component_id = self._component.get(premise)
+        if component_id is not None and component_id == self._component.get(conclusion):
+            return
+
+        # A new cycle exists iff the conclusion already reaches the premise.
+        successors_of = self.graph.successors
+        reachable = {conclusion}
+        frontier = [conclusion]
+        while frontier:
+            for child in successors_of(frontier.pop()):
+                if child not in reachable:
+                    reachable.add(child)
+                    frontier.append(child)
+        if premise not in reachable:
+            return
+
+        # Merge every belief lying on a path conclusion -> ... -> premise.
+        predecessors_of = self.graph.predecessors
+        on_cycle = {premise}
+        frontier = [premise]
+        while frontier:
+            for parent in predecessors_of(frontier.pop()):
+                if parent in reachable and parent not in on_cycle:
+                    on_cycle.add(parent)
+                    frontier.append(parent)
+
+        merged = set()
+        for belief in on_cycle:
+            component_id = self._component.get(belief)
+            if component_id is None:
+                merged.add(belief)
+            elif component_id in self._members:
+                merged |= self._members.pop(component_id)
+        self._register(merged)
+
+    def remove_edge(self, premise, conclusion):
+        if premise == conclusion:
+            return
+        component_id = self._component.get(premise)
+        if component_id is None or component_id != self._component.get(conclusion):
+            return
+        self._split(self._members.pop(component_id))
+
+    def drain_flipped(self):
+        flipped, self._flipped = self._flipped, set()
+        return flipped
+
+    def rebuild(self, beliefs):
+        previous = set(self._component)
+        self._component.clear()
+        self._members.clear()
+        for component in strongly_connected_components(set(beliefs), self.graph.successors):
+            self._register(component)
+        for belief in previous - set(self._component):
+            self._set_flag(belief, False)
+
+    def _split(self, members):
+        for component in strongly_connected_components(members, self.graph.successors):
+            self._register(component)
+
+    def _register(self, members):
+        if len(members) < 2:
+            for belief in members:
+                self._component.pop(belief, None)
+                self._set_flag(belief, False)
+            return
+        component_id = self._next_id
+        self._next_id += 1
+        self._members[component_id] = set(members)
+        for belief in members:
+            self._component[belief] = component_id
+            self._set_flag(belief, True)
+
+    def _set_flag(self, belief, flag):
+        if self.graph.is_non_monotonic(belief) != flag:
+            self.graph.set_non_monotonic(belief, flag)
+            self._flipped.add(belief)
+
+
+def relabel(beliefs, pinned=(), graph=BELIEF_GRAPH):
+    """
+    Recompute ``beliefs`` and everything downstream of them.
+
+    The affected region is visited component by component in topological
+    order, so each belief is evaluated at most once, and only when one of its
+    antecedents actually changed. Beliefs in ``pinned`` keep their current
+    value (they were just set explicitly) and are not traversed.
+    """
+    successors_of = graph.successors
+    pinned = set(pinned)
+    affected = set()
+    frontier = [b for b in beliefs if b not in pinned]
+    while frontier:
+        belief = frontier.pop()
+        if belief in affected:
+            continue
+        affected.add(belief)
+        frontier.extend(s for s in successors_of(belief) if s not in affected and s not in pinned)
+
+    dirty = set(affected.intersection(beliefs))
+    for component in reversed(strongly_connected_components(affected, successors_of)):
+        if dirty.isdisjoint(component):
+            continue
+        for belief in component:
+            previous = graph.value(belief)
+            value = None if graph.is_non_monotonic(belief) else graph.evaluate(belief)
+            if value != previous:
+                graph.set_value(belief, value)
+                dirty.update(successors_of(belief))
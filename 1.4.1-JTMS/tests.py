@@ -1,5 +1,6 @@
 import pytest
 from jtms import JTMS
+from jtms_compact import CompactJTMS
 from atms import ATMS
 
 strict_jtms = True
@@ -103,6 +104,125 @@ def test_graph_consistency_after_multiple_changes():
     for b in "BCDE":
         assert jtms.beliefs[b].valid is None
 
+def test_long_chain_propagates_without_recursion():
+    jtms = JTMS()
+    length = 5000
+    for i in range(length):
+        jtms.add_justification([f"B{i}"], [], f"B{i + 1}")
+
+    jtms.set_belief_validity("B0", True)
+    assert jtms.beliefs[f"B{length}"].valid is True
+
+    jtms.set_belief_validity("B0", False)
+    assert jtms.beliefs[f"B{length}"].valid is None
+
+def test_removing_justification_breaks_loop():
+    jtms = JTMS()
+    jtms.add_justification(["A"], [], "B")
+    loop = jtms.add_justification(["B"], [], "C")
+    jtms.add_justification(["C"], [], "A")
+
+    for b in "ABC":
+        assert jtms.beliefs[b].non_monotonic is True
+
+    jtms.remove_justification(loop)
+
+    for b in "ABC":
+        assert jtms.beliefs[b].non_monotonic is False
+
+    jtms.set_belief_validity("C", True)
+    assert jtms.beliefs["A"].valid is True
+    assert jtms.beliefs["B"].valid is True
+
+def test_loop_created_downstream_resets_values():
+    jtms = JTMS()
+    jtms.add_justification(["A"], [], "B")
+    jtms.add_justification(["B"], [], "C")
+    jtms.add_justification(["C"], [], "D")
+    jtms.set_belief_validity("A", True)
+    assert jtms.beliefs["D"].valid is True
+
+    jtms.add_justification(["C"], [], "B")  # B <-> C
+
+    assert jtms.beliefs["B"].non_monotonic is True
+    assert jtms.beliefs["C"].non_monotonic is True
+    assert jtms.beliefs["D"].non_monotonic is False
+    assert jtms.beliefs["D"].valid is None
+
+def test_batch_defers_propagation_until_commit():
+    jtms = JTMS()
+    with jtms.batch():
+        jtms.add_justification(["A"], [], "B")
+        jtms.add_justification(["B"], ["C"], "D")
+        jtms.add_justification(["D"], [], "E")
+        jtms.add_justification(["E"], [], "D")
+        jtms.set_belief_validity("A", True)
+
+        assert jtms.beliefs["B"].valid is None
+        assert jtms.beliefs["D"].non_monotonic is False
+
+    assert jtms.beliefs["B"].valid is True
+    assert jtms.beliefs["D"].non_monotonic is True
+    assert jtms.beliefs["E"].non_monotonic is True
+    assert jtms.beliefs["D"].valid is None
+
+def test_batch_matches_sequential_updates():
+    def build(jtms):
+        jtms.add_justification(["A"], [], "B")
+        jtms.add_justification(["B"], ["C"], "D")
+        jtms.add_justification(["A", "D"], [], "E")
+        jtms.set_belief_validity("A", True)
+        jtms.remove_belief("C")
+        return {name: b.valid for name, b in jtms.beliefs.items()}
+
+    sequential = build(JTMS())
+    batched = JTMS()
+    with batched.batch():
+        build(batched)
+
+    assert {name: b.valid for name, b in batched.beliefs.items()} == sequential
+    assert batched.beliefs["B"].valid is True
+    assert batched.beliefs["D"].valid is None  # sa seule justification citait C
+
+# ---------- Compact backend ----------
+
+def test_compact_backend_matches_object_backend():
+    def build(jtms):
+        for name in "ABCDE":
+            jtms.add_belief(name)
+        jtms.add_justification(["A"], [], "B")
+        jtms.add_justification(["B"], ["C"], "D")
+        jtms.add_justification(["D"], [], "E")
+        jtms.add_justification(["E"], [], "D")
+        jtms.set_belief_validity("A", True)
+        return {name: (b.valid, b.non_monotonic, len(b.justifications), len(b.implications))
+                for name, b in jtms.beliefs.items()}
+
+    assert build(CompactJTMS()) == build(JTMS())
+
+def test_compact_backend_removal_and_views():
+    jtms = CompactJTMS(strict_jtms)
+    for name in "ABC":
+        jtms.add_belief(name)
+    first = jtms.add_justification(["A"], [], "C")
+    jtms.add_justification(["B"], [], "C")
+    jtms.set_belief_validity("A", True)
+
+    assert jtms.beliefs["C"].valid is True
+    assert [repr(b) for b in first.in_list] == ["A"]
+    assert "Justification" in jtms.explain_belief("C")
+
+    jtms.remove_justification(first)
+    assert jtms.beliefs["C"].valid is None
+    assert len(jtms.beliefs["A"].implications) == 0
+
+    jtms.remove_belief("B")
+    assert "B" not in jtms.beliefs
+    assert jtms.beliefs["C"].justifications == []
+
+    with pytest.raises(KeyError):
+        jtms.add_justification(["Z"], [], "C")
+
 # -------------- ATMS ---------------
 '''
 def test_simple_justification(atms):
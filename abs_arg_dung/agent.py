@@ -12,29 +12,62 @@ import matplotlib.pyplot as plt
 import networkx as nx
 from jpype import JClass
 
-# Classes pour la structure du graphe
-DungTheory = JClass('org.tweetyproject.arg.dung.syntax.DungTheory')
-Argument = JClass('org.tweetyproject.arg.dung.syntax.Argument')
-Attack = JClass('org.tweetyproject.arg.dung.syntax.Attack')
-
-# Classes pour le raisonnement (calcul des extensions)
-SimpleGroundedReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleGroundedReasoner')
-SimplePreferredReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimplePreferredReasoner')
-SimpleStableReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleStableReasoner')
-SimpleCompleteReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleCompleteReasoner')
-SimpleAdmissibleReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleAdmissibleReasoner')
-SimpleIdealReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleIdealReasoner')
-SimpleSemiStableReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleSemiStableReasoner')
+from native_semantics import NativeDungSolver, SearchBudget, BudgetExceeded
+from framework_analytics import DEFAULT_MAX_CYCLES, analyze_structure, print_structure_report
+
+# Moteurs de calcul des extensions disponibles pour un DungAgent
+BACKENDS = ('tweety', 'native')
+
+# Les classes Tweety ne sont résolues que si la JVM tourne déjà : le backend
+# natif doit pouvoir importer ce module sans JVM.
+if jpype.isJVMStarted():
+    # Classes pour la structure du graphe
+    DungTheory = JClass('org.tweetyproject.arg.dung.syntax.DungTheory')
+    Argument = JClass('org.tweetyproject.arg.dung.syntax.Argument')
+    Attack = JClass('org.tweetyproject.arg.dung.syntax.Attack')
+
+    # Classes pour le raisonnement (calcul des extensions)
+    SimpleGroundedReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleGroundedReasoner')
+    SimplePreferredReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimplePreferredReasoner')
+    SimpleStableReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleStableReasoner')
+    SimpleCompleteReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleCompleteReasoner')
+    SimpleAdmissibleReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleAdmissibleReasoner')
+    SimpleIdealReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleIdealReasoner')
+    SimpleSemiStableReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleSemiStableReasoner')
 
 
 # --- Définition de l'Agent d'Argumentation ---
 
 class DungAgent:
-    def __init__(self):
+    def __init__(self, backend: str = 'tweety', budget: SearchBudget = None):
         """
         Initialise l'agent. Les classes Java sont importées ici pour s'assurer
         que la JVM est prête au moment de l'instanciation.
+
+        Args:
+            backend: 'tweety' (reasoners TweetyProject via JPype) ou 'native'
+                (solveur Python de native_semantics, sans JVM).
+            budget: limites optionnelles (temps, nombre d'extensions, taille)
+                des énumérations exponentielles. Un dépassement lève
+                BudgetExceeded. Avec Tweety, un appel Java ne peut pas être
+                interrompu : la taille est vérifiée avant l'appel, le temps et
+                le nombre d'extensions après.
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend inconnu : {backend}. Choix possibles : {BACKENDS}")
+        self.backend = backend
+        self._arguments = {}
+        self._attacks = {}
+        self.budget = budget
+
+        # Cache des extensions, rempli sémantique par sémantique
+        self._cached_extensions = {}
+        self._solver = None
+
+        if backend == 'native':
+            self.af = None
+            return
+
         if not jpype.isJVMStarted():
             raise RuntimeError(
                 "La JVM doit être démarrée avant d'instancier un DungAgent. "
@@ -56,7 +89,6 @@ class DungAgent:
         self.SimpleSemiStableReasoner = JClass('org.tweetyproject.arg.dung.reasoner.SimpleSemiStableReasoner')
         
         self.af = self.DungTheory()
-        self._arguments = {}
         
         # Initialiser les reasoners une seule fois
         self.grounded_reasoner = self.SimpleGroundedReasoner()
@@ -67,80 +99,107 @@ class DungAgent:
         self.ideal_reasoner = self.SimpleIdealReasoner()
         self.semi_stable_reasoner = self.SimpleSemiStableReasoner()
 
-        # Attributs pour le cache des extensions
-        self._cached_extensions = {}
-        self._cache_valid = False
-
     def add_argument(self, name: str):
         if name not in self._arguments:
-            arg = self.Argument(name)
-            self.af.add(arg)
-            self._arguments[name] = arg
+            if self.backend == 'native':
+                self._arguments[name] = name
+                if self._solver is not None:
+                    self._solver.add_argument(name)
+            else:
+                arg = self.Argument(name)
+                self.af.add(arg)
+                self._arguments[name] = arg
             self._invalidate_cache()
         else:
             print(f"Avertissement : L'argument '{name}' existe déjà.")
 
     def add_attack(self, source_name: str, target_name: str):
         if source_name in self._arguments and target_name in self._arguments:
-            self.af.add(self.Attack(self._arguments[source_name], self._arguments[target_name]))
+            if self.backend == 'tweety':
+                self.af.add(self.Attack(self._arguments[source_name], self._arguments[target_name]))
+            elif self._solver is not None:
+                self._solver.add_attack(source_name, target_name)
+            self._attacks[(source_name, target_name)] = None
             self._invalidate_cache()
         else:
             print(f"Erreur : Un ou plusieurs arguments ('{source_name}', '{target_name}') n'existent pas.")
 
+    def get_arguments(self) -> list:
+        """Noms des arguments, dans l'ordre d'ajout."""
+        return list(self._arguments.keys())
+
+    def get_attacks(self) -> list:
+        """Attaques sous forme de couples (attaquant, attaqué), dans l'ordre d'ajout."""
+        return list(self._attacks.keys())
+
     def _invalidate_cache(self):
-        """Invalide le cache quand le framework est modifié."""
+        """
+        Invalide le cache quand le framework est modifié. Avec le backend
+        natif, le solveur est conservé et mis à jour en place : il ne
+        recalcule que les SCC en aval de la modification.
+        """
         self._cached_extensions = {}
-        self._cache_valid = False
+
+    def _get_extensions(self, semantics: str):
+        """Calcule une seule sémantique, à la demande, et la met en cache."""
+        if semantics not in self._cached_extensions:
+            if self.backend == 'native':
+                if self._solver is None:
+                    self._solver = NativeDungSolver(self.get_arguments(), self.get_attacks(), self.budget)
+                result = self._solver.compute(semantics)
+            else:
+                result = self._compute_with_tweety(semantics)
+            self._cached_extensions[semantics] = result
+        return self._cached_extensions[semantics]
+
+    def _compute_with_tweety(self, semantics: str):
+        if self.budget is not None:
+            self.budget.start(semantics, len(self._arguments))
+        print(f"(Calcul des extensions '{semantics}' en cours...)")
+        if semantics == 'grounded':
+            return sorted([str(arg.getName()) for arg in self.grounded_reasoner.getModel(self.af)])
+        if semantics == 'ideal':
+            result = sorted([str(arg.getName()) for arg in self.ideal_reasoner.getModel(self.af)])
+        else:
+            reasoner = getattr(self, f"{semantics}_reasoner")
+            result = self._format_extensions(reasoner.getModels(self.af))
+        if self.budget is not None:
+            self.budget.check(len(result) if semantics != 'ideal' else 0)
+        return result
 
     def _compute_extensions_if_needed(self):
-        """Calcule les extensions seulement si elles n'ont pas déjà été calculées."""
-        if not self._cache_valid:
-            print("(Calcul des extensions en cours...)")
-            self._cached_extensions = {
-                'grounded': sorted([str(arg.getName()) for arg in self.grounded_reasoner.getModel(self.af)]),
-                'preferred': self._format_extensions(self.preferred_reasoner.getModels(self.af)),
-                'stable': self._format_extensions(self.stable_reasoner.getModels(self.af)),
-                'complete': self._format_extensions(self.complete_reasoner.getModels(self.af)),
-                'admissible': self._format_extensions(self.admissible_reasoner.getModels(self.af)),
-                'ideal': sorted([str(arg.getName()) for arg in self.ideal_reasoner.getModel(self.af)]),
-                'semi_stable': self._format_extensions(self.semi_stable_reasoner.getModels(self.af))
-            }
-            self._cache_valid = True
+        """Calcule toutes les sémantiques qui ne sont pas encore en cache."""
+        for semantics in ('grounded', 'preferred', 'stable', 'complete', 'admissible', 'ideal', 'semi_stable'):
+            self._get_extensions(semantics)
 
     def reset_cache(self):
         """Vide manuellement le cache des extensions."""
         self._invalidate_cache()
+        self._solver = None
 
     def _format_extensions(self, java_collection) -> list:
         return [sorted([str(arg.getName()) for arg in extension]) for extension in java_collection]
 
     def get_grounded_extension(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['grounded']
+        return self._get_extensions('grounded')
 
     def get_preferred_extensions(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['preferred']
+        return self._get_extensions('preferred')
 
     def get_stable_extensions(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['stable']
+        return self._get_extensions('stable')
     
     def get_complete_extensions(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['complete']
+        return self._get_extensions('complete')
 
     def get_admissible_sets(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['admissible']
+        return self._get_extensions('admissible')
 
     def get_ideal_extension(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['ideal']
+        return self._get_extensions('ideal')
 
     def get_semi_stable_extensions(self) -> list:
-        self._compute_extensions_if_needed()
-        return self._cached_extensions['semi_stable']
+        return self._get_extensions('semi_stable')
     
     # LA MÉTHODE SUIVANTE A ÉTÉ SUPPRIMÉE
     # def get_cf2_extensions(self) -> list:
@@ -151,10 +210,8 @@ class DungAgent:
         import networkx as nx
         
         G = nx.DiGraph()
-        nodes = [arg.getName() for arg in self.af.getNodes()]
-        G.add_nodes_from(nodes)
-        edges = [(a.getAttacker().getName(), a.getAttacked().getName()) for a in self.af.getAttacks()]
-        G.add_edges_from(edges)
+        G.add_nodes_from(self.get_arguments())
+        G.add_edges_from(self.get_attacks())
 
         plt.figure(figsize=(10, 8))
         pos = nx.spring_layout(G, seed=42, k=0.8)
@@ -227,11 +284,9 @@ class DungAgent:
         if arg_name not in self._arguments:
             return {'error': f"Argument '{arg_name}' n'existe pas"}
         
-        self._compute_extensions_if_needed()
-        
-        grounded = self._cached_extensions['grounded']
-        preferred = self._cached_extensions['preferred']
-        stable = self._cached_extensions['stable']
+        grounded = self._get_extensions('grounded')
+        preferred = self._get_extensions('preferred')
+        stable = self._get_extensions('stable')
         
         status = {
             'credulously_accepted': any(arg_name in ext for ext in preferred),
@@ -263,45 +318,17 @@ class DungAgent:
                 print(f"  - Accepté dans l'extension fondée: {status['grounded_accepted']}")
                 print(f"  - Accepté dans une extension stable: {status['stable_accepted']}")
 
-    def get_framework_properties(self) -> dict:
-        """Retourne les propriétés structurelles du framework."""
-        nodes = list(self.af.getNodes())
-        attacks = list(self.af.getAttacks())
-        
-        # Vérifier s'il y a des cycles
-        import networkx as nx
-        G = nx.DiGraph()
-        G.add_nodes_from([arg.getName() for arg in nodes])
-        G.add_edges_from([(a.getAttacker().getName(), a.getAttacked().getName()) for a in attacks])
-        
-        cycles = list(nx.simple_cycles(G))
-        
-        # Arguments self-attacking
-        self_attacking = [a.getAttacker().getName() for a in attacks 
-                         if a.getAttacker().getName() == a.getAttacked().getName()]
-        
-        return {
-            'num_arguments': len(nodes),
-            'num_attacks': len(attacks),
-            'has_cycles': len(cycles) > 0,
-            'cycles': cycles,
-            'self_attacking': self_attacking
-        }
+    def get_framework_properties(self, max_cycles: int = DEFAULT_MAX_CYCLES) -> dict:
+        """
+        Retourne les propriétés structurelles du framework (voir
+        framework_analytics.analyze_structure) ; seul un échantillon borné de
+        cycles est énuméré.
+        """
+        return analyze_structure(self.get_arguments(), self.get_attacks(), max_cycles)
 
     def analyze_framework_properties(self):
         """Affiche les propriétés structurelles du framework (méthode de convenance)."""
-        properties = self.get_framework_properties()
-        
-        print("=== PROPRIÉTÉS STRUCTURELLES ===")
-        print(f"Nombre d'arguments: {properties['num_arguments']}")
-        print(f"Nombre d'attaques: {properties['num_attacks']}")
-        print(f"Cycles détectés: {len(properties['cycles'])}")
-        
-        if properties['cycles']:
-            print(f"Cycles: {properties['cycles']}")
-        
-        if properties['self_attacking']:
-            print(f"Arguments auto-attaquants: {properties['self_attacking']}")
+        print_structure_report(self.get_framework_properties())
 
 # --- Cas d'étude et Démonstration ---
 
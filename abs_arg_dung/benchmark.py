@@ -150,9 +150,7 @@ class ArgumentationBenchmark:
         enh_agent = EnhancedDungAgent()
         for arg_name in std_agent._arguments.keys():
             enh_agent.add_argument(arg_name)
-        for attack in std_agent.af.getAttacks():
-            source = attack.getAttacker().getName()
-            target = attack.getAttacked().getName()
+        for source, target in std_agent.get_attacks():
             enh_agent.add_attack(source, target)
         
         return std_agent, enh_agent
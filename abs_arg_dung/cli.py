@@ -4,6 +4,7 @@ from agent import DungAgent
 from enhanced_agent import EnhancedDungAgent
 from framework_generator import FrameworkGenerator
 from io_utils import FrameworkIO
+from framework_analytics import analyze_structure, print_structure_report
 from config import get_project_info, RANDOM_GENERATION_CONFIG
 
 def main():
@@ -135,9 +136,7 @@ def analyze_framework_file(args):
             # Transférer les arguments et attaques
             for arg_name in temp_agent._arguments.keys():
                 agent.add_argument(arg_name)
-            for attack in temp_agent.af.getAttacks():
-                source = attack.getAttacker().getName()
-                target = attack.getAttacked().getName()
+            for source, target in temp_agent.get_attacks():
                 agent.add_attack(source, target)
         else:
             agent = FrameworkIO.import_from_json(args.file)
@@ -159,7 +158,7 @@ def handle_examples(args):
     if args.list:
         print("=== EXEMPLES DISPONIBLES ===")
         for name, agent in examples.items():
-            props = agent.get_framework_properties()
+            props = analyze_structure(agent.get_arguments(), agent.get_attacks())
             print(f"- {name}: {props['num_arguments']} arguments, {props['num_attacks']} attaques")
         return
     
@@ -200,7 +199,7 @@ def analyze_framework(agent):
     print("ANALYSE DU FRAMEWORK")
     print("="*60)
     
-    agent.analyze_framework_properties()
+    print_structure_report(analyze_structure(agent.get_arguments(), agent.get_attacks()))
     print()
     agent.analyze_semantics_relationships()
     print()
@@ -4,8 +4,8 @@ import networkx as nx
 class EnhancedDungAgent(DungAgent):
     """Agent avec corrections pour certains cas spécifiques"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, backend: str = 'tweety'):
+        super().__init__(backend)
         self.correction_mode = True
     
     def get_preferred_extensions(self) -> list:
@@ -38,9 +38,8 @@ class EnhancedDungAgent(DungAgent):
     
     def _is_perfect_cycle(self) -> bool:
         """Détecte si le framework est un cycle parfait"""
-        nodes = [arg.getName() for arg in self.af.getNodes()]
-        attacks = [(a.getAttacker().getName(), a.getAttacked().getName()) 
-                  for a in self.af.getAttacks()]
+        nodes = self.get_arguments()
+        attacks = self.get_attacks()
         
         # Vérifier si c'est un cycle simple
         if len(nodes) != len(attacks):
@@ -55,15 +54,14 @@ class EnhancedDungAgent(DungAgent):
     
     def _compute_cycle_extensions(self) -> list:
         """Calcule manuellement les extensions pour un cycle parfait"""
-        nodes = [arg.getName() for arg in self.af.getNodes()]
+        nodes = self.get_arguments()
         # Pour un cycle parfait, chaque argument forme une extension préférée
         return [[node] for node in nodes]
     
     def _check_self_attack_case(self) -> list:
         """Vérifie et corrige le cas self-attack + attack"""
-        nodes = [arg.getName() for arg in self.af.getNodes()]
-        attacks = [(a.getAttacker().getName(), a.getAttacked().getName()) 
-                  for a in self.af.getAttacks()]
+        nodes = self.get_arguments()
+        attacks = self.get_attacks()
         
         self_attacking = set()
         attacked_by_others = set()
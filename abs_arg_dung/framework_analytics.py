@@ -0,0 +1,181 @@
+"""Analyse structurelle bornée d'un framework d'argumentation.
+
+Remplace l'énumération complète ``nx.simple_cycles`` (exponentielle sur les
+frameworks denses) par des indicateurs calculés en temps quasi linéaire :
+composantes fortement connexes, acyclicité, présence de cycles impairs,
+auto-attaques. Seul un échantillon borné de cycles est énuméré ; il sert à
+illustrer la structure et, quand il est exhaustif, à trancher la présence de
+cycles pairs (problème bien plus coûteux que pour les cycles impairs).
+"""
+
+from itertools import islice
+
+import networkx as nx
+
+# Nombre maximal de cycles énumérés par analyse
+DEFAULT_MAX_CYCLES = 20
+
+
+def _strongly_connected_components(arguments, successors):
+    """Tarjan itératif ; renvoie les SCC de l'aval vers l'amont."""
+    index, low = {}, {}
+    on_stack, stack, components = set(), [], []
+    counter = 0
+    for root in arguments:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors[child])))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def _has_odd_cycle(component, successors):
+    """
+    Une SCC contient un cycle impair ssi ses arcs internes ne sont pas
+    compatibles avec une parité de distance depuis une racine (parcours en
+    largeur, temps linéaire).
+    """
+    members = set(component)
+    parity = {component[0]: 0}
+    queue = [component[0]]
+    for node in queue:
+        for child in successors[node]:
+            if child not in members:
+                continue
+            if child not in parity:
+                parity[child] = parity[node] ^ 1
+                queue.append(child)
+            elif parity[child] == parity[node]:
+                return True
+    return False
+
+
+def analyze_structure(arguments, attacks, max_cycles: int = DEFAULT_MAX_CYCLES) -> dict:
+    """
+    Propriétés structurelles d'un framework.
+
+    Args:
+        arguments: noms des arguments.
+        attacks: couples (attaquant, attaqué).
+        max_cycles: taille maximale de l'échantillon de cycles.
+
+    Returns:
+        dict avec les clés historiques de ``get_framework_properties``
+        (``num_arguments``, ``num_attacks``, ``has_cycles``, ``cycles``,
+        ``self_attacking``) et l'analyse des SCC. ``has_even_cycle`` vaut
+        None quand l'échantillon borné ne permet pas de conclure.
+    """
+    arguments = list(dict.fromkeys(arguments))
+    attacks = list(dict.fromkeys(attacks))
+    successors = {arg: [] for arg in arguments}
+    for source, target in attacks:
+        successors[source].append(target)
+    self_attacking = [source for source, target in attacks if source == target]
+    self_attacking_set = set(self_attacking)
+
+    components = _strongly_connected_components(arguments, successors)
+    cyclic = [c for c in components if len(c) > 1 or c[0] in self_attacking_set]
+
+    cycles = []
+    truncated = False
+    has_odd = False
+    even_status = []
+    for component in cyclic:
+        odd = _has_odd_cycle(component, successors)
+        has_odd = has_odd or odd
+        if not odd:
+            # Tous les cycles d'une SCC sans cycle impair sont pairs
+            even_status.append(True)
+
+        # Échantillon : Johnson a un délai polynomial entre deux cycles
+        remaining = max_cycles - len(cycles)
+        if remaining <= 0:
+            truncated = True
+            if odd:
+                even_status.append(None)
+            continue
+        graph = nx.DiGraph()
+        graph.add_nodes_from(component)
+        members = set(component)
+        graph.add_edges_from((s, t) for s in component for t in successors[s] if t in members)
+        sample = list(islice(nx.simple_cycles(graph), remaining + 1))
+        exhaustive = len(sample) <= remaining
+        truncated = truncated or not exhaustive
+        sample = sample[:remaining]
+        cycles.extend(sample)
+        if odd:
+            if any(len(cycle) % 2 == 0 for cycle in sample):
+                even_status.append(True)
+            else:
+                even_status.append(False if exhaustive else None)
+
+    if any(status is True for status in even_status):
+        has_even = True
+    elif all(status is False for status in even_status):
+        has_even = False
+    else:
+        has_even = None
+
+    non_trivial = [sorted(c) for c in components if len(c) > 1]
+    return {
+        'num_arguments': len(arguments),
+        'num_attacks': len(attacks),
+        'num_sccs': len(components),
+        'sccs': sorted(non_trivial, key=lambda c: (-len(c), c)),
+        'largest_scc_size': max((len(c) for c in components), default=0),
+        'is_acyclic': not cyclic,
+        'has_cycles': bool(cyclic),
+        'has_odd_cycle': has_odd,
+        'has_even_cycle': has_even,
+        'cycles': cycles,
+        'cycles_truncated': truncated,
+        'self_attacking': self_attacking,
+    }
+
+
+def print_structure_report(properties: dict):
+    """Affiche le résultat de :func:`analyze_structure`."""
+    print("=== PROPRIÉTÉS STRUCTURELLES ===")
+    print(f"Nombre d'arguments: {properties['num_arguments']}")
+    print(f"Nombre d'attaques: {properties['num_attacks']}")
+    print(f"Composantes fortement connexes: {properties['num_sccs']} "
+          f"(plus grande: {properties['largest_scc_size']})")
+    print(f"Acyclique: {properties['is_acyclic']}")
+    if properties['has_cycles']:
+        even = {True: 'oui', False: 'non', None: 'indéterminé'}[properties['has_even_cycle']]
+        print(f"Cycle impair: {'oui' if properties['has_odd_cycle'] else 'non'} - Cycle pair: {even}")
+        suffix = " (échantillon tronqué)" if properties['cycles_truncated'] else ""
+        print(f"Cycles détectés: {len(properties['cycles'])}{suffix}")
+        print(f"Cycles: {properties['cycles']}")
+
+    if properties['self_attacking']:
+        print(f"Arguments auto-attaquants: {properties['self_attacking']}")
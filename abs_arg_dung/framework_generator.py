@@ -58,6 +58,117 @@ class FrameworkGenerator:
         
         return examples
 
+    # --- Familles de graphes pour les benchmarks à grande échelle ---
+    # Chaque générateur est déterministe pour une graine donnée (générateur
+    # aléatoire local) et renvoie (arguments, attaques) sans créer d'agent :
+    # un même framework peut ainsi être chargé dans plusieurs backends.
+
+    @staticmethod
+    def erdos_renyi(num_args: int, seed: int = 0, avg_degree: float = 2.0) -> tuple:
+        """Graphe aléatoire uniforme avec ~avg_degree attaques par argument."""
+        rng = random.Random(seed)
+        args = [f"arg_{i}" for i in range(num_args)]
+        attacks = set()
+        target = min(int(num_args * avg_degree), num_args * num_args)
+        while len(attacks) < target:
+            attacks.add((args[rng.randrange(num_args)], args[rng.randrange(num_args)]))
+        return args, sorted(attacks)
+
+    @staticmethod
+    def scale_free(num_args: int, seed: int = 0, edges_per_node: int = 2) -> tuple:
+        """Attachement préférentiel (Barabási–Albert) avec orientation aléatoire."""
+        rng = random.Random(seed)
+        args = [f"arg_{i}" for i in range(num_args)]
+        attacks = set()
+        # Chaque extrémité d'arc y figure une fois : tirer dedans revient à
+        # tirer proportionnellement au degré.
+        endpoints = []
+        for i in range(1, num_args):
+            for _ in range(min(edges_per_node, i)):
+                j = rng.choice(endpoints) if endpoints else rng.randrange(i)
+                edge = (args[i], args[j]) if rng.random() < 0.5 else (args[j], args[i])
+                if edge not in attacks:
+                    attacks.add(edge)
+                    endpoints.extend((i, j))
+        return args, sorted(attacks)
+
+    @staticmethod
+    def grid(num_args: int, seed: int = 0, mutual_probability: float = 0.3) -> tuple:
+        """Grille carrée : attaques entre voisins, parfois mutuelles."""
+        rng = random.Random(seed)
+        width = max(1, int(num_args ** 0.5))
+        args = [f"arg_{i}" for i in range(num_args)]
+        attacks = set()
+        for i in range(num_args):
+            for j in (i + 1 if (i + 1) % width else None, i + width):
+                if j is None or j >= num_args:
+                    continue
+                if rng.random() < mutual_probability:
+                    attacks.update(((args[i], args[j]), (args[j], args[i])))
+                elif rng.random() < 0.5:
+                    attacks.add((args[i], args[j]))
+                else:
+                    attacks.add((args[j], args[i]))
+        return args, sorted(attacks)
+
+    @staticmethod
+    def layered_acyclic(num_args: int, seed: int = 0, num_layers: int = 10, out_degree: int = 2) -> tuple:
+        """Couches successives, attaques uniquement d'une couche vers la suivante."""
+        rng = random.Random(seed)
+        args = [f"arg_{i}" for i in range(num_args)]
+        layers = [args[k::num_layers] for k in range(num_layers)]
+        attacks = set()
+        for upper, lower in zip(layers, layers[1:]):
+            if not lower:
+                continue
+            for source in upper:
+                for _ in range(out_degree):
+                    attacks.add((source, rng.choice(lower)))
+        return args, sorted(attacks)
+
+    @staticmethod
+    def iccma_style(num_args: int, seed: int = 0, cluster_size: int = 12,
+                    inner_probability: float = 0.25, outer_degree: float = 1.0) -> tuple:
+        """
+        Inspiré des générateurs des compétitions ICCMA (AFBenchGen) : des
+        grappes denses, fortement connexes en pratique, reliées entre elles
+        sans retour en arrière, ce qui exerce la récursivité SCC des solveurs.
+        """
+        rng = random.Random(seed)
+        args = [f"arg_{i}" for i in range(num_args)]
+        clusters = [args[k:k + cluster_size] for k in range(0, num_args, cluster_size)]
+        attacks = set()
+        for cluster in clusters:
+            for source in cluster:
+                for target in cluster:
+                    if rng.random() < inner_probability:
+                        attacks.add((source, target))
+        for index, cluster in enumerate(clusters[1:], start=1):
+            for _ in range(max(1, int(outer_degree * len(cluster)))):
+                upstream = clusters[rng.randrange(index)]
+                attacks.add((rng.choice(upstream), rng.choice(cluster)))
+        return args, sorted(attacks)
+
+    @staticmethod
+    def build_agent(arguments: list, attacks: list, backend: str = 'tweety', budget=None) -> DungAgent:
+        """Charge un framework (arguments, attaques) dans un nouvel agent."""
+        agent = DungAgent(backend=backend, budget=budget)
+        for arg in arguments:
+            agent.add_argument(arg)
+        for source, target in attacks:
+            agent.add_attack(source, target)
+        return agent
+
+
+# Familles disponibles pour les benchmarks à grande échelle
+FRAMEWORK_FAMILIES = {
+    'erdos_renyi': FrameworkGenerator.erdos_renyi,
+    'scale_free': FrameworkGenerator.scale_free,
+    'grid': FrameworkGenerator.grid,
+    'layered_acyclic': FrameworkGenerator.layered_acyclic,
+    'iccma': FrameworkGenerator.iccma_style,
+}
+
 # Test du générateur
 if __name__ == "__main__":
     # Framework aléatoire
@@ -1,14 +1,14 @@
 import json
 from agent import DungAgent
+from framework_analytics import analyze_structure
 
 class FrameworkIO:
     
     @staticmethod
     def export_to_json(agent: DungAgent, filename: str):
         """Exporte un framework vers un fichier JSON"""
-        nodes = [str(arg.getName()) for arg in agent.af.getNodes()]
-        edges = [(str(a.getAttacker().getName()), str(a.getAttacked().getName()))
-                 for a in agent.af.getAttacks()]
+        nodes = [str(arg) for arg in agent.get_arguments()]
+        edges = [(str(source), str(target)) for source, target in agent.get_attacks()]
         
         data = {
             "arguments": nodes,
@@ -56,9 +56,9 @@ class FrameworkIO:
             
             # Edges
             arg_to_id = {str(arg): i+1 for i, arg in enumerate(agent._arguments.keys())}
-            for attack in agent.af.getAttacks():
-                source_id = arg_to_id[str(attack.getAttacker().getName())]
-                target_id = arg_to_id[str(attack.getAttacked().getName())]
+            for source, target in agent.get_attacks():
+                source_id = arg_to_id[str(source)]
+                target_id = arg_to_id[str(target)]
                 f.write(f"{source_id} {target_id}\n")
         
         print(f"Framework exporté vers {filename} (format TGF)")
@@ -76,9 +76,7 @@ class FrameworkIO:
                 f.write(f"  \"{str(arg)}\";\n")
             
             # Edges
-            for attack in agent.af.getAttacks():
-                source = str(attack.getAttacker().getName())
-                target = str(attack.getAttacked().getName())
+            for source, target in agent.get_attacks():
                 f.write(f"  \"{source}\" -> \"{target}\";\n")
             
             f.write("}\n")
@@ -89,7 +87,7 @@ class FrameworkIO:
     def export_analysis_report(agent: DungAgent, filename: str):
         """Exporte un rapport d'analyse complet"""
         # Calculer toutes les informations
-        properties = agent.get_framework_properties()
+        properties = analyze_structure(agent.get_arguments(), agent.get_attacks())
         semantics = agent.get_semantics_relationships()
         all_status = agent.get_all_arguments_status()
         
@@ -101,6 +99,8 @@ class FrameworkIO:
                 "total_arguments": properties['num_arguments'],
                 "total_attacks": properties['num_attacks'],
                 "has_cycles": properties['has_cycles'],
+                "has_odd_cycle": properties['has_odd_cycle'],
+                "largest_scc_size": properties['largest_scc_size'],
                 "grounded_extension_size": len(semantics['extensions']['grounded']),
                 "num_preferred_extensions": len(semantics['extensions']['preferred']),
                 "num_stable_extensions": len(semantics['extensions']['stable'])
@@ -0,0 +1,432 @@
+"""Solveur natif (pur Python) des sémantiques de Dung.
+
+Alternative à TweetyProject pour les frameworks petits et moyens : aucun
+aller-retour JPype, aucune JVM à démarrer. Les ensembles d'arguments sont des
+bitsets (entiers Python, bit ``i`` = argument ``i``) et les labellings sont
+des triplets de bitsets ``(IN, OUT, UNDEC)``.
+
+Les sémantiques complète, préférée et stable sont calculées composante
+fortement connexe par composante (SCC-récursivité) : chaque SCC n'est
+énumérée qu'à partir des labels déjà fixés en amont. La sémantique fondée
+est un simple point fixe, la semi-stable et l'idéale sont dérivées des
+extensions préférées.
+
+Le solveur peut être modifié en place (:meth:`NativeDungSolver.add_argument`,
+:meth:`NativeDungSolver.add_attack`) : les labellings locaux de chaque SCC
+sont mémorisés selon les labels de leurs attaquants externes, si bien
+qu'après une modification seules les SCC en aval de l'argument touché sont
+réellement recalculées.
+
+Les énumérations exponentielles peuvent être bornées par un
+:class:`SearchBudget` (temps, nombre d'extensions, taille du framework) ;
+un dépassement lève :class:`BudgetExceeded`.
+"""
+
+import time
+
+# Sémantiques dont le calcul peut être exponentiel (tout sauf la fondée)
+EXPONENTIAL_SEMANTICS = ('preferred', 'stable', 'complete', 'admissible', 'ideal', 'semi_stable')
+
+
+class BudgetExceeded(RuntimeError):
+    """Levée quand une énumération dépasse le budget qui lui est alloué."""
+
+    def __init__(self, message: str, semantics: str = None):
+        super().__init__(message)
+        self.semantics = semantics
+
+
+class SearchBudget:
+    """
+    Budget d'une énumération d'extensions.
+
+    Args:
+        max_seconds: durée maximale d'un calcul de sémantique.
+        max_extensions: nombre maximal d'extensions (ou d'ensembles
+            admissibles) produites par un calcul.
+        max_arguments: taille au-delà de laquelle les sémantiques
+            exponentielles ne sont pas lancées du tout.
+    """
+
+    def __init__(self, max_seconds: float = None, max_extensions: int = None, max_arguments: int = None):
+        self.max_seconds = max_seconds
+        self.max_extensions = max_extensions
+        self.max_arguments = max_arguments
+        self.semantics = None
+        self._deadline = None
+
+    def start(self, semantics: str, num_arguments: int):
+        """Arme le budget pour un calcul ; vérifie d'abord la taille du framework."""
+        self.semantics = semantics
+        if self.max_arguments is not None and semantics in EXPONENTIAL_SEMANTICS \
+                and num_arguments > self.max_arguments:
+            raise BudgetExceeded(
+                f"{num_arguments} arguments > {self.max_arguments} : calcul '{semantics}' non lancé", semantics)
+        self._deadline = None if self.max_seconds is None else time.monotonic() + self.max_seconds
+
+    def check(self, found: int = 0):
+        """Interrompt le calcul si le temps ou le nombre de résultats est dépassé."""
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise BudgetExceeded(f"Temps dépassé ({self.max_seconds} s) pour '{self.semantics}'", self.semantics)
+        if self.max_extensions is not None and found > self.max_extensions:
+            raise BudgetExceeded(
+                f"Plus de {self.max_extensions} résultats pour '{self.semantics}'", self.semantics)
+
+
+def _bits(mask: int):
+    """Itère sur les indices des bits à 1 d'un bitset."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class NativeDungSolver:
+    """Calcule les extensions d'un framework d'argumentation abstraite."""
+
+    def __init__(self, arguments, attacks, budget: SearchBudget = None):
+        self.budget = budget
+        self.arguments = []
+        self._index = {}
+        self._attackers = []
+        self._targets = []
+        self._all = 0
+        # SCC -> {(mode, IN externes, UNDEC externes): labellings locaux}
+        self._local_cache = {}
+        self._invalidate()
+        for name in arguments:
+            self.add_argument(name)
+        for source, target in attacks:
+            self.add_attack(source, target)
+
+    # --- Modifications -----------------------------------------------------
+
+    def add_argument(self, name):
+        """Ajoute un argument isolé (nouvelle SCC singleton, rien d'autre n'est touché)."""
+        if name in self._index:
+            return
+        self._index[name] = len(self.arguments)
+        self.arguments.append(name)
+        self._attackers.append(0)
+        self._targets.append(0)
+        self._all = (self._all << 1) | 1
+        self._invalidate()
+
+    def add_attack(self, source, target):
+        """
+        Ajoute une attaque. Seuls les labellings locaux de la SCC de la cible
+        sont oubliés ; ceux des autres SCC restent valides puisqu'ils sont
+        indexés par les labels de leurs attaquants externes.
+        """
+        s, t = self._index[source], self._index[target]
+        if self._attackers[t] >> s & 1:
+            return
+        self._attackers[t] |= 1 << s
+        self._targets[s] |= 1 << t
+        for scc in [scc for scc in self._local_cache if scc >> t & 1]:
+            del self._local_cache[scc]
+        self._invalidate()
+
+    def _invalidate(self):
+        self._scc_order = None
+        self._labelling_cache = {}
+
+    # --- Conversions -------------------------------------------------------
+
+    def _names(self, mask: int) -> list:
+        return sorted(self.arguments[i] for i in _bits(mask))
+
+    def _format(self, masks) -> list:
+        return sorted(self._names(mask) for mask in masks)
+
+    def _range(self, mask: int) -> int:
+        attacked = 0
+        for i in _bits(mask):
+            attacked |= self._targets[i]
+        return attacked
+
+    # --- Structure ---------------------------------------------------------
+
+    def sccs(self) -> list:
+        """Bitsets des SCC du graphe d'attaque, en ordre topologique (amont d'abord)."""
+        if self._scc_order is None:
+            n = len(self.arguments)
+            index, low = [-1] * n, [0] * n
+            on_stack, stack, order = [False] * n, [], []
+            counter = 0
+            for root in range(n):
+                if index[root] != -1:
+                    continue
+                index[root] = low[root] = counter
+                counter += 1
+                stack.append(root)
+                on_stack[root] = True
+                work = [(root, _bits(self._targets[root]))]
+                while work:
+                    node, children = work[-1]
+                    for child in children:
+                        if index[child] == -1:
+                            index[child] = low[child] = counter
+                            counter += 1
+                            stack.append(child)
+                            on_stack[child] = True
+                            work.append((child, _bits(self._targets[child])))
+                            break
+                        if on_stack[child]:
+                            low[node] = min(low[node], index[child])
+                    else:
+                        work.pop()
+                        if work:
+                            parent = work[-1][0]
+                            low[parent] = min(low[parent], low[node])
+                        if low[node] == index[node]:
+                            component = 0
+                            while True:
+                                member = stack.pop()
+                                on_stack[member] = False
+                                component |= 1 << member
+                                if member == node:
+                                    break
+                            order.append(component)
+            # Tarjan produit les SCC de l'aval vers l'amont
+            order.reverse()
+            self._scc_order = order
+            # Les SCC fusionnées par une nouvelle attaque n'existent plus
+            current = set(order)
+            for scc in [scc for scc in self._local_cache if scc not in current]:
+                del self._local_cache[scc]
+        return self._scc_order
+
+    # --- Sémantique fondée -------------------------------------------------
+
+    def grounded_mask(self) -> int:
+        """Plus petit point fixe de la fonction caractéristique (propagation de labels)."""
+        n = len(self.arguments)
+        live_attackers = [bin(self._attackers[i]).count("1") for i in range(n)]
+        accepted, rejected = 0, 0
+        queue = [i for i in range(n) if live_attackers[i] == 0]
+        while queue:
+            arg = queue.pop()
+            bit = 1 << arg
+            if accepted & bit:
+                continue
+            accepted |= bit
+            for target in _bits(self._targets[arg] & ~rejected):
+                rejected |= 1 << target
+                for victim in _bits(self._targets[target]):
+                    live_attackers[victim] -= 1
+                    if live_attackers[victim] == 0:
+                        queue.append(victim)
+        return accepted
+
+    def grounded_extension(self) -> list:
+        return self._names(self.grounded_mask())
+
+    # --- Labellings SCC-récursifs -----------------------------------------
+
+    def _local_complete(self, scc: int, upstream_in: int, upstream_undec: int, maximal: bool = False):
+        """
+        Labellings complets d'une SCC, étant donnés les labels de l'amont.
+
+        Recherche avec propagation : un candidat défendu est forcé IN, les
+        voisins d'un argument IN sont exclus, et un attaquant qui n'a plus
+        qu'un seul contre-attaquant possible force celui-ci. Avec
+        ``maximal=True`` seuls les labellings à IN maximal (préférés) sont
+        conservés et les branches incluses dans un résultat sont coupées.
+        """
+        attackers, targets = self._attackers, self._targets
+        forced_out = 0
+        candidates = 0
+        for arg in _bits(scc):
+            external = attackers[arg] & ~scc
+            if external & upstream_in:
+                forced_out |= 1 << arg
+            elif not external & upstream_undec and not attackers[arg] & (1 << arg):
+                candidates |= 1 << arg
+
+        results = []
+
+        def propagate(accepted, excluded):
+            while True:
+                out = (self._range(accepted) & scc) | forced_out
+                neighbours = out
+                for arg in _bits(accepted):
+                    neighbours |= attackers[arg]
+                if neighbours & accepted:
+                    return None
+                undecided = candidates & ~accepted & ~excluded
+                forced = 0
+                excluded |= neighbours & undecided
+                undecided &= ~neighbours
+                for arg in _bits(accepted):
+                    for attacker in _bits(attackers[arg] & scc & ~out):
+                        counter = attackers[attacker] & undecided
+                        if not counter:
+                            return None
+                        if not counter & (counter - 1):
+                            forced |= counter
+                for arg in _bits(candidates & ~accepted):
+                    if not attackers[arg] & scc & ~out:
+                        if excluded & (1 << arg):
+                            return None
+                        forced |= 1 << arg
+                if not forced:
+                    return accepted, excluded, out
+                accepted |= forced
+                excluded &= ~forced
+
+        def search(accepted, excluded):
+            if self.budget is not None:
+                self.budget.check(len(results))
+            state = propagate(accepted, excluded)
+            if state is None:
+                return
+            accepted, excluded, out = state
+            undecided = candidates & ~accepted & ~excluded
+            if maximal and any(found[0] & (accepted | undecided) == (accepted | undecided) for found in results):
+                return
+            if not undecided:
+                results.append((accepted, out, scc & ~accepted & ~out))
+                return
+            low = undecided & -undecided
+            search(accepted | low, excluded)
+            search(accepted, excluded | low)
+
+        search(0, 0)
+        if maximal:
+            results = [lab for lab in results
+                       if not any(other[0] != lab[0] and other[0] & lab[0] == lab[0] for other in results)]
+        return results
+
+    def _labellings(self, mode: str) -> list:
+        if mode in self._labelling_cache:
+            return self._labelling_cache[mode]
+        partial = [(0, 0, 0)]
+        for scc in self.sccs():
+            external = 0
+            for arg in _bits(scc):
+                external |= self._attackers[arg]
+            external &= ~scc
+            memo = self._local_cache.setdefault(scc, {})
+            extended = []
+            for labelling in partial:
+                upstream_in, upstream_out, upstream_undec = labelling
+                key = (mode, upstream_in & external, upstream_undec & external)
+                local = memo.get(key)
+                if local is None:
+                    local = self._local_complete(scc, key[1], key[2], maximal=mode == "preferred")
+                    if mode == "stable":
+                        local = [lab for lab in local if not lab[2]]
+                    memo[key] = local
+                for lab_in, lab_out, lab_undec in local:
+                    extended.append((upstream_in | lab_in, upstream_out | lab_out, upstream_undec | lab_undec))
+                if self.budget is not None:
+                    self.budget.check(len(extended))
+            partial = extended
+            if not partial:
+                break
+        self._labelling_cache[mode] = partial
+        return partial
+
+    def complete_masks(self) -> list:
+        return [lab[0] for lab in self._labellings("complete")]
+
+    def preferred_masks(self) -> list:
+        return [lab[0] for lab in self._labellings("preferred")]
+
+    def stable_masks(self) -> list:
+        return [lab[0] for lab in self._labellings("stable")]
+
+    def complete_extensions(self) -> list:
+        return self._format(self.complete_masks())
+
+    def preferred_extensions(self) -> list:
+        return self._format(self.preferred_masks())
+
+    def stable_extensions(self) -> list:
+        return self._format(self.stable_masks())
+
+    # --- Sémantiques dérivées des préférées ---------------------------------
+
+    def semi_stable_masks(self) -> list:
+        """Extensions préférées dont le range (S ∪ S+) est maximal pour l'inclusion."""
+        stable = self.stable_masks()
+        if stable:
+            return stable
+        preferred = self.preferred_masks()
+        ranges = [mask | self._range(mask) for mask in preferred]
+        return [mask for mask, reach in zip(preferred, ranges)
+                if not any(other != reach and other & reach == reach for other in ranges)]
+
+    def semi_stable_extensions(self) -> list:
+        return self._format(self.semi_stable_masks())
+
+    def ideal_mask(self) -> int:
+        """Plus grand ensemble admissible contenu dans toutes les extensions préférées."""
+        candidate = self._all
+        for mask in self.preferred_masks():
+            candidate &= mask
+        while True:
+            defended = candidate
+            attacked = self._range(candidate)
+            for arg in _bits(candidate):
+                if self._attackers[arg] & ~attacked:
+                    defended &= ~(1 << arg)
+            if defended == candidate:
+                return candidate
+            candidate = defended
+
+    def ideal_extension(self) -> list:
+        return self._names(self.ideal_mask())
+
+    # --- Ensembles admissibles --------------------------------------------
+
+    def admissible_masks(self) -> list:
+        """Tous les ensembles admissibles (sans conflit et auto-défendus)."""
+        n = len(self.arguments)
+        attackers, targets = self._attackers, self._targets
+        eligible = [i for i in range(n) if not attackers[i] & (1 << i)]
+        results = []
+
+        def search(position, accepted, remaining):
+            if self.budget is not None:
+                self.budget.check(len(results))
+            attacked = self._range(accepted)
+            for arg in _bits(accepted):
+                for attacker in _bits(attackers[arg] & ~attacked):
+                    if not attackers[attacker] & remaining:
+                        return
+            if position == len(eligible):
+                results.append(accepted)
+                return
+            arg = eligible[position]
+            bit = 1 << arg
+            remaining &= ~bit
+            if not (attackers[arg] | targets[arg]) & accepted:
+                search(position + 1, accepted | bit, remaining)
+            search(position + 1, accepted, remaining)
+
+        search(0, 0, sum(1 << i for i in eligible))
+        return results
+
+    def admissible_sets(self) -> list:
+        return self._format(self.admissible_masks())
+
+    # --- Accès uniforme ------------------------------------------------------
+
+    def compute(self, semantics: str):
+        """Calcule une sémantique par son nom (noms de ``config.SUPPORTED_SEMANTICS``)."""
+        handlers = {
+            'grounded': self.grounded_extension,
+            'preferred': self.preferred_extensions,
+            'stable': self.stable_extensions,
+            'complete': self.complete_extensions,
+            'admissible': self.admissible_sets,
+            'ideal': self.ideal_extension,
+            'semi_stable': self.semi_stable_extensions,
+        }
+        if semantics not in handlers:
+            raise ValueError(f"Sémantique non supportée : {semantics}")
+        if self.budget is not None:
+            self.budget.start(semantics, len(self.arguments))
+        return handlers[semantics]()
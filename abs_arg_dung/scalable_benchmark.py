@@ -0,0 +1,204 @@
+"""Benchmark à grande échelle des backends de DungAgent.
+
+Complète ``benchmark.py`` (petits frameworks, toutes sémantiques mesurées
+ensemble) pour dimensionner un déploiement : familles de graphes générées
+avec graine (voir ``FRAMEWORK_FAMILIES``) jusqu'à plusieurs milliers
+d'arguments, une mesure par sémantique et par backend, pic mémoire Python
+(tracemalloc) et, pour Tweety, mémoire utilisée par la JVM. Les résultats
+sont exportables en JSON et en CSV.
+
+Chaque mesure est bornée par un :class:`SearchBudget` ; un dépassement est
+enregistré avec le statut ``budget`` au lieu d'interrompre la campagne.
+
+Usage :
+    python scalable_benchmark.py --families erdos_renyi grid --sizes 100 1000 10000 \\
+        --backends native --timeout 30 --json results.json --csv results.csv
+"""
+
+import argparse
+import csv
+import gc
+import glob
+import json
+import os
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+
+import jpype
+
+from framework_generator import FRAMEWORK_FAMILIES, FrameworkGenerator
+from native_semantics import BudgetExceeded, SearchBudget, EXPONENTIAL_SEMANTICS
+from config import SUPPORTED_SEMANTICS
+
+# Le traçage de tracemalloc ralentit les allocations : budget de la mesure mémoire
+MEMORY_TIMEOUT_FACTOR = 5.0
+
+CSV_FIELDS = [
+    'family', 'size', 'seed', 'num_attacks', 'backend', 'semantics', 'status',
+    'seconds', 'peak_memory_bytes', 'jvm_memory_bytes', 'result_size', 'agrees', 'error',
+]
+
+
+def _jvm_used_memory():
+    if not jpype.isJVMStarted():
+        return None
+    runtime = jpype.JClass('java.lang.Runtime').getRuntime()
+    return int(runtime.totalMemory() - runtime.freeMemory())
+
+
+class ScalableBenchmark:
+
+    def __init__(self, timeout: float = 30.0, max_exponential_size: int = None, measure_memory: bool = False):
+        """
+        Args:
+            timeout: budget de temps par sémantique (secondes).
+            max_exponential_size: taille au-delà de laquelle les sémantiques
+                exponentielles ne sont pas lancées (indispensable pour Tweety,
+                dont les appels ne peuvent pas être interrompus).
+            measure_memory: relance chaque mesure native réussie sous
+                tracemalloc pour obtenir le pic mémoire (le traçage fausserait
+                le temps), dans un budget de ``timeout * MEMORY_TIMEOUT_FACTOR``.
+        """
+        self.timeout = timeout
+        self.max_exponential_size = max_exponential_size
+        self.measure_memory = measure_memory
+        self.records = []
+
+    def _budget(self) -> SearchBudget:
+        return SearchBudget(max_seconds=self.timeout, max_arguments=self.max_exponential_size)
+
+    def _measure(self, arguments, attacks, backend, semantics):
+        """Une mesure sur un agent neuf, pour ne profiter d'aucun cache."""
+        agent = FrameworkGenerator.build_agent(arguments, attacks, backend, self._budget())
+        gc.collect()
+        start = time.perf_counter()
+        try:
+            result = agent._get_extensions(semantics)
+        except BudgetExceeded as e:
+            return {'status': 'budget', 'seconds': time.perf_counter() - start, 'error': str(e)}, None
+        except Exception as e:
+            return {'status': 'error', 'seconds': time.perf_counter() - start, 'error': repr(e)}, None
+        record = {'status': 'ok', 'seconds': time.perf_counter() - start, 'result_size': len(result)}
+
+        if backend == 'tweety':
+            record['jvm_memory_bytes'] = _jvm_used_memory()
+        if self.measure_memory and backend != 'tweety':
+            # Tweety : appels non interruptibles et mémoire hors de portée de tracemalloc
+            budget = SearchBudget(max_seconds=self.timeout * MEMORY_TIMEOUT_FACTOR,
+                                  max_arguments=self.max_exponential_size)
+            agent = FrameworkGenerator.build_agent(arguments, attacks, backend, budget)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                agent._get_extensions(semantics)
+                record['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+            except BudgetExceeded as e:
+                record['error'] = f"mesure mémoire abandonnée : {e}"
+            finally:
+                tracemalloc.stop()
+        return record, result
+
+    def run(self, families=None, sizes=(100, 1000), semantics=None, backends=('native',), seeds=(0,)):
+        """Lance la campagne et renvoie la liste des mesures."""
+        families = families or list(FRAMEWORK_FAMILIES)
+        semantics = semantics or [s for s in SUPPORTED_SEMANTICS if s != 'admissible']
+        available = [b for b in backends if b != 'tweety' or jpype.isJVMStarted()]
+        for backend in backends:
+            if backend not in available:
+                print(f"⚠️  Backend '{backend}' ignoré : la JVM n'est pas démarrée")
+
+        for family in families:
+            generator = FRAMEWORK_FAMILIES[family]
+            for size in sizes:
+                for seed in seeds:
+                    arguments, attacks = generator(size, seed=seed)
+                    for sem in semantics:
+                        outcomes = {}
+                        for backend in available:
+                            record, result = self._measure(arguments, attacks, backend, sem)
+                            record.update({
+                                'family': family, 'size': size, 'seed': seed, 'num_attacks': len(attacks),
+                                'backend': backend, 'semantics': sem,
+                            })
+                            outcomes[backend] = result
+                            self.records.append(record)
+                            print(f"{family:16s} n={size:6d} {backend:7s} {sem:12s} "
+                                  f"{record['status']:6s} {record['seconds']:.3f}s")
+                        self._mark_agreement(outcomes)
+        return self.records
+
+    def _mark_agreement(self, outcomes: dict):
+        """Compare les résultats des backends ayant tous deux abouti."""
+        finished = {backend: result for backend, result in outcomes.items() if result is not None}
+        if len(finished) < 2:
+            return
+        normalized = [sorted(result) for result in finished.values()]
+        agrees = all(r == normalized[0] for r in normalized)
+        for record in self.records[-len(outcomes):]:
+            if record['backend'] in finished:
+                record['agrees'] = agrees
+
+    def write_json(self, filename: str):
+        data = {
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'timeout': self.timeout,
+                'max_exponential_size': self.max_exponential_size,
+                'exponential_semantics': list(EXPONENTIAL_SEMANTICS),
+            },
+            'records': self.records,
+        }
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2)
+        print(f"Résultats exportés vers {filename}")
+
+    def write_csv(self, filename: str):
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for record in self.records:
+                writer.writerow({field: record.get(field) for field in CSV_FIELDS})
+        print(f"Résultats exportés vers {filename} (format CSV)")
+
+
+def start_jvm():
+    """Démarre la JVM avec les JAR Tweety du dépôt (comme la démo de agent.py)."""
+    if jpype.isJVMStarted():
+        return
+    libs_dir = Path(__file__).parent.parent / 'libs' / 'tweety'
+    jar_files = glob.glob(str(libs_dir / '*.jar'))
+    if not jar_files:
+        raise FileNotFoundError(f"Aucun JAR trouvé dans {libs_dir}")
+    jpype.startJVM(jpype.getDefaultJVMPath(), "-ea", f"-Djava.class.path={os.pathsep.join(jar_files)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark à grande échelle des sémantiques de Dung')
+    parser.add_argument('--families', nargs='+', choices=list(FRAMEWORK_FAMILIES), help='Familles de graphes')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[100, 1000, 10000], help='Nombres d\'arguments')
+    parser.add_argument('--semantics', nargs='+', choices=SUPPORTED_SEMANTICS, help='Sémantiques mesurées')
+    parser.add_argument('--backends', nargs='+', choices=['native', 'tweety'], default=['native'])
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0], help='Graines des générateurs')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Budget de temps par sémantique (s)')
+    parser.add_argument('--max-exponential-size', type=int, help='Taille max. pour les sémantiques exponentielles')
+    parser.add_argument('--memory', action='store_true',
+                        help='Mesurer le pic mémoire Python (relance native sous tracemalloc)')
+    parser.add_argument('--json', help='Fichier JSON de sortie')
+    parser.add_argument('--csv', help='Fichier CSV de sortie')
+    args = parser.parse_args()
+
+    if 'tweety' in args.backends:
+        start_jvm()
+    benchmark = ScalableBenchmark(args.timeout, args.max_exponential_size, args.memory)
+    benchmark.run(args.families, args.sizes, args.semantics, args.backends, args.seeds)
+    if args.json:
+        benchmark.write_json(args.json)
+    if args.csv:
+        benchmark.write_csv(args.csv)
+
+
+if __name__ == "__main__":
+    main()
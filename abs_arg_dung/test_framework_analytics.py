@@ -0,0 +1,67 @@
+import random
+import time
+import unittest
+
+import networkx as nx
+
+from framework_analytics import analyze_structure
+
+
+class TestFrameworkAnalytics(unittest.TestCase):
+
+    def test_chain_is_acyclic(self):
+        props = analyze_structure(['a', 'b', 'c'], [('a', 'b'), ('b', 'c')])
+        self.assertTrue(props['is_acyclic'])
+        self.assertFalse(props['has_cycles'])
+        self.assertEqual(props['num_sccs'], 3)
+        self.assertEqual(props['cycles'], [])
+
+    def test_odd_cycle(self):
+        props = analyze_structure(['a', 'b', 'c'], [('a', 'b'), ('b', 'c'), ('c', 'a')])
+        self.assertTrue(props['has_odd_cycle'])
+        self.assertFalse(props['has_even_cycle'])
+        self.assertEqual(props['sccs'], [['a', 'b', 'c']])
+
+    def test_even_cycle(self):
+        props = analyze_structure(['a', 'b'], [('a', 'b'), ('b', 'a')])
+        self.assertFalse(props['has_odd_cycle'])
+        self.assertTrue(props['has_even_cycle'])
+
+    def test_self_attack(self):
+        props = analyze_structure(['a', 'b'], [('a', 'a'), ('a', 'b')])
+        self.assertEqual(props['self_attacking'], ['a'])
+        self.assertTrue(props['has_odd_cycle'])
+        self.assertEqual(props['cycles'], [['a']])
+
+    def test_against_simple_cycles(self):
+        """Les indicateurs concordent avec l'énumération complète sur de petits graphes"""
+        rng = random.Random(0)
+        for _ in range(200):
+            arguments = [f"a{i}" for i in range(rng.randint(1, 7))]
+            attacks = [(a, b) for a in arguments for b in arguments if rng.random() < 0.3]
+            graph = nx.DiGraph()
+            graph.add_nodes_from(arguments)
+            graph.add_edges_from(attacks)
+            cycles = list(nx.simple_cycles(graph))
+            props = analyze_structure(arguments, attacks, max_cycles=1000)
+            self.assertEqual(props['has_cycles'], bool(cycles))
+            self.assertEqual(props['has_odd_cycle'], any(len(c) % 2 for c in cycles))
+            self.assertEqual(props['has_even_cycle'], any(len(c) % 2 == 0 for c in cycles))
+            self.assertEqual(len(props['cycles']), len(cycles))
+
+    def test_dense_framework_is_bounded(self):
+        """Un framework dense (exponentiellement de cycles) reste rapide"""
+        arguments = [f"a{i}" for i in range(60)]
+        attacks = [(a, b) for a in arguments for b in arguments if a != b]
+        start = time.time()
+        props = analyze_structure(arguments, attacks, max_cycles=10)
+        self.assertLess(time.time() - start, 5.0)
+        self.assertEqual(len(props['cycles']), 10)
+        self.assertTrue(props['cycles_truncated'])
+        self.assertEqual(props['largest_scc_size'], 60)
+        self.assertTrue(props['has_odd_cycle'])
+        self.assertTrue(props['has_even_cycle'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+import itertools
+import random
+import unittest
+
+import jpype
+
+from agent import DungAgent
+from native_semantics import NativeDungSolver, SearchBudget, BudgetExceeded
+
+SEMANTICS = ['grounded', 'preferred', 'stable', 'complete', 'admissible', 'ideal', 'semi_stable']
+
+
+def brute_force(arguments, attacks, semantics):
+    """Référence naïve : énumère tous les sous-ensembles d'arguments."""
+    attacks = set(attacks)
+    subsets = [frozenset(c) for r in range(len(arguments) + 1) for c in itertools.combinations(arguments, r)]
+
+    def attacked_by(s):
+        return {b for (a, b) in attacks if a in s}
+
+    def conflict_free(s):
+        return not any((a, b) in attacks for a in s for b in s)
+
+    def defends(s, x):
+        return all(a in attacked_by(s) for (a, b) in attacks if b == x)
+
+    admissible = [s for s in subsets if conflict_free(s) and all(defends(s, x) for x in s)]
+    complete = [s for s in admissible if {x for x in arguments if defends(s, x)} == set(s)]
+    preferred = [s for s in admissible if not any(s < t for t in admissible)]
+    stable = [s for s in complete if set(s) | attacked_by(s) == set(arguments)]
+    reach = {s: set(s) | attacked_by(s) for s in complete}
+    semi_stable = [s for s in complete if not any(reach[s] < reach[t] for t in complete)]
+    common = frozenset.intersection(*preferred) if preferred else frozenset()
+    ideal = max((s for s in admissible if s <= common), key=len)
+
+    def fmt(sets):
+        return sorted(sorted(s) for s in sets)
+
+    return {
+        'grounded': sorted(min(complete, key=len)),
+        'preferred': fmt(preferred),
+        'stable': fmt(stable),
+        'complete': fmt(complete),
+        'admissible': fmt(admissible),
+        'ideal': sorted(ideal),
+        'semi_stable': fmt(semi_stable),
+    }[semantics]
+
+
+class TestNativeDungSolver(unittest.TestCase):
+
+    def test_chain(self):
+        """a -> b -> c : une seule extension {a, c}"""
+        solver = NativeDungSolver(['a', 'b', 'c'], [('a', 'b'), ('b', 'c')])
+        self.assertEqual(solver.grounded_extension(), ['a', 'c'])
+        self.assertEqual(solver.preferred_extensions(), [['a', 'c']])
+        self.assertEqual(solver.stable_extensions(), [['a', 'c']])
+
+    def test_odd_cycle(self):
+        """Cycle impair : pas d'extension stable, semi-stable = préférée vide"""
+        solver = NativeDungSolver(['a', 'b', 'c'], [('a', 'b'), ('b', 'c'), ('c', 'a')])
+        self.assertEqual(solver.grounded_extension(), [])
+        self.assertEqual(solver.preferred_extensions(), [[]])
+        self.assertEqual(solver.stable_extensions(), [])
+        self.assertEqual(solver.semi_stable_extensions(), [[]])
+
+    def test_mutual_attack(self):
+        """a <-> b : deux extensions préférées, extension idéale vide"""
+        solver = NativeDungSolver(['a', 'b'], [('a', 'b'), ('b', 'a')])
+        self.assertEqual(solver.preferred_extensions(), [['a'], ['b']])
+        self.assertEqual(solver.complete_extensions(), [[], ['a'], ['b']])
+        self.assertEqual(solver.ideal_extension(), [])
+
+    def test_unknown_semantics(self):
+        solver = NativeDungSolver(['a'], [])
+        with self.assertRaises(ValueError):
+            solver.compute('cf2')
+
+    def test_against_brute_force(self):
+        """Comparaison avec l'énumération naïve sur des frameworks aléatoires"""
+        rng = random.Random(42)
+        for _ in range(150):
+            arguments = [f"a{i}" for i in range(rng.randint(1, 6))]
+            attacks = [(a, b) for a in arguments for b in arguments if rng.random() < 0.25]
+            solver = NativeDungSolver(arguments, attacks)
+            for semantics in SEMANTICS:
+                self.assertEqual(solver.compute(semantics), brute_force(arguments, attacks, semantics),
+                                 f"{semantics} sur {attacks}")
+
+    def test_large_framework(self):
+        """Un framework de plusieurs centaines d'arguments reste traitable"""
+        rng = random.Random(7)
+        arguments = [f"a{i}" for i in range(300)]
+        attacks = [(rng.choice(arguments), rng.choice(arguments)) for _ in range(600)]
+        solver = NativeDungSolver(arguments, attacks)
+        grounded = set(solver.grounded_extension())
+        for extension in solver.preferred_extensions():
+            self.assertTrue(grounded <= set(extension))
+
+    def test_incremental_updates(self):
+        """Les modifications en place donnent les mêmes extensions qu'un recalcul complet"""
+        rng = random.Random(11)
+        for _ in range(40):
+            solver = NativeDungSolver([], [])
+            arguments, attacks = [], []
+            for step in range(15):
+                if not arguments or rng.random() < 0.3:
+                    arguments.append(f"a{step}")
+                    solver.add_argument(arguments[-1])
+                else:
+                    attacks.append((rng.choice(arguments), rng.choice(arguments)))
+                    solver.add_attack(*attacks[-1])
+                fresh = NativeDungSolver(arguments, attacks)
+                for semantics in ['grounded', 'preferred', 'stable', 'complete', 'semi_stable']:
+                    self.assertEqual(solver.compute(semantics), fresh.compute(semantics))
+
+    def test_incremental_reuses_upstream(self):
+        """Une attaque en aval ne relance pas la recherche des SCC en amont"""
+        solver = NativeDungSolver(['a', 'b', 'c', 'd'], [('a', 'b'), ('b', 'a'), ('b', 'c')])
+        solver.preferred_extensions()
+        upstream = next(scc for scc in solver.sccs() if scc == 0b11)
+        cached = solver._local_cache[upstream]
+        solver.add_attack('c', 'd')
+        self.assertEqual(solver.preferred_extensions(), [['a', 'c'], ['b', 'd']])
+        self.assertIs(solver._local_cache[upstream], cached)
+
+    def test_native_agent(self):
+        """Un DungAgent natif fonctionne sans JVM"""
+        agent = DungAgent(backend='native')
+        for name in ['a', 'b', 'c']:
+            agent.add_argument(name)
+        agent.add_attack('a', 'b')
+        agent.add_attack('b', 'c')
+        self.assertEqual(agent.get_grounded_extension(), ['a', 'c'])
+        self.assertEqual(agent.get_attacks(), [('a', 'b'), ('b', 'c')])
+
+    def test_lazy_semantics(self):
+        """Le statut d'un argument n'énumère pas les ensembles admissibles"""
+        agent = DungAgent(backend='native')
+        for i in range(40):
+            agent.add_argument(f"a{i}")
+        for i in range(39):
+            agent.add_attack(f"a{i}", f"a{i + 1}")
+        agent.get_grounded_extension()
+        self.assertEqual(set(agent._cached_extensions), {'grounded'})
+        self.assertTrue(agent.get_argument_status('a0')['skeptically_accepted'])
+        self.assertNotIn('admissible', agent._cached_extensions)
+
+    def test_budget(self):
+        """Les énumérations exponentielles sont coupées au-delà du budget"""
+        agent = DungAgent(backend='native', budget=SearchBudget(max_extensions=10))
+        for i in range(8):
+            agent.add_argument(f"a{i}")
+        self.assertEqual(len(agent.get_grounded_extension()), 8)
+        self.assertEqual(agent.get_preferred_extensions(), [[f"a{i}" for i in range(8)]])
+        with self.assertRaises(BudgetExceeded):
+            agent.get_admissible_sets()
+
+        small = DungAgent(backend='native', budget=SearchBudget(max_arguments=3))
+        for name in ['a', 'b', 'c', 'd']:
+            small.add_argument(name)
+        self.assertEqual(small.get_grounded_extension(), ['a', 'b', 'c', 'd'])
+        with self.assertRaises(BudgetExceeded) as context:
+            small.get_stable_extensions()
+        self.assertEqual(context.exception.semantics, 'stable')
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            DungAgent(backend='clingo')
+
+
+class TestNativeAgentAgainstBruteForce(unittest.TestCase):
+    """Vérification sans JVM des réponses du DungAgent natif (voir TestNativeAgainstTweety)."""
+
+    def test_same_extensions(self):
+        """Les méthodes de l'agent natif donnent les extensions de l'énumération naïve"""
+        rng = random.Random(3)
+        for _ in range(60):
+            arguments = [f"a{i}" for i in range(rng.randint(1, 8))]
+            attacks = [(a, b) for a in arguments for b in arguments if rng.random() < 0.25]
+            agent = DungAgent(backend='native')
+            for name in arguments:
+                agent.add_argument(name)
+            for source, target in attacks:
+                agent.add_attack(source, target)
+
+            reference = {semantics: brute_force(arguments, attacks, semantics) for semantics in SEMANTICS}
+            self.assertEqual(agent.get_grounded_extension(), reference['grounded'])
+            self.assertEqual(agent.get_preferred_extensions(), reference['preferred'])
+            self.assertEqual(agent.get_stable_extensions(), reference['stable'])
+            self.assertEqual(agent.get_complete_extensions(), reference['complete'])
+            self.assertEqual(agent.get_admissible_sets(), reference['admissible'])
+            self.assertEqual(agent.get_ideal_extension(), reference['ideal'])
+            self.assertEqual(agent.get_semi_stable_extensions(), reference['semi_stable'])
+
+            for name, status in agent.get_all_arguments_status().items():
+                self.assertEqual(status, {
+                    'credulously_accepted': any(name in ext for ext in reference['preferred']),
+                    'skeptically_accepted': all(name in ext for ext in reference['preferred']),
+                    'grounded_accepted': name in reference['grounded'],
+                    'stable_accepted': any(name in ext for ext in reference['stable']),
+                }, f"{name} sur {attacks}")
+
+
+@unittest.skipUnless(jpype.isJVMStarted(), "La JVM Tweety n'est pas démarrée")
+class TestNativeAgainstTweety(unittest.TestCase):
+
+    def test_same_extensions(self):
+        """Les deux backends donnent les mêmes extensions"""
+        rng = random.Random(3)
+        for _ in range(20):
+            arguments = [f"a{i}" for i in range(rng.randint(1, 7))]
+            attacks = [(a, b) for a in arguments for b in arguments if rng.random() < 0.25]
+            tweety, native = DungAgent(), DungAgent(backend='native')
+            for agent in (tweety, native):
+                for name in arguments:
+                    agent.add_argument(name)
+                for source, target in attacks:
+                    agent.add_attack(source, target)
+            self.assertEqual(sorted(tweety.get_grounded_extension()), native.get_grounded_extension())
+            self.assertEqual(sorted(tweety.get_preferred_extensions()), native.get_preferred_extensions())
+            self.assertEqual(sorted(tweety.get_stable_extensions()), native.get_stable_extensions())
+            self.assertEqual(sorted(tweety.get_complete_extensions()), native.get_complete_extensions())
+
+
+if __name__ == '__main__':
+    unittest.main()
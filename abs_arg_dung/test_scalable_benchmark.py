@@ -0,0 +1,75 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from framework_analytics import analyze_structure
+from framework_generator import FRAMEWORK_FAMILIES
+from scalable_benchmark import ScalableBenchmark
+
+
+class TestFrameworkFamilies(unittest.TestCase):
+
+    def test_generators_are_seeded(self):
+        for name, generator in FRAMEWORK_FAMILIES.items():
+            self.assertEqual(generator(200, seed=3), generator(200, seed=3), name)
+            arguments, attacks = generator(200, seed=3)
+            self.assertEqual(len(arguments), 200)
+            names = set(arguments)
+            self.assertTrue(all(s in names and t in names for s, t in attacks))
+
+    def test_layered_is_acyclic(self):
+        arguments, attacks = FRAMEWORK_FAMILIES['layered_acyclic'](500, seed=1)
+        self.assertTrue(analyze_structure(arguments, attacks)['is_acyclic'])
+
+    def test_large_sizes(self):
+        """Les générateurs restent quasi linéaires jusqu'à 10k arguments"""
+        for generator in FRAMEWORK_FAMILIES.values():
+            arguments, attacks = generator(10000, seed=0)
+            self.assertEqual(len(arguments), 10000)
+            self.assertLess(len(attacks), 100000)
+
+
+class TestScalableBenchmark(unittest.TestCase):
+
+    def test_run_and_export(self):
+        benchmark = ScalableBenchmark(timeout=5.0, measure_memory=True)
+        records = benchmark.run(families=['grid', 'iccma'], sizes=[30], semantics=['grounded', 'preferred'])
+        self.assertEqual(len(records), 4)
+        for record in records:
+            self.assertEqual(record['status'], 'ok')
+            self.assertIn('peak_memory_bytes', record)
+
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, 'results.json')
+            csv_path = os.path.join(directory, 'results.csv')
+            benchmark.write_json(json_path)
+            benchmark.write_csv(csv_path)
+            with open(json_path) as f:
+                self.assertEqual(len(json.load(f)['records']), 4)
+            with open(csv_path) as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(rows[0]['backend'], 'native')
+
+    def test_budget_is_recorded(self):
+        benchmark = ScalableBenchmark(max_exponential_size=10, measure_memory=False)
+        records = benchmark.run(families=['erdos_renyi'], sizes=[50], semantics=['grounded', 'stable'])
+        self.assertEqual([r['status'] for r in records], ['ok', 'budget'])
+
+    def test_memory_measure_is_opt_in_and_budgeted(self):
+        records = ScalableBenchmark().run(families=['grid'], sizes=[30], semantics=['grounded'])
+        self.assertNotIn('peak_memory_bytes', records[0])
+
+        # Mesure mémoire hors budget : abandonnée, la mesure de temps reste valide
+        with patch('scalable_benchmark.MEMORY_TIMEOUT_FACTOR', -1.0):
+            benchmark = ScalableBenchmark(timeout=5.0, measure_memory=True)
+            records = benchmark.run(families=['erdos_renyi'], sizes=[30], semantics=['preferred'])
+        self.assertEqual(records[0]['status'], 'ok')
+        self.assertNotIn('peak_memory_bytes', records[0])
+        self.assertIn('mesure mémoire abandonnée', records[0]['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
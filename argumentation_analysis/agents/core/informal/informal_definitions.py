@@ -44,6 +44,7 @@ from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterM
 from argumentation_analysis.core.utils.file_loaders import load_csv_file
 from argumentation_analysis.utils.taxonomy_loader import get_taxonomy_path
 from argumentation_analysis.paths import DATA_DIR # Assurer que DATA_DIR est importé si nécessaire ailleurs
+from .taxonomy_model import TaxonomyModel
 
 # Configuration du logging
 logging.basicConfig(
@@ -79,6 +80,8 @@ class InformalAnalysisPlugin:
         _current_taxonomy_path (Path): Chemin effectif utilisé pour charger la taxonomie.
         _taxonomy_df_cache (Optional[pd.DataFrame]): Cache pour le DataFrame afin
             d'optimiser les accès répétés.
+        _taxonomy_model (Optional[TaxonomyModel]): Modèle immuable (colonnes en
+            lecture seule, enfants précalculés) construit une fois à partir du cache.
     """
 
     def __init__(self, taxonomy_file_path: Optional[str] = None):
@@ -108,8 +111,9 @@ class InformalAnalysisPlugin:
             self._current_taxonomy_path = get_taxonomy_path()
             self._logger.info(f"Utilisation du chemin de taxonomie fourni par le loader: {self._current_taxonomy_path}")
             
-        # Cache pour le DataFrame de taxonomie
+        # Cache pour le DataFrame de taxonomie et le modèle immuable associé
         self._taxonomy_df_cache = None
+        self._taxonomy_model = None
     
     def _internal_load_and_prepare_dataframe(self) -> pd.DataFrame:
         """
@@ -124,6 +128,10 @@ class InformalAnalysisPlugin:
             df = load_csv_file(self._current_taxonomy_path)
             if df is None:
                 raise Exception(f"Impossible de charger la taxonomie depuis {self._current_taxonomy_path}")
+
+            # Profondeur numérique dès le chargement (évite une conversion à chaque exploration)
+            if 'depth' in df.columns and not pd.api.types.is_numeric_dtype(df['depth']):
+                df['depth'] = pd.to_numeric(df['depth'], errors='coerce')
             
             self._logger.info(f"Taxonomie chargée : {len(df)} entrées. Standardisation des types de clés...")
 
@@ -182,12 +190,35 @@ class InformalAnalysisPlugin:
         retourne la version en cache pour les appels suivants.
 
         Returns:
-            pd.DataFrame: Une copie du DataFrame de la taxonomie pour éviter
-            les modifications involontaires du cache.
+            pd.DataFrame: Le DataFrame partagé de la taxonomie (sans copie).
+            Il doit être traité en lecture seule.
         """
         if self._taxonomy_df_cache is None:
             self._taxonomy_df_cache = self._internal_load_and_prepare_dataframe()
-        return self._taxonomy_df_cache.copy() # Retourner une copie pour éviter les modifications accidentelles du cache
+        return self._taxonomy_df_cache
+
+    def _get_taxonomy_model(self, df: Optional[pd.DataFrame] = None) -> TaxonomyModel:
+        """
+        Retourne le modèle immuable de la taxonomie.
+
+        Le modèle du DataFrame en cache est construit une seule fois et partagé.
+        Un autre DataFrame (fourni explicitement, ex. dans les tests) donne un
+        modèle construit à la volée.
+
+        Args:
+            df (Optional[pd.DataFrame]): Le DataFrame à modéliser. Par défaut,
+                celui du cache.
+
+        Returns:
+            TaxonomyModel: Le modèle correspondant.
+        """
+        if df is None:
+            df = self._get_taxonomy_dataframe()
+        if df is not self._taxonomy_df_cache:
+            return TaxonomyModel(df)
+        if self._taxonomy_model is None or self._taxonomy_model.frame is not df:
+            self._taxonomy_model = TaxonomyModel(df)
+        return self._taxonomy_model
     
     def _internal_explore_hierarchy(self, current_pk: int, df: pd.DataFrame, max_children: int = 15) -> Dict[str, Any]:
         """
@@ -218,94 +249,43 @@ class InformalAnalysisPlugin:
             self._logger.debug("DEBUG: Exiting _internal_explore_hierarchy (df is None)")
             return result
         
-        # Convertir les colonnes numériques
-        if 'depth' in df.columns and not pd.api.types.is_numeric_dtype(df['depth']):
-            df['depth'] = pd.to_numeric(df['depth'], errors='coerce')
+        model = self._get_taxonomy_model(df)
         
         # Trouver le nœud courant
-        current_node_df = df.loc[df.index == current_pk] if current_pk in df.index else pd.DataFrame()
-        if len(current_node_df) == 0:
+        if current_pk not in model:
             result["error"] = f"PK {current_pk} non trouvée dans la taxonomie."
             return result
         
         # Extraire les informations du nœud courant
-        current_row = current_node_df.iloc[0]
-        # Utiliser une valeur par défaut pour path si elle n'existe pas
-        current_path = current_row.get('path', '') # .get est disponible sur les Series pandas
-        
+        current_depth = model.depth(current_pk)
         result["current_node"] = {
-            "pk": int(current_row.name), # PK est l'index
-            "path": current_path,
-            "depth": int(current_row['depth']) if pd.notna(current_row.get('depth')) else 0,
-            "Name": current_row.get('Name', ''), # Utiliser la colonne 'Name' du CSV
-            "nom_vulgarise": current_row.get('nom_vulgarise', ''), # nom_vulgarise (peut être redondant ou un alias)
-            "famille": current_row.get('Famille', ''),             # Famille
-            "description_courte": current_row.get('text_fr', '')   # text_fr comme description courte
+            "pk": int(current_pk),
+            "path": model.value(current_pk, 'path'),
+            "depth": current_depth if current_depth is not None else 0,
+            "Name": model.value(current_pk, 'Name'), # Utiliser la colonne 'Name' du CSV
+            "nom_vulgarise": model.value(current_pk, 'nom_vulgarise'), # nom_vulgarise (peut être redondant ou un alias)
+            "famille": model.value(current_pk, 'Famille'),             # Famille
+            "description_courte": model.value(current_pk, 'text_fr')   # text_fr comme description courte
         }
         
-        # Trouver les enfants
-        children_df = pd.DataFrame() # Initialiser à un DataFrame vide
-        if 'FK_Parent' in df.columns:
-            # Si FK_Parent existe, l'utiliser pour trouver les enfants
-            children_df = df[df['FK_Parent'] == current_pk]
-        elif 'parent_pk' in df.columns:
-            # Si parent_pk existe, l'utiliser pour trouver les enfants
-            children_df = df[df['parent_pk'] == current_pk]
-        elif 'path' in df.columns and current_path:
-            # Si path existe, l'utiliser pour trouver les enfants
-            # S'assurer que current_path se termine par un point pour éviter les correspondances partielles incorrectes
-            # Exemple: si current_path est "1", on ne veut pas matcher "10.x"
-            # On cherche les enfants directs, donc le path de l'enfant doit être current_path + ".quelquechose"
-            # et ne pas contenir d'autres points après "quelquechose".
-            # Exemple: si current_path = "1", on cherche "1.X" mais pas "1.X.Y"
-            # Si current_path = "1.2", on cherche "1.2.X" mais pas "1.2.X.Y"
-            
-            # Construire le préfixe attendu pour les enfants directs
-            child_path_prefix = str(current_path) + "."
-            
-            # Filtrer les enfants qui commencent par ce préfixe
-            potential_children = df[df['path'].astype(str).str.startswith(child_path_prefix, na=False)]
-            
-            # Filtrer pour ne garder que les enfants directs (pas les petits-enfants, etc.)
-            # Un enfant direct aura un path qui, une fois le préfixe retiré, ne contient plus de "."
-            children_df = potential_children[~potential_children['path'].astype(str).str.slice(start=len(child_path_prefix)).str.contains('.', na=False, regex=False)]
-
-        elif 'depth' in df.columns and pd.notna(current_row.get('depth')):
-             # Si depth existe et que le nœud courant a une profondeur,
-             # les enfants directs auront une profondeur de current_depth + 1
-             # et leur path commencera par le path du parent.
-            current_depth = int(current_row['depth'])
-            # S'assurer que current_path est une chaîne pour la comparaison str.startswith
-            current_path_str = str(current_path) if pd.notna(current_path) else ""
-
-            # Filtrer par profondeur et par le début du path
-            # (pour éviter de prendre des nœuds d'une autre branche ayant la même profondeur)
-            children_df = df[
-                (df['depth'] == current_depth + 1) &
-                (df['path'].astype(str).str.startswith(current_path_str + ('.' if current_path_str else ''), na=False))
-            ]
-        
-        children_count = len(children_df)
+        # Enfants directs précalculés par le modèle (FK_Parent, parent_pk, path ou depth)
+        children = model.children[int(current_pk)]
+        children_count = len(children)
         
         if children_count > 0:
             # Limiter le nombre d'enfants si nécessaire
             if max_children > 0 and children_count > max_children:
-                children_df = children_df.head(max_children)
+                children = children[:max_children]
                 result["children_truncated"] = True
                 result["total_children"] = children_count
             
             # Extraire les informations des enfants
-            for _, child_row in children_df.iterrows():
-                # Vérifier si l'enfant a lui-même des enfants
-                # (simplifié, une vérification plus robuste serait nécessaire pour une UI complexe)
-                # Pour cette fonction, on peut se baser sur la présence d'enfants dans le dataframe
-                # en utilisant une logique similaire à celle ci-dessus.
-                # Pour l'instant, on met False, car le but est de lister les enfants directs.
+            for child_pk in children:
                 child_info = {
-                    "pk": int(child_row.name), # .name est l'index (PK)
-                    "nom_vulgarise": child_row.get('nom_vulgarise', ''), # nom_vulgarise
-                    "description_courte": child_row.get('text_fr', ''),   # text_fr
-                    "famille": child_row.get('Famille', ''),             # Famille
+                    "pk": child_pk,
+                    "nom_vulgarise": model.value(child_pk, 'nom_vulgarise'), # nom_vulgarise
+                    "description_courte": model.value(child_pk, 'text_fr'),   # text_fr
+                    "famille": model.value(child_pk, 'Famille'),             # Famille
                     "has_children": False # Simplifié. Pourrait être calculé si besoin.
                 }
                 result["children"].append(child_info)
@@ -342,92 +322,35 @@ class InformalAnalysisPlugin:
             self._logger.debug(f"DEBUG: Exiting _internal_get_node_details (df is None) for pk={pk}")
             return result
         
-        # Convertir les colonnes numériques si elles existent et ne sont pas déjà numériques
-        if 'PK' in df.columns and not pd.api.types.is_numeric_dtype(df['PK']):
-            df['PK'] = pd.to_numeric(df['PK'], errors='coerce')
-        if 'depth' in df.columns and not pd.api.types.is_numeric_dtype(df['depth']):
-            df['depth'] = pd.to_numeric(df['depth'], errors='coerce')
+        model = self._get_taxonomy_model(df)
         
         # Trouver le nœud
-        # Correction pour la compatibilité pandas 2.x
-        # Remplacer df.loc[[pk]] par un filtrage sur l'index, plus robuste
-        node_df = df.loc[df.index == pk]
-        if len(node_df) == 0:
+        if pk not in model:
             result["error"] = f"PK {pk} non trouvée dans la taxonomie."
             return result
-        # Extraire les informations du nœud
-        row = node_df.iloc[0]
-        # Suppression des logs de débogage
-        for col in row.index: # Utiliser row.index qui contient les noms des colonnes
-            if pd.notna(row[col]):
-                # Gérer la conversion pour numpy types si nécessaire pour la sérialisation JSON
-                if hasattr(row[col], 'item'): # Typique pour les types numpy (int64, float64, etc.)
-                    result[col] = row[col].item()
-                else:
-                    result[col] = row[col]
+        # Extraire les informations du nœud (valeurs non manquantes, types Python pour la sérialisation JSON)
+        result.update(model.non_null_items(pk))
         
         # Trouver le parent
-        parent_df = pd.DataFrame() # Initialiser
-        parent_pk_val = None
-        if 'FK_Parent' in df.columns and pd.notna(row.get('FK_Parent')):
-            parent_pk_val = row.get('FK_Parent')
-        elif 'parent_pk' in df.columns and pd.notna(row.get('parent_pk')): # Fallback
-            parent_pk_val = row.get('parent_pk')
-        
-        if parent_pk_val is not None:
-            try:
-                parent_pk_int = int(parent_pk_val)
-                parent_df = df.loc[df.index == parent_pk_int]
-            except ValueError:
-                self._logger.warning(f"Valeur FK_Parent/parent_pk non entière pour le nœud {pk}: {parent_pk_val}")
-
-        elif 'path' in df.columns:
-            # Sinon, essayer d'utiliser path
-            path_val = row.get('path', '')
-            if path_val and '.' in str(path_val): # S'assurer que path_val est une chaîne
-                parent_path = str(path_val).rsplit('.', 1)[0]
-                parent_df = df[df['path'] == parent_path]
-        
-        if len(parent_df) > 0:
-            parent_row = parent_df.iloc[0]
+        parent_pk = model.parent[int(pk)]
+        if parent_pk is not None:
             result["parent"] = {
-                "pk": int(parent_row.name), # .name est l'index (PK)
-                "nom_vulgarise": parent_row.get('nom_vulgarise', ''), # nom_vulgarise
-                "description_courte": parent_row.get('text_fr', ''),   # text_fr
-                "famille": parent_row.get('Famille', '')              # Famille
+                "pk": parent_pk,
+                "nom_vulgarise": model.value(parent_pk, 'nom_vulgarise'), # nom_vulgarise
+                "description_courte": model.value(parent_pk, 'text_fr'),   # text_fr
+                "famille": model.value(parent_pk, 'Famille')              # Famille
             }
         
-        # Trouver les enfants (logique similaire à _internal_explore_hierarchy)
-        # children_list = [] # Renommé pour éviter conflit
-        # Pour être plus précis, on reprend la logique de _internal_explore_hierarchy pour les enfants directs
-        
-        child_nodes_for_details = pd.DataFrame()
-        current_path_for_children = row.get('path', '')
-        current_depth_for_children = row.get('depth', None)
-        
-        if 'FK_Parent' in df.columns:
-            child_nodes_for_details = df[df['FK_Parent'] == pk]
-        elif 'parent_pk' in df.columns:
-            child_nodes_for_details = df[df['parent_pk'] == pk]
-        elif 'path' in df.columns and current_path_for_children:
-            child_path_prefix = str(current_path_for_children) + "."
-            potential_children = df[df['path'].astype(str).str.startswith(child_path_prefix, na=False)]
-            child_nodes_for_details = potential_children[~potential_children['path'].astype(str).str.slice(start=len(child_path_prefix)).str.contains('.', na=False, regex=False)]
-        elif 'depth' in df.columns and pd.notna(current_depth_for_children):
-            current_path_str_for_children = str(current_path_for_children) if pd.notna(current_path_for_children) else ""
-            child_nodes_for_details = df[
-                (df['depth'] == int(current_depth_for_children) + 1) &
-                (df['path'].astype(str).str.startswith(current_path_str_for_children + ('.' if current_path_str_for_children else ''), na=False))
-            ]
-
-        if len(child_nodes_for_details) > 0:
+        # Trouver les enfants (mêmes règles que _internal_explore_hierarchy)
+        children = model.children[int(pk)]
+        if children:
             result["children"] = []
-            for _, child_row_detail in child_nodes_for_details.iterrows():
+            for child_pk in children:
                 child_info_detail = {
-                    "pk": int(child_row_detail.name),
-                    "nom_vulgarise": child_row_detail.get('nom_vulgarise', ''), # nom_vulgarise
-                    "description_courte": child_row_detail.get('text_fr', ''),   # text_fr
-                    "famille": child_row_detail.get('Famille', '')              # Famille
+                    "pk": child_pk,
+                    "nom_vulgarise": model.value(child_pk, 'nom_vulgarise'), # nom_vulgarise
+                    "description_courte": model.value(child_pk, 'text_fr'),   # text_fr
+                    "famille": model.value(child_pk, 'Famille')              # Famille
                 }
                 result["children"].append(child_info_detail)
         
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Index compilé de la taxonomie des sophismes.
+
+Construit une seule fois à partir du DataFrame de la taxonomie, il remplace
+les parcours `df.iterrows()` répétés à chaque requête :
+
+- un automate d'Aho–Corasick sur les termes de détection (noms, noms
+  vulgarisés, mots-clés des descriptions) : la détection devient un seul
+  passage sur le texte, quelle que soit la taille de la taxonomie ;
+- les champs textuels déjà normalisés (minuscules) pour la recherche par motif ;
+- les groupes de frères déduits de la colonne `path` (la hiérarchie complète,
+  avec ses règles de résolution, est celle de `TaxonomyModel`).
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from argumentation_analysis.nlp.aho_corasick import AhoCorasick
+
+# Poids des correspondances (identiques à l'heuristique lexicale historique)
+WEIGHT_NOM_VULGARISE = 0.7
+WEIGHT_NAME = 0.5
+WEIGHT_KEYWORD = 0.1
+# Mots-clés : les premiers mots significatifs de la description
+MAX_KEYWORDS = 5
+MIN_KEYWORD_LENGTH = 5
+
+# Poids de la recherche par motif, par champ
+SEARCH_WEIGHTS = (
+    ('nom_vulgarise', 0.8),
+    ('name', 0.6),
+    ('description', 0.4),
+    ('famille', 0.3),
+)
+
+
+def _text(value: Any) -> str:
+    """Convertit une cellule en chaîne ; les valeurs manquantes donnent ''."""
+    if value is None:
+        return ''
+    try:
+        if pd.isna(value):
+            return ''
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+class TaxonomyIndex:
+    """
+    Vue précompilée et en lecture seule d'un DataFrame de taxonomie (indexé par PK).
+
+    Attributes:
+        keys (List[int]): Les PK, dans l'ordre du DataFrame.
+        records (Dict[int, Dict[str, Any]]): Champs d'affichage de chaque nœud.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.keys: List[int] = []
+        self.records: Dict[int, Dict[str, Any]] = {}
+        self._position: Dict[int, int] = {}
+        self._search_fields: Dict[int, Dict[str, str]] = {}
+        # Termes de détection par nœud, dans l'ordre de l'heuristique :
+        # (libellé, terme, poids), doublons compris.
+        self._terms: Dict[int, List[Tuple[str, str, float]]] = {}
+        self._term_owners: Dict[str, List[int]] = {}
+        self._automaton = AhoCorasick()
+
+        # Nœuds regroupés par chemin parent : les frères restent liés même si
+        # le nœud parent est absent du fichier.
+        self._children_by_path: Dict[str, List[int]] = {}
+
+        for position, (pk, row) in enumerate(zip(df.index, df.to_dict('records'))):
+            key = int(pk)
+            self.keys.append(key)
+            self._position[key] = position
+            self._add_record(key, row)
+
+        self._automaton.build()
+
+    def _add_record(self, key: int, row: Dict[str, Any]) -> None:
+        name = _text(row.get('Name'))
+        nom_vulgarise = _text(row.get('nom_vulgarisé'))
+        famille = _text(row.get('Famille'))
+        description = _text(row.get('text_fr'))
+        path = _text(row.get('path'))
+        depth = pd.to_numeric(row.get('depth'), errors='coerce')
+
+        self.records[key] = {
+            'taxonomy_key': key,
+            'name': row.get('Name', ''),
+            'nom_vulgarise': row.get('nom_vulgarisé', ''),
+            'famille': row.get('Famille', ''),
+            'description': row.get('text_fr', ''),
+            'depth': int(depth) if pd.notna(depth) else 0,
+            'path': row.get('path', ''),
+        }
+
+        fields = {
+            'name': name.lower(),
+            'nom_vulgarise': nom_vulgarise.lower(),
+            'description': description.lower(),
+            'famille': famille.lower(),
+        }
+        self._search_fields[key] = fields
+
+        terms = []
+        if fields['nom_vulgarise']:
+            terms.append((f"Nom vulgarisé: '{fields['nom_vulgarise']}'", fields['nom_vulgarise'], WEIGHT_NOM_VULGARISE))
+        if fields['name']:
+            terms.append((f"Nom officiel: '{fields['name']}'", fields['name'], WEIGHT_NAME))
+        keywords = [w for w in fields['description'].split() if len(w) >= MIN_KEYWORD_LENGTH]
+        for word in keywords[:MAX_KEYWORDS]:
+            terms.append((f"Mot-clé: '{word}'", word, WEIGHT_KEYWORD))
+        self._terms[key] = terms
+
+        for _, term, _ in terms:
+            owners = self._term_owners.setdefault(term, [])
+            if not owners or owners[-1] != key:
+                owners.append(key)
+            self._automaton.add(term)
+
+        parent_path = self.parent_path(key)
+        if parent_path is not None:
+            self._children_by_path.setdefault(parent_path, []).append(key)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self.records
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def parent_path(self, key: int) -> Optional[str]:
+        """Chemin du parent d'après `path` ('1.2.3' -> '1.2'), ou None pour une racine."""
+        path = _text(self.records[key]['path']) if key in self.records else ''
+        if '.' not in path:
+            return None
+        return path.rsplit('.', 1)[0]
+
+    def siblings(self, key: int) -> List[int]:
+        """Nœuds de même parent que `key` (hors `key`), dans l'ordre de la taxonomie."""
+        parent_path = self.parent_path(key)
+        if parent_path is None:
+            return []
+        return [k for k in self._children_by_path[parent_path] if k != key]
+
+    def match(self, text: str) -> List[Tuple[int, float, List[str]]]:
+        """
+        Recherche tous les termes de détection dans `text` en un seul passage.
+
+        Returns:
+            List[Tuple[int, float, List[str]]]: Pour chaque nœud ayant au moins
+            une correspondance, dans l'ordre de la taxonomie : (PK, score brut,
+            libellés des correspondances).
+        """
+        found = self._automaton.find_all(text.lower())
+        if not found:
+            return []
+        candidates: Set[int] = set()
+        for term in found:
+            candidates.update(self._term_owners.get(term, ()))
+
+        results = []
+        for key in sorted(candidates, key=self._position.__getitem__):
+            score = 0.0
+            matches = []
+            for label, term, weight in self._terms[key]:
+                if term in found:
+                    score += weight
+                    matches.append(label)
+            results.append((key, score, matches))
+        return results
+
+    def search(self, pattern: str) -> List[Tuple[int, float]]:
+        """Score de chaque nœud contenant `pattern` (insensible à la casse), dans l'ordre de la taxonomie."""
+        pattern_lower = pattern.lower()
+        results = []
+        for key in self.keys:
+            fields = self._search_fields[key]
+            score = 0.0
+            for field, weight in SEARCH_WEIGHTS:
+                if pattern_lower in fields[field]:
+                    score += weight
+            if score > 0:
+                results.append((key, score))
+        return results
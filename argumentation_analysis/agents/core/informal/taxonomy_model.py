@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Modèle immuable et partagé de la taxonomie des sophismes.
+
+`InformalAnalysisPlugin` construit ce modèle une seule fois à partir du
+DataFrame chargé. Il expose :
+
+- les colonnes sous forme de tableaux numpy en lecture seule (aucune copie
+  ni allocation par requête) ;
+- la position de chaque PK, pour un accès direct à une ligne ;
+- les listes d'enfants et le parent de chaque nœud, précalculés selon les
+  mêmes règles que l'exploration historique (`FK_Parent`, puis `parent_pk`,
+  puis `path`, puis `depth`).
+
+L'exploration de la hiérarchie et la lecture d'un nœud sont ainsi en
+O(nombre d'enfants) au lieu d'un filtrage du DataFrame complet par nœud.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class TaxonomyModel:
+    """
+    Vue en lecture seule, orientée colonnes, d'un DataFrame de taxonomie indexé par PK.
+
+    Attributes:
+        frame (pd.DataFrame): Le DataFrame source, partagé (à ne pas modifier).
+        keys (Tuple[int, ...]): Les PK, dans l'ordre du DataFrame.
+        columns (Tuple[str, ...]): Les noms de colonnes.
+        children (Dict[int, Tuple[int, ...]]): Enfants directs de chaque nœud.
+        parent (Dict[int, Optional[int]]): Parent de chaque nœud, s'il existe.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.frame = df
+        self.keys: Tuple[int, ...] = tuple(int(k) for k in df.index)
+        self.columns: Tuple[str, ...] = tuple(df.columns)
+        self._positions: Dict[int, int] = {}
+        for position, key in enumerate(self.keys):
+            # En cas de PK dupliquée, la première ligne fait foi (comme df.loc[...].iloc[0])
+            self._positions.setdefault(key, position)
+
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._present: Dict[str, np.ndarray] = {}
+        for column in self.columns:
+            values = df[column].to_numpy(copy=True)
+            present = ~pd.isna(values)
+            values.setflags(write=False)
+            present.setflags(write=False)
+            self._arrays[column] = values
+            self._present[column] = present
+
+        # Profondeur numérique, convertie une fois pour toutes
+        if 'depth' in df.columns:
+            depth = pd.to_numeric(df['depth'], errors='coerce').to_numpy(dtype=float, copy=True)
+        else:
+            depth = np.full(len(self.keys), np.nan)
+        depth.setflags(write=False)
+        self._depth = depth
+
+        self.children: Dict[int, Tuple[int, ...]] = {}
+        self.parent: Dict[int, Optional[int]] = {}
+        self._build_hierarchy()
+
+    # --- Accès aux données ---
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return int(key) in self._positions
+        except (TypeError, ValueError):
+            return False
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def column(self, name: str) -> Optional[np.ndarray]:
+        """Tableau (lecture seule) d'une colonne, ou None si elle n'existe pas."""
+        return self._arrays.get(name)
+
+    def value(self, key: int, column: str, default: Any = '') -> Any:
+        """Valeur brute d'une cellule (comme `row.get(column, default)`)."""
+        values = self._arrays.get(column)
+        if values is None:
+            return default
+        return values[self._positions[key]]
+
+    def depth(self, key: int) -> Optional[int]:
+        """Profondeur numérique du nœud, ou None si elle est absente."""
+        depth = self._depth[self._positions[key]]
+        return None if np.isnan(depth) else int(depth)
+
+    def non_null_items(self, key: int) -> Iterator[Tuple[str, Any]]:
+        """Couples (colonne, valeur) non manquants de la ligne, convertis en types Python."""
+        position = self._positions[key]
+        for column in self.columns:
+            if self._present[column][position]:
+                value = self._arrays[column][position]
+                yield column, value.item() if hasattr(value, 'item') else value
+
+    # --- Hiérarchie ---
+
+    def _build_hierarchy(self) -> None:
+        relation_column = next((c for c in ('FK_Parent', 'parent_pk') if c in self._arrays), None)
+        by_relation: Dict[Any, List[int]] = {}
+        by_parent_path: Dict[str, List[int]] = {}
+        by_depth: Dict[int, List[int]] = {}
+        path_to_key: Dict[str, int] = {}
+
+        path_values = self._arrays.get('path')
+        for position, key in enumerate(self.keys):
+            if relation_column is not None and self._present[relation_column][position]:
+                by_relation.setdefault(self._arrays[relation_column][position], []).append(key)
+            if path_values is not None:
+                path = str(path_values[position])
+                if '.' in path:
+                    by_parent_path.setdefault(path.rsplit('.', 1)[0], []).append(key)
+                if isinstance(path_values[position], str):
+                    path_to_key.setdefault(path_values[position], key)
+            if not np.isnan(self._depth[position]):
+                by_depth.setdefault(int(self._depth[position]), []).append(key)
+
+        for key, position in self._positions.items():
+            self.children[key] = tuple(self._direct_children(
+                key, position, relation_column, by_relation, by_parent_path, by_depth))
+            self.parent[key] = self._find_parent(key, position, path_to_key)
+
+    def _direct_children(self, key: int, position: int, relation_column: Optional[str],
+                         by_relation: Dict[Any, List[int]], by_parent_path: Dict[str, List[int]],
+                         by_depth: Dict[int, List[int]]) -> List[int]:
+        if relation_column is not None:
+            return by_relation.get(key, [])
+        path_values = self._arrays.get('path')
+        current_path = path_values[position] if path_values is not None else ''
+        if path_values is not None and current_path:
+            return by_parent_path.get(str(current_path), [])
+        current_depth = self.depth(key)
+        if path_values is not None and current_depth is not None:
+            prefix = str(current_path) if self._present['path'][position] else ''
+            prefix = prefix + '.' if prefix else ''
+            return [k for k in by_depth.get(current_depth + 1, [])
+                    if str(path_values[self._positions[k]]).startswith(prefix)]
+        return []
+
+    def _find_parent(self, key: int, position: int, path_to_key: Dict[str, int]) -> Optional[int]:
+        for column in ('FK_Parent', 'parent_pk'):
+            if column in self._arrays and self._present[column][position]:
+                try:
+                    parent_key = int(self._arrays[column][position])
+                except (TypeError, ValueError):
+                    return None
+                return parent_key if parent_key in self._positions else None
+        path_values = self._arrays.get('path')
+        if path_values is None:
+            return None
+        path = path_values[position]
+        if path and '.' in str(path):
+            return path_to_key.get(str(path).rsplit('.', 1)[0])
+        return None
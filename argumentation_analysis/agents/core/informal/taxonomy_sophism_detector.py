@@ -18,6 +18,7 @@ from pathlib import Path
 
 # Import de l'InformalAnalysisPlugin pour accéder à la taxonomie
 from .informal_definitions import InformalAnalysisPlugin
+from .taxonomy_index import TaxonomyIndex
 
 logger = logging.getLogger("TaxonomySophismDetector")
 
@@ -37,6 +38,8 @@ class TaxonomySophismDetector:
             aux données de la taxonomie.
         _taxonomy_cache (Optional[pd.DataFrame]): Cache pour le DataFrame de
             la taxonomie afin d'éviter les lectures répétées.
+        _taxonomy_index (Optional[TaxonomyIndex]): Index compilé (automate de
+            détection, hiérarchie) construit une seule fois à partir du DataFrame.
         logger: Instance du logger pour ce module.
     """
 
@@ -52,6 +55,7 @@ class TaxonomySophismDetector:
         self.logger = logging.getLogger("TaxonomySophismDetector")
         self.plugin = InformalAnalysisPlugin(taxonomy_file_path=taxonomy_file_path)
         self._taxonomy_cache = None
+        self._taxonomy_index = None
 
     def _get_taxonomy_df(self) -> pd.DataFrame:
         """
@@ -64,6 +68,18 @@ class TaxonomySophismDetector:
             self._taxonomy_cache = self.plugin._get_taxonomy_dataframe()
         return self._taxonomy_cache
 
+    def _get_taxonomy_index(self) -> TaxonomyIndex:
+        """
+        Récupère l'index compilé de la taxonomie, construit au premier appel.
+
+        Returns:
+            TaxonomyIndex: L'index partagé par toutes les détections et recherches.
+        """
+        if self._taxonomy_index is None:
+            self._taxonomy_index = TaxonomyIndex(self._get_taxonomy_df())
+            self.logger.info(f"Index de la taxonomie compilé: {len(self._taxonomy_index)} sophismes.")
+        return self._taxonomy_index
+
     def get_main_branches(self) -> List[Dict[str, Any]]:
         """
         Récupère les branches principales (racines) de la taxonomie.
@@ -152,8 +168,9 @@ class TaxonomySophismDetector:
         la taxonomie et le contenu du texte fourni.
 
         Le processus se déroule en trois étapes :
-        1.  **Analyse lexicale** : Parcourt la taxonomie et assigne un score de
-            confiance basé sur les correspondances trouvées.
+        1.  **Analyse lexicale** : Recherche en un seul passage sur le texte
+            (automate de l'index compilé) de tous les termes de la taxonomie,
+            puis assigne un score de confiance basé sur les correspondances.
         2.  **Tri et filtrage** : Trie les détections par confiance et ne conserve
             que les plus pertinentes.
         3.  **Enrichissement** : Ajoute du contexte aux sophismes détectés, comme
@@ -170,51 +187,18 @@ class TaxonomySophismDetector:
         detected_sophisms = []
         
         try:
-            df = self._get_taxonomy_df()
-            text_lower = text.lower()
+            index = self._get_taxonomy_index()
             
-            # 1. Analyse lexicale basée sur les noms et descriptions
-            for pk, row in df.iterrows():
-                confidence = 0.0
-                matches = []
-                
-                # Vérifier les correspondances avec les noms
-                name = str(row.get('Name', '')).lower()
-                nom_vulgarise = str(row.get('nom_vulgarisé', '')).lower()
-                description = str(row.get('text_fr', '')).lower()
-                
-                # Correspondance avec le nom vulgarisé (plus probable)
-                if nom_vulgarise and nom_vulgarise in text_lower:
-                    confidence += 0.7
-                    matches.append(f"Nom vulgarisé: '{nom_vulgarise}'")
-                
-                # Correspondance avec le nom officiel
-                if name and name in text_lower:
-                    confidence += 0.5
-                    matches.append(f"Nom officiel: '{name}'")
-                
-                # Correspondance avec des mots-clés de la description
-                if description:
-                    desc_words = [w for w in description.split() if len(w) > 4]
-                    for word in desc_words[:5]:  # Limiter aux 5 premiers mots significatifs
-                        if word in text_lower:
-                            confidence += 0.1
-                            matches.append(f"Mot-clé: '{word}'")
-                
+            # 1. Analyse lexicale basée sur les noms, noms vulgarisés et mots-clés
+            for pk, confidence, matches in index.match(text):
                 # Si on a des correspondances significatives
                 if confidence >= 0.3:
-                    sophism = {
-                        'taxonomy_key': int(pk),
-                        'name': row.get('Name', ''),
-                        'nom_vulgarise': row.get('nom_vulgarisé', ''),
-                        'famille': row.get('Famille', ''),
-                        'description': row.get('text_fr', ''),
+                    sophism = dict(index.records[pk])
+                    sophism.update({
                         'confidence': min(confidence, 1.0),
                         'matches': matches,
-                        'depth': int(row.get('depth', 0)),
-                        'path': row.get('path', ''),
                         'detection_method': 'taxonomy_lexical'
-                    }
+                    })
                     detected_sophisms.append(sophism)
             
             # 2. Trier par confiance et limiter
@@ -252,41 +236,28 @@ class TaxonomySophismDetector:
             une liste des nœuds frères.
         """
         try:
-            df = self._get_taxonomy_df()
+            index = self._get_taxonomy_index()
             
-            if taxonomy_key not in df.index:
+            if taxonomy_key not in index:
                 return {'siblings': []}
             
-            current_row = df.loc[taxonomy_key]
-            current_path = current_row.get('path', '')
-            
-            if not current_path:
-                return {'siblings': []}
-            
-            # Trouver le path parent
-            path_parts = str(current_path).split('.')
-            if len(path_parts) <= 1:
+            parent_path = index.parent_path(taxonomy_key)
+            if parent_path is None:
                 return {'siblings': []}
             
-            parent_path = '.'.join(path_parts[:-1])
-            
-            # Trouver les frères/sœurs (même parent)
-            siblings = df[df['path'].astype(str).str.startswith(parent_path + '.', na=False)]
-            siblings = siblings[siblings.index != taxonomy_key]  # Exclure soi-même
-            
             siblings_list = []
-            for _, sibling in siblings.iterrows():
-                sibling_info = {
-                    'taxonomy_key': int(sibling.name),
-                    'name': sibling.get('Name', ''),
-                    'nom_vulgarise': sibling.get('nom_vulgarisé', ''),
-                    'description_courte': sibling.get('text_fr', '')
-                }
-                siblings_list.append(sibling_info)
+            for sibling_key in index.siblings(taxonomy_key)[:5]:  # Limiter à 5 frères/sœurs
+                record = index.records[sibling_key]
+                siblings_list.append({
+                    'taxonomy_key': sibling_key,
+                    'name': record['name'],
+                    'nom_vulgarise': record['nom_vulgarise'],
+                    'description_courte': record['description']
+                })
             
             return {
                 'parent_path': parent_path,
-                'siblings': siblings_list[:5]  # Limiter à 5 frères/sœurs
+                'siblings': siblings_list
             }
             
         except Exception as e:
@@ -334,41 +305,13 @@ class TaxonomySophismDetector:
             motif, triés par pertinence.
         """
         try:
-            df = self._get_taxonomy_df()
-            pattern_lower = pattern.lower()
+            index = self._get_taxonomy_index()
             
             matching_sophisms = []
-            
-            for pk, row in df.iterrows():
-                score = 0.0
-                
-                # Recherche dans les différents champs
-                name = str(row.get('Name', '')).lower()
-                nom_vulgarise = str(row.get('nom_vulgarisé', '')).lower()
-                description = str(row.get('text_fr', '')).lower()
-                famille = str(row.get('Famille', '')).lower()
-                
-                if pattern_lower in nom_vulgarise:
-                    score += 0.8
-                if pattern_lower in name:
-                    score += 0.6
-                if pattern_lower in description:
-                    score += 0.4
-                if pattern_lower in famille:
-                    score += 0.3
-                
-                if score > 0:
-                    sophism = {
-                        'taxonomy_key': int(pk),
-                        'name': row.get('Name', ''),
-                        'nom_vulgarise': row.get('nom_vulgarisé', ''),
-                        'famille': row.get('Famille', ''),
-                        'description': row.get('text_fr', ''),
-                        'match_score': score,
-                        'depth': int(row.get('depth', 0)),
-                        'path': row.get('path', '')
-                    }
-                    matching_sophisms.append(sophism)
+            for pk, score in index.search(pattern):
+                sophism = dict(index.records[pk])
+                sophism['match_score'] = score
+                matching_sophisms.append(sophism)
             
             # Trier par score et limiter
             matching_sophisms.sort(key=lambda x: x['match_score'], reverse=True)
@@ -0,0 +1,121 @@
+# argumentation_analysis/agents/core/logic/belief_set_cache.py
+"""
+Cache LRU des ensembles de croyances Java construits par les handlers logiques.
+
+Le parsing d'une base de connaissances via JPype (une traversée Python -> Java
+par formule) domine le coût d'une requête : une analyse interroge souvent des
+dizaines de fois le même ensemble de croyances. Ce module conserve les objets
+Java déjà construits (`PlBeliefSet`, `FolBeliefSet`), indexés par le texte
+normalisé de la base et par sa signature.
+
+La mémoire occupée côté JVM n'est pas mesurable à bas coût ; chaque entrée est
+donc comptée avec une estimation proportionnelle à la taille du texte et au
+nombre de formules. L'éviction (la moins récemment utilisée d'abord) se
+déclenche dès que le nombre d'entrées ou l'estimation totale dépasse sa limite.
+
+Les objets mis en cache sont partagés : les appelants ne doivent pas les modifier.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Estimation grossière de l'empreinte Java : chaînes UTF-16 et noeuds de l'AST
+# par caractère de la source, plus un surcoût fixe par formule.
+BYTES_PER_CHAR = 16
+BYTES_PER_FORMULA = 512
+
+
+def estimate_size(text: str, num_formulas: int) -> int:
+    """Estime (en octets) l'empreinte mémoire d'un ensemble de croyances parsé."""
+    return len(text) * BYTES_PER_CHAR + num_formulas * BYTES_PER_FORMULA
+
+
+class BeliefSetCache:
+    """
+    Cache LRU borné en nombre d'entrées et en mémoire estimée.
+
+    :param max_entries: Nombre maximal d'ensembles de croyances conservés.
+    :param max_bytes: Budget mémoire estimé (voir `estimate_size`).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Any:
+        """Retourne l'objet en cache (et le marque comme récent), ou None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        """Ajoute (ou remplace) une entrée puis évince jusqu'à respecter les limites."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            if size > self.max_bytes:
+                logger.debug(f"Ensemble de croyances trop volumineux pour le cache ({size} octets estimés).")
+                return
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Tuple[Any, int]]) -> Any:
+        """
+        Retourne l'objet associé à `key`, en le construisant au besoin.
+
+        `builder` retourne le couple `(objet, taille_estimée)`. Il est appelé
+        hors du verrou : deux fils concurrents peuvent construire le même
+        ensemble, le second remplace alors simplement le premier. Les exceptions
+        du builder (erreurs de parsing) se propagent et ne sont pas mises en cache.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        value, size = builder()
+        self.put(key, value, size)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Statistiques d'utilisation (pour les logs et le diagnostic)."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "estimated_bytes": self.current_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -1138,7 +1138,7 @@ class FirstOrderLogicAgent(BaseLogicAgent):
             java_belief_set = await self._recreate_java_belief_set(belief_set)
             if java_belief_set:
                 signature = java_belief_set.getSignature()
-                is_valid, _ = self.tweety_bridge._fol_handler.validate_formula_with_signature(signature, formula)
+                is_valid, _ = self.tweety_bridge.fol_handler.validate_formula_with_signature(signature, formula)
                 return is_valid
 
         # Fallback to context-less validation
@@ -1,9 +1,11 @@
 import jpype
 import logging
 import asyncio
+from typing import List, Optional, Tuple
 # La configuration du logging (appel à setup_logging()) est supposée être faite globalement.
 from argumentation_analysis.core.utils.logging_utils import setup_logging
 from .tweety_initializer import TweetyInitializer # To access FOL parser
+from .belief_set_cache import BeliefSetCache, estimate_size
 
 setup_logging()
 logger = logging.getLogger(__name__) # Obtient le logger pour ce module
@@ -14,9 +16,11 @@ class FOLHandler:
     Relies on TweetyInitializer for JVM and FOL component setup.
     """
 
-    def __init__(self, initializer_instance: TweetyInitializer):
+    def __init__(self, initializer_instance: TweetyInitializer, belief_set_cache: Optional[BeliefSetCache] = None):
         self.logger = logging.getLogger(__name__)
         self._initializer_instance = initializer_instance
+        # FolBeliefSet déjà parsés, indexés par le texte normalisé de la base.
+        self._belief_set_cache = belief_set_cache if belief_set_cache is not None else BeliefSetCache()
         self._fol_parser = self._initializer_instance.get_fol_parser()
         # self._fol_reasoner = TweetyInitializer.get_fol_reasoner() # If a general one is set up
 
@@ -39,7 +43,7 @@ class FOLHandler:
         try:
             java_formula_str = jpype.JClass("java.lang.String")(formula_str)
             fol_formula = parser_to_use.parseFormula(java_formula_str)
-            logger.info(f"Successfully parsed FOL formula: {formula_str} -> {fol_formula}")
+            logger.debug("Successfully parsed FOL formula: %s -> %s", formula_str, fol_formula)
             return fol_formula
         except jpype.JException as e:
             logger.error(f"JPype JException parsing FOL formula '{formula_str}': {e.getMessage()}", exc_info=True)
@@ -54,9 +58,19 @@ class FOLHandler:
         utilisant la syntaxe native de Tweety.
         C'est la nouvelle approche privilégiée.
 
+        Le résultat est mis en cache (clé : texte normalisé, qui contient la
+        signature) ; il est partagé entre appelants et ne doit pas être modifié.
+
         :param tweety_syntax: Une chaîne contenant la base de connaissances complète.
         :return: Un objet FolBeliefSet de jpype.
         """
+        normalized = "\n".join(line.strip() for line in tweety_syntax.strip().splitlines() if line.strip())
+        return self._belief_set_cache.get_or_build(
+            ("fol", normalized), lambda: self._parse_belief_set(normalized)
+        )
+
+    def _parse_belief_set(self, tweety_syntax: str):
+        """Parse une base FOL avec un parser neuf ; retourne (belief_set, taille estimée)."""
         logger.info("Parsing de la base de connaissances FOL à partir de la syntaxe native.")
         StringReader = jpype.JClass("java.io.StringReader")
         FolParser = jpype.JClass("org.tweetyproject.logics.fol.parser.FolParser")
@@ -69,8 +83,9 @@ class FOLHandler:
             local_parser = FolParser()
             reader = StringReader(tweety_syntax)
             belief_set = local_parser.parseBeliefBase(reader)
-            logger.info(f"Parsing réussi avec un parser local. {belief_set.size()} formules chargées.")
-            return belief_set
+            num_formulas = belief_set.size()
+            logger.info(f"Parsing réussi avec un parser local. {num_formulas} formules chargées.")
+            return belief_set, estimate_size(tweety_syntax, num_formulas)
         except jpype.JException as e:
             # Il est crucial de remonter l'exception de parsing pour le feedback au LLM.
             self.logger.error(f"Erreur de parsing dans Tweety: {e.getMessage()}", exc_info=True)
@@ -219,6 +234,45 @@ class FOLHandler:
             logger.error(f"JPype JException during FOL consistency check: {e.getMessage()}", exc_info=True)
             raise RuntimeError(f"FOL consistency check failed: {e.getMessage()}") from e
 
+    def _get_fol_reasoner(self):
+        """Retourne le raisonneur FOL partagé, créé au premier usage."""
+        if getattr(self, '_fol_reasoner', None) is None:
+            Prover = jpype.JClass("org.tweetyproject.logics.fol.reasoner.SimpleFolReasoner")
+            self._fol_reasoner = Prover()
+        return self._fol_reasoner
+
+    def fol_query_batch(self, belief_set, query_formula_strs: List[str]) -> List[Tuple[Optional[bool], Optional[str]]]:
+        """
+        Vérifie plusieurs requêtes contre un même FolBeliefSet.
+
+        Un seul parser (portant la signature de la base) et un seul raisonneur
+        servent pour tout le lot ; chaque requête distincte n'est parsée et
+        évaluée qu'une fois. Retourne un couple (entraînée, erreur) par requête,
+        dans l'ordre d'entrée ; une requête invalide n'interrompt pas le lot.
+        """
+        FolParser = jpype.JClass("org.tweetyproject.logics.fol.parser.FolParser")
+        parser = FolParser()
+        parser.setSignature(belief_set.getSignature())
+        reasoner = self._get_fol_reasoner()
+
+        verdicts = {}
+        for query_str in query_formula_strs:
+            if query_str in verdicts:
+                continue
+            try:
+                query_formula = self.parse_fol_formula(query_str, custom_parser=parser)
+                verdicts[query_str] = (bool(reasoner.query(belief_set, query_formula)), None)
+            except (ValueError, TypeError) as e:
+                verdicts[query_str] = (None, str(e))
+            except jpype.JException as e:
+                verdicts[query_str] = (None, f"FOL query failed: {e.getMessage()}")
+
+        results = [verdicts[q] for q in query_formula_strs]
+        logger.info(f"Requêtes FOL groupées : {len(query_formula_strs)} requêtes ({len(verdicts)} distinctes), "
+                    f"{sum(1 for entailed, _ in results if entailed)} entraînées, "
+                    f"{sum(1 for entailed, _ in results if entailed is None)} erreurs.")
+        return results
+
     def fol_query(self, belief_set, query_formula_str: str) -> bool:
         """
         Checks if a query formula is entailed by an FOL belief base object.
@@ -235,12 +289,8 @@ class FOLHandler:
             query_formula = self.parse_fol_formula(query_formula_str, custom_parser=parser)
             
             # Utiliser le même raisonneur que pour la vérification de cohérence pour la consistance.
-            if not hasattr(self, '_fol_reasoner') or self._fol_reasoner is None:
-                 Prover = jpype.JClass("org.tweetyproject.logics.fol.reasoner.SimpleFolReasoner")
-                 self._fol_reasoner = Prover()
-            
             # La méthode query est synchrone, pas besoin d'asyncio ici.
-            entails = self._fol_reasoner.query(belief_set, query_formula)
+            entails = self._get_fol_reasoner().query(belief_set, query_formula)
             
             logger.info(f"FOL Query: KB entails '{query_formula_str}'? {entails}")
             return bool(entails)
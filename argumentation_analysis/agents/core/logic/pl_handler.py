@@ -1,12 +1,13 @@
 import jpype
 import re
 import logging
-from typing import Optional, List
+from typing import Optional, List, Tuple
 # La configuration du logging (appel à setup_logging()) est supposée être faite globalement,
 # par exemple au point d'entrée de l'application ou dans conftest.py pour les tests.
 from argumentation_analysis.core.utils.logging_utils import setup_logging
 # Import TweetyInitializer to access its static methods for parser/reasoner
 from .tweety_initializer import TweetyInitializer
+from .belief_set_cache import BeliefSetCache, estimate_size
 
 setup_logging() # Appel de la configuration globale du logging
 logger = logging.getLogger(__name__) # Obtient le logger pour ce module
@@ -17,8 +18,10 @@ class PLHandler:
     Relies on TweetyInitializer for JVM and PL component setup.
     """
 
-    def __init__(self, initializer_instance: TweetyInitializer):
+    def __init__(self, initializer_instance: TweetyInitializer, belief_set_cache: Optional[BeliefSetCache] = None):
         self._initializer_instance = initializer_instance
+        # Parsed PlBeliefSet objects, keyed by normalized KB text and signature.
+        self._belief_set_cache = belief_set_cache if belief_set_cache is not None else BeliefSetCache()
         self._pl_parser = self._initializer_instance.get_pl_parser()
         # Dans la nouvelle architecture, le handler est responsable de créer son propre reasoner.
         # Le nom correct, trouvé dans les sources, est SimplePlReasoner.
@@ -93,12 +96,13 @@ class PLHandler:
                     proposition = Proposition(jpype.JClass("java.lang.String")(const_name))
                     if not signature.contains(proposition):
                         signature.add(proposition)
-                pl_formula = self._pl_parser.parseFormula(JString(normalized_formula), signature)
+                pl_formula = self._pl_parser.parseFormula(jpype.JString(normalized_formula), signature)
             else:
                 # Using JString is a good practice to avoid ambiguity.
                 pl_formula = self._pl_parser.parseFormula(jpype.JString(normalized_formula))
 
-            logger.info(f"Successfully parsed PL formula: '{formula_str}' as '{normalized_formula}' -> {pl_formula}")
+            # Lazy %-formatting: the formula's toString() is a JVM round-trip, only paid when DEBUG is on.
+            logger.debug("Successfully parsed PL formula: '%s' as '%s' -> %s", formula_str, normalized_formula, pl_formula)
             return pl_formula
         except jpype.JException as e:
             logger.error(f"JPype JException parsing PL formula '{formula_str}' (normalized to '{normalized_formula}'): {e.getMessage()}", exc_info=True)
@@ -107,37 +111,52 @@ class PLHandler:
             logger.error(f"Unexpected error parsing PL formula '{formula_str}' (normalized to '{normalized_formula}'): {e}", exc_info=True)
             raise
 
+    def _split_knowledge_base(self, knowledge_base_str: str) -> List[str]:
+        """
+        Splits a KB string into cleaned formula strings (one per line), dropping
+        markdown fences and the legacy trailing '%'.
+        """
+        formula_strings = []
+        for line in knowledge_base_str.split('\n'):
+            cleaned = line.strip()
+            if cleaned and cleaned != '```':
+                cleaned = cleaned.rstrip('%').strip()
+                if cleaned:
+                    formula_strings.append(cleaned)
+        return formula_strings
+
+    def _get_pl_belief_set(self, formula_strings: List[str], constants: Optional[List[str]] = None):
+        """
+        Returns the PlBeliefSet for the given formulas, parsing them only on a cache miss.
+        The cache key is the normalized KB text plus the signature (constants).
+        """
+        normalized_kb = "\n".join(self._normalize_formula(f) for f in formula_strings)
+        key = ("pl", normalized_kb, tuple(constants) if constants else ())
+
+        def build():
+            PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
+            kb = PlBeliefSet()
+            for f_str in formula_strings:
+                parsed_formula = self.parse_pl_formula(f_str, constants)
+                if parsed_formula:
+                    kb.add(parsed_formula)
+            return kb, estimate_size(normalized_kb, len(formula_strings))
+
+        return self._belief_set_cache.get_or_build(key, build)
+
     def pl_check_consistency(self, knowledge_base_str: str, constants: Optional[List[str]] = None) -> bool:
         """
         Checks if a PL knowledge base (string of formulas, semicolon-separated) is consistent.
         """
         logger.debug(f"Checking PL consistency for: {knowledge_base_str}")
         try:
-            # Parse the knowledge base string into a PlBeliefSet
-            # Tweety's PlParser can parse a belief set directly if formulas are separated by ';'
-            # However, it's often safer to parse individual formulas and add them to a knowledge base.
-            # For simplicity here, assuming parseBeliefSet handles it or we adapt.
-            
-            # Let's refine this: parse individual formulas and add to a PlBeliefSet
-            formulas = []
-            # Handle potential empty strings or formulas correctly
-            formula_strings = [f.strip() for f in knowledge_base_str.split('\n') if f.strip() and f.strip() != '```']
-            
+            formula_strings = self._split_knowledge_base(knowledge_base_str)
             if not formula_strings:
                 logger.info("Empty knowledge base is considered consistent.")
                 return True
 
-            PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
-            kb = PlBeliefSet()
+            kb = self._get_pl_belief_set(formula_strings, constants)
 
-            for f_str in formula_strings:
-                # Remove trailing '%' if present, as it was a previous workaround
-                cleaned_f_str = f_str.rstrip('%').strip()
-                if cleaned_f_str:
-                    parsed_formula = self.parse_pl_formula(cleaned_f_str, constants)
-                    if parsed_formula:
-                        kb.add(parsed_formula)
-            
             logger.info(f"DEBUG: Méthodes disponibles pour _pl_reasoner: {dir(self._pl_reasoner)}")
             
             # Contournement pour le bug JPype avec isConsistent.
@@ -177,17 +196,8 @@ class PLHandler:
         """
         logger.debug(f"Performing PL query. KB: '{knowledge_base_str}', Query: '{query_formula_str}'")
         try:
-            PlBeliefSet = jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
-            kb = PlBeliefSet()
+            kb = self._get_pl_belief_set(self._split_knowledge_base(knowledge_base_str), constants)
 
-            formula_strings = [f.strip() for f in knowledge_base_str.split('\n') if f.strip() and f.strip() != '```']
-            for f_str in formula_strings:
-                cleaned_f_str = f_str.rstrip('%').strip()
-                if cleaned_f_str:
-                    parsed_formula = self.parse_pl_formula(cleaned_f_str, constants)
-                    if parsed_formula:
-                        kb.add(parsed_formula)
-            
             # Nettoyer également la chaîne de la requête
             cleaned_query_str = query_formula_str.rstrip('%').strip()
             if not cleaned_query_str or cleaned_query_str == '```':
@@ -212,4 +222,44 @@ class PLHandler:
             logger.error(f"Unexpected error during PL query: {e}", exc_info=True)
             raise
 
+    def pl_query_batch(self, knowledge_base_str: str, query_formula_strs: List[str],
+                       constants: Optional[List[str]] = None) -> List[Tuple[Optional[bool], Optional[str]]]:
+        """
+        Checks several query formulas against one PL knowledge base.
+
+        The KB is parsed once (through the belief set cache), each distinct query is
+        parsed and checked once with the shared reasoner, and a single summary line is
+        logged for the whole batch.
+
+        Returns one (entailed, error) pair per query, in input order. `entailed` is None
+        and `error` holds the reason when a query cannot be parsed or checked; a failing
+        query does not abort the batch. Errors on the KB itself are raised as in pl_query.
+        """
+        try:
+            kb = self._get_pl_belief_set(self._split_knowledge_base(knowledge_base_str), constants)
+        except jpype.JException as e:
+            raise RuntimeError(f"PL query failed: {e.getMessage()}") from e
+
+        cleaned_queries = [q.rstrip('%').strip() if isinstance(q, str) else "" for q in query_formula_strs]
+        verdicts = {}
+        for query_str, cleaned_query_str in zip(query_formula_strs, cleaned_queries):
+            if cleaned_query_str in verdicts:
+                continue
+            try:
+                query_formula = self.parse_pl_formula(cleaned_query_str, constants)
+                if not query_formula:
+                    verdicts[cleaned_query_str] = (None, f"Invalid or empty query: '{query_str}'")
+                    continue
+                verdicts[cleaned_query_str] = (bool(self._pl_reasoner.query(kb, query_formula)), None)
+            except ValueError as e:
+                verdicts[cleaned_query_str] = (None, str(e))
+            except jpype.JException as e:
+                verdicts[cleaned_query_str] = (None, f"PL query failed: {e.getMessage()}")
+
+        results = [verdicts[q] for q in cleaned_queries]
+        logger.info(f"PL batch query: {len(query_formula_strs)} queries ({len(verdicts)} distinct), "
+                    f"{sum(1 for entailed, _ in results if entailed)} entailed, "
+                    f"{sum(1 for entailed, _ in results if entailed is None)} errors.")
+        return results
+
     # Add other PL-specific methods as needed, e.g., model finding, transformations, etc.
\ No newline at end of file
@@ -612,7 +612,7 @@ class PropositionalLogicAgent(BaseLogicAgent):
         try:
             belief_set_content = belief_set.content
             # Correction: Appeler pl_check_consistency sur le _pl_handler du bridge.
-            is_valid = self._tweety_bridge._pl_handler.pl_check_consistency(belief_set_content)
+            is_valid = self._tweety_bridge.pl_handler.pl_check_consistency(belief_set_content)
             
             if is_valid:
                 details = "Belief set is consistent."
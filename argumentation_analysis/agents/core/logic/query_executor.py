@@ -69,7 +69,11 @@ class QueryExecutor:
         """
         Exécute une liste de requêtes logiques sur un ensemble de croyances.
 
-        Appelle `execute_query` pour chaque requête dans la liste.
+        Pour les logiques propositionnelle et du premier ordre, le lot entier est
+        transmis en un seul appel à `TweetyBridge` (`execute_pl_queries` /
+        `execute_fol_queries`) : la base n'est parsée qu'une fois et chaque requête
+        est validée par son propre parsing. Les autres logiques retombent sur un
+        appel à `execute_query` par requête.
 
         :param belief_set: L'objet `BeliefSet` sur lequel exécuter les requêtes.
         :type belief_set: BeliefSet
@@ -80,14 +84,51 @@ class QueryExecutor:
         :rtype: List[Tuple[str, Optional[bool], str]]
         """
         self._logger.info(f"Exécution de {len(queries)} requêtes sur un ensemble de croyances de type '{belief_set.logic_type}'")
-        
-        results = []
-        for query in queries:
-            result, message = self.execute_query(belief_set, query)
-            results.append((query, result, message))
-        
-        return results
-    
+
+        batch_methods = {
+            "propositional": "execute_pl_queries",
+            "first_order": "execute_fol_queries",
+        }
+        method_name = batch_methods.get(belief_set.logic_type)
+        if method_name is None or not queries:
+            results = []
+            for query in queries:
+                result, message = self.execute_query(belief_set, query)
+                results.append((query, result, message))
+            return results
+
+        if not self._tweety_bridge.is_jvm_ready():
+            error_msg = "FUNC_ERROR: JVM non prête ou composants Tweety non chargés"
+            self._logger.error(error_msg)
+            return [(query, None, error_msg) for query in queries]
+
+        try:
+            result_strs = getattr(self._tweety_bridge, method_name)(belief_set.content, queries)
+        except Exception as e:
+            error_msg = f"FUNC_ERROR: Erreur lors de l'exécution du lot de requêtes: {str(e)}"
+            self._logger.error(error_msg, exc_info=True)
+            return [(query, None, error_msg) for query in queries]
+
+        return [(query,) + self._interpret_result(result_str, belief_set.logic_type)
+                for query, result_str in zip(queries, result_strs)]
+
+    def _interpret_result(self, result_str: str, logic_label: str) -> Tuple[Optional[bool], str]:
+        """
+        Convertit le message texte renvoyé par `TweetyBridge` en (résultat, message).
+
+        :param result_str: Message contenant "ACCEPTED", "REJECTED" ou "FUNC_ERROR".
+        :param logic_label: Libellé de la logique, pour les logs d'erreur.
+        :rtype: Tuple[Optional[bool], str]
+        """
+        if "FUNC_ERROR" in result_str:
+            self._logger.error(f"Erreur lors de l'exécution de la requête ({logic_label}): {result_str}")
+            return None, result_str
+        if "ACCEPTED" in result_str:
+            return True, result_str
+        if "REJECTED" in result_str:
+            return False, result_str
+        return None, result_str
+
     def _execute_propositional_query(self, belief_set: BeliefSet, query: str) -> Tuple[Optional[bool], str]:
         """
         Exécute une requête de logique propositionnelle via `TweetyBridge`.
@@ -112,16 +153,7 @@ class QueryExecutor:
             result_str = self._tweety_bridge.execute_pl_query(belief_set.content, query)
             
             # Analyser le résultat
-            if "FUNC_ERROR" in result_str:
-                self._logger.error(f"Erreur lors de l'exécution de la requête propositionnelle: {result_str}")
-                return None, result_str
-            
-            if "ACCEPTED" in result_str:
-                return True, result_str
-            elif "REJECTED" in result_str:
-                return False, result_str
-            else:
-                return None, result_str
+            return self._interpret_result(result_str, "propositionnelle")
         
         except Exception as e:
             error_msg = f"Erreur lors de l'exécution de la requête propositionnelle: {str(e)}"
@@ -152,16 +184,7 @@ class QueryExecutor:
             result_str = self._tweety_bridge.execute_fol_query(belief_set.content, query)
             
             # Analyser le résultat
-            if "FUNC_ERROR" in result_str:
-                self._logger.error(f"Erreur lors de l'exécution de la requête du premier ordre: {result_str}")
-                return None, result_str
-            
-            if "ACCEPTED" in result_str:
-                return True, result_str
-            elif "REJECTED" in result_str:
-                return False, result_str
-            else:
-                return None, result_str
+            return self._interpret_result(result_str, "du premier ordre")
         
         except Exception as e:
             error_msg = f"Erreur lors de l'exécution de la requête du premier ordre: {str(e)}"
@@ -192,16 +215,7 @@ class QueryExecutor:
             result_str = self._tweety_bridge.execute_modal_query(belief_set.content, query)
             
             # Analyser le résultat
-            if "FUNC_ERROR" in result_str:
-                self._logger.error(f"Erreur lors de l'exécution de la requête modale: {result_str}")
-                return None, result_str
-            
-            if "ACCEPTED" in result_str:
-                return True, result_str
-            elif "REJECTED" in result_str:
-                return False, result_str
-            else:
-                return None, result_str
+            return self._interpret_result(result_str, "modale")
         
         except Exception as e:
             error_msg = f"Erreur lors de l'exécution de la requête modale: {str(e)}"
@@ -29,10 +29,21 @@ from typing import Optional, Dict, List, Tuple, Any
 from .pl_handler import PLHandler as PropositionalLogicHandler
 from .fol_handler import FOLHandler as FirstOrderLogicHandler
 from .tweety_initializer import TweetyInitializer
+from .belief_set_cache import BeliefSetCache
+from .tweety_worker_pool import TweetyWorkerPool
+from argumentation_analysis.config.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
+def _format_query_result(label: str, query: str, entailed: Optional[bool], error: Optional[str]) -> str:
+    """Formate un verdict au format texte attendu par QueryExecutor."""
+    if entailed is None:
+        return f"FUNC_ERROR: {error or 'résultat indéterminé'}"
+    status = "ACCEPTED" if entailed else "REJECTED"
+    return f"Tweety Result: {label} '{query}' is {status} ({entailed})."
+
+
 class TweetyBridge:
     """
     Un pont singleton pour interagir avec la bibliothèque Java TweetyProject.
@@ -46,10 +57,14 @@ class TweetyBridge:
     # Handlers pour les différentes logiques. Initialisés avec la logique du pont.
     _pl_handler: Optional[PropositionalLogicHandler] = None
     _fol_handler: Optional[FirstOrderLogicHandler] = None
+    _modal_handler = None
     
     # Nouvel attribut pour l'initialiseur
     _initializer: Optional[TweetyInitializer] = None
 
+    # Pool de workers hors processus (None : JVM locale)
+    _worker_pool: Optional[TweetyWorkerPool] = None
+
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             with cls._lock:
@@ -63,14 +78,62 @@ class TweetyBridge:
         """
         if not hasattr(self, '_initialized'):  # Empêche la réinitialisation sur les appels multiples
             self.jar_directory = jar_directory or self._find_default_jar_dir()
-            
+
+            # Cache des ensembles de croyances parsés, partagé par les handlers
+            # pour que le budget mémoire couvre toutes les logiques.
+            self.belief_set_cache = BeliefSetCache()
+
+            if settings.jvm.worker_pool_size > 0:
+                # Les requêtes textuelles partent vers les workers ; la JVM locale
+                # ne démarre que si un appel manipule des objets Java.
+                self.enable_worker_pool(settings.jvm.worker_pool_size)
+            else:
+                self._ensure_local_handlers()
+            self._initialized = True
+
+    def _ensure_local_handlers(self) -> None:
+        """
+        Démarre la JVM locale (via l'initializer), une seule fois. Les handlers
+        sont créés ici, sauf en mode `lazy_class_import` où chacun l'est au
+        premier accès (ce qui importe alors les classes de sa logique).
+        """
+        if self._initializer is None:
             # L'initializer devient un composant clé du pont
             self._initializer = TweetyInitializer()
-            
-            # Les handlers sont maintenant initialisés avec l'initializer
-            self._pl_handler = PropositionalLogicHandler(self._initializer)
-            self._fol_handler = FirstOrderLogicHandler(self._initializer)
-            self._initialized = True
+        if not settings.jvm.lazy_class_import:
+            self._get_pl_handler()
+            self._get_fol_handler()
+
+    def _get_pl_handler(self) -> PropositionalLogicHandler:
+        if self._pl_handler is None:
+            self._pl_handler = PropositionalLogicHandler(self._initializer, self.belief_set_cache)
+        return self._pl_handler
+
+    def _get_fol_handler(self) -> FirstOrderLogicHandler:
+        if self._fol_handler is None:
+            self._fol_handler = FirstOrderLogicHandler(self._initializer, self.belief_set_cache)
+        return self._fol_handler
+
+    def enable_worker_pool(self, num_workers: Optional[int] = None, query_timeout: Optional[float] = None,
+                           max_requests_per_worker: Optional[int] = None) -> TweetyWorkerPool:
+        """
+        Active le pool de workers Tweety (une JVM par processus). Les requêtes PL,
+        FOL et modales exprimées en texte y sont alors envoyées, ce qui permet
+        d'utiliser tous les coeurs et d'isoler les requêtes pathologiques.
+        """
+        if self._worker_pool is None:
+            self._worker_pool = TweetyWorkerPool(
+                num_workers=num_workers,
+                query_timeout=query_timeout if query_timeout is not None else settings.jvm.worker_query_timeout,
+                max_requests_per_worker=(max_requests_per_worker if max_requests_per_worker is not None
+                                         else settings.jvm.worker_max_requests),
+            )
+        return self._worker_pool
+
+    @property
+    def worker_pool(self) -> Optional[TweetyWorkerPool]:
+        """Le pool de workers actif, ou None en mode JVM locale."""
+        return self._worker_pool
 
     def _find_default_jar_dir(self) -> str:
         """
@@ -95,16 +158,20 @@ class TweetyBridge:
     @property
     def pl_handler(self) -> PropositionalLogicHandler:
         """Retourne le handler pour la logique propositionnelle."""
+        if self._worker_pool is not None:
+            self._ensure_local_handlers()
         if not TweetyInitializer.is_jvm_ready():
             raise RuntimeError("La JVM n'est pas démarrée. Appelez initialize_jvm() en premier.")
-        return self._pl_handler
+        return self._get_pl_handler()
 
     @property
     def fol_handler(self) -> FirstOrderLogicHandler:
         """Retourne le handler pour la logique du premier ordre."""
+        if self._worker_pool is not None:
+            self._ensure_local_handlers()
         if not TweetyInitializer.is_jvm_ready():
             raise RuntimeError("La JVM n'est pas démarrée. Appelez initialize_jvm() en premier.")
-        return self._fol_handler
+        return self._get_fol_handler()
 
     @property
     def initializer(self) -> TweetyInitializer:
@@ -125,6 +192,12 @@ class TweetyBridge:
         if not TweetyInitializer.is_jvm_ready():
             raise TimeoutError(f"La JVM n'a pas démarré dans le temps imparti de {timeout} secondes.")
 
+    def is_jvm_ready(self) -> bool:
+        """Indique si la JVM (ou, en mode pool, le pool de workers) est disponible."""
+        if self._worker_pool is not None:
+            return self._worker_pool.is_running()
+        return TweetyInitializer.is_jvm_ready()
+
     def set_jvm_path(self, jvm_path: str):
         """Définit manuellement le chemin vers la bibliothèque de la JVM (dll, so, etc.)."""
         self._jvm_path = jvm_path
@@ -170,8 +243,11 @@ class TweetyBridge:
                 raise RuntimeError("Échec de l'initialisation de la JVM.") from e
 
     def shutdown_jvm(self):
-        """Arrête la JVM si elle est en cours d'exécution."""
+        """Arrête la JVM si elle est en cours d'exécution, ainsi que le pool de workers."""
         with self._lock:
+            if self._worker_pool is not None:
+                self._worker_pool.close()
+                self._worker_pool = None
             if TweetyInitializer.is_jvm_ready():
                 # shutdown_jvm est maintenant géré de manière centralisée
                 from argumentation_analysis.core.jvm_setup import shutdown_jvm
@@ -188,12 +264,41 @@ class TweetyBridge:
         Exécute une requête en logique propositionnelle.
         Retourne True si la KB entraîne la requête, False sinon, ou None en cas d'erreur.
         """
-        return self.pl_handler.query(knowledge_base, query)
+        if self._worker_pool is not None:
+            return self._worker_pool.call("pl_query", knowledge_base, query)
+        return self.pl_handler.pl_query(knowledge_base, query)
+
+    def execute_pl_queries(self, knowledge_base: str, queries: List[str]) -> List[str]:
+        """
+        Exécute un lot de requêtes PL sur une même base en un seul appel au handler
+        (base parsée une fois, raisonneur partagé).
+        Retourne un message de résultat par requête, dans l'ordre : "... ACCEPTED (True).",
+        "... REJECTED (False)." ou "FUNC_ERROR: ...".
+        """
+        if self._worker_pool is not None:
+            results = self._worker_pool.call("pl_query_batch", knowledge_base, queries)
+        else:
+            results = self.pl_handler.pl_query_batch(knowledge_base, queries)
+        return [_format_query_result("Query", query, entailed, error)
+                for query, (entailed, error) in zip(queries, results)]
 
     def create_pl_belief_base_from_string(self, formula_string: str) -> Optional["java.lang.Object"]:
         """Crée un objet PlBeliefSet Java à partir d'une chaîne."""
         return self.pl_handler.create_belief_base_from_string(formula_string)
 
+    def modal_query(self, knowledge_base: str, query: str, modal_logic: str = "S4") -> bool:
+        """
+        Exécute une requête en logique modale. En mode pool, la requête tourne
+        dans un worker et est interrompue au-delà de `worker_query_timeout`.
+        """
+        if self._worker_pool is not None:
+            return self._worker_pool.call("modal_query", knowledge_base, query, modal_logic)
+        if self._modal_handler is None:
+            from .modal_handler import ModalHandler
+            self._ensure_local_handlers()
+            self._modal_handler = ModalHandler(self._initializer)
+        return self._modal_handler.modal_query(knowledge_base, query, modal_logic)
+
     # ===============================================
     # Méthodes pour la logique du premier ordre (FOL)
     # ===============================================
@@ -204,20 +309,38 @@ class TweetyBridge:
 
     def fol_check_consistency(self, belief_set: Any) -> Tuple[bool, str]:
         """Vérifie la consistance d'un ensemble de croyances FOL."""
+        fol_handler = self.fol_handler  # charge les classes FOL en mode paresseux
         if not self._initializer.FolBeliefSet:
             logger.error("FolBeliefSet class not loaded.")
             return False, "FolBeliefSet class not loaded."
         if not isinstance(belief_set, self._initializer.FolBeliefSet):
             return False, "L'objet fourni n'est pas une instance de FolBeliefSet."
-        return self.fol_handler.fol_check_consistency(belief_set)
+        return fol_handler.fol_check_consistency(belief_set)
 
     def fol_query(self, belief_set: Any, query_formula_str: str) -> bool:
         """Exécute une requête en logique du premier ordre."""
         return self.fol_handler.fol_query(belief_set, query_formula_str)
         
+    def execute_fol_queries(self, belief_set_content: str, queries: List[str]) -> List[str]:
+        """
+        Exécute un lot de requêtes FOL sur une base en syntaxe Tweety (parsée une
+        fois via le cache). Même format de retour que `execute_pl_queries`.
+        """
+        if self._worker_pool is not None:
+            results = self._worker_pool.call("fol_query_batch", belief_set_content, queries)
+        else:
+            belief_set = self.fol_handler.create_belief_set_from_string(belief_set_content)
+            results = self.fol_handler.fol_query_batch(belief_set, queries)
+        return [_format_query_result("FOL Query", query, entailed, error)
+                for query, (entailed, error) in zip(queries, results)]
+
     def create_belief_set_from_string(self, formula_string: str) -> Optional[Any]:
         """Crée un objet FolBeliefSet à partir d'une chaîne de formules."""
         
+        # Les objets Java ne traversent pas les processus : en mode pool, JVM locale
+        if self._worker_pool is not None:
+            self._ensure_local_handlers()
+
         # Vérifier d'abord si la JVM est prête, car l'initializer est nécessaire
         # S'assurer que les classes Java nécessaires sont chargées
         if not TweetyInitializer.is_jvm_ready():
@@ -225,7 +348,7 @@ class TweetyBridge:
             return None
 
         # Déléguer la création au handler FOL
-        return self._fol_handler.create_belief_set_from_string(formula_string)
+        return self._get_fol_handler().create_belief_set_from_string(formula_string)
 
     @staticmethod
     def get_tweety_project_version() -> str:
@@ -10,7 +10,8 @@ import os
 from argumentation_analysis.core.utils.logging_utils import setup_logging
 # On importe directement la fonction d'initialisation robuste
 from argumentation_analysis.core.jvm_setup import initialize_jvm as initialize_jvm_robustly
-from argumentation_analysis.core.jvm_setup import shutdown_jvm, is_jvm_started
+from argumentation_analysis.core.jvm_setup import shutdown_jvm, is_jvm_started, startup_phase
+from argumentation_analysis.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,50 @@ class TweetyInitializer:
     Implication = None
     Conjunction = None
     Negation = None
+
+    # Classes Java par logique : (nom de classe, attribut de TweetyInitializer ou None)
+    _LOGIC_CLASSES = {
+        "pl": [
+            ("org.tweetyproject.logics.pl.syntax.PlSignature", None),
+            ("org.tweetyproject.logics.pl.syntax.Proposition", None),
+            ("org.tweetyproject.logics.pl.syntax.PlBeliefSet", None),
+            ("org.tweetyproject.logics.pl.reasoner.SatReasoner", None),
+            ("org.tweetyproject.logics.pl.sat.Sat4jSolver", None),
+        ],
+        "fol": [
+            ("org.tweetyproject.logics.fol.syntax.FolBeliefSet", "FolBeliefSet"),
+            ("org.tweetyproject.logics.fol.syntax.FolSignature", "FolSignature"),
+            ("org.tweetyproject.logics.fol.syntax.FolFormula", "FolFormula"),
+            ("org.tweetyproject.logics.fol.syntax.FolAtom", "FolAtom"),
+            ("org.tweetyproject.logics.fol.syntax.ForallQuantifiedFormula", "ForallQuantifiedFormula"),
+            ("org.tweetyproject.logics.fol.syntax.ExistsQuantifiedFormula", "ExistsQuantifiedFormula"),
+            ("org.tweetyproject.logics.commons.syntax.Variable", "Variable"),
+            ("org.tweetyproject.logics.commons.syntax.Predicate", "Predicate"),
+            ("org.tweetyproject.logics.commons.syntax.Sort", "Sort"),
+            ("org.tweetyproject.logics.commons.syntax.Constant", "Constant"),
+            ("org.tweetyproject.logics.fol.syntax.Implication", "Implication"),
+            ("org.tweetyproject.logics.fol.syntax.Conjunction", "Conjunction"),
+            ("org.tweetyproject.logics.fol.syntax.Negation", "Negation"),
+            # Reasoner (using EProver, not Prover9)
+            ("org.tweetyproject.logics.fol.reasoner.SimpleFolReasoner", None),
+        ],
+        "modal": [
+            ("org.tweetyproject.logics.ml.syntax.MlFormula", None),
+            ("org.tweetyproject.logics.ml.syntax.MlBeliefSet", None),
+            ("org.tweetyproject.logics.ml.reasoner.SimpleMlReasoner", None),
+            ("org.tweetyproject.logics.ml.parser.MlParser", None),
+        ],
+    }
+    _COMMON_CLASSES = [
+        "org.tweetyproject.commons.ParserException",
+        "org.tweetyproject.commons.Signature",
+    ]
+    _PARSER_CLASSES = {
+        "pl": ("_pl_parser", "org.tweetyproject.logics.pl.parser.PlParser"),
+        "fol": ("_fol_parser", "org.tweetyproject.logics.fol.parser.FolParser"),
+        "modal": ("_modal_parser", "org.tweetyproject.logics.ml.parser.MlParser"),
+    }
+    _loaded_logics = set()
  
     def __init__(self, tweety_bridge_instance=None):
         if tweety_bridge_instance:
@@ -63,9 +108,10 @@ class TweetyInitializer:
         if not self.__class__._initialized_components:
             logger.info("JVM is running. Initializing Java class imports and components for the first time.")
             self._import_java_classes()
-            self.initialize_pl_components()
-            self.initialize_fol_components()
-            self.initialize_modal_components()
+            if not settings.jvm.lazy_class_import:
+                self.initialize_pl_components()
+                self.initialize_fol_components()
+                self.initialize_modal_components()
             self.__class__._initialized_components = True
         else:
             logger.debug("Java components already initialized for this session.")
@@ -93,45 +139,19 @@ class TweetyInitializer:
     def _import_java_classes(self):
         """
         Imports and caches required Java classes.
+        With `settings.jvm.lazy_class_import`, only the common classes are imported here;
+        logic-specific classes are imported on first use (see `ensure_logic_loaded`).
         Raises RuntimeError if a class is not found, indicating a classpath issue.
         """
         logger.info("Importation des classes Java de TweetyProject...")
         try:
-            # PL Classes
-            jpype.JClass("org.tweetyproject.logics.pl.syntax.PlSignature")
-            jpype.JClass("org.tweetyproject.logics.pl.syntax.Proposition")
-            jpype.JClass("org.tweetyproject.logics.pl.syntax.PlBeliefSet")
-            jpype.JClass("org.tweetyproject.logics.pl.reasoner.SatReasoner")
-            jpype.JClass("org.tweetyproject.logics.pl.sat.Sat4jSolver")
-
-            # FOL Classes
-            TweetyInitializer.FolBeliefSet = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolBeliefSet")
-            TweetyInitializer.FolSignature = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolSignature")
-            TweetyInitializer.FolFormula = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolFormula")
-            TweetyInitializer.FolAtom = jpype.JClass("org.tweetyproject.logics.fol.syntax.FolAtom")
-            TweetyInitializer.ForallQuantifiedFormula = jpype.JClass("org.tweetyproject.logics.fol.syntax.ForallQuantifiedFormula")
-            TweetyInitializer.ExistsQuantifiedFormula = jpype.JClass("org.tweetyproject.logics.fol.syntax.ExistsQuantifiedFormula")
-            TweetyInitializer.Variable = jpype.JClass("org.tweetyproject.logics.commons.syntax.Variable")
-            TweetyInitializer.Predicate = jpype.JClass("org.tweetyproject.logics.commons.syntax.Predicate")
-
-            # Common Classes
-            TweetyInitializer.Sort = jpype.JClass("org.tweetyproject.logics.commons.syntax.Sort")
-            TweetyInitializer.Constant = jpype.JClass("org.tweetyproject.logics.commons.syntax.Constant")
-            TweetyInitializer.Implication = jpype.JClass("org.tweetyproject.logics.fol.syntax.Implication")
-            TweetyInitializer.Conjunction = jpype.JClass("org.tweetyproject.logics.fol.syntax.Conjunction")
-            TweetyInitializer.Negation = jpype.JClass("org.tweetyproject.logics.fol.syntax.Negation")
-            jpype.JClass("org.tweetyproject.commons.ParserException")
-            
-            # Modal classes
-            _ = jpype.JClass("org.tweetyproject.logics.ml.syntax.MlFormula")
-            _ = jpype.JClass("org.tweetyproject.logics.ml.syntax.MlBeliefSet")
-            _ = jpype.JClass("org.tweetyproject.logics.ml.reasoner.SimpleMlReasoner")
-            _ = jpype.JClass("org.tweetyproject.logics.ml.parser.MlParser")
-            _ = jpype.JClass("org.tweetyproject.commons.Signature")
+            with startup_phase("import_classes:common"):
+                for class_name in TweetyInitializer._COMMON_CLASSES:
+                    jpype.JClass(class_name)
+            if not settings.jvm.lazy_class_import:
+                for logic in TweetyInitializer._LOGIC_CLASSES:
+                    TweetyInitializer._load_logic_classes(logic)
 
-            # Reasoner (using EProver, not Prover9)
-            jpype.JClass("org.tweetyproject.logics.fol.reasoner.SimpleFolReasoner")
-            
             logger.info("Successfully imported and cached TweetyProject Java classes.")
             TweetyInitializer._classes_loaded = True
 
@@ -145,6 +165,36 @@ class TweetyInitializer:
              logger.error(f"A Python exception occurred during class import: {e}", exc_info=True)
              raise RuntimeError(f"A non-Java exception occurred during class import: {e}") from e
 
+    @staticmethod
+    def _load_logic_classes(logic: str) -> None:
+        """Imports the Java classes of one logic ("pl", "fol" or "modal"), once."""
+        if logic in TweetyInitializer._loaded_logics:
+            return
+        with startup_phase(f"import_classes:{logic}"):
+            for class_name, attribute in TweetyInitializer._LOGIC_CLASSES[logic]:
+                java_class = jpype.JClass(class_name)
+                if attribute:
+                    setattr(TweetyInitializer, attribute, java_class)
+        TweetyInitializer._loaded_logics.add(logic)
+
+    @staticmethod
+    def ensure_logic_loaded(logic: str):
+        """
+        Imports the classes of a logic and creates its parser if not done yet
+        (first use in lazy mode; no-op otherwise). Returns the parser.
+        """
+        attribute, parser_class = TweetyInitializer._PARSER_CLASSES[logic]
+        parser = getattr(TweetyInitializer, attribute)
+        if parser is None:
+            if not is_jvm_started():
+                raise RuntimeError(f"{logic.upper()} Parser not initialized.")
+            TweetyInitializer._load_logic_classes(logic)
+            with startup_phase(f"init_parser:{logic}"):
+                parser = jpype.JClass(parser_class)()
+            setattr(TweetyInitializer, attribute, parser)
+            logger.info(f"{logic.upper()} classes and parser loaded on first use.")
+        return parser
+
 
     def initialize_pl_components(self):
         if self.__class__._pl_parser:
@@ -182,19 +232,19 @@ class TweetyInitializer:
     @staticmethod
     def get_pl_parser():
         if not TweetyInitializer._pl_parser:
-            raise RuntimeError("PL Parser not initialized.")
+            return TweetyInitializer.ensure_logic_loaded("pl")
         return TweetyInitializer._pl_parser
 
     @staticmethod
     def get_fol_parser():
         if not TweetyInitializer._fol_parser:
-            raise RuntimeError("FOL Parser not initialized.")
+            return TweetyInitializer.ensure_logic_loaded("fol")
         return TweetyInitializer._fol_parser
 
     @staticmethod
     def get_modal_parser():
         if not TweetyInitializer._modal_parser:
-            raise RuntimeError("Modal Parser not initialized.")
+            return TweetyInitializer.ensure_logic_loaded("modal")
         return TweetyInitializer._modal_parser
 
     @staticmethod
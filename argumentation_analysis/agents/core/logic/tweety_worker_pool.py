@@ -0,0 +1,304 @@
+# argumentation_analysis/agents/core/logic/tweety_worker_pool.py
+"""
+Pool de processus "workers" Tweety, chacun avec sa propre JVM.
+
+Dans le mode par défaut, tous les agents logiques partagent la JVM du
+processus principal : les requêtes sont sérialisées et une requête
+pathologique (FOL, modale) bloque toute l'API. Ce pool répartit les requêtes
+sur plusieurs processus :
+
+- chaque worker démarre sa JVM et importe les classes Tweety (via
+  `TweetyInitializer`) *avant* de se déclarer prêt, la première requête ne
+  paie donc pas le coût de démarrage ;
+- le protocole est local (un `multiprocessing.Pipe` par worker) : requête
+  `(id, opération, arguments)`, réponse `(id, "ok" | "error", charge)`.
+  Seules des chaînes et des booléens traversent la frontière : les objets
+  Java restent dans le worker (qui garde son propre cache de belief sets) ;
+- les appels concurrents (threads, ou `call_async`) sont multiplexés sur les
+  workers libres, avec une préférence pour le worker qui a déjà traité la
+  même base de connaissances ;
+- chaque requête a un délai maximal : au-delà, le worker est tué puis
+  remplacé, et l'appelant reçoit un `TimeoutError`. Un worker peut aussi être
+  recyclé après un nombre donné de requêtes.
+
+Le pool est activé dans `TweetyBridge` via `settings.jvm.worker_pool_size`
+(variable d'environnement `JVM_WORKER_POOL_SIZE`) ou `enable_worker_pool()`.
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_TIMEOUT = 30.0
+DEFAULT_STARTUP_TIMEOUT = 180.0
+
+
+class TweetyWorkerHandlers:
+    """
+    Opérations exposées par un worker. Construit côté worker : démarre la JVM
+    et charge les classes et parsers Tweety une fois pour toutes.
+    """
+
+    OPERATIONS = (
+        "pl_query", "pl_query_batch", "pl_check_consistency",
+        "fol_query_batch", "modal_query", "modal_check_consistency",
+    )
+
+    def __init__(self):
+        from .tweety_initializer import TweetyInitializer
+        from .belief_set_cache import BeliefSetCache
+        from .pl_handler import PLHandler
+        from .fol_handler import FOLHandler
+        from .modal_handler import ModalHandler
+
+        initializer = TweetyInitializer()
+        cache = BeliefSetCache()
+        self._pl = PLHandler(initializer, cache)
+        self._fol = FOLHandler(initializer, cache)
+        self._modal = ModalHandler(initializer)
+
+    def pl_query(self, knowledge_base: str, query: str) -> bool:
+        return self._pl.pl_query(knowledge_base, query)
+
+    def pl_query_batch(self, knowledge_base: str, queries: List[str]):
+        return self._pl.pl_query_batch(knowledge_base, queries)
+
+    def pl_check_consistency(self, knowledge_base: str) -> bool:
+        return self._pl.pl_check_consistency(knowledge_base)
+
+    def fol_query_batch(self, belief_set_content: str, queries: List[str]):
+        belief_set = self._fol.create_belief_set_from_string(belief_set_content)
+        return self._fol.fol_query_batch(belief_set, queries)
+
+    def modal_query(self, knowledge_base: str, query: str, modal_logic: str = "S4") -> bool:
+        return self._modal.modal_query(knowledge_base, query, modal_logic)
+
+    def modal_check_consistency(self, knowledge_base: str, modal_logic: str = "S4") -> bool:
+        return self._modal.modal_check_consistency(knowledge_base, modal_logic)
+
+
+def _worker_main(conn, handlers_factory: Callable[[], Any]) -> None:
+    """Boucle d'un worker : initialisation, puis une requête à la fois jusqu'au message `None`."""
+    try:
+        handlers = handlers_factory()
+    except Exception as e:
+        conn.send(("init_error", f"{type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", os.getpid()))
+    operations = getattr(handlers, "OPERATIONS", ())
+
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                return
+            if message is None:
+                return
+            request_id, operation, args = message
+            try:
+                if operation not in operations:
+                    raise ValueError(f"Opération inconnue : {operation}")
+                conn.send((request_id, "ok", getattr(handlers, operation)(*args)))
+            except Exception as e:
+                conn.send((request_id, "error", (type(e).__name__, str(e))))
+    finally:
+        # Arrêt explicite de la JVM du worker : son archive CDS éventuelle est renommée en place
+        from argumentation_analysis.core.jvm_setup import shutdown_jvm
+        shutdown_jvm()
+
+
+class _Worker:
+    """Un processus worker et l'extrémité parent de son pipe."""
+
+    def __init__(self, context, index: int, handlers_factory: Callable[[], Any]):
+        self.index = index
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, handlers_factory),
+            name=f"tweety-worker-{index}", daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.requests_served = 0
+        self.last_key: Optional[str] = None
+
+    def ensure_ready(self, timeout: float) -> None:
+        if self.ready:
+            return
+        if not self.conn.poll(timeout):
+            raise TimeoutError(f"Le worker Tweety {self.index} n'a pas démarré en {timeout} s.")
+        status, payload = self.conn.recv()
+        if status != "ready":
+            raise RuntimeError(f"Échec de l'initialisation du worker Tweety {self.index} : {payload}")
+        self.ready = True
+        logger.info(f"Worker Tweety {self.index} prêt (pid {payload}).")
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=2)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=5)
+        self.conn.close()
+
+
+class TweetyWorkerPool:
+    """
+    Pool de workers Tweety hors processus.
+
+    :param num_workers: Nombre de processus (par défaut : nombre de coeurs).
+    :param query_timeout: Délai maximal d'une requête (s) avant recyclage du worker.
+    :param max_requests_per_worker: Recycle un worker après ce nombre de requêtes (0 : jamais).
+    :param startup_timeout: Délai maximal de démarrage d'un worker (JVM + classes).
+    :param handlers_factory: Construit les opérations côté worker (doit être picklable).
+    :param start_method: Méthode de démarrage multiprocessing ("spawn" par défaut :
+                         un fork d'un processus ayant déjà une JVM n'est pas sûr).
+    """
+
+    def __init__(self, num_workers: Optional[int] = None, query_timeout: float = DEFAULT_QUERY_TIMEOUT,
+                 max_requests_per_worker: int = 0, startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+                 handlers_factory: Callable[[], Any] = TweetyWorkerHandlers, start_method: str = "spawn"):
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.query_timeout = query_timeout
+        self.max_requests_per_worker = max_requests_per_worker
+        self.startup_timeout = startup_timeout
+        self._handlers_factory = handlers_factory
+        self._context = multiprocessing.get_context(start_method)
+        self._request_ids = itertools.count(1)
+        self._condition = threading.Condition()
+        self._closed = False
+        self.recycled = 0
+        self._workers = [_Worker(self._context, i, handlers_factory) for i in range(self.num_workers)]
+        self._idle: List[_Worker] = list(self._workers)
+        logger.info(f"Pool Tweety : {self.num_workers} worker(s) en cours de démarrage.")
+
+    def is_running(self) -> bool:
+        return not self._closed
+
+    def wait_until_ready(self) -> None:
+        """Attend le démarrage de tous les workers (optionnel : sinon, à la première requête)."""
+        for worker in list(self._workers):
+            worker.ensure_ready(self.startup_timeout)
+
+    def _acquire(self, key: Optional[str]) -> _Worker:
+        with self._condition:
+            while not self._idle:
+                if self._closed:
+                    raise RuntimeError("Le pool de workers Tweety est fermé.")
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError("Le pool de workers Tweety est fermé.")
+            # Préférer le worker dont le cache contient déjà cette base
+            for position, worker in enumerate(self._idle):
+                if key is not None and worker.last_key == key:
+                    return self._idle.pop(position)
+            return self._idle.pop(0)
+
+    def _release(self, worker: _Worker) -> None:
+        with self._condition:
+            self._idle.append(worker)
+            self._condition.notify()
+
+    def _recycle(self, worker: _Worker, reason: str) -> None:
+        """Tue un worker et le remplace (le remplaçant démarre en arrière-plan)."""
+        logger.warning(f"Recyclage du worker Tweety {worker.index} : {reason}")
+        worker.kill()
+        self.recycled += 1
+        with self._condition:
+            if self._closed:
+                return
+            replacement = _Worker(self._context, worker.index, self._handlers_factory)
+            self._workers[worker.index] = replacement
+            self._idle.append(replacement)
+            self._condition.notify()
+
+    def call(self, operation: str, *args, timeout: Optional[float] = None) -> Any:
+        """
+        Exécute `operation(*args)` sur un worker libre et retourne son résultat.
+
+        :raises TimeoutError: si la requête dépasse le délai (le worker est recyclé).
+        :raises ValueError: erreur de parsing remontée par le worker.
+        :raises RuntimeError: autre erreur du worker, ou worker mort en cours de requête.
+        """
+        timeout = self.query_timeout if timeout is None else timeout
+        key = args[0] if args and isinstance(args[0], str) else None
+        worker = self._acquire(key)
+        try:
+            worker.ensure_ready(self.startup_timeout)
+        except (TimeoutError, RuntimeError) as e:
+            self._recycle(worker, str(e))
+            raise
+
+        request_id = next(self._request_ids)
+        try:
+            # Sérialisé avant l'envoi (comme `Connection.send`) : un argument non
+            # sérialisable n'atteint pas le pipe et le worker reste utilisable
+            message = ForkingPickler.dumps((request_id, operation, args))
+        except BaseException:
+            self._release(worker)
+            raise
+        try:
+            worker.conn.send_bytes(message)
+            answered = worker.conn.poll(timeout)
+            if answered:
+                response_id, status, payload = worker.conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionError) as e:
+            self._recycle(worker, f"worker indisponible ({e!r})")
+            raise RuntimeError(f"Le worker Tweety {worker.index} a échoué en cours de requête.") from e
+        except BaseException as e:
+            # État du pipe inconnu (écriture partielle, réponse illisible...) : le worker est remplacé
+            self._recycle(worker, f"échec de l'échange ({e!r})")
+            raise
+        if not answered:
+            self._recycle(worker, f"requête '{operation}' au-delà de {timeout} s")
+            raise TimeoutError(f"Requête Tweety '{operation}' interrompue après {timeout} s.")
+
+        worker.requests_served += 1
+        worker.last_key = key
+        if self.max_requests_per_worker and worker.requests_served >= self.max_requests_per_worker:
+            self._recycle(worker, f"{worker.requests_served} requêtes traitées")
+        else:
+            self._release(worker)
+
+        if response_id != request_id:
+            raise RuntimeError(f"Réponse inattendue du worker Tweety (id {response_id} au lieu de {request_id}).")
+        if status == "ok":
+            return payload
+        error_type, message = payload
+        if error_type == "ValueError":
+            raise ValueError(message)
+        raise RuntimeError(f"{error_type}: {message}")
+
+    async def call_async(self, operation: str, *args, timeout: Optional[float] = None) -> Any:
+        """Version asynchrone de `call` (exécutée dans un thread)."""
+        return await asyncio.to_thread(self.call, operation, *args, timeout=timeout)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            workers = list(self._workers)
+            self._condition.notify_all()
+        for worker in workers:
+            worker.stop()
+        logger.info("Pool de workers Tweety arrêté.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Moteur de détection des relations entre arguments.
+
+Utilisé par `EnhancedComplexFallacyAnalyzer` à la place de la comparaison de
+chaque paire d'arguments :
+
+- chaque argument est tokenisé (mêmes mots que le coefficient de Jaccard
+  historique : `texte.lower().split()`) et étiqueté une seule fois par les
+  mots-clés de relation, en un passage d'automate d'Aho–Corasick ;
+- un index inversé (mot → arguments qui le contiennent) donne, pour un
+  argument, le nombre de mots partagés avec chacun des autres en ne
+  parcourant que les listes de ses propres mots : |A ∩ B| est compté, puis
+  |A ∪ B| = |A| + |B| - |A ∩ B| ; les lignes de similarité sont calculées à
+  la demande et conservées ;
+- seules les `top_k` sources les plus similaires sont retenues pour chaque
+  argument cible porteur d'un mot-clé de relation.
+
+Les scores sont identiques à ceux de `_calculate_simple_similarity` ; pour
+`top_k` ≥ nombre d'arguments - 1, les relations produites sont exactement
+celles de la comparaison exhaustive.
+
+Le module est en Python pur : l'analyseur n'utilise pas NumPy pour ce calcul.
+"""
+
+import heapq
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from argumentation_analysis.nlp.aho_corasick import AhoCorasick
+
+# Mots-clés indiquant différents types de relations
+RELATION_KEYWORDS: Dict[str, List[str]] = {
+    "support": ["donc", "ainsi", "par conséquent", "ce qui montre", "ce qui prouve", "en conséquence"],
+    "contradiction": ["cependant", "mais", "néanmoins", "pourtant", "en revanche", "contrairement à"],
+    "qualification": ["bien que", "même si", "certes", "en admettant que", "tout en reconnaissant"],
+    "elaboration": ["en outre", "de plus", "par ailleurs", "également", "en particulier", "notamment"],
+    "example": ["par exemple", "comme", "tel que", "notamment", "en particulier", "pour illustrer"]
+}
+
+# Nombre de sources retenues par argument cible
+DEFAULT_TOP_K = 10
+
+
+class ArgumentRelationEngine:
+    """
+    Similarités et relations d'un ensemble d'arguments, calculées en une fois.
+
+    Args:
+        arguments: Les textes des arguments.
+        relation_keywords: Mots-clés par type de relation (par défaut `RELATION_KEYWORDS`).
+    """
+
+    def __init__(self, arguments: List[str], relation_keywords: Optional[Dict[str, List[str]]] = None):
+        self.arguments = arguments
+        self.relation_keywords = relation_keywords or RELATION_KEYWORDS
+        lowered = [argument.lower() for argument in arguments]
+        self.keywords_by_argument = self._tag_keywords(lowered)
+        self._words: List[Set[str]] = [set(text.split()) for text in lowered]
+        self._postings: Dict[str, List[int]] = {}
+        for index, words in enumerate(self._words):
+            for word in words:
+                self._postings.setdefault(word, []).append(index)
+        self._rows: Dict[int, Dict[int, float]] = {}
+
+    # --- Préparation ---
+
+    def _tag_keywords(self, lowered: List[str]) -> List[Dict[str, List[str]]]:
+        """Mots-clés présents dans chaque argument, par type de relation (un passage par argument)."""
+        automaton = AhoCorasick()
+        for keywords in self.relation_keywords.values():
+            for keyword in keywords:
+                automaton.add(keyword)
+        automaton.build()
+        tags = []
+        for text in lowered:
+            present = automaton.find_all(text)
+            tags.append({
+                relation_type: [keyword for keyword in keywords if keyword in present]
+                for relation_type, keywords in self.relation_keywords.items()
+                if any(keyword in present for keyword in keywords)
+            })
+        return tags
+
+    # --- Similarité ---
+
+    def similarity_row(self, index: int) -> Dict[int, float]:
+        """
+        Coefficients de Jaccard non nuls entre un argument et les autres (lui compris).
+
+        Returns:
+            Dictionnaire indice → similarité ; les arguments absents ont une similarité nulle.
+        """
+        row = self._rows.get(index)
+        if row is None:
+            words = self._words[index]
+            shared = Counter(other for word in words for other in self._postings[word])
+            row = {
+                other: count / (len(words) + len(self._words[other]) - count)
+                for other, count in shared.items()
+            }
+            self._rows[index] = row
+        return row
+
+    def similarity(self, index1: int, index2: int) -> float:
+        """Coefficient de Jaccard entre deux arguments (identique à `_calculate_simple_similarity`)."""
+        return self.similarity_row(index1).get(index2, 0.0)
+
+    def top_sources(self, target: int, top_k: Optional[int]) -> List[int]:
+        """
+        Sources retenues pour un argument cible, par ordre d'indice.
+
+        Les `top_k` arguments les plus similaires à la cible (à similarité égale,
+        les premiers du texte) ; tous les autres arguments si `top_k` est None.
+        """
+        candidates = [i for i in range(len(self.arguments)) if i != target]
+        if top_k is None or top_k >= len(candidates):
+            return candidates
+        row = self.similarity_row(target)
+        # Tri par similarité décroissante puis par indice croissant
+        return sorted(heapq.nsmallest(top_k, candidates, key=lambda i: (-row.get(i, 0.0), i)))
+
+    # --- Relations ---
+
+    def relations(self, top_k: Optional[int] = DEFAULT_TOP_K) -> List[Dict[str, Any]]:
+        """
+        Relations entre arguments : l'argument cible porte un mot-clé du type de
+        relation, la confiance dépend de sa similarité avec la source.
+
+        Args:
+            top_k: Nombre de sources retenues par cible (None : toutes).
+
+        Returns:
+            Les relations, triées par source, cible puis type (ordre historique).
+        """
+        if len(self.arguments) < 2:
+            return []
+        keyed: List[Tuple[int, int, int, Dict[str, Any]]] = []
+        type_order = {relation_type: rank for rank, relation_type in enumerate(self.relation_keywords)}
+        for target, tags in enumerate(self.keywords_by_argument):
+            if not tags:
+                continue
+            for source in self.top_sources(target, top_k):
+                similarity_score = self.similarity(source, target)
+                for relation_type, matched in tags.items():
+                    keyed.append((source, target, type_order[relation_type], {
+                        "relation_type": relation_type,
+                        "source_argument_index": source,
+                        "target_argument_index": target,
+                        "confidence": min(0.9, 0.5 + similarity_score * 0.4),
+                        "keywords_matched": matched
+                    }))
+        keyed.sort(key=lambda entry: entry[:3])
+        return [relation for *_, relation in keyed]
@@ -37,6 +37,9 @@ if str(parent_dir) not in sys.path:
 
 # Importer l'analyseur de sophismes complexes de base
 from argumentation_analysis.agents.tools.analysis.complex_fallacy_analyzer import ComplexFallacyAnalyzer as BaseAnalyzer
+from argumentation_analysis.agents.tools.analysis.enhanced.argument_relation_engine import (
+    ArgumentRelationEngine, DEFAULT_TOP_K
+)
 
 # Fonction d'importation paresseuse pour éviter les importations circulaires
 def _lazy_imports():
@@ -106,6 +109,10 @@ class EnhancedComplexFallacyAnalyzer(BaseAnalyzer):
         # Historique des analyses pour l'apprentissage continu
         self.analysis_history = []
         
+        # Nombre de sources retenues par argument cible lors de la détection des relations
+        self.relation_top_k = DEFAULT_TOP_K
+        self._relation_engine = None
+        
         self.logger.info("Analyseur de sophismes complexes amélioré initialisé.")
     
     def _define_argument_structure_patterns(self) -> Dict[str, Dict[str, Any]]:
@@ -352,47 +359,29 @@ class EnhancedComplexFallacyAnalyzer(BaseAnalyzer):
         Returns:
             Liste des relations entre arguments
         """
-        relations = []
-        
         # Si moins de 2 arguments, pas de relations à analyser
         if len(arguments) < 2:
-            return relations
-        
-        # Mots-clés indiquant différents types de relations
-        relation_keywords = {
-            "support": ["donc", "ainsi", "par conséquent", "ce qui montre", "ce qui prouve", "en conséquence"],
-            "contradiction": ["cependant", "mais", "néanmoins", "pourtant", "en revanche", "contrairement à"],
-            "qualification": ["bien que", "même si", "certes", "en admettant que", "tout en reconnaissant"],
-            "elaboration": ["en outre", "de plus", "par ailleurs", "également", "en particulier", "notamment"],
-            "example": ["par exemple", "comme", "tel que", "notamment", "en particulier", "pour illustrer"]
-        }
+            return []
         
-        # Pour chaque paire d'arguments
-        for i in range(len(arguments)):
-            for j in range(len(arguments)):
-                if i == j:
-                    continue
-                
-                arg1 = arguments[i].lower()
-                arg2 = arguments[j].lower()
-                
-                # Vérifier chaque type de relation
-                for relation_type, keywords in relation_keywords.items():
-                    # Vérifier si l'argument 2 contient des mots-clés indiquant une relation avec l'argument 1
-                    if any(keyword in arg2 for keyword in keywords):
-                        # Calculer un score de similarité sémantique (simplifié)
-                        # Dans une implémentation réelle, on utiliserait des embeddings de phrases
-                        similarity_score = self._calculate_simple_similarity(arg1, arg2)
-                        
-                        relations.append({
-                            "relation_type": relation_type,
-                            "source_argument_index": i,
-                            "target_argument_index": j,
-                            "confidence": min(0.9, 0.5 + similarity_score * 0.4),
-                            "keywords_matched": [keyword for keyword in keywords if keyword in arg2]
-                        })
-        
-        return relations
+        # Mots-clés étiquetés une fois par argument, similarités obtenues par index inversé
+        # des mots, et seules les sources les plus proches de chaque cible sont retenues
+        return self._get_relation_engine(arguments).relations(top_k=self.relation_top_k)
+    
+    def _get_relation_engine(self, arguments: List[str]) -> ArgumentRelationEngine:
+        """
+        Retourne le moteur de relations des arguments, réutilisé tant qu'ils ne changent pas.
+        
+        Args:
+            arguments: Liste d'arguments à analyser
+            
+        Returns:
+            Le moteur de relations (tokenisation, mots-clés et similarités déjà calculés)
+        """
+        engine = self._relation_engine
+        if engine is None or engine.arguments != list(arguments):
+            engine = ArgumentRelationEngine(list(arguments))
+            self._relation_engine = engine
+        return engine
     
     def _calculate_simple_similarity(self, text1: str, text2: str) -> float:
         """
@@ -455,17 +444,19 @@ class EnhancedComplexFallacyAnalyzer(BaseAnalyzer):
         
         disconnected_arguments = [i for i in range(len(arguments)) if i not in connected_arguments]
         
-        # Identifier les relations contradictoires
-        contradictory_relations = []
-        for i, relation1 in enumerate(argument_relations):
-            for j, relation2 in enumerate(argument_relations):
-                if i >= j:
-                    continue
-                
-                if (relation1["source_argument_index"] == relation2["source_argument_index"] and
-                    relation1["target_argument_index"] == relation2["target_argument_index"] and
-                    relation1["relation_type"] == "support" and relation2["relation_type"] == "contradiction"):
-                    contradictory_relations.append((i, j))
+        # Identifier les relations contradictoires (support puis contradiction sur la même paire),
+        # en regroupant les relations par paire plutôt qu'en comparant toutes les relations deux à deux
+        relations_by_pair = defaultdict(lambda: ([], []))
+        for index, relation in enumerate(argument_relations):
+            pair = (relation["source_argument_index"], relation["target_argument_index"])
+            if relation["relation_type"] == "support":
+                relations_by_pair[pair][0].append(index)
+            elif relation["relation_type"] == "contradiction":
+                relations_by_pair[pair][1].append(index)
+        contradictory_relations = sorted(
+            (i, j) for supports, contradictions in relations_by_pair.values()
+            for i in supports for j in contradictions if i < j
+        )
         
         # Vérifier s'il y a un raisonnement circulaire
         circular_reasoning = self._detect_circular_reasoning(graph)
@@ -1095,14 +1086,8 @@ class EnhancedComplexFallacyAnalyzer(BaseAnalyzer):
                 "thematic_shifts": []
             }
         
-        # Calculer la similarité entre chaque paire d'arguments
-        # Utiliser une liste de listes au lieu de numpy pour éviter les problèmes d'interface
-        similarity_matrix = []
-        for i in range(len(arguments)):
-            row = []
-            for j in range(len(arguments)):
-                row.append(self._calculate_simple_similarity(arguments[i], arguments[j]))
-            similarity_matrix.append(row)
+        # Similarités entre arguments, calculées via l'index inversé des mots du moteur de relations
+        relation_engine = self._get_relation_engine(arguments)
         
         # Identifier les clusters thématiques (implémentation simplifiée)
         # Dans une implémentation réelle, on utiliserait un algorithme de clustering comme K-means
@@ -1118,25 +1103,28 @@ class EnhancedComplexFallacyAnalyzer(BaseAnalyzer):
             visited.add(i)
             
             # Ajouter les arguments similaires au cluster
-            for j in range(len(arguments)):
+            similarities = relation_engine.similarity_row(i)
+            for j in sorted(similarities):
+                if similarities[j] <= 0.5:  # Seuil arbitraire
+                    continue
                 if j in visited:
                     continue
                 
-                if similarity_matrix[i][j] > 0.5:  # Seuil arbitraire
-                    cluster["arguments"].append(j)
-                    visited.add(j)
+                cluster["arguments"].append(j)
+                visited.add(j)
             
             thematic_clusters.append(cluster)
         
         # Identifier les changements thématiques
         thematic_shifts = []
         for i in range(len(arguments) - 1):
-            if similarity_matrix[i][i + 1] < 0.3:  # Seuil arbitraire
+            similarity = relation_engine.similarity(i, i + 1)
+            if similarity < 0.3:  # Seuil arbitraire
                 thematic_shifts.append({
                     "position": i,
                     "from_argument": i,
                     "to_argument": i + 1,
-                    "shift_magnitude": 1.0 - similarity_matrix[i][i + 1]
+                    "shift_magnitude": 1.0 - similarity
                 })
         
         # Calculer le score de cohérence thématique
@@ -13,12 +13,18 @@ Son rôle est de :
 - Centraliser la configuration des noms de modèles utilisés.
 - Fournir une interface thread-safe pour le chargement et l'accès aux modèles.
 - Gérer gracieusement l'absence de la bibliothèque `transformers`.
+
+L'inférence passe par un `NLPModelRuntime` partagé (voir `nlp_runtime`) :
+chargement paresseux de chaque modèle, regroupement des requêtes concurrentes
+en lots, contrôle des threads CPU et backend ONNX/quantifié optionnel.
 """
 
 import logging
 import asyncio
 from threading import Lock
 
+from argumentation_analysis.agents.tools.analysis.enhanced.nlp_runtime import NLPModelRuntime
+
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
@@ -54,14 +60,16 @@ class NLPModelManager:
     Le cycle de vie est le suivant :
     1. L'instance est créée (ex: `nlp_model_manager = NLPModelManager()`).
        Le constructeur est non-bloquant.
-    2. Le chargement réel est déclenché par l'appel à `load_models_sync()`.
-       Cette méthode est bloquante et doit être gérée avec soin.
-    3. Les modèles sont ensuite accessibles via `get_model(model_name)`.
+    2. `get_model(model_name)` retourne immédiatement un accès au modèle ;
+       celui-ci est chargé au premier appel.
+    3. `load_models_sync()` peut être appelée au démarrage pour précharger
+       tous les modèles. Cette méthode est bloquante.
     """
     _instance = None
     _lock = Lock()
     _models = {}
     _models_loaded = False
+    _runtime = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -77,6 +85,18 @@ class NLPModelManager:
         # Le constructeur est maintenant non bloquant.
         pass
 
+    @property
+    def runtime(self) -> NLPModelRuntime:
+        """Runtime d'inférence partagé, créé au premier accès avec les modèles de l'application."""
+        if NLPModelManager._runtime is None:
+            with self._lock:
+                if NLPModelManager._runtime is None:
+                    runtime = NLPModelRuntime(pipeline_factory=pipeline)
+                    runtime.register('sentiment', "sentiment-analysis", TEXT_CLASSIFICATION_MODEL, truncation=True)
+                    runtime.register('ner', "ner", NER_MODEL)
+                    NLPModelManager._runtime = runtime
+        return NLPModelManager._runtime
+
     def load_models_sync(self):
         """
         Charge tous les modèles NLP de manière synchrone et thread-safe.
@@ -87,8 +107,8 @@ class NLPModelManager:
         Caractéristiques :
         - **Bloquante :** L'appelant attendra que tous les modèles soient chargés.
           À utiliser dans un thread de démarrage pour ne pas geler une IHM.
-        - **Thread-safe :** Utilise un verrou pour empêcher les chargements multiples
-          si la méthode est appelée par plusieurs threads simultanément.
+        - **Thread-safe :** Le runtime verrouille chaque modèle pour empêcher les
+          chargements multiples si la méthode est appelée par plusieurs threads.
         - **Idempotente :** Si les modèles sont déjà chargés, la méthode retourne
           immédiatement sans rien faire.
         """
@@ -99,39 +119,41 @@ class NLPModelManager:
                 logger.warning("Impossible de charger les modèles car 'transformers' n'est pas disponible.")
             return
 
-        with self._lock:
-            if self._models_loaded:
-                return
-                
-            logger.info("Début du chargement SYNC des modèles NLP...")
-            try:
-                logger.info(f"Chargement du modèle de classification: {TEXT_CLASSIFICATION_MODEL}")
-                self._models['sentiment'] = pipeline("sentiment-analysis", model=TEXT_CLASSIFICATION_MODEL)
-                
-                logger.info(f"Chargement du modèle NER: {NER_MODEL}")
-                self._models['ner'] = pipeline("ner", model=NER_MODEL)
-                
-                self._models_loaded = True
-                logger.info("Tous les modèles NLP ont été chargés et sont prêts (mode synchrone).")
-
-            except Exception as e:
-                logger.error(f"Erreur critique lors du chargement synchrone des modèles NLP : {e}", exc_info=True)
-                self._models_loaded = False
+        # Le runtime verrouille chaque modèle : des appels concurrents ne le chargent qu'une fois
+        logger.info("Début du chargement SYNC des modèles NLP...")
+        try:
+            for name in ('sentiment', 'ner'):
+                logger.info(f"Chargement du modèle '{name}'")
+                self.runtime.load(name)
+                self._models[name] = self.runtime.handle(name)
+            
+            self._models_loaded = True
+            logger.info("Tous les modèles NLP ont été chargés et sont prêts (mode synchrone).")
+
+        except Exception as e:
+            logger.error(f"Erreur critique lors du chargement synchrone des modèles NLP : {e}", exc_info=True)
+            self._models_loaded = False
 
     def get_model(self, model_name: str):
         """
-        Récupère un pipeline de modèle NLP pré-chargé.
+        Récupère un accès à un modèle NLP.
+
+        L'objet retourné s'utilise comme un pipeline Hugging Face (une chaîne ou
+        une liste de chaînes) ; le modèle est chargé au premier appel et les
+        appels concurrents sont traités en lots.
 
         Args:
             model_name (str): Le nom du modèle à récupérer (ex: 'sentiment', 'ner').
 
         Returns:
-            Le pipeline Hugging Face si le modèle est chargé et trouvé, sinon None.
+            L'accès au modèle si `transformers` est disponible et le modèle connu, sinon None.
         """
-        if not self._models_loaded:
-            logger.warning(f"Tentative d'accès au modèle '{model_name}' avant la fin du chargement.")
+        if not HAS_TRANSFORMERS:
+            logger.warning(f"Modèle '{model_name}' indisponible : 'transformers' n'est pas installé.")
+            return None
+        if not self.runtime.is_registered(model_name):
             return None
-        return self._models.get(model_name)
+        return self.runtime.handle(model_name)
 
     def are_models_loaded(self) -> bool:
         """Vérifie si les modèles sont chargés."""
@@ -0,0 +1,415 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Runtime partagé d'inférence pour les modèles NLP des analyseurs améliorés.
+
+Ce module fournit `NLPModelRuntime`, utilisé par `NLPModelManager` :
+
+- **Chargement paresseux par modèle :** un modèle n'est chargé qu'au premier
+  appel qui le concerne (verrou par modèle : deux modèles différents se
+  chargent en parallèle, un même modèle une seule fois).
+- **Micro-batching dynamique :** chaque modèle possède une file
+  (`MicroBatcher`) qui regroupe les requêtes concurrentes en un seul passage
+  du modèle, dans la limite de `max_batch_size` entrées et d'une attente de
+  `max_wait` secondes après la première requête.
+- **Contrôle des threads CPU :** le nombre de threads d'inférence est fixé
+  une fois pour toutes (torch et onnxruntime).
+- **Backend ONNX / quantifié optionnel :** avec `optimum[onnxruntime]`, les
+  modèles sont exportés en ONNX (et quantifiés dynamiquement en int8 si
+  demandé) ; sans `optimum`, le backend PyTorch est utilisé, avec
+  quantification dynamique des couches linéaires si demandée.
+
+Les objets retournés par `NLPModelRuntime.handle` s'appellent comme un
+pipeline Hugging Face : une chaîne donne le résultat de cette chaîne, une
+liste de chaînes donne la liste des résultats (traitée en lots).
+
+Configuration par variables d'environnement (voir `RuntimeSettings.from_env`) :
+``NLP_NUM_THREADS``, ``NLP_BACKEND`` (``pytorch`` ou ``onnx``),
+``NLP_QUANTIZE``, ``NLP_MAX_BATCH_SIZE``, ``NLP_MAX_WAIT_MS``.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("pytorch", "onnx")
+
+# Classes optimum selon la tâche du pipeline
+_ORT_MODEL_CLASSES = {
+    "sentiment-analysis": "ORTModelForSequenceClassification",
+    "text-classification": "ORTModelForSequenceClassification",
+    "ner": "ORTModelForTokenClassification",
+    "token-classification": "ORTModelForTokenClassification",
+}
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass
+class RuntimeSettings:
+    """
+    Paramètres du runtime.
+
+    Attributes:
+        num_threads: Threads CPU d'inférence (None : valeur par défaut de la bibliothèque).
+        backend: 'pytorch' ou 'onnx'.
+        quantize: Quantification dynamique int8 des modèles.
+        max_batch_size: Nombre maximal d'entrées par passage du modèle.
+        max_wait: Attente maximale (secondes) pour compléter un lot.
+        onnx_cache_dir: Répertoire des modèles exportés en ONNX.
+    """
+    num_threads: Optional[int] = None
+    backend: str = "pytorch"
+    quantize: bool = False
+    max_batch_size: int = 16
+    max_wait: float = 0.005
+    onnx_cache_dir: Path = field(default_factory=lambda: Path.home() / ".cache" / "argumentation_analysis" / "onnx")
+
+    @classmethod
+    def from_env(cls) -> "RuntimeSettings":
+        """Construit les paramètres à partir des variables d'environnement ``NLP_*``."""
+        settings = cls()
+        if os.environ.get("NLP_NUM_THREADS"):
+            settings.num_threads = max(1, int(os.environ["NLP_NUM_THREADS"]))
+        backend = os.environ.get("NLP_BACKEND", settings.backend).strip().lower()
+        if backend not in BACKENDS:
+            logger.warning(f"Backend NLP inconnu '{backend}', utilisation de 'pytorch'.")
+            backend = "pytorch"
+        settings.backend = backend
+        settings.quantize = _env_flag("NLP_QUANTIZE", settings.quantize)
+        if os.environ.get("NLP_MAX_BATCH_SIZE"):
+            settings.max_batch_size = max(1, int(os.environ["NLP_MAX_BATCH_SIZE"]))
+        if os.environ.get("NLP_MAX_WAIT_MS"):
+            settings.max_wait = max(0.0, float(os.environ["NLP_MAX_WAIT_MS"]) / 1000.0)
+        return settings
+
+
+class MicroBatcher:
+    """
+    File qui regroupe les requêtes concurrentes en lots.
+
+    Un thread de service (démarré au premier envoi) prend la première requête
+    en attente, attend au plus `max_wait` secondes d'autres requêtes jusqu'à
+    `max_batch_size`, puis appelle `batch_fn` une seule fois pour tout le lot.
+
+    Args:
+        batch_fn: Fonction qui reçoit une liste d'entrées et retourne la liste
+            des résultats, dans le même ordre.
+        max_batch_size: Taille maximale d'un lot.
+        max_wait: Attente maximale (secondes) pour compléter un lot.
+        name: Nom du thread de service.
+    """
+
+    _STOP = object()
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], max_batch_size: int = 16,
+                 max_wait: float = 0.005, name: str = "nlp-batcher"):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+        self.name = name
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.batches = 0
+        self.items = 0
+
+    def submit(self, item: Any) -> Future:
+        """Ajoute une entrée à la file et retourne le `Future` de son résultat."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Le batcher '{self.name}' est arrêté.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._queue.put((item, future))
+        return future
+
+    def map(self, items: List[Any], timeout: Optional[float] = None) -> List[Any]:
+        """Soumet toutes les entrées d'un coup (elles partagent donc les lots) et attend les résultats."""
+        futures = [self.submit(item) for item in items]
+        return [future.result(timeout=timeout) for future in futures]
+
+    def close(self) -> None:
+        """Arrête le thread de service après le traitement des requêtes déjà en file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(self._STOP)
+        if thread is not None:
+            thread.join()
+
+    @property
+    def average_batch_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is self._STOP:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                # Les requêtes déjà en file sont prises sans attendre
+                remaining = deadline - time.monotonic()
+                try:
+                    entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is self._STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            self._process(batch)
+
+    def _process(self, batch: List[Any]) -> None:
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            results = self.batch_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"{len(results)} résultats pour un lot de {len(batch)} entrées")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        self.batches += 1
+        self.items += len(batch)
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """Description d'un modèle : tâche du pipeline, identifiant et options d'appel."""
+    task: str
+    model: str
+    call_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+class ModelHandle:
+    """
+    Accès à un modèle du runtime, utilisable comme un pipeline Hugging Face.
+
+    Le modèle n'est chargé qu'au premier appel. Une chaîne seule retourne le
+    résultat au format du pipeline (liste de prédictions), une liste de
+    chaînes retourne un résultat par chaîne.
+    """
+
+    def __init__(self, runtime: "NLPModelRuntime", name: str):
+        self.runtime = runtime
+        self.name = name
+
+    def __call__(self, inputs, **kwargs):
+        if isinstance(inputs, str):
+            result = self.runtime.predict(self.name, [inputs])[0]
+            # Un pipeline de classification retourne [prédiction] pour une chaîne seule
+            return result if isinstance(result, list) else [result]
+        return self.runtime.predict(self.name, list(inputs))
+
+    def __repr__(self) -> str:
+        return f"ModelHandle({self.name!r})"
+
+
+class NLPModelRuntime:
+    """
+    Runtime partagé : chargement paresseux, micro-batching et contrôle des ressources CPU.
+
+    Args:
+        settings: Paramètres du runtime (par défaut : `RuntimeSettings.from_env()`).
+        pipeline_factory: Fonction de création des pipelines (par défaut :
+            `transformers.pipeline`, importé au premier chargement).
+    """
+
+    def __init__(self, settings: Optional[RuntimeSettings] = None, pipeline_factory: Optional[Callable] = None):
+        self.settings = settings or RuntimeSettings.from_env()
+        self._pipeline_factory = pipeline_factory
+        self._specs: Dict[str, ModelSpec] = {}
+        self._pipelines: Dict[str, Any] = {}
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self._model_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._threads_configured = False
+
+    # --- Enregistrement et chargement ---
+
+    def register(self, name: str, task: str, model: str, **call_kwargs) -> None:
+        """Déclare un modèle sans le charger."""
+        with self._lock:
+            self._specs[name] = ModelSpec(task, model, call_kwargs)
+            self._model_locks.setdefault(name, threading.Lock())
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._specs
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._pipelines
+
+    def handle(self, name: str) -> ModelHandle:
+        """Retourne un accès paresseux au modèle `name` (aucun chargement à ce stade)."""
+        if name not in self._specs:
+            raise KeyError(f"Modèle NLP non enregistré : {name}")
+        return ModelHandle(self, name)
+
+    def load(self, name: str) -> Any:
+        """Charge le modèle `name` s'il ne l'est pas déjà, et retourne son pipeline."""
+        pipeline = self._pipelines.get(name)
+        if pipeline is not None:
+            return pipeline
+        spec = self._specs.get(name)
+        if spec is None:
+            raise KeyError(f"Modèle NLP non enregistré : {name}")
+        with self._model_locks[name]:
+            if name not in self._pipelines:
+                self._configure_threads()
+                start = time.perf_counter()
+                pipeline = self._build_pipeline(spec)
+                self._pipelines[name] = pipeline
+                logger.info(f"Modèle NLP '{name}' ({spec.model}, backend {self.settings.backend}"
+                            f"{', quantifié' if self.settings.quantize else ''}) chargé en "
+                            f"{time.perf_counter() - start:.2f}s")
+        return self._pipelines[name]
+
+    def _configure_threads(self) -> None:
+        with self._lock:
+            if self._threads_configured:
+                return
+            self._threads_configured = True
+            threads = self.settings.num_threads
+            if threads is None:
+                return
+            # Pris en compte par les bibliothèques qui ne sont pas encore importées
+            os.environ.setdefault("OMP_NUM_THREADS", str(threads))
+            os.environ.setdefault("MKL_NUM_THREADS", str(threads))
+            try:
+                import torch
+                torch.set_num_threads(threads)
+            except (ImportError, OSError, RuntimeError) as e:
+                logger.debug(f"Nombre de threads torch non modifié : {e}")
+
+    def _get_pipeline_factory(self) -> Callable:
+        if self._pipeline_factory is None:
+            from transformers import pipeline
+            self._pipeline_factory = pipeline
+        return self._pipeline_factory
+
+    def _build_pipeline(self, spec: ModelSpec) -> Any:
+        if self.settings.backend == "onnx":
+            try:
+                return self._build_onnx_pipeline(spec)
+            except ImportError as e:
+                logger.warning(f"Backend ONNX indisponible ({e}), utilisation de PyTorch pour '{spec.model}'.")
+        pipeline = self._get_pipeline_factory()(spec.task, model=spec.model)
+        if self.settings.quantize:
+            try:
+                import torch
+                pipeline.model = torch.quantization.quantize_dynamic(
+                    pipeline.model, {torch.nn.Linear}, dtype=torch.qint8)
+            except Exception as e:
+                logger.warning(f"Quantification dynamique impossible pour '{spec.model}' : {e}")
+        return pipeline
+
+    def _build_onnx_pipeline(self, spec: ModelSpec) -> Any:
+        import onnxruntime
+        import optimum.onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_class = getattr(ort, _ORT_MODEL_CLASSES.get(spec.task, "ORTModelForSequenceClassification"))
+        session_options = onnxruntime.SessionOptions()
+        if self.settings.num_threads is not None:
+            session_options.intra_op_num_threads = self.settings.num_threads
+            session_options.inter_op_num_threads = 1
+
+        export_dir = self.settings.onnx_cache_dir / spec.model.replace("/", "__")
+        model_dir = export_dir / "quantized" if self.settings.quantize else export_dir
+        if not any(model_dir.glob("*.onnx")):
+            model = model_class.from_pretrained(spec.model, export=True)
+            model.save_pretrained(export_dir)
+            if self.settings.quantize:
+                from optimum.onnxruntime.configuration import AutoQuantizationConfig
+                quantizer = ort.ORTQuantizer.from_pretrained(model)
+                quantizer.quantize(save_dir=model_dir,
+                                   quantization_config=AutoQuantizationConfig.avx2(is_static=False))
+        onnx_files = sorted(model_dir.glob("*.onnx"))
+        model = model_class.from_pretrained(model_dir, file_name=onnx_files[0].name,
+                                            session_options=session_options)
+        tokenizer = AutoTokenizer.from_pretrained(spec.model)
+        return self._get_pipeline_factory()(spec.task, model=model, tokenizer=tokenizer)
+
+    # --- Inférence ---
+
+    def _batcher(self, name: str) -> MicroBatcher:
+        batcher = self._batchers.get(name)
+        if batcher is None:
+            with self._lock:
+                batcher = self._batchers.get(name)
+                if batcher is None:
+                    spec = self._specs[name]
+
+                    def run_batch(texts: List[str]) -> List[Any]:
+                        pipeline = self.load(name)
+                        # Une liste en entrée donne toujours un résultat par entrée
+                        return pipeline(texts, batch_size=len(texts), **spec.call_kwargs)
+
+                    batcher = MicroBatcher(run_batch, self.settings.max_batch_size,
+                                           self.settings.max_wait, name=f"nlp-{name}")
+                    self._batchers[name] = batcher
+        return batcher
+
+    def predict(self, name: str, texts: List[str], timeout: Optional[float] = None) -> List[Any]:
+        """
+        Prédictions du modèle `name` pour une liste de textes.
+
+        Les textes passent par la file du modèle : ils sont traités en lots,
+        avec ceux des autres threads qui interrogent le même modèle.
+        """
+        if name not in self._specs:
+            raise KeyError(f"Modèle NLP non enregistré : {name}")
+        if not texts:
+            return []
+        return self._batcher(name).map(texts, timeout=timeout)
+
+    # --- Supervision ---
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """État de chaque modèle : chargé ou non, nombre de lots et taille moyenne des lots."""
+        report = {}
+        for name in self._specs:
+            batcher = self._batchers.get(name)
+            report[name] = {
+                "loaded": name in self._pipelines,
+                "batches": batcher.batches if batcher else 0,
+                "items": batcher.items if batcher else 0,
+                "average_batch_size": batcher.average_batch_size if batcher else 0.0,
+            }
+        return report
+
+    def shutdown(self) -> None:
+        """Arrête les files de traitement (les modèles chargés restent en mémoire)."""
+        with self._lock:
+            batchers = list(self._batchers.values())
+            self._batchers.clear()
+        for batcher in batchers:
+            batcher.close()
@@ -13,13 +13,14 @@ import asyncio
 from .jtms_models import (
     # Requêtes
     CreateBeliefRequest, AddJustificationRequest, SetBeliefValidityRequest,
-    QueryBeliefsRequest, ExplainBeliefRequest, GetJTMSStateRequest,
+    BatchOperationsRequest, QueryBeliefsRequest, ExplainBeliefRequest, GetJTMSStateRequest,
     CreateSessionRequest, CreateCheckpointRequest, RestoreCheckpointRequest,
     UpdateSessionMetadataRequest, ExportJTMSRequest, ImportJTMSRequest,
     
     # Réponses
     CreateBeliefResponse, AddJustificationResponse, ExplainBeliefResponse,
     QueryBeliefsResponse, GetJTMSStateResponse, SetBeliefValidityResponse,
+    BatchOperationsResponse,
     CreateSessionResponse, SessionListResponse, CreateCheckpointResponse,
     RestoreCheckpointResponse, ExportJTMSResponse, ImportJTMSResponse,
     PluginStatusResponse, JTMSError,
@@ -29,12 +30,9 @@ from .jtms_models import (
 )
 
 # Import des services
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from services.jtms_service import JTMSService
-from services.jtms_session_manager import JTMSSessionManager
-from plugins.semantic_kernel.jtms_plugin import JTMSSemanticKernelPlugin, create_jtms_plugin
+from argumentation_analysis.services.jtms_service import JTMSService
+from argumentation_analysis.services.jtms_session_manager import JTMSSessionManager
+from argumentation_analysis.plugins.semantic_kernel.jtms_plugin import JTMSSemanticKernelPlugin, create_jtms_plugin
 
 # Router principal pour les endpoints JTMS
 jtms_router = APIRouter(prefix="/jtms", tags=["JTMS"])
@@ -295,6 +293,72 @@ async def set_belief_validity(
         )
         raise HTTPException(status_code=400, detail=error.dict())
 
+@jtms_router.post(
+    "/batch",
+    response_model=BatchOperationsResponse,
+    summary="Appliquer un lot d'opérations",
+    description="""
+Applique plusieurs opérations (croyances, justifications, validités) dans une seule transaction.
+
+- La détection des boucles non monotones et la propagation ne sont faites qu'une fois, à la fin du lot.
+- Crée la session/instance si nécessaire.
+""",
+    responses={
+        400: {"model": JTMSError, "description": "Erreur lors de l'application du lot."}
+    }
+)
+async def apply_batch(
+    request: BatchOperationsRequest,
+    jtms_service: JTMSService = Depends(get_jtms_service),
+    session_manager: JTMSSessionManager = Depends(get_session_manager)
+):
+    """
+    Applique un lot d'opérations JTMS avec une seule passe de propagation.
+    """
+    try:
+        session_id = request.session_id
+        instance_id = request.instance_id
+        
+        if not session_id:
+            session_id = await session_manager.create_session(
+                agent_id=request.agent_id,
+                session_name=f"API_Session_{request.agent_id}",
+                metadata={"created_by": "jtms_api", "auto_created": True}
+            )
+        
+        if not instance_id:
+            instance_id = await jtms_service.create_jtms_instance(
+                session_id=session_id,
+                strict_mode=False
+            )
+            await session_manager.add_jtms_instance_to_session(session_id, instance_id)
+        
+        result = await jtms_service.apply_batch(
+            instance_id=instance_id,
+            operations=[operation.dict() for operation in request.operations]
+        )
+        
+        return BatchOperationsResponse(
+            status="success",
+            operation="apply_batch",
+            session_id=session_id,
+            instance_id=instance_id,
+            agent_id=request.agent_id,
+            timestamp=datetime.now().isoformat(),
+            operations_applied=result["operations_applied"],
+            changed_beliefs=[BeliefInfo(**belief) for belief in result["changed_beliefs"]],
+            total_beliefs=result["total_beliefs"]
+        )
+        
+    except Exception as e:
+        error = await handle_jtms_error(
+            "apply_batch", e,
+            session_id=request.session_id,
+            instance_id=request.instance_id,
+            operations_count=len(request.operations)
+        )
+        raise HTTPException(status_code=400, detail=error.dict())
+
 @jtms_router.post("/beliefs/explain", response_model=ExplainBeliefResponse)
 async def explain_belief(
     request: ExplainBeliefRequest,
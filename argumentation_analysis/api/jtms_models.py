@@ -51,6 +51,22 @@ class SetBeliefValidityRequest(BaseModel):
     instance_id: Optional[str] = Field(None, description="ID d'instance JTMS (optionnel)")
     agent_id: str = Field("api_client", description="ID de l'agent")
 
+class BatchOperation(BaseModel):
+    """Opération élémentaire d'un lot JTMS."""
+    type: str = Field(..., description="Type: 'add_belief', 'add_justification', 'set_validity', 'remove_belief'")
+    belief_name: Optional[str] = Field(None, description="Croyance visée (add_belief, set_validity, remove_belief)")
+    in_beliefs: List[str] = Field([], description="Croyances positives (add_justification)")
+    out_beliefs: List[str] = Field([], description="Croyances négatives (add_justification)")
+    conclusion: Optional[str] = Field(None, description="Croyance conclusion (add_justification)")
+    validity: Optional[bool] = Field(None, description="Nouvelle valeur (set_validity)")
+
+class BatchOperationsRequest(BaseModel):
+    """Requête d'application d'un lot d'opérations en une seule propagation."""
+    operations: List[BatchOperation] = Field(..., description="Opérations à appliquer, dans l'ordre")
+    session_id: Optional[str] = Field(None, description="ID de session (optionnel)")
+    instance_id: Optional[str] = Field(None, description="ID d'instance JTMS (optionnel)")
+    agent_id: str = Field("api_client", description="ID de l'agent")
+
 class QueryBeliefsRequest(BaseModel):
     """Requête d'interrogation de croyances."""
     filter_status: str = Field("all", description="Filtre: 'valid', 'invalid', 'unknown', 'non_monotonic', 'all'")
@@ -166,6 +182,12 @@ class SetBeliefValidityResponse(JTMSResponse):
     new_value: bool = Field(..., description="Nouvelle valeur")
     propagation_occurred: bool = Field(True, description="Indique si propagation effectuée")
 
+class BatchOperationsResponse(JTMSResponse):
+    """Réponse d'application d'un lot d'opérations."""
+    operations_applied: int = Field(0, description="Nombre d'opérations appliquées")
+    changed_beliefs: List[BeliefInfo] = Field([], description="Croyances dont le statut a changé")
+    total_beliefs: int = Field(0, description="Nombre total de croyances")
+
 # Modèles de réponses pour les sessions
 
 class CreateSessionResponse(BaseModel):
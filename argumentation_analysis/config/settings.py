@@ -67,6 +67,15 @@ class JVMSettings(BaseSettings):
     tweety_libs_dir: Path = Path("libs/tweety")
     native_libs_dir: Path = Path("libs/native")
 
+    # Démarrage : import paresseux des classes par logique, archive CDS (JDK >= 13)
+    lazy_class_import: bool = False
+    use_cds_archive: bool = False
+
+    # Pool de workers Tweety hors processus (0 : JVM dans le processus principal)
+    worker_pool_size: int = 0
+    worker_query_timeout: float = 30.0
+    worker_max_requests: int = 0
+
     model_config = SettingsConfigDict(env_prefix='JVM_')
 
 class AppSettings(BaseSettings):
@@ -87,5 +96,6 @@ class AppSettings(BaseSettings):
     enable_jvm: bool = Field(True, alias='ENABLE_JVM')
     use_mock_llm: bool = Field(False, alias='USE_MOCK_LLM')
     libs_dir: Optional[DirectoryPath] = Field(None, alias='LIBS_DIR')
+    corpus_cache_dir: Optional[Path] = Field(None, alias='CORPUS_CACHE_DIR')
 
 settings = AppSettings()
\ No newline at end of file
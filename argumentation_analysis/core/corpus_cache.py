@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Cache des corpus déchiffrés.
+
+Le déchiffrement d'un corpus (`load_extract_definitions` avec une clé) coûte
+un déchiffrement Fernet, une décompression gzip et un décodage JSON ; ce cache
+permet aux traitements par lots de ne payer ce coût qu'une fois :
+
+- les entrées sont indexées par l'empreinte SHA-256 du fichier chiffré et par
+  l'empreinte de la clé : un fichier modifié ou une autre clé ne retrouvent
+  jamais une entrée périmée ;
+- l'empreinte d'un fichier est recalculée seulement si sa date de modification
+  ou sa taille a changé ;
+- le cache est en mémoire (LRU borné) et peut être doublé d'un répertoire,
+  idéalement un tmpfs (`CORPUS_CACHE_DIR`, par exemple `/dev/shm/corpus_cache`),
+  partagé entre les processus d'un même lot. Les définitions y sont stockées
+  EN CLAIR (fichiers en mode 0600) : ne l'activer que sur une machine de
+  confiance, et appeler `clear()` en fin de traitement.
+"""
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+cache_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 8
+
+
+class DecryptedCorpusCache:
+    """
+    Cache des définitions d'extraits déchiffrées.
+
+    Args:
+        max_entries: Nombre maximal de corpus conservés en mémoire.
+        cache_dir: Répertoire de persistance (tmpfs recommandé), None pour la mémoire seule.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, cache_dir: Optional[Union[str, Path]] = None):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._file_digests: Dict[Path, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    # --- Clés ---
+
+    def _file_digest(self, config_file: Path) -> str:
+        """Empreinte SHA-256 du fichier, recalculée seulement si mtime ou taille ont changé."""
+        path = config_file.resolve()
+        stat = path.stat()
+        with self._lock:
+            known = self._file_digests.get(path)
+        if known and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return known[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        with self._lock:
+            self._file_digests[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def _entry_key(self, config_file: Path, b64_derived_key: Union[str, bytes]) -> str:
+        key_bytes = b64_derived_key.encode('utf-8') if isinstance(b64_derived_key, str) else b64_derived_key
+        key_fingerprint = hashlib.sha256(b"corpus-cache:" + key_bytes).hexdigest()
+        return hashlib.sha256(f"{self._file_digest(config_file)}:{key_fingerprint}".encode('ascii')).hexdigest()
+
+    def _disk_path(self, entry_key: str) -> Path:
+        return self.cache_dir / f"{entry_key}.json"
+
+    # --- Accès ---
+
+    def get(
+        self,
+        config_file: Path,
+        b64_derived_key: Union[str, bytes],
+        source_names: Optional[Iterable[str]] = None,
+        with_full_text: bool = True
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Définitions déchiffrées en cache (copie modifiable), ou None.
+
+        `source_names` et `with_full_text` filtrent les définitions avant la
+        copie : seules les sources retenues (sans leur texte complet si
+        `with_full_text=False`) sont copiées, pas le corpus entier.
+        """
+        try:
+            entry_key = self._entry_key(config_file, b64_derived_key)
+        except OSError:
+            return None
+
+        with self._lock:
+            definitions = self._entries.get(entry_key)
+            if definitions is not None:
+                self._entries.move_to_end(entry_key)
+
+        if definitions is None and self.cache_dir is not None:
+            disk_path = self._disk_path(entry_key)
+            try:
+                with open(disk_path, 'r', encoding='utf-8') as f:
+                    definitions = json.load(f)
+                self._remember(entry_key, definitions)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                cache_logger.warning(f"Entrée de cache illisible ignorée ({disk_path.name}): {e}")
+
+        with self._lock:
+            if definitions is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        cache_logger.debug(f"Corpus '{config_file.name}' servi depuis le cache.")
+        if source_names is not None:
+            source_names = set(source_names)
+            definitions = [d for d in definitions if d.get("source_name") in source_names]
+        if not with_full_text:
+            definitions = [{k: v for k, v in d.items() if k != "full_text"} for d in definitions]
+        return copy.deepcopy(definitions)
+
+    def put(self, config_file: Path, b64_derived_key: Union[str, bytes], definitions: List[Dict[str, Any]]) -> None:
+        """Mémorise les définitions déchiffrées d'un fichier pour une clé."""
+        try:
+            entry_key = self._entry_key(config_file, b64_derived_key)
+        except OSError:
+            return
+        stored = copy.deepcopy(definitions)
+        self._remember(entry_key, stored)
+
+        if self.cache_dir is not None:
+            disk_path = self._disk_path(entry_key)
+            temp_path = disk_path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(stored, f, ensure_ascii=False)
+                os.replace(temp_path, disk_path)
+            except OSError as e:
+                cache_logger.warning(f"Écriture du cache impossible ({disk_path.name}): {e}")
+
+    def _remember(self, entry_key: str, definitions: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._entries[entry_key] = definitions
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vide le cache, y compris les fichiers persistés."""
+        with self._lock:
+            self._entries.clear()
+            self._file_digests.clear()
+        if self.cache_dir is not None and self.cache_dir.exists():
+            for cached_file in self.cache_dir.glob("*.json"):
+                try:
+                    cached_file.unlink()
+                except OSError as e:
+                    cache_logger.warning(f"Suppression du cache impossible ({cached_file.name}): {e}")
+
+
+_corpus_cache: Optional[DecryptedCorpusCache] = None
+_corpus_cache_lock = threading.Lock()
+
+
+def get_corpus_cache() -> DecryptedCorpusCache:
+    """Cache de corpus partagé par le processus (répertoire : `settings.corpus_cache_dir`)."""
+    global _corpus_cache
+    with _corpus_cache_lock:
+        if _corpus_cache is None:
+            from argumentation_analysis.config.settings import settings
+            _corpus_cache = DecryptedCorpusCache(cache_dir=settings.corpus_cache_dir)
+        return _corpus_cache
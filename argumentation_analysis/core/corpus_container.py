@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Format conteneur « par blocs » des corpus chiffrés, à accès direct par source.
+
+Le format historique (`.json.gz.enc`) est un unique jeton Fernet contenant
+tout le corpus compressé : lire une source impose de tout déchiffrer et de
+tout décoder, textes complets compris. Dans le conteneur par blocs, chaque
+source est compressée et chiffrée indépendamment, en deux blocs (définition
+sans `full_text`, puis `full_text`), et un petit index chiffré donne la
+position de chaque bloc :
+
+    MAGIC (9 octets) | taille de l'index (uint32 gros-boutiste) | index | blocs...
+
+L'index et chaque bloc sont des jetons Fernet de données gzip (JSON pour
+l'index et les définitions, UTF-8 pour les textes). Les positions de l'index
+sont relatives au début de la zone des blocs. Un jeton Fernet commençant
+toujours par `gAAAAA`, les deux formats se distinguent par leurs premiers
+octets (`is_chunked_corpus`).
+"""
+import gzip
+import json
+import logging
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from cryptography.fernet import Fernet
+
+container_logger = logging.getLogger(__name__)
+
+MAGIC = b"ISCORPUS\x01"
+INDEX_SIZE_FORMAT = ">I"
+FORMAT_VERSION = 1
+
+
+def _fernet(b64_derived_key: Union[str, bytes]) -> Fernet:
+    return Fernet(b64_derived_key.encode('utf-8') if isinstance(b64_derived_key, str) else b64_derived_key)
+
+
+def is_chunked_corpus(config_file: Union[str, Path]) -> bool:
+    """Indique si le fichier est un conteneur par blocs (et non un jeton Fernet unique)."""
+    try:
+        with open(config_file, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_chunked_corpus(definitions: List[Dict[str, Any]],
+                         config_file: Union[str, Path],
+                         b64_derived_key: Union[str, bytes]) -> None:
+    """
+    Écrit des définitions d'extraits au format conteneur par blocs.
+
+    Raises:
+        ValueError: Si la clé n'est pas une clé Fernet valide.
+        OSError: En cas d'erreur d'écriture.
+    """
+    fernet = _fernet(b64_derived_key)
+    blocks: List[bytes] = []
+    entries: List[Dict[str, Any]] = []
+    offset = 0
+
+    def add_block(payload: bytes) -> List[int]:
+        nonlocal offset
+        token = fernet.encrypt(gzip.compress(payload))
+        blocks.append(token)
+        position = [offset, len(token)]
+        offset += len(token)
+        return position
+
+    for definition in definitions:
+        definition = dict(definition)
+        # Un `full_text` absent ou nul reste dans la définition, tel quel
+        full_text = definition.pop("full_text") if definition.get("full_text") is not None else None
+        entry = {
+            "source_name": definition.get("source_name", ""),
+            "definition": add_block(json.dumps(definition, ensure_ascii=False).encode('utf-8')),
+            "full_text": add_block(full_text.encode('utf-8')) if full_text is not None else None,
+        }
+        entries.append(entry)
+
+    index = {"version": FORMAT_VERSION, "sources": entries}
+    index_token = fernet.encrypt(gzip.compress(json.dumps(index, ensure_ascii=False).encode('utf-8')))
+
+    config_file = Path(config_file)
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(config_file, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack(INDEX_SIZE_FORMAT, len(index_token)))
+        f.write(index_token)
+        for token in blocks:
+            f.write(token)
+    container_logger.debug(f"Conteneur par blocs écrit: {len(entries)} sources, {offset} octets de blocs.")
+
+
+class ChunkedCorpusReader:
+    """
+    Lecteur à accès direct d'un conteneur par blocs.
+
+    Seul l'index est déchiffré à l'ouverture ; chaque définition et chaque
+    texte complet ne sont lus et déchiffrés qu'à la demande.
+
+    Args:
+        config_file: Chemin du conteneur.
+        b64_derived_key: Clé Fernet (encodée en base64url, str ou bytes).
+
+    Raises:
+        ValueError: Si le fichier n'est pas un conteneur par blocs.
+        InvalidToken: Si la clé ne permet pas de déchiffrer l'index.
+    """
+
+    def __init__(self, config_file: Union[str, Path], b64_derived_key: Union[str, bytes]):
+        self.config_file = Path(config_file)
+        self._fernet = _fernet(b64_derived_key)
+        self._file = open(self.config_file, 'rb')
+        try:
+            if self._file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"'{self.config_file}' n'est pas un conteneur de corpus par blocs.")
+            (index_size,) = struct.unpack(INDEX_SIZE_FORMAT, self._file.read(struct.calcsize(INDEX_SIZE_FORMAT)))
+            index = json.loads(self._decrypt(self._file.read(index_size)).decode('utf-8'))
+            self._blocks_start = len(MAGIC) + struct.calcsize(INDEX_SIZE_FORMAT) + index_size
+        except Exception:
+            self._file.close()
+            raise
+        self._entries: List[Dict[str, Any]] = index["sources"]
+        self._positions = {entry["source_name"]: i for i, entry in reversed(list(enumerate(self._entries)))}
+
+    def _decrypt(self, token: bytes) -> bytes:
+        return gzip.decompress(self._fernet.decrypt(token))
+
+    def _read_block(self, position: List[int]) -> bytes:
+        offset, length = position
+        self._file.seek(self._blocks_start + offset)
+        token = self._file.read(length)
+        if len(token) != length:
+            raise ValueError(f"Bloc tronqué dans '{self.config_file}'.")
+        return self._decrypt(token)
+
+    def _entry(self, source: Union[int, str]) -> Dict[str, Any]:
+        if isinstance(source, str):
+            if source not in self._positions:
+                raise KeyError(source)
+            return self._entries[self._positions[source]]
+        return self._entries[source]
+
+    # --- Accès ---
+
+    @property
+    def source_names(self) -> List[str]:
+        return [entry["source_name"] for entry in self._entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def has_full_text(self, source: Union[int, str]) -> bool:
+        return self._entry(source)["full_text"] is not None
+
+    def load_source(self, source: Union[int, str], with_full_text: bool = False) -> Dict[str, Any]:
+        """Définition d'une source (par indice ou par nom), avec ou sans son texte complet."""
+        entry = self._entry(source)
+        definition = json.loads(self._read_block(entry["definition"]).decode('utf-8'))
+        if with_full_text and entry["full_text"] is not None:
+            definition["full_text"] = self._read_block(entry["full_text"]).decode('utf-8')
+        return definition
+
+    def read_full_text(self, source: Union[int, str]) -> Optional[str]:
+        """Texte complet d'une source, déchiffré à la demande (None s'il n'est pas embarqué)."""
+        entry = self._entry(source)
+        if entry["full_text"] is None:
+            return None
+        return self._read_block(entry["full_text"]).decode('utf-8')
+
+    def iter_sources(self, with_full_text: bool = False) -> Iterator[Dict[str, Any]]:
+        """Parcourt les définitions une à une (une seule source déchiffrée à la fois)."""
+        for i in range(len(self._entries)):
+            yield self.load_source(i, with_full_text=with_full_text)
+
+    def load_all(self, with_full_text: bool = True) -> List[Dict[str, Any]]:
+        """Toutes les définitions, comme le format historique."""
+        return list(self.iter_sources(with_full_text=with_full_text))
+
+    def load_sources(self, source_names: Optional[Iterable[str]] = None,
+                     with_full_text: bool = True) -> List[Dict[str, Any]]:
+        """
+        Définitions des sources demandées, dans l'ordre du fichier.
+
+        Seuls les blocs de ces sources (et leurs textes si `with_full_text`)
+        sont déchiffrés ; les noms inconnus sont ignorés.
+        """
+        if source_names is None:
+            return self.load_all(with_full_text=with_full_text)
+        wanted = set(source_names)
+        return [
+            self.load_source(i, with_full_text=with_full_text)
+            for i, entry in enumerate(self._entries) if entry["source_name"] in wanted
+        ]
+
+    # --- Cycle de vie ---
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ChunkedCorpusReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def open_chunked_corpus(config_file: Union[str, Path], b64_derived_key: Union[str, bytes]) -> ChunkedCorpusReader:
+    """Ouvre un conteneur par blocs en lecture (à utiliser comme gestionnaire de contexte)."""
+    return ChunkedCorpusReader(config_file, b64_derived_key)
@@ -2,7 +2,7 @@
 """
 I/O Manager for handling all file read/write operations.
 """
-from typing import Optional, Union, List, Dict, Any
+from typing import Optional, Union, List, Dict, Any, Iterable
 import json
 import gzip
 import logging
@@ -10,38 +10,75 @@ from pathlib import Path
 from cryptography.fernet import InvalidToken
 
 from argumentation_analysis.core.utils.crypto_utils import encrypt_data_with_fernet, decrypt_data_with_fernet
+from argumentation_analysis.core.corpus_cache import DecryptedCorpusCache
+from argumentation_analysis.core.corpus_container import is_chunked_corpus, open_chunked_corpus, write_chunked_corpus
 
 io_logger = logging.getLogger(__name__)
 
+# Formats de fichier chiffré : jeton Fernet unique (historique) ou conteneur par blocs
+CONTAINER_FORMAT_LEGACY = "legacy"
+CONTAINER_FORMAT_CHUNKED = "chunked"
+
 
 def load_extract_definitions(
     config_file: Path,
     b64_derived_key: Optional[str],
     app_config: Optional[Dict[str, Any]] = None,
     raise_on_decrypt_error: bool = False,
-    fallback_definitions: Optional[List[Dict[str, Any]]] = None
+    fallback_definitions: Optional[List[Dict[str, Any]]] = None,
+    cache: Optional[DecryptedCorpusCache] = None,
+    source_names: Optional[Iterable[str]] = None,
+    with_full_text: bool = True
 ) -> list:
-    """Charge, déchiffre et décompresse les définitions depuis le fichier chiffré."""
+    """Charge, déchiffre et décompresse les définitions depuis le fichier chiffré.
+
+    Le format du fichier chiffré (historique ou conteneur par blocs) est
+    détecté automatiquement. Si un `cache` est fourni, un fichier déjà
+    déchiffré avec la même clé (et inchangé depuis) est servi sans nouveau
+    déchiffrement.
+
+    `source_names` restreint le résultat aux sources nommées et
+    `with_full_text=False` omet les textes complets (à récupérer ensuite avec
+    `load_source_full_text`). Avec un conteneur par blocs, seuls les blocs
+    correspondants sont déchiffrés ; avec le format historique, le fichier est
+    déchiffré en entier puis filtré.
+    """
     if fallback_definitions is None:
         fallback_definitions = []
+    if source_names is not None:
+        source_names = set(source_names)
+    selective = source_names is not None or not with_full_text
+    chunked = False
 
     if not config_file.exists():
         io_logger.info(f"Fichier config '{config_file}' non trouvé. Utilisation définitions par défaut.")
         return [item.copy() for item in fallback_definitions]
 
     if b64_derived_key:  # Clé fournie, tenter le déchiffrement
+        chunked = is_chunked_corpus(config_file)
+        # Une lecture sélective d'un conteneur par blocs ne déchiffre que le nécessaire : pas de cache
+        if cache is not None and not (chunked and selective):
+            # Le cache filtre avant de copier : seules les sources demandées sont dupliquées
+            cached_definitions = cache.get(config_file, b64_derived_key, source_names, with_full_text)
+            if cached_definitions is not None:
+                io_logger.info(f"-> {len(cached_definitions)} définitions servies depuis le cache pour '{config_file}'.")
+                return cached_definitions
         io_logger.info(f"Chargement et déchiffrement de '{config_file}' avec clé...")
         try:
-            with open(config_file, 'rb') as f:
-                encrypted_data = f.read()
-            decrypted_compressed_data = decrypt_data_with_fernet(encrypted_data, b64_derived_key)
-
-            if not decrypted_compressed_data:
-                io_logger.error(f"Échec du déchiffrement pour '{config_file}'. Le token est peut-être invalide.")
-                raise InvalidToken(f"Échec du déchiffrement pour '{config_file}'.")
-
-            decompressed_data = gzip.decompress(decrypted_compressed_data)
-            definitions = json.loads(decompressed_data.decode('utf-8'))
+            if chunked:
+                with open_chunked_corpus(config_file, b64_derived_key) as reader:
+                    definitions = reader.load_sources(source_names, with_full_text=with_full_text)
+            else:
+                with open(config_file, 'rb') as f:
+                    encrypted_data = f.read()
+                decrypted_compressed_data = decrypt_data_with_fernet(encrypted_data, b64_derived_key)
+
+                if not decrypted_compressed_data:
+                    io_logger.error(f"Échec du déchiffrement pour '{config_file}'. Le token est peut-être invalide.")
+                    raise InvalidToken(f"Échec du déchiffrement pour '{config_file}'.")
+
+                decompressed_data = gzip.decompress(decrypted_compressed_data)
+                definitions = json.loads(decompressed_data.decode('utf-8'))
             io_logger.info("✅ Définitions chargées et déchiffrées.")
 
         except InvalidToken:
@@ -77,20 +114,70 @@ def load_extract_definitions(
         io_logger.warning(f"[WARN] Format definitions invalide apres chargement de '{config_file}'. Utilisation definitions par defaut.")
         return [item.copy() for item in fallback_definitions]
 
+    if b64_derived_key and cache is not None and not (chunked and selective):
+        cache.put(config_file, b64_derived_key, definitions)
+    if not (b64_derived_key and chunked):
+        definitions = select_definitions(definitions, source_names, with_full_text)
+
     io_logger.info(f"-> {len(definitions)} définitions chargées depuis '{config_file}'.")
     return definitions
 
+
+def select_definitions(
+    definitions: List[Dict[str, Any]],
+    source_names: Optional[set],
+    with_full_text: bool
+) -> List[Dict[str, Any]]:
+    """Restreint des définitions déjà chargées aux sources nommées, avec ou sans leurs textes complets."""
+    if source_names is not None:
+        definitions = [d for d in definitions if d.get("source_name") in source_names]
+    if not with_full_text:
+        definitions = [{k: v for k, v in d.items() if k != "full_text"} for d in definitions]
+    return definitions
+
+
+def load_source_full_text(
+    config_file: Path,
+    b64_derived_key: str,
+    source_name: str,
+    cache: Optional[DecryptedCorpusCache] = None
+) -> Optional[str]:
+    """Texte complet embarqué d'une source (None s'il est absent ou illisible).
+
+    Avec un conteneur par blocs, seul le bloc de ce texte est déchiffré ; avec
+    le format historique, le fichier entier est déchiffré (via `cache` s'il
+    est fourni).
+    """
+    try:
+        if is_chunked_corpus(config_file):
+            with open_chunked_corpus(config_file, b64_derived_key) as reader:
+                return reader.read_full_text(source_name)
+    except KeyError:
+        return None
+    except Exception as e:
+        io_logger.error(f"Erreur lecture du texte de '{source_name}' dans '{config_file}': {e}")
+        return None
+    definitions = load_extract_definitions(config_file, b64_derived_key, cache=cache, source_names=[source_name])
+    return definitions[0].get("full_text") if definitions else None
+
 def save_extract_definitions(
     extract_definitions: List[Dict[str, Any]],
     config_file: Path,
     b64_derived_key: Optional[Union[str, bytes]],
     embed_full_text: bool = False,
     config: Optional[Dict[str, Any]] = None,
-    text_retriever: Optional[Any] = None # Fonction pour récupérer le texte
+    text_retriever: Optional[Any] = None, # Fonction pour récupérer le texte
+    container_format: str = CONTAINER_FORMAT_LEGACY
 ) -> bool:
     """Sauvegarde, compresse et chiffre les définitions dans le fichier.
     Peut optionnellement embarquer le texte complet des sources.
+
+    Avec `container_format="chunked"`, chaque source est chiffrée dans ses
+    propres blocs (voir `corpus_container`), lisibles individuellement.
     """
+    if container_format not in (CONTAINER_FORMAT_LEGACY, CONTAINER_FORMAT_CHUNKED):
+        io_logger.error(f"Format de conteneur inconnu: '{container_format}'. Sauvegarde annulée.")
+        return False
     if not b64_derived_key:
         io_logger.error("Clé chiffrement (b64_derived_key) absente ou vide. Sauvegarde annulée.")
         return False
@@ -139,6 +226,15 @@ def save_extract_definitions(
                 source_info.pop("full_text", None)
                 io_logger.debug(f"Champ 'full_text' retiré pour '{source_info.get('source_name', 'Source inconnue')}'.")
 
+    if container_format == CONTAINER_FORMAT_CHUNKED:
+        try:
+            write_chunked_corpus(definitions_to_process, config_file, b64_derived_key)
+            io_logger.info(f"[OK] Définitions sauvegardées (conteneur par blocs) dans '{config_file}'.")
+            return True
+        except Exception as e:
+            io_logger.error(f"[FAIL] Erreur lors de la sauvegarde chiffrée par blocs vers '{config_file}': {e}", exc_info=True)
+            return False
+
     try:
         json_data = json.dumps(definitions_to_process, indent=2, ensure_ascii=False).encode('utf-8')
         compressed_data = gzip.compress(json_data)
@@ -27,6 +27,9 @@ import requests
 import shutil
 import subprocess
 import zipfile
+import hashlib
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Optional, Dict
 from tqdm.auto import tqdm
@@ -44,6 +47,24 @@ _JVM_INITIALIZED_THIS_SESSION = False
 _JVM_WAS_SHUTDOWN = False
 _SESSION_FIXTURE_OWNS_JVM = False
 
+# --- Instrumentation du démarrage ---
+_STARTUP_TIMINGS: Dict[str, float] = {}
+
+
+@contextmanager
+def startup_phase(name: str):
+    """Chronomètre une phase du démarrage ; les durées se cumulent par nom."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _STARTUP_TIMINGS[name] = _STARTUP_TIMINGS.get(name, 0.0) + time.perf_counter() - start
+
+
+def get_startup_timings() -> Dict[str, float]:
+    """Durées (secondes) des phases de démarrage JVM/Tweety mesurées dans ce processus."""
+    return dict(_STARTUP_TIMINGS)
+
 
 def get_project_root_robust() -> Path:
     """
@@ -314,6 +335,111 @@ def find_valid_java_home() -> Optional[str]:
         if jdk_zip_target_path.exists(): jdk_zip_target_path.unlink(missing_ok=True)
         return None
 
+CDS_DIR_NAME = "cds"
+MIN_CDS_JAVA_VERSION = 13       # -XX:ArchiveClassesAtExit (CDS dynamique)
+CDS_STALE_DUMP_SECONDS = 24 * 3600
+
+# Archive CDS générée par ce processus : (fichier temporaire, archive définitive)
+_PENDING_CDS_ARCHIVE: Optional[tuple] = None
+
+
+def get_java_major_version(java_home: str) -> Optional[int]:
+    """Lit la version majeure dans le fichier `release` du JDK, sans lancer `java`."""
+    try:
+        release = (Path(java_home) / "release").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    match = re.search(r'JAVA_VERSION="(\d+)(?:\.(\d+))?', release)
+    if not match:
+        return None
+    major = int(match.group(1))
+    if major == 1 and match.group(2):
+        major = int(match.group(2))
+    return major
+
+
+def get_cds_archive_path(classpath: List[str], java_home: str) -> Path:
+    """
+    Chemin de l'archive CDS pour ce JDK et ce classpath. Le nom dépend du JDK
+    et des JARs (taille, date) : une mise à jour de Tweety produit une nouvelle archive.
+    """
+    digest = hashlib.sha256()
+    for entry in [str(Path(java_home) / "release")] + sorted(classpath):
+        digest.update(entry.encode("utf-8"))
+        try:
+            stat = os.stat(entry)
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode("ascii"))
+        except OSError:
+            pass
+    return LIBS_DIR / CDS_DIR_NAME / f"tweety-{digest.hexdigest()[:16]}.jsa"
+
+
+def get_cds_options(classpath: List[str], java_home: str) -> List[str]:
+    """
+    Options JVM de Class Data Sharing pour les classes Tweety (option
+    `settings.jvm.use_cds_archive`, désactivée par défaut).
+
+    Au premier démarrage, la JVM génère l'archive à son arrêt (CDS dynamique,
+    JDK >= 13) sous un nom propre au processus, renommée ensuite en place par
+    `shutdown_jvm` : des workers démarrés en parallèle n'écrivent jamais le
+    même fichier. Les démarrages suivants chargent l'archive et évitent de
+    re-parser/vérifier les classes des JARs. Sans JDK compatible, aucune
+    option n'est ajoutée.
+    """
+    global _PENDING_CDS_ARCHIVE
+    if not settings.jvm.use_cds_archive:
+        return []
+    major = get_java_major_version(java_home)
+    if major is None or major < MIN_CDS_JAVA_VERSION:
+        logger.debug(f"Archive CDS non utilisée (version Java détectée : {major}).")
+        return []
+    archive = get_cds_archive_path(classpath, java_home)
+    try:
+        archive.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Archive CDS désactivée, répertoire inaccessible : {e}")
+        return []
+    if archive.is_file() and archive.stat().st_size > 0:
+        logger.info(f"Utilisation de l'archive CDS : {archive}")
+        return [f"-XX:SharedArchiveFile={archive}", "-Xshare:auto"]
+    _remove_stale_cds_dumps(archive)
+    dump = archive.with_name(f"{archive.stem}.{os.getpid()}.jsa.tmp")
+    _PENDING_CDS_ARCHIVE = (dump, archive)
+    logger.info(f"Archive CDS absente, elle sera générée à l'arrêt de la JVM : {archive}")
+    return [f"-XX:ArchiveClassesAtExit={dump}"]
+
+
+def _remove_stale_cds_dumps(archive: Path) -> None:
+    """Supprime les archives temporaires laissées par des processus arrêtés sans `shutdown_jvm`."""
+    for dump in archive.parent.glob(f"{archive.stem}.*.jsa.tmp"):
+        try:
+            if time.time() - dump.stat().st_mtime > CDS_STALE_DUMP_SECONDS:
+                dump.unlink()
+        except OSError:
+            pass
+
+
+def promote_cds_archive() -> None:
+    """
+    Renomme en place l'archive CDS générée par ce processus (après l'arrêt de
+    la JVM). Le renommage est atomique : un worker concurrent ne lit jamais
+    une archive partielle, et la dernière archive complète l'emporte.
+    """
+    global _PENDING_CDS_ARCHIVE
+    if _PENDING_CDS_ARCHIVE is None:
+        return
+    dump, archive = _PENDING_CDS_ARCHIVE
+    _PENDING_CDS_ARCHIVE = None
+    try:
+        if dump.is_file() and dump.stat().st_size > 0:
+            os.replace(dump, archive)
+            logger.info(f"Archive CDS enregistrée : {archive}")
+        else:
+            dump.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Impossible d'enregistrer l'archive CDS {archive} : {e}")
+
+
 def get_jvm_options() -> List[str]:
     """
     Retourne une liste d'options JVM optimisées.
@@ -354,10 +480,13 @@ def initialize_jvm(session_fixture_owns_jvm=False) -> bool:
             return False
         
         # Provisioning des dépendances
-        if not download_tweety_jars():
+        with startup_phase("provision_jars"):
+            jars_ok = download_tweety_jars()
+        if not jars_ok:
             return False
         
-        java_home = find_valid_java_home()
+        with startup_phase("find_java_home"):
+            java_home = find_valid_java_home()
         if not java_home:
             return False
         os.environ['JAVA_HOME'] = java_home
@@ -377,16 +506,19 @@ def initialize_jvm(session_fixture_owns_jvm=False) -> bool:
         # Démarrage de la JVM
         try:
             jvm_path = jpype.getDefaultJVMPath()
-            jvm_options = get_jvm_options()
+            jvm_options = get_jvm_options() + get_cds_options(classpath, java_home)
             logger.info("Tentative de démarrage de la JVM...")
-            jpype.startJVM(
-                jvm_path,
-                *jvm_options,
-                classpath=classpath,
-                ignoreUnrecognized=True,
-                convertStrings=False
-            )
+            with startup_phase("start_jvm"):
+                jpype.startJVM(
+                    jvm_path,
+                    *jvm_options,
+                    classpath=classpath,
+                    ignoreUnrecognized=True,
+                    convertStrings=False
+                )
             logger.info("[SUCCESS] JVM démarrée.")
+            logger.info("Durées de démarrage : " + ", ".join(
+                f"{name}={seconds:.3f}s" for name, seconds in get_startup_timings().items()))
             _JVM_INITIALIZED_THIS_SESSION = True
             return True
         except Exception as e:
@@ -406,6 +538,7 @@ def shutdown_jvm(called_by_session_fixture=False):
             jpype.shutdownJVM()
             logger.info("[SUCCESS] JVM arrêtée.")
             _JVM_WAS_SHUTDOWN = True
+            promote_cds_archive()
         except Exception as e:
             logger.error(f"Erreur lors de l'arrêt de la JVM: {e}", exc_info=True)
             _JVM_WAS_SHUTDOWN = True
@@ -21,7 +21,7 @@ import getpass
 import logging
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass, field
 from contextlib import contextmanager
@@ -30,7 +30,8 @@ from contextlib import contextmanager
 from argumentation_analysis.config.settings import settings
 from argumentation_analysis.core.source_manager import SourceManager, SourceConfig, SourceType as LegacySourceType
 from argumentation_analysis.core.utils.crypto_utils import derive_encryption_key, load_encryption_key
-from argumentation_analysis.core.io_manager import load_extract_definitions
+from argumentation_analysis.core.io_manager import load_extract_definitions, load_source_full_text
+from argumentation_analysis.core.corpus_cache import get_corpus_cache
 from argumentation_analysis.models.extract_definition import ExtractDefinitions
 
 logger = logging.getLogger(__name__)
@@ -102,6 +103,8 @@ class UnifiedSourceManager:
         self.logger = self._setup_logging()
         self._temp_files: List[Path] = []
         self._cached_sources: Dict[str, Any] = {}
+        # Fichier .enc chargé et sa clé : les textes complets y sont lus à la demande
+        self._enc_source: Optional[Tuple[Path, str]] = None
         
         # Intégration avec le SourceManager existant pour compatibilité
         self._legacy_manager: Optional[SourceManager] = None
@@ -202,10 +205,15 @@ class UnifiedSourceManager:
             if not encryption_key:
                 return None, "Impossible de dériver la clé de chiffrement"
             
-            # Charger les définitions
-            definitions = load_extract_definitions(config_file=enc_path, b64_derived_key=encryption_key, fallback_definitions=[])
+            # Charger les définitions sans les textes complets, lus ensuite source par source
+            # (clé et corpus déchiffré mémorisés pour le processus)
+            definitions = load_extract_definitions(
+                config_file=enc_path, b64_derived_key=encryption_key, fallback_definitions=[],
+                cache=get_corpus_cache(), with_full_text=False
+            )
             if not definitions:
                 return None, "Impossible de charger les définitions depuis le fichier .enc"
+            self._enc_source = (enc_path, encryption_key)
             
             # Convertir en ExtractDefinitions si nécessaire
             if isinstance(definitions, list):
@@ -321,12 +329,17 @@ class UnifiedSourceManager:
         if self.config.source_type in [UnifiedSourceType.SIMPLE, UnifiedSourceType.COMPLEX] and self._legacy_manager:
             return self._legacy_manager.select_text_for_analysis(extract_definitions)
         
-        # Pour les nouveaux types de sources, sélectionner le contenu approprié
-        for source in extract_definitions.sources:
-            if hasattr(source, 'full_text') and source.full_text:
+        # Pour les nouveaux types de sources, sélectionner le contenu approprié,
+        # en commençant par la source demandée (`source_index`)
+        sources = list(extract_definitions.sources)
+        if 0 < self.config.source_index < len(sources):
+            sources.insert(0, sources.pop(self.config.source_index))
+        for source in sources:
+            source_text = self._source_full_text(source)
+            if source_text:
                 description = f"Source {self.config.source_type.value}: {source.source_name}"
                 self.logger.info(f"Texte sélectionné: {description}")
-                return source.full_text.strip(), description
+                return source_text.strip(), description
             
             if source.extracts:
                 for extract in source.extracts:
@@ -342,6 +355,44 @@ class UnifiedSourceManager:
         )
         return fallback_text, "Texte de fallback (aucun contenu trouvé)"
     
+    def iter_texts_for_analysis(self, extract_definitions: Optional[ExtractDefinitions]) -> Iterator[Tuple[str, str]]:
+        """
+        Parcourt tous les textes analysables des sources chargées (mode corpus).
+        
+        Contrairement à `select_text_for_analysis`, aucun texte de fallback n'est
+        produit : seuls les contenus non vides sont renvoyés, au fil de l'eau.
+        
+        Args:
+            extract_definitions: Les définitions d'extraits chargées
+            
+        Yields:
+            Tuple[str, str]: La description du texte et le texte lui-même
+        """
+        if not extract_definitions or not extract_definitions.sources:
+            return
+        
+        for source in extract_definitions.sources:
+            source_text = self._source_full_text(source)
+            if source_text and source_text.strip():
+                yield f"Source {self.config.source_type.value}: {source.source_name}", source_text.strip()
+            
+            for extract in source.extracts or []:
+                extract_text = getattr(extract, 'full_text', None)
+                if extract_text and extract_text.strip():
+                    description = f"Source {self.config.source_type.value}: {source.source_name} / {extract.extract_name}"
+                    yield description, extract_text.strip()
+    
+    def _source_full_text(self, source: Any) -> Optional[str]:
+        """
+        Texte complet d'une source : celui des définitions, sinon celui embarqué
+        dans le fichier .enc chargé, déchiffré pour cette seule source.
+        """
+        source_text = getattr(source, 'full_text', None)
+        if not source_text and self._enc_source is not None:
+            enc_path, encryption_key = self._enc_source
+            source_text = load_source_full_text(enc_path, encryption_key, source.source_name, cache=get_corpus_cache())
+        return source_text
+    
     def list_available_sources(self) -> Dict[str, List[str]]:
         """
         Liste toutes les sources disponibles sans les charger complètement.
@@ -1,7 +1,11 @@
 # project_core/utils/crypto_utils.py
 import base64
+import hashlib
+import hmac
 import logging
 import os
+import threading
+from collections import OrderedDict
 from typing import Optional, Union # MODIFIÉ: Ajout de Union
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -24,9 +28,65 @@ if not logger.handlers:
 # Pourrait être externalisé dans une configuration si partagé par d'autres modules.
 FIXED_SALT = b'q\x8b\t\x97\x8b\xe9\xa3\xf2\xe4\x8e\xea\xf5\xe8\xb7\xd6\x8c'
 
+PBKDF2_ITERATIONS = 480000
+
+# --- Cache des clés dérivées (niveau processus) ---
+# PBKDF2 est volontairement coûteux (~0,5 s par dérivation) : chaque couple
+# (phrase secrète, sel) n'est dérivé qu'une fois par processus. Le cache est
+# indexé par une empreinte HMAC avec un secret tiré au démarrage du processus,
+# si bien que ni la phrase secrète ni une empreinte exploitable hors du
+# processus ne sont conservées.
+KEY_CACHE_MAX_ENTRIES = 32
+_key_cache_secret = os.urandom(32)
+_derived_key_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_derived_key_cache_lock = threading.Lock()
+
+
+def _key_cache_id(passphrase: str, salt: bytes, iterations: int, length: int) -> bytes:
+    """Empreinte de cache d'une dérivation (jamais la phrase secrète elle-même)."""
+    message = b"%d:%d:%d:" % (iterations, length, len(salt)) + salt + passphrase.encode('utf-8')
+    return hmac.new(_key_cache_secret, message, hashlib.sha256).digest()
+
+
+def _derive_pbkdf2_cached(passphrase: str, salt: bytes, iterations: int, length: int,
+                          use_cache: bool = True) -> bytes:
+    """Dérivation PBKDF2-HMAC-SHA256, mémorisée pour le processus (LRU borné)."""
+    cache_id = _key_cache_id(passphrase, salt, iterations, length)
+    with _derived_key_cache_lock:
+        cached = _derived_key_cache.get(cache_id)
+        if cached is not None:
+            _derived_key_cache.move_to_end(cache_id)
+            return cached
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=length,
+        salt=salt,
+        iterations=iterations,
+        backend=default_backend()
+    )
+    derived_key = kdf.derive(passphrase.encode('utf-8'))
+    if not use_cache:
+        return derived_key
+
+    with _derived_key_cache_lock:
+        _derived_key_cache[cache_id] = derived_key
+        _derived_key_cache.move_to_end(cache_id)
+        while len(_derived_key_cache) > KEY_CACHE_MAX_ENTRIES:
+            _derived_key_cache.popitem(last=False)
+    return derived_key
+
+
+def clear_derived_key_cache() -> None:
+    """Vide le cache des clés dérivées (par exemple après usage de données sensibles)."""
+    with _derived_key_cache_lock:
+        _derived_key_cache.clear()
+
+
 def derive_encryption_key(passphrase: str) -> Optional[bytes]:
     """
     Dérive une clé de chiffrement Fernet (encodée en base64url) à partir d'une phrase secrète.
+    La dérivation n'est effectuée qu'une fois par processus et par phrase secrète.
     
     Args:
         passphrase: La phrase secrète.
@@ -39,14 +99,8 @@ def derive_encryption_key(passphrase: str) -> Optional[bytes]:
         logger.warning("Tentative de dérivation de clé avec une phrase secrète vide. Retour de None.")
         return None
     try:
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32, # Produit une clé de 256 bits, adaptée pour Fernet
-            salt=FIXED_SALT,
-            iterations=480000,
-            backend=default_backend()
-        )
-        derived_key_raw = kdf.derive(passphrase.encode('utf-8'))
+        # Clé de 256 bits, adaptée pour Fernet
+        derived_key_raw = _derive_pbkdf2_cached(passphrase, FIXED_SALT, PBKDF2_ITERATIONS, 32)
         # Fernet attend une clé encodée en base64 URL-safe.
         encryption_key_bytes = base64.urlsafe_b64encode(derived_key_raw)
         
@@ -160,16 +214,18 @@ def decrypt_data_with_fernet(encrypted_data: bytes, b64_encoded_key_str: Union[s
 
 # --- Fonctions de chiffrement/déchiffrement AESGCM ---
 
-def derive_key_aes(passphrase: str, salt: bytes, key_length: int = 32, iterations: int = 480000) -> bytes:
+def derive_key_aes(passphrase: str, salt: bytes, key_length: int = 32, iterations: int = PBKDF2_ITERATIONS,
+                   use_cache: bool = True) -> bytes:
     """
     Dérive une clé de chiffrement pour AESGCM à partir d'une phrase secrète et d'un sel.
-    Utilise PBKDF2HMAC avec SHA256.
+    Utilise PBKDF2HMAC avec SHA256 ; le résultat est mémorisé par (phrase secrète, sel).
 
     Args:
         passphrase: La phrase secrète.
         salt: Le sel à utiliser pour la dérivation.
         key_length: La longueur souhaitée de la clé en bytes (par défaut 32 pour AES-256).
         iterations: Le nombre d'itérations pour PBKDF2HMAC.
+        use_cache: Mémoriser la clé (inutile pour un sel à usage unique, comme au chiffrement).
 
     Returns:
         bytes: La clé dérivée.
@@ -182,14 +238,7 @@ def derive_key_aes(passphrase: str, salt: bytes, key_length: int = 32, iteration
         raise ValueError("Le sel ne peut pas être vide pour la dérivation de clé AES.")
 
     try:
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=key_length,
-            salt=salt,
-            iterations=iterations, # Nombre d'itérations standard, peut être augmenté pour plus de sécurité
-            backend=default_backend()
-        )
-        derived_key = kdf.derive(passphrase.encode('utf-8'))
+        derived_key = _derive_pbkdf2_cached(passphrase, salt, iterations, key_length, use_cache=use_cache)
         logger.debug(f"Clé AES dérivée avec succès (longueur: {len(derived_key)} bytes).")
         return derived_key
     except Exception as e:
@@ -216,7 +265,7 @@ def encrypt_data_aesgcm(data_bytes: bytes, passphrase: str, salt_len: int = 16,
         return None
     try:
         salt = os.urandom(salt_len)
-        key = derive_key_aes(passphrase, salt)
+        key = derive_key_aes(passphrase, salt, use_cache=False)
         
         from cryptography.hazmat.primitives.ciphers.aead import AESGCM # Ajout import
         aesgcm = AESGCM(key)
@@ -12,6 +12,7 @@ d'argumentation. Cela peut inclure :
 
 Modules clés :
     - `embedding_utils`: Fonctions pour la création et la manipulation d'embeddings.
+    - `aho_corasick`: Automate de recherche simultanée de sous-chaînes.
 """
 
 # Exposer les fonctions ou classes importantes si nécessaire
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Recherche simultanée de sous-chaînes par automate d'Aho–Corasick.
+
+Module sans dépendance, partagé par l'index de la taxonomie des sophismes,
+le moteur de patterns du service web et le moteur de relations entre
+arguments.
+"""
+
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+
+class AhoCorasick:
+    """
+    Automate d'Aho–Corasick minimal (Python pur) pour la recherche simultanée
+    de sous-chaînes.
+
+    Les motifs sont ajoutés avec `add`, puis l'automate est compilé par
+    `build`. `find_all` retourne l'ensemble des motifs présents dans un texte
+    en un seul passage.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        self._built = False
+
+    def add(self, pattern: str) -> None:
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        if pattern not in self._output[state]:
+            self._output[state] = self._output[state] + (pattern,)
+        self._built = False
+
+    def build(self) -> None:
+        """Calcule les liens d'échec (parcours en largeur) et fusionne les sorties."""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+        self._built = True
+
+    def find_all(self, text: str) -> Set[str]:
+        """Retourne l'ensemble des motifs présents au moins une fois dans `text`."""
+        if not self._built:
+            self.build()
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def __len__(self) -> int:
+        return len(self._goto)
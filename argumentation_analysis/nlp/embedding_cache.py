@@ -0,0 +1,214 @@
+"""
+Cache disque des embeddings, adressé par contenu.
+
+Chaque vecteur est identifié par le couple (modèle, SHA-256 du morceau de
+texte). Pour chaque modèle, le cache contient :
+    - `vectors.f32` : les vecteurs float32 bout à bout (fichier binaire plat,
+      en ajout seul) ;
+    - `index.json` : la dimension et la correspondance empreinte -> numéro
+      de ligne (le nombre d'entrées donne le nombre de vecteurs valides) ;
+    - `index.journal` : les entrées ajoutées depuis le dernier `index.json`,
+      une ligne `numéro empreinte` par vecteur, en ajout seul.
+
+La lecture passe par `numpy.memmap` : aucun vecteur n'est copié tant que les
+lignes demandées sont contiguës (cas d'un document ré-encodé à l'identique).
+Un ajout écrit d'abord les vecteurs, puis leurs lignes de journal : son coût
+ne dépend que du lot ajouté. Le journal est fusionné dans `index.json`
+(réécrit atomiquement) lorsqu'il dépasse la taille de l'index. Des octets
+écrits au-delà du nombre de lignes indexées (interruption) sont ignorés puis
+écrasés au prochain ajout ; une ligne de journal incomplète est écartée.
+
+Le cache est sûr entre threads d'un même processus, pas entre processus.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILENAME = "vectors.f32"
+INDEX_FILENAME = "index.json"
+JOURNAL_FILENAME = "index.journal"
+# Taille minimale du journal (en entrées) avant sa fusion dans l'index
+JOURNAL_COMPACTION_MIN_ENTRIES = 1024
+
+
+def chunk_hash(text: str) -> str:
+    """Empreinte SHA-256 (hexadécimale) d'un morceau de texte."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class _ModelStore:
+    """Vecteurs d'un seul modèle : fichier plat + index."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.vectors_path = directory / VECTORS_FILENAME
+        self.index_path = directory / INDEX_FILENAME
+        self.journal_path = directory / JOURNAL_FILENAME
+        self.dim: Optional[int] = None
+        self.rows: Dict[str, int] = {}
+        self._matrix: Optional[np.memmap] = None
+        self._journal_entries = 0
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            self.dim = index["dim"]
+            self.rows = index["rows"]
+            self._replay_journal()
+
+    def _replay_journal(self):
+        """Applique les entrées du journal postérieures à `index.json`."""
+        if not self.journal_path.exists():
+            return
+        damaged = False
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if not line.endswith("\n") or len(parts) != 2 or not parts[0].isdigit() or len(parts[1]) != 64:
+                    damaged = True
+                    break
+                row, digest = int(parts[0]), parts[1]
+                if row < self.count:
+                    continue  # Déjà fusionnée dans index.json
+                if row > self.count:
+                    damaged = True
+                    break
+                self.rows[digest] = row
+                self._journal_entries += 1
+        if damaged:
+            logger.warning(f"Journal d'index incomplet ignoré après {self.count} entrées ({self.journal_path}).")
+            self._write_index()
+
+    @property
+    def count(self) -> int:
+        return len(self.rows)
+
+    def matrix(self) -> np.ndarray:
+        """Vue memmap (lecture seule) des vecteurs indexés."""
+        if self.count == 0:
+            return np.empty((0, self.dim or 0), dtype=np.float32)
+        if self._matrix is None or self._matrix.shape[0] != self.count:
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(self.count, self.dim))
+        return self._matrix
+
+    def append(self, hashes: List[str], vectors: np.ndarray):
+        """Ajoute des vecteurs (empreintes absentes du cache) en fin de fichier."""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Dimension {vectors.shape[1]} incompatible avec le cache ({self.dim}).")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Libérer la projection avant de modifier le fichier (impossible sous Windows sinon)
+        self._matrix = None
+        start = self.count
+        valid_bytes = start * self.dim * 4
+        if self.vectors_path.exists():
+            with open(self.vectors_path, "r+b") as f:
+                if os.fstat(f.fileno()).st_size != valid_bytes:
+                    f.truncate(valid_bytes)
+                f.seek(valid_bytes)
+                f.write(vectors.tobytes())
+        else:
+            with open(self.vectors_path, "wb") as f:
+                f.write(vectors.tobytes())
+
+        new_rows = [(start + offset, digest) for offset, digest in enumerate(hashes)]
+        self.rows.update((digest, row) for row, digest in new_rows)
+        if not self.index_path.exists() or self._journal_entries + len(new_rows) > max(
+                JOURNAL_COMPACTION_MIN_ENTRIES, start):
+            self._write_index()
+        else:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.writelines(f"{row} {digest}\n" for row, digest in new_rows)
+            self._journal_entries += len(new_rows)
+
+    def _write_index(self):
+        """Réécrit `index.json` avec toutes les entrées, puis vide le journal."""
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "rows": self.rows}, f)
+        os.replace(tmp_path, self.index_path)
+        # Une interruption ici laisse des lignes déjà fusionnées, ignorées à la relecture
+        if self.journal_path.exists():
+            os.remove(self.journal_path)
+        self._journal_entries = 0
+
+
+class EmbeddingCache:
+    """
+    Cache d'embeddings persistant, partagé entre exécutions du pipeline.
+
+    :param cache_dir: Répertoire racine du cache (un sous-répertoire par modèle).
+    :type cache_dir: Path
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self._stores: Dict[str, _ModelStore] = {}
+        self._lock = threading.Lock()
+
+    def _store(self, model_name: str) -> _ModelStore:
+        store = self._stores.get(model_name)
+        if store is None:
+            # Nom lisible + empreinte du nom exact : « org/model » et « org_model » restent distincts
+            safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+            digest = hashlib.sha256(model_name.encode("utf-8")).hexdigest()[:12]
+            store = _ModelStore(self.cache_dir / f"{safe_name}-{digest}")
+            self._stores[model_name] = store
+        return store
+
+    def __contains__(self, key) -> bool:
+        model_name, text = key
+        return chunk_hash(text) in self._store(model_name).rows
+
+    def get_embeddings(
+        self,
+        text_chunks: List[str],
+        embedding_model_name: str,
+        encoder: Callable[..., np.ndarray],
+        **encoder_kwargs,
+    ) -> np.ndarray:
+        """
+        Retourne les embeddings (float32, une ligne par morceau) en n'encodant
+        que les morceaux absents du cache.
+
+        :param encoder: Fonction `(morceaux, nom_du_modèle, **kwargs)` qui
+                        encode les morceaux manquants, typiquement
+                        `get_embeddings_for_chunks`.
+        :return: Une vue memmap (sans copie) si les lignes demandées sont
+                 contiguës dans le cache, sinon une matrice rassemblée.
+        """
+        with self._lock:
+            store = self._store(embedding_model_name)
+            hashes = [chunk_hash(text) for text in text_chunks]
+            missing: Dict[str, str] = {}
+            for digest, text in zip(hashes, text_chunks):
+                if digest not in store.rows and digest not in missing:
+                    missing[digest] = text
+
+            if missing:
+                logger.info(f"Cache d'embeddings ({embedding_model_name}): {len(missing)} morceau(x) à encoder, "
+                            f"{len(text_chunks) - len(missing)} déjà en cache.")
+                vectors = np.asarray(
+                    encoder(list(missing.values()), embedding_model_name, **encoder_kwargs), dtype=np.float32
+                )
+                if vectors.ndim != 2 or len(vectors) != len(missing):
+                    raise ValueError("L'encodeur n'a pas retourné un vecteur par morceau.")
+                store.append(list(missing), vectors)
+            else:
+                logger.info(f"Cache d'embeddings ({embedding_model_name}): {len(text_chunks)} morceau(x) déjà en cache.")
+
+            matrix = store.matrix()
+            rows = [store.rows[digest] for digest in hashes]
+            if rows and rows == list(range(rows[0], rows[0] + len(rows))):
+                return matrix[rows[0]:rows[0] + len(rows)]
+            return np.asarray(matrix[rows]) if rows else matrix[:0]
@@ -10,17 +10,25 @@ Ce module fournit des fonctions pour :
         (incluant potentiellement les textes originaux et d'autres métadonnées)
         dans un fichier au format JSON.
 
+Les modèles Sentence Transformers et le client OpenAI sont conservés dans un
+pool partagé par le processus (`get_sentence_transformer`, `get_openai_client`,
+`clear_embedding_pool`), ce qui évite de les recharger à chaque appel.
+
 Il gère les importations conditionnelles pour OpenAI et Sentence Transformers,
 permettant une utilisation flexible même si l'une des bibliothèques n'est pas
 installée (bien que cela lèvera une `ImportError` si le modèle correspondant
 est sollicité).
 """
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 from typing import List
 import logging
 
+import numpy as np
+
 # Importation conditionnelle ou gestion d'erreur si openai n'est pas installé.
 # Pour l'instant, on suppose qu'il est disponible.
 try:
@@ -39,7 +47,106 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-def get_embeddings_for_chunks(text_chunks: List[str], embedding_model_name: str) -> List[List[float]]:
+# Pool de modèles/clients partagé par tout le processus.
+# La clé inclut la fabrique (classe) en plus du nom : un modèle n'est chargé
+# qu'une fois par processus, et remplacer la fabrique (tests, rechargement de
+# la bibliothèque) ne renvoie jamais une instance périmée.
+# Le verrou global ne protège que les dictionnaires : chaque chargement se fait
+# sous le verrou de sa propre clé, sans bloquer les autres modèles.
+_MODEL_POOL: Dict[tuple, Any] = {}
+_LOAD_LOCKS: Dict[tuple, threading.Lock] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pooled(factory, name: str, *args):
+    """Renvoie l'instance partagée `factory(*args)` associée à `name`, en la créant au besoin."""
+    key = (factory, name)
+    with _POOL_LOCK:
+        instance = _MODEL_POOL.get(key)
+        if instance is not None:
+            return instance
+        load_lock = _LOAD_LOCKS.setdefault(key, threading.Lock())
+
+    # Un seul chargement par clé ; les appels concurrents sur la même clé attendent
+    with load_lock:
+        with _POOL_LOCK:
+            instance = _MODEL_POOL.get(key)
+        if instance is None:
+            logger.info(f"Chargement de '{name}' dans le pool d'embeddings")
+            instance = factory(*args)
+            with _POOL_LOCK:
+                _MODEL_POOL[key] = instance
+        return instance
+
+
+def get_sentence_transformer(model_name: str):
+    """Modèle Sentence Transformer partagé (chargé au premier appel seulement)."""
+    return _get_pooled(SentenceTransformer, model_name, model_name)
+
+
+def get_openai_client():
+    """Client OpenAI partagé (le client est thread-safe et réutilise ses connexions)."""
+    return _get_pooled(OpenAI, "openai")
+
+
+def clear_embedding_pool():
+    """Libère tous les modèles et clients du pool (par exemple pour récupérer la mémoire)."""
+    with _POOL_LOCK:
+        _MODEL_POOL.clear()
+        _LOAD_LOCKS.clear()
+
+
+def _split_batches(text_chunks: List[str], batch_size: Optional[int]) -> List[List[str]]:
+    if not batch_size or batch_size >= len(text_chunks):
+        return [text_chunks]
+    return [text_chunks[i:i + batch_size] for i in range(0, len(text_chunks), batch_size)]
+
+
+def _run_batches(encode_batch, batches: List[List[str]], max_in_flight: int, as_numpy: bool):
+    """
+    Encode les lots (au plus `max_in_flight` simultanément) et assemble le
+    résultat dans l'ordre des morceaux.
+
+    En mode NumPy, la matrice float32 finale est allouée une seule fois et
+    remplie lot par lot, sans liste Python intermédiaire.
+    """
+    if max_in_flight > 1 and len(batches) > 1:
+        executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="embeddings")
+        results = executor.map(encode_batch, batches)
+    else:
+        executor = None
+        results = map(encode_batch, batches)
+    try:
+        if not as_numpy:
+            embeddings = []
+            for batch_result in results:
+                embeddings.extend(batch_result.tolist() if hasattr(batch_result, 'tolist')
+                                  else [list(map(float, emb)) for emb in batch_result])
+            return embeddings
+        total = sum(len(batch) for batch in batches)
+        matrix = None
+        offset = 0
+        for batch_result in results:
+            block = np.asarray(batch_result, dtype=np.float32)
+            if matrix is None:
+                if len(batches) == 1:
+                    return block
+                matrix = np.empty((total, block.shape[1]), dtype=np.float32)
+            matrix[offset:offset + len(block)] = block
+            offset += len(block)
+        return matrix if matrix is not None else np.empty((0, 0), dtype=np.float32)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def get_embeddings_for_chunks(
+    text_chunks: List[str],
+    embedding_model_name: str,
+    batch_size: Optional[int] = None,
+    max_in_flight: int = 1,
+    as_numpy: bool = False,
+) -> Union[List[List[float]], "np.ndarray"]:
     """
     Génère les embeddings pour une liste de morceaux de texte en utilisant un modèle spécifié.
 
@@ -50,6 +157,9 @@ def get_embeddings_for_chunks(text_chunks: List[str], embedding_model_name: str)
     Supporte les modèles d'embedding OpenAI (par exemple, "text-embedding-3-small")
     et les modèles Sentence Transformers (par exemple, "all-MiniLM-L6-v2").
 
+    Les modèles et le client OpenAI sont conservés dans un pool partagé par le
+    processus : seul le premier appel pour un modèle donné paie son chargement.
+
     :param text_chunks: Une liste de chaînes de caractères, où chaque chaîne est un morceau
                         de texte pour lequel un embedding doit être généré.
     :type text_chunks: List[str]
@@ -57,10 +167,20 @@ def get_embeddings_for_chunks(text_chunks: List[str], embedding_model_name: str)
                                  Peut être un modèle OpenAI (commençant par "text-embedding-")
                                  ou un modèle Sentence Transformer (par exemple, "all-MiniLM-L6-v2").
     :type embedding_model_name: str
+    :param batch_size: Nombre maximal de morceaux par appel au modèle ou à l'API.
+                       `None` (défaut) envoie tout en un seul appel.
+    :type batch_size: Optional[int]
+    :param max_in_flight: Nombre maximal de lots traités simultanément (threads).
+    :type max_in_flight: int
+    :param as_numpy: Si True, retourne directement une matrice NumPy float32
+                     (n_morceaux x dimension) au lieu d'une liste de listes,
+                     ce qui évite de dupliquer les vecteurs en mémoire.
+    :type as_numpy: bool
 
-    :return: Une liste d'embeddings, où chaque embedding est une liste de flottants.
+    :return: Une liste d'embeddings, où chaque embedding est une liste de flottants
+             (ou une matrice float32 si `as_numpy`).
              L'ordre des embeddings correspond à l'ordre des morceaux de texte en entrée.
-    :rtype: List[List[float]]
+    :rtype: Union[List[List[float]], np.ndarray]
 
     :raises ImportError: Si la bibliothèque requise (OpenAI ou Sentence Transformers)
                          n'est pas installée lors de la tentative d'utilisation du modèle correspondant.
@@ -73,6 +193,8 @@ def get_embeddings_for_chunks(text_chunks: List[str], embedding_model_name: str)
     :raises RuntimeError: Pour des erreurs d'exécution inattendues avec Sentence Transformers.
     :raises Exception: Pour d'autres erreurs inattendues non explicitement gérées.
     """
+    batches = _split_batches(text_chunks, batch_size)
+
     # Choix de la méthode de génération d'embeddings en fonction du nom du modèle
     if embedding_model_name.startswith("text-embedding-"):
         # Utilisation des modèles OpenAI
@@ -84,14 +206,17 @@ def get_embeddings_for_chunks(text_chunks: List[str], embedding_model_name: str)
                 "Veuillez l'installer pour utiliser les modèles d'embedding OpenAI."
             )
         try:
-            client = OpenAI() # Initialisation du client OpenAI
-            response = client.embeddings.create(
-                input=text_chunks,
-                model=embedding_model_name
-            )
-            # Extraction des embeddings de la réponse de l'API
-            embeddings = [item.embedding for item in response.data]
-            return embeddings
+            client = get_openai_client() # Client OpenAI partagé
+
+            def encode_batch(batch):
+                response = client.embeddings.create(
+                    input=batch,
+                    model=embedding_model_name
+                )
+                # Extraction des embeddings de la réponse de l'API
+                return [item.embedding for item in response.data]
+
+            return _run_batches(encode_batch, batches, max_in_flight, as_numpy)
         except APIError as e:
             logger.error(f"Erreur de l'API OpenAI lors de la génération des embeddings avec le modèle {embedding_model_name}: {e}")
             # Relance l'exception APIError pour que l'appelant puisse la gérer spécifiquement.
@@ -110,18 +235,11 @@ def get_embeddings_for_chunks(text_chunks: List[str], embedding_model_name: str)
                 "mais n'a pas pu être importée. Veuillez l'installer."
             )
         try:
-            logger.info(f"Chargement du modèle Sentence Transformer: {embedding_model_name}")
-            model = SentenceTransformer(embedding_model_name) # Chargement du modèle
+            model = get_sentence_transformer(embedding_model_name) # Modèle partagé
             logger.info(f"Génération des embeddings avec {embedding_model_name} pour {len(text_chunks)} morceaux.")
-            embeddings_np = model.encode(text_chunks) # Génération des embeddings (typiquement un ndarray NumPy)
-            
-            # Conversion en liste de listes de flottants Python standard
-            # Commentaire : Assure un format de sortie cohérent, quel que soit le type de retour de model.encode().
-            if hasattr(embeddings_np, 'tolist'):
-                embeddings = embeddings_np.tolist() # Méthode standard pour les arrays NumPy
-            else:
-                # Cas de repli si embeddings_np n'est pas un array NumPy (par exemple, déjà une liste de listes)
-                embeddings = [list(map(float, emb)) for emb in embeddings_np]
+            # model.encode renvoie typiquement un ndarray NumPy float32 ; la
+            # conversion éventuelle en listes se fait lot par lot.
+            embeddings = _run_batches(model.encode, batches, max_in_flight, as_numpy)
             logger.info("Embeddings générés avec succès.")
             return embeddings
         except OSError as e:
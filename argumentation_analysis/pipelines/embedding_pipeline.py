@@ -25,6 +25,9 @@ Données d'entrée:
         - Les définitions de sources (mises à jour avec les textes récupérés)
           sont sauvegardées dans un nouveau fichier de configuration chiffré.
         - Les embeddings générés sont stockés dans des fichiers JSON dédiés.
+        - Les vecteurs sont aussi conservés dans un cache disque adressé par
+          contenu (`EmbeddingCache`) : une nouvelle exécution n'encode que les
+          morceaux de texte nouveaux ou modifiés.
 
 Artefacts produits:
     - Un fichier de configuration de sortie mis à jour.
@@ -59,6 +62,7 @@ from argumentation_analysis.core.io_manager import load_extract_definitions, sav
 from argumentation_analysis.ui.utils import get_full_text_for_source
 from argumentation_analysis.ui.config import ENCRYPTION_KEY as CONFIG_UI_ENCRYPTION_KEY
 from argumentation_analysis.nlp.embedding_utils import get_embeddings_for_chunks, save_embeddings_data
+from argumentation_analysis.nlp.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +74,9 @@ def run_embedding_generation_pipeline(
     generate_embeddings_model: Optional[str],
     force_overwrite: bool,
     log_level: str = "INFO",
-    passphrase: Optional[str] = None
+    passphrase: Optional[str] = None,
+    embedding_cache_dir: Optional[Path] = None,
+    use_embedding_cache: bool = True
 ) -> None:
     """Exécute le pipeline de génération d'embeddings.
 
@@ -116,6 +122,11 @@ def run_embedding_generation_pipeline(
     :param passphrase: Passphrase (OBSOLÈTE pour la dérivation de clé dans ce
         pipeline, mais conservé pour la signature de la fonction).
     :type passphrase: Optional[str]
+    :param embedding_cache_dir: Répertoire du cache d'embeddings. Par défaut,
+        `embeddings_data/cache` à côté du fichier de configuration de sortie.
+    :type embedding_cache_dir: Optional[Path]
+    :param use_embedding_cache: Si False, tous les morceaux sont ré-encodés.
+    :type use_embedding_cache: bool
     :return: None. La fonction termine par `sys.exit(1)` en cas d'erreur critique.
     :rtype: None
     :raises SystemExit: Si une erreur critique empêche la poursuite du pipeline
@@ -239,6 +250,12 @@ def run_embedding_generation_pipeline(
     updated_sources_count = 0
     sources_with_errors_count = 0
 
+    embedding_cache: Optional[EmbeddingCache] = None
+    if generate_embeddings_model and use_embedding_cache:
+        cache_dir = embedding_cache_dir or (output_config_path.parent / "embeddings_data" / "cache")
+        embedding_cache = EmbeddingCache(cache_dir)
+        logger.info(f"Cache d'embeddings activé: {cache_dir}")
+
     for i, source_info in enumerate(extract_definitions):
         source_id = source_info.get('id', f"SourceNonIdentifiée_{i+1}") # ID par défaut si manquant
         logger.info(f"Traitement de la source: {source_id} (Type: {source_info.get('type', 'N/A')}, Chemin/URL: {source_info.get('path', 'N/A')})")
@@ -299,7 +316,14 @@ def run_embedding_generation_pipeline(
                 # Simplification: le texte complet est traité comme un seul chunk.
                 # Pour une application réelle, un découpage (chunking) plus sophistiqué serait nécessaire.
                 text_chunks = [current_full_text_for_embedding]
-                embeddings = get_embeddings_for_chunks(text_chunks, generate_embeddings_model)
+                if embedding_cache is not None:
+                    # Seuls les morceaux absents du cache sont encodés ; la conversion
+                    # en listes n'a lieu que pour l'export JSON.
+                    embeddings = embedding_cache.get_embeddings(
+                        text_chunks, generate_embeddings_model, get_embeddings_for_chunks, as_numpy=True
+                    ).tolist()
+                else:
+                    embeddings = get_embeddings_for_chunks(text_chunks, generate_embeddings_model)
                 
                 if embeddings and embeddings[0] is not None: # Vérifier si des embeddings ont été retournés et ne sont pas None
                     logger.info(f"    Embeddings générés: {len(embeddings)} vecteur(s). Dimension du premier: {len(embeddings[0])}.")
@@ -396,6 +420,14 @@ if __name__ == '__main__':
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         help="Niveau de verbosité du logging."
     )
+    parser.add_argument(
+        "--embedding-cache-dir", type=Path, default=None,
+        help="Répertoire du cache d'embeddings (défaut: <sortie>/embeddings_data/cache)."
+    )
+    parser.add_argument(
+        "--no-embedding-cache", action="store_true",
+        help="Désactive le cache d'embeddings et ré-encode tous les textes."
+    )
     # L'argument passphrase n'est plus utilisé pour la dérivation de clé dans le pipeline lui-même,
     # mais on le garde pour une éventuelle compatibilité si le script lanceur le passe.
     parser.add_argument(
@@ -413,5 +445,7 @@ if __name__ == '__main__':
         generate_embeddings_model=args.generate_embeddings,
         force_overwrite=args.force,
         log_level=args.log_level,
-        passphrase=args.passphrase # Passé même si non utilisé activement pour la clé
+        passphrase=args.passphrase, # Passé même si non utilisé activement pour la clé
+        embedding_cache_dir=args.embedding_cache_dir,
+        use_embedding_cache=not args.no_embedding_cache
     )
\ No newline at end of file
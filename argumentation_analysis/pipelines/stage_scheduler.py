@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Ordonnanceur d'étapes asynchrones tenant compte des dépendances.
+
+Utilisé par `UnifiedTextAnalysisPipeline` pour exécuter en parallèle les
+analyses indépendantes (informelle, formelle, unifiée, orchestration) :
+
+- chaque étape est une fabrique de coroutine, lancée dès que les étapes dont
+  elle dépend sont terminées (quel que soit leur statut : une dépendance
+  exprime un ordre, par exemple l'usage exclusif d'un orchestrateur partagé) ;
+- le nombre d'étapes simultanées peut être borné par un sémaphore ;
+- chaque étape peut avoir un délai maximal, au-delà duquel elle est annulée ;
+- l'annulation de `run` annule toutes les étapes en cours ;
+- le temps d'exécution de chaque étape est mesuré.
+
+Les erreurs d'une étape ne se propagent pas : elles sont consignées dans son
+`StageResult`.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("StageScheduler")
+
+# Statuts possibles d'une étape
+STATUS_SUCCESS = "success"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class Stage:
+    """Description d'une étape : nom, fabrique de coroutine, dépendances et délai."""
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+
+
+@dataclass
+class StageResult:
+    """Résultat d'une étape exécutée par le `StageScheduler`."""
+    name: str
+    status: str
+    value: Any = None
+    error: Optional[str] = None
+    wall_time: float = 0.0
+    started_at: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == STATUS_SUCCESS
+
+
+class StageScheduler:
+    """
+    Exécute un graphe acyclique d'étapes asynchrones.
+
+    Args:
+        max_concurrency: Nombre maximal d'étapes exécutées simultanément (None : pas de limite).
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency doit être supérieur ou égal à 1")
+        self.max_concurrency = max_concurrency
+        self._stages: Dict[str, Stage] = {}
+
+    def add(self, name: str,
+            run: Callable[[], Awaitable[Any]],
+            depends_on: Tuple[str, ...] = (),
+            timeout: Optional[float] = None) -> "StageScheduler":
+        """Ajoute une étape ; les dépendances doivent avoir été ajoutées auparavant."""
+        if name in self._stages:
+            raise ValueError(f"Étape déjà déclarée : {name}")
+        unknown = [dependency for dependency in depends_on if dependency not in self._stages]
+        if unknown:
+            raise ValueError(f"Dépendances inconnues pour l'étape {name} : {unknown}")
+        self._stages[name] = Stage(name, run, tuple(depends_on), timeout)
+        return self
+
+    @property
+    def stage_names(self) -> List[str]:
+        return list(self._stages)
+
+    async def run(self) -> Dict[str, StageResult]:
+        """
+        Exécute toutes les étapes et renvoie leurs résultats, dans l'ordre de déclaration.
+
+        Les dépendances étant déclarées avant leurs dépendants, le graphe est
+        acyclique par construction.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        origin = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def execute(stage: Stage) -> StageResult:
+            if stage.depends_on:
+                await asyncio.wait([tasks[dependency] for dependency in stage.depends_on])
+            if semaphore is not None:
+                async with semaphore:
+                    return await self._run_stage(stage, origin)
+            return await self._run_stage(stage, origin)
+
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.ensure_future(execute(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            pending = [task for task in tasks.values() if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    @staticmethod
+    async def _run_stage(stage: Stage, origin: float) -> StageResult:
+        """Exécute une étape sous son délai et mesure son temps d'exécution."""
+        start = time.perf_counter()
+        result = StageResult(stage.name, STATUS_SUCCESS, started_at=start - origin)
+        try:
+            if stage.timeout is not None:
+                result.value = await asyncio.wait_for(stage.run(), timeout=stage.timeout)
+            else:
+                result.value = await stage.run()
+        except asyncio.TimeoutError:
+            logger.warning(f"Étape '{stage.name}' interrompue après {stage.timeout}s")
+            result.status = STATUS_TIMEOUT
+            result.error = f"Délai dépassé ({stage.timeout}s)"
+        except Exception as e:
+            logger.error(f"Erreur dans l'étape '{stage.name}': {e}")
+            result.status = STATUS_ERROR
+            result.error = str(e)
+        result.wall_time = time.perf_counter() - start
+        return result
@@ -25,7 +25,9 @@ Données d'entrée:
         -   Instanciation de l'orchestrateur (si mode `real` ou `conversation`).
         -   Chargement des outils d'analyse (ex: `EnhancedComplexFallacyAnalyzer`).
     2.  **Exécution de l'analyse**: La méthode `analyze_text_unified` exécute
-        les analyses sélectionnées dans la configuration :
+        les analyses sélectionnées dans la configuration, en parallèle via un
+        `StageScheduler` (seule l'orchestration attend l'analyse informelle
+        lorsque celle-ci utilise aussi l'orchestrateur) :
         -   `_perform_informal_analysis`: Détecte les sophismes en utilisant
           les outils d'analyse.
         -   `_perform_formal_analysis`: Convertit le texte en un ensemble de
@@ -34,13 +36,18 @@ Données d'entrée:
           créer un rapport combinant les différentes facettes de l'analyse.
         -   `_perform_orchestration_analysis`: Délègue l'analyse à un
           orchestrateur plus complexe pour une interaction multi-agents.
+        En mode corpus (`analyze_corpus` / `run_unified_corpus_analysis`), le
+        pipeline est initialisé une seule fois et les documents sont analysés
+        avec une concurrence bornée, les résultats étant écrits en JSONL au fil
+        de l'eau.
     3.  **Génération de recommandations**: Synthétise les résultats pour
         fournir des recommandations actionnables.
     4.  **Logging**: Capture un log détaillé de la conversation si configuré.
 
 Artefacts produits:
     - Un dictionnaire de résultats complet contenant :
-        - `metadata`: Informations sur l'exécution de l'analyse.
+        - `metadata`: Informations sur l'exécution de l'analyse, dont le
+          temps (`stage_timings`) et le statut (`stage_status`) de chaque étape.
         - `informal_analysis`: Résultats de la détection de sophismes.
         - `formal_analysis`: Résultats de l'analyse logique (cohérence, etc.).
         - `unified_analysis`: Rapport de synthèse de l'agent dédié.
@@ -51,11 +58,12 @@ Artefacts produits:
 """
 
 import asyncio
+import json
 import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import AsyncIterable, Dict, Iterable, List, Any, Optional, Tuple, Union
 
 # Imports Semantic Kernel et architecture
 import semantic_kernel as sk
@@ -70,6 +78,7 @@ from argumentation_analysis.orchestration.conversation_orchestrator import Conve
 
 # Imports du pipeline existant
 from argumentation_analysis.pipelines.analysis_pipeline import run_text_analysis_pipeline
+from argumentation_analysis.pipelines.stage_scheduler import StageScheduler, STATUS_SUCCESS, STATUS_TIMEOUT
 
 # Imports des agents et outils
 from argumentation_analysis.agents.core.logic.logic_factory import LogicAgentFactory
@@ -91,7 +100,10 @@ class UnifiedAnalysisConfig:
                  use_mocks: bool = False,
                  use_advanced_tools: bool = True,
                  output_format: str = "detailed",
-                 enable_conversation_logging: bool = True):
+                 enable_conversation_logging: bool = True,
+                 stage_timeout: Optional[float] = None,
+                 stage_timeouts: Optional[Dict[str, float]] = None,
+                 max_concurrent_stages: Optional[int] = None):
         """
         Initialise la configuration unifiée.
         
@@ -103,6 +115,9 @@ class UnifiedAnalysisConfig:
             use_advanced_tools: Activation des outils avancés
             output_format: Format de sortie ["summary", "detailed", "json"]
             enable_conversation_logging: Log des conversations
+            stage_timeout: Délai maximal par étape d'analyse, en secondes (None : aucun)
+            stage_timeouts: Délais spécifiques par étape ("informal", "formal", "unified", "orchestration")
+            max_concurrent_stages: Nombre maximal d'étapes exécutées en parallèle (None : pas de limite)
         """
         self.analysis_modes = analysis_modes or ["informal", "formal"]
         self.orchestration_mode = orchestration_mode
@@ -111,6 +126,9 @@ class UnifiedAnalysisConfig:
         self.use_advanced_tools = use_advanced_tools
         self.output_format = output_format
         self.enable_conversation_logging = enable_conversation_logging
+        self.stage_timeout = stage_timeout
+        self.stage_timeouts = dict(stage_timeouts or {})
+        self.max_concurrent_stages = max_concurrent_stages
         
         # Validation des modes
         valid_modes = {"informal", "formal", "unified"}
@@ -119,6 +137,10 @@ class UnifiedAnalysisConfig:
         if not self.analysis_modes:
             self.analysis_modes = ["informal"]
 
+    def timeout_for(self, stage: str) -> Optional[float]:
+        """Délai maximal applicable à une étape d'analyse."""
+        return self.stage_timeouts.get(stage, self.stage_timeout)
+
 
 class UnifiedTextAnalysisPipeline:
     """Pipeline unifié d'analyse textuelle consolidant les fonctionnalités de analyze_text.py."""
@@ -271,28 +293,24 @@ class UnifiedTextAnalysisPipeline:
         }
         
         try:
-            # Analyse informelle
-            if "informal" in self.config.analysis_modes:
-                logger.info("[ANALYZE] Execution analyse informelle...")
-                if self.config.orchestration_mode in ["real", "conversation"] and self.orchestrator:
-                    results["informal_analysis"] = await self._perform_informal_analysis_orchestrated(text)
-                else:
-                    results["informal_analysis"] = await self._perform_informal_analysis(text)
-            
-            # Analyse formelle
-            if "formal" in self.config.analysis_modes:
-                logger.info("[ANALYZE] Execution analyse formelle...")
-                results["formal_analysis"] = await self._perform_formal_analysis(text)
+            # Exécution parallèle des analyses indépendantes
+            scheduler = self._build_stage_scheduler(text)
+            stage_results = await scheduler.run()
             
-            # Analyse unifiée (combinaison sophistiquée)
-            if "unified" in self.config.analysis_modes:
-                logger.info("[ANALYZE] Execution analyse unifiee...")
-                results["unified_analysis"] = await self._perform_unified_analysis(text)
-            
-            # Orchestration si activée
-            if self.orchestrator and self.config.orchestration_mode != "pipeline":
-                logger.info("[ANALYZE] Execution orchestration avancee...")
-                results["orchestration_analysis"] = await self._perform_orchestration_analysis(text)
+            for name, stage_result in stage_results.items():
+                if stage_result.succeeded:
+                    results[f"{name}_analysis"] = stage_result.value
+                else:
+                    results[f"{name}_analysis"] = {
+                        "status": "Timeout" if stage_result.status == STATUS_TIMEOUT else "Error",
+                        "reason": stage_result.error
+                    }
+            results["metadata"]["stage_timings"] = {
+                name: round(stage_result.wall_time, 4) for name, stage_result in stage_results.items()
+            }
+            results["metadata"]["stage_status"] = {
+                name: stage_result.status for name, stage_result in stage_results.items()
+            }
             
             # Génération des recommandations
             results["recommendations"] = self._generate_recommendations(results)
@@ -311,6 +329,148 @@ class UnifiedTextAnalysisPipeline:
         logger.info(f"[ANALYZE] Analyse unifiee terminee en {results['execution_time']:.2f}s")
         return results
     
+    async def analyze_corpus(self,
+                             documents: Union[Iterable[Union[str, Tuple[str, str]]],
+                                              AsyncIterable[Union[str, Tuple[str, str]]]],
+                             output_path: Union[str, Path],
+                             max_concurrency: int = 4) -> Dict[str, Any]:
+        """
+        Analyse un corpus de documents avec le pipeline déjà initialisé.
+        
+        Les documents sont consommés au fur et à mesure (une file bornée assure
+        la contre-pression : au plus `2 * max_concurrency` documents sont lus
+        d'avance) et chaque résultat est ajouté au fichier JSONL dès qu'il est
+        disponible, dans l'ordre de fin d'analyse.
+        
+        Le statut d'un document tient compte de ses étapes (`stage_status`) :
+        "success" si toutes ont abouti, "partial" si certaines seulement ont
+        échoué ou expiré, "failed" si aucune n'a abouti ou si l'analyse a levé
+        une erreur.
+        
+        Args:
+            documents: Textes, ou couples (identifiant, texte), synchrones ou asynchrones
+                (par exemple `UnifiedSourceManager.iter_texts_for_analysis`)
+            output_path: Fichier JSONL de sortie (une ligne par document)
+            max_concurrency: Nombre maximal de documents analysés simultanément
+            
+        Returns:
+            Résumé de l'exécution (documents traités, réussis, partiels, en échec, durée)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency doit être supérieur ou égal à 1")
+        if self.orchestrator and self.config.orchestration_mode != "pipeline" and max_concurrency > 1:
+            # L'orchestrateur et son log de conversation sont partagés entre les documents
+            logger.warning("[CORPUS] Orchestrateur partagé : analyse des documents un par un")
+            max_concurrency = 1
+        
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * max_concurrency)
+        summary = {"documents": 0, "succeeded": 0, "partial": 0, "failed": 0}
+        corpus_start = time.time()
+        
+        async def produce():
+            index = 0
+            if hasattr(documents, "__aiter__"):
+                async for document in documents:
+                    await queue.put(self._as_corpus_document(index, document))
+                    index += 1
+            else:
+                for document in documents:
+                    await queue.put(self._as_corpus_document(index, document))
+                    index += 1
+            for _ in range(max_concurrency):
+                await queue.put(None)
+        
+        async def consume(output_file):
+            while True:
+                document = await queue.get()
+                if document is None:
+                    return
+                document_id, text = document
+                record = {"document_id": document_id}
+                try:
+                    result = await self.analyze_text_unified(text, source_info=document_id)
+                    record.update({"status": self._corpus_document_status(result), "result": result})
+                except Exception as e:
+                    logger.error(f"[CORPUS] Erreur sur le document '{document_id}': {e}")
+                    record.update({"status": "failed", "error": str(e)})
+                summary["documents"] += 1
+                summary["succeeded" if record["status"] == "success" else record["status"]] += 1
+                output_file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                output_file.flush()
+        
+        logger.info(f"[CORPUS] Debut analyse du corpus (concurrence: {max_concurrency}) -> {output_path}")
+        with open(output_path, "w", encoding="utf-8") as output_file:
+            tasks = [asyncio.ensure_future(produce())]
+            tasks += [asyncio.ensure_future(consume(output_file)) for _ in range(max_concurrency)]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        
+        summary["output_path"] = str(output_path)
+        summary["execution_time"] = time.time() - corpus_start
+        logger.info(f"[CORPUS] {summary['documents']} documents analyses "
+                    f"({summary['partial']} partiels, {summary['failed']} en echec) "
+                    f"en {summary['execution_time']:.2f}s")
+        return summary
+    
+    @staticmethod
+    def _corpus_document_status(result: Dict[str, Any]) -> str:
+        """Statut d'un document du corpus d'après l'erreur globale et le statut de ses étapes."""
+        if "error" in result:
+            return "failed"
+        stage_status = result.get("metadata", {}).get("stage_status", {})
+        succeeded = sum(1 for status in stage_status.values() if status == STATUS_SUCCESS)
+        if stage_status and succeeded == 0:
+            return "failed"
+        return "success" if succeeded == len(stage_status) else "partial"
+    
+    @staticmethod
+    def _as_corpus_document(index: int, document: Union[str, Tuple[str, str]]) -> Tuple[str, str]:
+        """Normalise un document du corpus en couple (identifiant, texte)."""
+        if isinstance(document, str):
+            return f"document_{index}", document
+        document_id, text = document
+        return str(document_id), text
+    
+    def _build_stage_scheduler(self, text: str) -> StageScheduler:
+        """
+        Construit le graphe des étapes d'analyse à exécuter pour un texte.
+        
+        Les analyses informelle, formelle et unifiée sont indépendantes ;
+        l'orchestration n'attend l'analyse informelle que lorsque celle-ci
+        utilise aussi l'orchestrateur partagé.
+        """
+        scheduler = StageScheduler(max_concurrency=self.config.max_concurrent_stages)
+        orchestrated = self.orchestrator is not None and self.config.orchestration_mode in ["real", "conversation"]
+        
+        if "informal" in self.config.analysis_modes:
+            if orchestrated:
+                informal = lambda: self._perform_informal_analysis_orchestrated(text)
+            else:
+                informal = lambda: self._perform_informal_analysis(text)
+            scheduler.add("informal", informal, timeout=self.config.timeout_for("informal"))
+        
+        if "formal" in self.config.analysis_modes:
+            scheduler.add("formal", lambda: self._perform_formal_analysis(text),
+                          timeout=self.config.timeout_for("formal"))
+        
+        if "unified" in self.config.analysis_modes:
+            scheduler.add("unified", lambda: self._perform_unified_analysis(text),
+                          timeout=self.config.timeout_for("unified"))
+        
+        if self.orchestrator and self.config.orchestration_mode != "pipeline":
+            depends_on = ("informal",) if orchestrated and "informal" in scheduler.stage_names else ()
+            scheduler.add("orchestration", lambda: self._perform_orchestration_analysis(text),
+                          depends_on=depends_on, timeout=self.config.timeout_for("orchestration"))
+        
+        logger.info(f"[ANALYZE] Etapes planifiees: {scheduler.stage_names}")
+        return scheduler
+    
     async def _perform_informal_analysis(self, text: str) -> Dict[str, Any]:
         """Effectue l'analyse informelle avec les outils classiques."""
         informal_results = {
@@ -325,10 +485,10 @@ class UnifiedTextAnalysisPipeline:
             severity_evaluator = self.analysis_tools.get("severity_evaluator")
             
             if contextual_analyzer:
-                # Analyse contextuelle des sophismes
-                context_text = text[:500] + "..." if len(text) > 500 else text
-                
-                contextual_fallacies = contextual_analyzer.identify_contextual_fallacies(
+                # Analyse contextuelle des sophismes (synchrone : exécutée hors de la
+                # boucle d'événements pour ne pas bloquer les autres étapes)
+                contextual_fallacies = await asyncio.to_thread(
+                    contextual_analyzer.identify_contextual_fallacies,
                     argument=text,
                     context="sample_for_analysis"
                 )
@@ -348,7 +508,9 @@ class UnifiedTextAnalysisPipeline:
                 # Évaluation de la sévérité si disponible
                 if severity_evaluator:
                     sample_context = {"text": text[:500], "context_type": "sample_for_analysis"}
-                    evaluation = severity_evaluator.evaluate_fallacy_list(contextual_fallacies, sample_context)
+                    evaluation = await asyncio.to_thread(
+                        severity_evaluator.evaluate_fallacy_list, contextual_fallacies, sample_context
+                    )
                     informal_results["fallacies"] = evaluation.get("fallacy_evaluations", contextual_fallacies)
                 else:
                     informal_results["fallacies"] = contextual_fallacies
@@ -402,8 +564,8 @@ class UnifiedTextAnalysisPipeline:
             belief_set, status = await logic_agent.text_to_belief_set(text)
             
             if belief_set:
-                # Vérification de cohérence
-                is_consistent, consistency_details = logic_agent.is_consistent(belief_set)
+                # Vérification de cohérence (appel JVM synchrone, hors de la boucle d'événements)
+                is_consistent, consistency_details = await asyncio.to_thread(logic_agent.is_consistent, belief_set)
                 
                 # Génération de requêtes
                 queries = await logic_agent.generate_queries(text, belief_set)
@@ -411,7 +573,7 @@ class UnifiedTextAnalysisPipeline:
                 # Exécution des requêtes
                 query_results = []
                 for query in queries[:3]:  # Limite pour performance
-                    result, raw_output = logic_agent.execute_query(belief_set, query)
+                    result, raw_output = await asyncio.to_thread(logic_agent.execute_query, belief_set, query)
                     query_results.append({
                         "query": query,
                         "result": "Entailed" if result else "Not Entailed" if result is not None else "Unknown",
@@ -866,6 +1028,57 @@ async def run_unified_text_analysis_pipeline(
         }
 
 
+async def run_unified_corpus_analysis(
+    documents: Union[Iterable[Union[str, Tuple[str, str]]], AsyncIterable[Union[str, Tuple[str, str]]]],
+    output_path: Union[str, Path],
+    config: Optional[UnifiedAnalysisConfig] = None,
+    max_concurrency: int = 4
+) -> Dict[str, Any]:
+    """
+    Fonction d'entrée du pipeline unifié en mode corpus.
+    
+    Le pipeline (JVM, service LLM, orchestrateur, outils d'analyse) est
+    initialisé une seule fois pour l'ensemble des documents.
+    
+    Args:
+        documents: Textes, ou couples (identifiant, texte), à analyser
+        output_path: Fichier JSONL recevant un résultat par document
+        config: Configuration d'analyse (optionnel, valeurs par défaut utilisées)
+        max_concurrency: Nombre maximal de documents analysés simultanément
+    
+    Returns:
+        Résumé de l'exécution du corpus
+    """
+    if config is None:
+        config = UnifiedAnalysisConfig(
+            analysis_modes=["informal", "formal"],
+            orchestration_mode="pipeline",
+            use_mocks=False
+        )
+    
+    pipeline = UnifiedTextAnalysisPipeline(config)
+    
+    try:
+        init_success = await pipeline.initialize()
+        if not init_success:
+            return {
+                "error": "Échec de l'initialisation du pipeline",
+                "status": "failed"
+            }
+        
+        summary = await pipeline.analyze_corpus(documents, output_path, max_concurrency=max_concurrency)
+        summary["status"] = "success"
+        return summary
+        
+    except Exception as e:
+        logger.error(f"Erreur pipeline unifié (corpus): {e}")
+        return {
+            "error": str(e),
+            "status": "failed",
+            "output_path": str(output_path)
+        }
+
+
 def create_unified_config_from_legacy(
     mode: str = "formal",
     use_mocks: bool = False,
@@ -3,11 +3,16 @@ Service d'extraction pour l'analyse d'argumentation.
 
 Ce module fournit un service centralisé pour l'extraction de texte à partir de sources,
 la gestion des marqueurs et la recherche de texte similaire.
+
+Les recherches s'appuient sur un index par texte source (`TextSearchIndex`),
+construit une fois puis conservé dans un petit cache LRU : les recherches
+répétées dans une même source (éditeur de marqueurs, réparation des extraits)
+ne reparcourent plus tout le texte.
 """
 
 import re
-import difflib
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Any, Tuple, Optional, Union
 
 # Imports absolus pour les tests
@@ -23,10 +28,18 @@ from pathlib import Path
 
 # Correction des imports pour pointer vers le bon emplacement des modèles
 from argumentation_analysis.models.extract_definition import ExtractResult, Extract, SourceDefinition, ExtractDefinitions
+from argumentation_analysis.services.text_search_index import TextSearchIndex
 
 # Configuration du logging
 logger = logging.getLogger("Services.ExtractService")
 
+# Nombre de textes sources dont l'index de recherche est conservé
+SEARCH_INDEX_CACHE_SIZE = 8
+# Mémoire totale maximale des index conservés (l'index le plus récent est toujours gardé)
+SEARCH_INDEX_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Distance d'édition tolérée pour les marqueurs longs, en proportion de leur longueur
+APPROXIMATE_MATCH_MAX_ERROR_RATE = 0.25
+
 
 class ExtractService:
     """Service pour l'extraction de texte et la gestion des marqueurs."""
@@ -34,6 +47,30 @@ class ExtractService:
     def __init__(self):
         """Initialise le service d'extraction."""
         self.logger = logger
+        self._search_indexes: "OrderedDict[str, TextSearchIndex]" = OrderedDict()
+
+    def get_search_index(self, text: str) -> TextSearchIndex:
+        """
+        Retourne l'index de recherche d'un texte, construit au premier appel.
+
+        :param text: Le texte source complet.
+        :type text: str
+        :return: L'index de recherche du texte.
+        :rtype: TextSearchIndex
+        """
+        index = self._search_indexes.get(text)
+        if index is not None:
+            self._search_indexes.move_to_end(text)
+            return index
+        index = TextSearchIndex(text)
+        self._search_indexes[text] = index
+        cached_bytes = sum(cached.nbytes for cached in self._search_indexes.values())
+        while len(self._search_indexes) > 1 and (
+            len(self._search_indexes) > SEARCH_INDEX_CACHE_SIZE or cached_bytes > SEARCH_INDEX_CACHE_MAX_BYTES
+        ):
+            _, evicted = self._search_indexes.popitem(last=False)
+            cached_bytes -= evicted.nbytes
+        return index
     
     def extract_text_with_markers(
         self,
@@ -126,8 +163,11 @@ class ExtractService:
         """
         Trouve des portions de texte similaires à un marqueur donné dans un texte source.
 
-        Utilise `re.finditer` pour les marqueurs courts et `difflib.SequenceMatcher`
-        pour les marqueurs plus longs afin de trouver des correspondances.
+        Pour les marqueurs courts (moins de 20 caractères), cherche les occurrences
+        exactes (insensibles à la casse) de leurs 10 premiers caractères, dans
+        l'ordre du texte. Pour les marqueurs plus longs, cherche les occurrences
+        approchées à au plus 25 % d'erreurs (distance d'édition), les plus proches
+        du marqueur en premier.
 
         :param text: Le texte source complet dans lequel rechercher.
         :type text: str
@@ -149,31 +189,24 @@ class ExtractService:
         if not text or not marker:
             return []
         
-        # Utiliser difflib pour trouver des séquences similaires
+        index = self.get_search_index(text)
         results = []
         
         # Si le marqueur est court, chercher des correspondances exactes de sous-chaînes
         if len(marker) < 20:
-            pattern = re.escape(marker[:10]) if len(marker) > 10 else re.escape(marker)
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
-            for match in matches[:max_results]:
-                start_pos = max(0, match.start() - context_size)
-                end_pos = min(len(text), match.end() + context_size)
-                context = text[start_pos:end_pos]
-                results.append((context, match.start(), match.group()))
+            term = marker[:10]
+            for position in index.find_non_overlapping(term)[:max_results]:
+                match_end = position + len(term)
+                start_pos = max(0, position - context_size)
+                end_pos = min(len(text), match_end + context_size)
+                results.append((text[start_pos:end_pos], position, text[position:match_end]))
         else:
-            # Pour les marqueurs plus longs, utiliser difflib
-            text_chunks = [text[i:i+len(marker)*2] for i in range(0, len(text), len(marker)//2)]
-            for i, chunk in enumerate(text_chunks):
-                ratio = difflib.SequenceMatcher(None, marker, chunk).ratio()
-                if ratio > 0.6:  # Seuil de similarité
-                    pos = i * (len(marker)//2)
-                    start_pos = max(0, pos - context_size)
-                    end_pos = min(len(text), pos + len(marker) + context_size)
-                    context = text[start_pos:end_pos]
-                    results.append((context, pos, chunk[:len(marker)]))
-                    if len(results) >= max_results:
-                        break
+            # Pour les marqueurs plus longs, chercher des occurrences approchées
+            max_distance = int(len(marker) * APPROXIMATE_MATCH_MAX_ERROR_RATE)
+            for match_start, match_end, _ in index.find_approximate(marker, max_distance, max_results):
+                start_pos = max(0, match_start - context_size)
+                end_pos = min(len(text), match_end + context_size)
+                results.append((text[start_pos:end_pos], match_start, text[match_start:match_end]))
         
         return results
     
@@ -237,7 +270,9 @@ class ExtractService:
         """
         Recherche toutes les occurrences d'un terme dans un texte.
 
-        Utilise les expressions régulières pour trouver les correspondances.
+        Les positions candidates viennent de l'index de recherche du texte ;
+        chacune est confirmée par l'expression régulière du terme, de sorte que
+        le résultat est identique à celui de `re.finditer`.
 
         :param text: Le texte source complet dans lequel rechercher.
         :type text: str
@@ -254,7 +289,16 @@ class ExtractService:
             return []
         
         flags = 0 if case_sensitive else re.IGNORECASE
-        matches = list(re.finditer(re.escape(search_term), text, flags))
+        pattern = re.compile(re.escape(search_term), flags)
+        matches = []
+        next_allowed = 0
+        for position in self.get_search_index(text).find_all(search_term):
+            if position < next_allowed:
+                continue
+            match = pattern.match(text, position)
+            if match:
+                matches.append(match)
+                next_allowed = match.end()
         return matches
     
     def highlight_search_results(
@@ -382,8 +426,10 @@ class ExtractService:
 
         Cette méthode est une simplification et ne réalise pas une recherche
         dichotomique au sens strict algorithmique, mais plutôt une recherche
-        par blocs. Elle divise le texte en blocs avec chevauchement et recherche
-        le terme dans chaque bloc.
+        par blocs. Elle divise le texte en blocs avec chevauchement et rapporte
+        les occurrences du terme contenues dans chaque bloc ; les occurrences
+        viennent de l'index de recherche du texte, seul leur rattachement aux
+        blocs est calculé ici.
 
         :param text: Le texte source complet dans lequel rechercher.
         :type text: str
@@ -408,31 +454,38 @@ class ExtractService:
         
         results = []
         text_length = len(text)
+        term_length = len(search_term)
+        positions = self.get_search_index(text).find_all(search_term)
+        first_candidate = 0
         
         # Diviser le texte en blocs avec chevauchement
         for i in range(0, text_length, block_size - overlap):
             start_pos = i
             end_pos = min(i + block_size, text_length)
-            block = text[start_pos:end_pos]
             
-            # Rechercher le terme dans le bloc
-            if search_term.lower() in block.lower():
-                # Trouver toutes les occurrences
-                for match in re.finditer(re.escape(search_term), block, re.IGNORECASE):
-                    match_start = start_pos + match.start()
-                    match_end = start_pos + match.end()
-                    
-                    # Extraire le contexte
-                    context_start = max(0, match_start - 50)
-                    context_end = min(text_length, match_end + 50)
-                    context = text[context_start:context_end]
-                    
-                    results.append({
-                        "match": match.group(),
-                        "position": match_start,
-                        "context": context,
-                        "block_start": start_pos,
-                        "block_end": end_pos
-                    })
+            # Occurrences entièrement contenues dans le bloc, sans chevauchement entre elles
+            while first_candidate < len(positions) and positions[first_candidate] < start_pos:
+                first_candidate += 1
+            next_allowed = start_pos
+            for match_start in positions[first_candidate:]:
+                match_end = match_start + term_length
+                if match_end > end_pos:
+                    break
+                if match_start < next_allowed:
+                    continue
+                next_allowed = match_end
+                
+                # Extraire le contexte
+                context_start = max(0, match_start - 50)
+                context_end = min(text_length, match_end + 50)
+                context = text[context_start:context_end]
+                
+                results.append({
+                    "match": text[match_start:match_end],
+                    "position": match_start,
+                    "context": context,
+                    "block_start": start_pos,
+                    "block_end": end_pos
+                })
         
         return results
\ No newline at end of file
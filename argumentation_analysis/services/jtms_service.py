@@ -16,6 +16,13 @@ import os
 # Ajout du path pour importer le module JTMS existant
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '1.4.1-JTMS'))
 from jtms import JTMS, Belief, Justification
+from jtms_compact import CompactJTMS
+
+# Implémentations de stockage disponibles pour les instances JTMS
+JTMS_BACKENDS = {
+    "object": JTMS,
+    "compact": CompactJTMS,
+}
 
 class JTMSService:
     """
@@ -23,29 +30,39 @@ class JTMSService:
     de sessions, versioning et synchronisation multi-agents.
     """
     
-    def __init__(self):
+    def __init__(self, default_backend: str = "object"):
+        if default_backend not in JTMS_BACKENDS:
+            raise ValueError(f"Backend JTMS inconnu: {default_backend}")
         self.instances: Dict[str, JTMS] = {}
         self.metadata: Dict[str, Dict] = {}
         self.session_manager = None  # Sera injecté par le SessionManager
+        self.default_backend = default_backend
         
-    async def create_jtms_instance(self, session_id: str, strict_mode: bool = False) -> str:
+    async def create_jtms_instance(self, session_id: str, strict_mode: bool = False,
+                                   backend: Optional[str] = None) -> str:
         """
         Crée une nouvelle instance JTMS pour une session donnée.
         
         Args:
             session_id: Identifiant unique de la session
             strict_mode: Mode strict pour la validation des croyances
+            backend: Stockage des croyances, 'object' ou 'compact' (tableaux,
+                beaucoup moins de mémoire par croyance). Par défaut celui du service.
             
         Returns:
             str: Identifiant de l'instance JTMS créée
         """
+        backend = backend or self.default_backend
+        if backend not in JTMS_BACKENDS:
+            raise ValueError(f"Backend JTMS inconnu: {backend}")
         instance_id = f"jtms_{session_id}_{uuid.uuid4().hex[:8]}"
         
-        self.instances[instance_id] = JTMS(strict=strict_mode)
+        self.instances[instance_id] = JTMS_BACKENDS[backend](strict=strict_mode)
         self.metadata[instance_id] = {
             "session_id": session_id,
             "created_at": datetime.now().isoformat(),
             "strict_mode": strict_mode,
+            "backend": backend,
             "beliefs_count": 0,
             "justifications_count": 0,
             "last_updated": datetime.now().isoformat()
@@ -302,6 +319,74 @@ class JTMSService:
             "timestamp": datetime.now().isoformat()
         }
     
+    async def apply_batch(self, instance_id: str, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Applique une liste d'opérations dans une seule transaction JTMS.
+        
+        La détection des boucles non monotones et la propagation des valeurs
+        ne sont effectuées qu'une fois, après la dernière opération.
+        
+        Args:
+            instance_id: Identifiant de l'instance JTMS
+            operations: Opérations à appliquer, dans l'ordre. Chaque opération
+                porte un champ "type" parmi 'add_belief', 'add_justification',
+                'set_validity' et 'remove_belief'. En cas d'erreur, les
+                opérations déjà appliquées sont conservées et propagées.
+            
+        Returns:
+            Dict contenant le nombre d'opérations appliquées et les croyances modifiées
+        """
+        if instance_id not in self.instances:
+            raise ValueError(f"Instance JTMS non trouvée: {instance_id}")
+            
+        jtms = self.instances[instance_id]
+        before = {name: (belief.valid, belief.non_monotonic) for name, belief in jtms.beliefs.items()}
+        
+        try:
+            with jtms.batch():
+                for index, operation in enumerate(operations):
+                    op_type = operation.get("type")
+                    if op_type == "add_belief":
+                        jtms.add_belief(operation["belief_name"])
+                    elif op_type == "add_justification":
+                        jtms.add_justification(
+                            operation.get("in_beliefs", []),
+                            operation.get("out_beliefs", []),
+                            operation["conclusion"]
+                        )
+                    elif op_type == "set_validity":
+                        if operation["belief_name"] not in jtms.beliefs:
+                            raise ValueError(f"Croyance non trouvée: {operation['belief_name']}")
+                        jtms.set_belief_validity(operation["belief_name"], operation["validity"])
+                    elif op_type == "remove_belief":
+                        if operation["belief_name"] not in jtms.beliefs:
+                            raise ValueError(f"Croyance non trouvée: {operation['belief_name']}")
+                        jtms.remove_belief(operation["belief_name"])
+                    else:
+                        raise ValueError(f"Opération {index} non supportée: {op_type}")
+        finally:
+            # Les opérations appliquées avant une erreur sont conservées : métadonnées à jour dans tous les cas
+            self.metadata[instance_id]["beliefs_count"] = len(jtms.beliefs)
+            self.metadata[instance_id]["justifications_count"] = sum(len(b.justifications) for b in jtms.beliefs.values())
+            self.metadata[instance_id]["last_updated"] = datetime.now().isoformat()
+        
+        changed_beliefs = [
+            {
+                "name": belief.name,
+                "valid": belief.valid,
+                "non_monotonic": belief.non_monotonic
+            }
+            for name, belief in jtms.beliefs.items()
+            if before.get(name) != (belief.valid, belief.non_monotonic)
+        ]
+        
+        return {
+            "operations_applied": len(operations),
+            "changed_beliefs": changed_beliefs,
+            "total_beliefs": len(jtms.beliefs),
+            "timestamp": datetime.now().isoformat()
+        }
+    
     async def remove_belief(self, instance_id: str, belief_name: str) -> Dict[str, Any]:
         """
         Supprime une croyance de l'instance JTMS.
@@ -379,30 +464,37 @@ class JTMSService:
         except json.JSONDecodeError as e:
             raise ValueError(f"Données JSON invalides: {e}")
         
-        # Créer une nouvelle instance
-        instance_id = await self.create_jtms_instance(session_id)
+        # Créer une nouvelle instance avec le même stockage que l'instance exportée
+        instance_id = await self.create_jtms_instance(
+            session_id, backend=state.get("metadata", {}).get("backend")
+        )
         jtms = self.instances[instance_id]
         
         # Reconstruire l'état
         beliefs_data = state.get("beliefs", {})
         
-        # Créer toutes les croyances d'abord
-        for belief_name in beliefs_data:
-            jtms.add_belief(belief_name)
-        
-        # Ajouter les justifications
-        for belief_name, belief_info in beliefs_data.items():
-            for justification in belief_info.get("justifications", []):
-                jtms.add_justification(
-                    justification["in_beliefs"],
-                    justification["out_beliefs"],
-                    justification["conclusion"]
-                )
-        
-        # Restaurer les valeurs de validité
-        for belief_name, belief_info in beliefs_data.items():
-            if belief_info["valid"] is not None:
-                jtms.set_belief_validity(belief_name, belief_info["valid"])
+        # Une seule passe de propagation pour tout l'état importé
+        with jtms.batch():
+            # Créer toutes les croyances d'abord
+            for belief_name in beliefs_data:
+                jtms.add_belief(belief_name)
+            
+            # Ajouter les justifications
+            for belief_name, belief_info in beliefs_data.items():
+                for justification in belief_info.get("justifications", []):
+                    jtms.add_justification(
+                        justification["in_beliefs"],
+                        justification["out_beliefs"],
+                        justification["conclusion"]
+                    )
+            
+            # Restaurer les valeurs de validité
+            for belief_name, belief_info in beliefs_data.items():
+                if belief_info["valid"] is not None:
+                    jtms.set_belief_validity(belief_name, belief_info["valid"])
+        
+        self.metadata[instance_id]["beliefs_count"] = len(jtms.beliefs)
+        self.metadata[instance_id]["justifications_count"] = sum(len(b.justifications) for b in jtms.beliefs.values())
         
         return instance_id
     
@@ -0,0 +1,363 @@
+"""
+Index de recherche textuelle par document.
+
+Ce module fournit l'index utilisé par `ExtractService` pour les recherches
+répétées dans un même texte source (éditeur de marqueurs, réparation des
+extraits), y compris sur des sources de la taille d'un livre :
+
+- le texte est mis en minuscules une seule fois, caractère par caractère, de
+  sorte que les positions du tampon correspondent à celles du texte original ;
+- un index inversé de trigrammes (tableaux `numpy` triés) donne les positions
+  candidates d'un terme, vérifiées ensuite dans le tampon en minuscules ;
+- les quelques caractères pour lesquels `str.lower` ne donne pas les mêmes
+  équivalences que `re.IGNORECASE` (« ſ », « İ », « ı », sigma final...) font
+  basculer la recherche exacte sur `re.finditer`, de sorte que les résultats
+  restent identiques à ceux d'une recherche par expression régulière ;
+- la recherche approchée filtre les positions par le lemme des q-grammes (une
+  occurrence à au plus k erreurs partage au moins (m - q + 1) - k·q trigrammes
+  avec le motif) puis calcule la distance d'édition des seules régions
+  candidates avec l'algorithme bit-parallèle de Myers.
+"""
+
+import logging
+import re
+import sys
+from typing import FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("Services.TextSearchIndex")
+
+# Longueur des q-grammes indexés
+QGRAM_SIZE = 3
+
+
+def _compute_regex_incompatible_characters() -> FrozenSet[str]:
+    """
+    Caractères dont la minuscule (`str.lower`, caractère par caractère) ne
+    reproduit pas les équivalences de `re.IGNORECASE`.
+
+    `re` compare les minuscules simples et ajoute quelques équivalences
+    (« ſ » ~ « s », « ı » ~ « i », « ς » ~ « σ », « µ » ~ « μ »...) ; pour chaque
+    paire en désaccord, le caractère marginal est retenu. Parcourt tout
+    Unicode (plusieurs secondes) : sert à vérifier `_REGEX_INCOMPATIBLE_CHARACTERS`.
+    """
+    cased = [
+        char for char in map(chr, range(sys.maxunicode + 1))
+        if char.lower() != char or char.upper() != char
+    ]
+    incompatible = set()
+    for char in cased:
+        lowered = char.lower()
+        uppered = lowered.upper()
+        # Minuscule de longueur différente, ou minuscule non canonique (« ſ » -> « S » -> « s »)
+        if len(lowered) != 1 or (len(uppered) == 1 and uppered.lower() != lowered):
+            incompatible.add(char)
+    alphabet = "".join(cased)
+    for char in cased:
+        if char in incompatible:
+            continue
+        for match in re.finditer(re.escape(char), alphabet, re.IGNORECASE):
+            other = match.group()
+            if other.lower() != char.lower() and other not in incompatible:
+                incompatible.add(max(char, other))
+    return frozenset(incompatible)
+
+
+# Résultat de `_compute_regex_incompatible_characters` pour la base Unicode de
+# Python (vérifié par les tests, à régénérer si elle change)
+_REGEX_INCOMPATIBLE_CHARACTERS = frozenset((
+    "\u00b5", "\u0130", "\u0131", "\u017f", "\u0345", "\u03c2", "\u03d0", "\u03d1", "\u03d5",
+    "\u03d6", "\u03f0", "\u03f1", "\u03f5", "\u1c80", "\u1c81", "\u1c82", "\u1c83", "\u1c84",
+    "\u1c85", "\u1c86", "\u1c87", "\u1c88", "\u1e9b", "\u1fbe", "\u1fd3", "\u1fe3", "\ufb06",
+))
+
+
+def is_regex_compatible(text: str) -> bool:
+    """Indique si `fold_case` donne pour ce texte les équivalences de `re.IGNORECASE`."""
+    return text.isascii() or _REGEX_INCOMPATIBLE_CHARACTERS.isdisjoint(text)
+
+
+def fold_case(text: str) -> str:
+    """
+    Met un texte en minuscules en préservant les positions.
+
+    Chaque caractère est traité isolément (pas de sigma final selon le
+    contexte) ; les rares caractères dont la minuscule change de longueur (par
+    exemple « İ ») sont laissés tels quels.
+    """
+    folded = text.lower()
+    if len(folded) == len(text) and "Σ" not in text:
+        return folded
+    return "".join(lowered if len(lowered) == 1 else char for char, lowered in ((c, c.lower()) for c in text))
+
+
+def _myers_distances(pattern: str, text: str, anchored: bool = False) -> List[int]:
+    """
+    Distances d'édition entre `pattern` et les sous-chaînes de `text` se
+    terminant à chaque position (algorithme bit-parallèle de Myers).
+
+    Args:
+        pattern: Le motif (non vide).
+        text: Le texte parcouru.
+        anchored: Si True, les sous-chaînes commencent toutes au début de `text`
+            (distance au préfixe) ; sinon elles peuvent commencer n'importe où.
+
+    Returns:
+        Liste de longueur len(text) : l'élément j vaut la distance minimale pour
+        une sous-chaîne se terminant juste après text[j].
+    """
+    carry = 1 if anchored else 0
+    m = len(pattern)
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    peq = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    pv, mv, score = mask, 0, m
+    distances = []
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        # Sans ancrage, une occurrence peut commencer n'importe où (pas de retenue en ligne 0)
+        ph = ((ph << 1) | carry) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+        distances.append(score)
+    return distances
+
+
+class TextSearchIndex:
+    """
+    Index de recherche d'un texte : tampon en minuscules et trigrammes.
+
+    Les caractères du tampon sont renumérotés selon leur rang dans l'alphabet
+    du texte, ce qui permet le plus souvent des clés de trigrammes sur 32 bits ;
+    les positions sont regroupées par trigramme (tableau trié des clés
+    distinctes et décalages de début de groupe).
+
+    Args:
+        text: Le texte source complet.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.folded = fold_case(text)
+        self._regex_compatible = is_regex_compatible(text)
+        codes = np.frombuffer(self.folded.encode("utf-32-le"), dtype=np.uint32)
+        self._alphabet, ranks = np.unique(codes, return_inverse=True)
+        self._code_bits = max(1, int(len(self._alphabet)).bit_length())
+        key_dtype = np.int32 if QGRAM_SIZE * self._code_bits <= 31 else np.int64
+        position_dtype = np.int32 if len(codes) < 2 ** 31 else np.int64
+        if len(codes) >= QGRAM_SIZE:
+            self._keys = self._gram_keys_of(ranks.astype(key_dtype))
+            order = np.argsort(self._keys, kind="stable").astype(position_dtype)
+            self._gram_values, group_starts = np.unique(self._keys[order], return_index=True)
+            self._gram_starts = np.append(group_starts, len(order)).astype(position_dtype)
+            self._sorted_positions = order
+        else:
+            self._keys = np.empty(0, dtype=key_dtype)
+            self._gram_values = np.empty(0, dtype=key_dtype)
+            self._gram_starts = np.zeros(1, dtype=position_dtype)
+            self._sorted_positions = np.empty(0, dtype=position_dtype)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par l'index (tampons de texte et tableaux)."""
+        arrays = (self._alphabet, self._keys, self._gram_values, self._gram_starts, self._sorted_positions)
+        return sys.getsizeof(self.folded) + sum(array.nbytes for array in arrays)
+
+    # --- Trigrammes ---
+
+    def _gram_keys_of(self, ranks: np.ndarray) -> np.ndarray:
+        keys = ranks[:len(ranks) - QGRAM_SIZE + 1].copy()
+        for offset in range(1, QGRAM_SIZE):
+            keys = (keys << self._code_bits) | ranks[offset:len(ranks) - QGRAM_SIZE + 1 + offset]
+        return keys
+
+    def _pattern_gram_keys(self, folded_pattern: str) -> np.ndarray:
+        """
+        Clés des trigrammes d'un motif ; -1 pour les trigrammes contenant un
+        caractère absent du texte (aucune occurrence possible).
+        """
+        codes = np.frombuffer(folded_pattern.encode("utf-32-le"), dtype=np.uint32)
+        ranks = np.searchsorted(self._alphabet, codes)
+        known = ranks < len(self._alphabet)
+        known[known] = self._alphabet[ranks[known]] == codes[known]
+        keys = self._gram_keys_of(np.where(known, ranks, 0).astype(self._keys.dtype))
+        unknown = ~known[:len(keys)]
+        for offset in range(1, QGRAM_SIZE):
+            unknown |= ~known[offset:offset + len(keys)]
+        keys[unknown] = -1
+        return keys
+
+    def _gram_positions(self, key: int) -> np.ndarray:
+        """Positions (croissantes) d'un trigramme dans le texte."""
+        group = int(np.searchsorted(self._gram_values, key))
+        if key < 0 or group >= len(self._gram_values) or self._gram_values[group] != key:
+            return self._sorted_positions[:0]
+        return self._sorted_positions[self._gram_starts[group]:self._gram_starts[group + 1]]
+
+    # --- Recherche exacte ---
+
+    def find_all(self, term: str, start: int = 0, end: Optional[int] = None) -> List[int]:
+        """
+        Positions de toutes les occurrences (éventuellement chevauchantes) d'un
+        terme, sans tenir compte de la casse, commençant dans [start, end).
+
+        Les positions sont celles que donnerait `re.IGNORECASE` sur le terme
+        échappé.
+        """
+        folded_term = fold_case(term)
+        end = len(self.text) if end is None else end
+        if not folded_term:
+            return []
+
+        if not (self._regex_compatible and is_regex_compatible(term)):
+            # Équivalences propres à `re` : recherche directe par expression régulière
+            pattern = re.compile("(?=" + re.escape(term) + ")", re.IGNORECASE)
+            positions = []
+            for match in pattern.finditer(self.text, start):
+                if match.start() >= end:
+                    break
+                positions.append(match.start())
+            return positions
+
+        if len(folded_term) < QGRAM_SIZE:
+            positions = []
+            position = self.folded.find(folded_term, start)
+            while position != -1 and position < end:
+                positions.append(position)
+                position = self.folded.find(folded_term, position + 1)
+            return positions
+
+        # Le trigramme le plus rare du terme fournit les candidats
+        keys = self._pattern_gram_keys(folded_term)
+        if np.count_nonzero(keys < 0):
+            return []
+        best_offset, best_positions = 0, None
+        for offset, key in enumerate(keys):
+            positions = self._gram_positions(int(key))
+            if best_positions is None or len(positions) < len(best_positions):
+                best_offset, best_positions = offset, positions
+                if len(positions) == 0:
+                    return []
+        candidates = best_positions.astype(np.int64) - best_offset
+        candidates = candidates[(candidates >= start) & (candidates < end)]
+        # Vérification vectorisée : des trigrammes couvrant tout le terme doivent coïncider
+        checked_offsets = sorted(set(range(0, len(keys), QGRAM_SIZE)) | {len(keys) - 1})
+        for offset in checked_offsets:
+            if not len(candidates):
+                break
+            candidates = candidates[(candidates + offset >= 0) & (candidates + offset < len(self._keys))]
+            candidates = candidates[self._keys[candidates + offset] == keys[offset]]
+        return np.sort(candidates).tolist()
+
+    def find_non_overlapping(self, term: str, start: int = 0, end: Optional[int] = None) -> List[int]:
+        """Occurrences sans chevauchement, de gauche à droite (comme `re.finditer`)."""
+        positions = []
+        next_allowed = start
+        for position in self.find_all(term, start, end):
+            if position >= next_allowed:
+                positions.append(position)
+                next_allowed = position + len(term)
+        return positions
+
+    # --- Recherche approchée ---
+
+    def find_approximate(self, pattern: str, max_distance: int, max_results: int = 5) -> List[Tuple[int, int, int]]:
+        """
+        Occurrences approchées d'un motif (sans tenir compte de la casse).
+
+        Args:
+            pattern: Le motif recherché.
+            max_distance: Distance d'édition maximale tolérée.
+            max_results: Nombre maximal d'occurrences renvoyées.
+
+        Returns:
+            Liste de (début, fin, distance), triée par distance puis par position,
+            les occurrences retenues ne se chevauchant pas.
+        """
+        folded_pattern = fold_case(pattern)
+        m = len(folded_pattern)
+        n = len(self.text)
+        if not m or not n or max_results <= 0:
+            return []
+        k = max(0, min(max_distance, m - 1))
+
+        threshold = (m - QGRAM_SIZE + 1) - k * QGRAM_SIZE
+        if threshold >= 1:
+            regions = self._candidate_regions(folded_pattern, k, threshold)
+        else:
+            # Filtre inopérant (motif trop court pour k) : vérification de tout le texte
+            regions = [(0, n)]
+
+        candidates = []
+        for region_start, region_end in regions:
+            distances = _myers_distances(folded_pattern, self.folded[region_start:region_end])
+            for offset, distance in enumerate(distances):
+                if distance <= k:
+                    candidates.append((distance, region_start + offset + 1))
+
+        results: List[Tuple[int, int, int]] = []
+        taken: List[Tuple[int, int]] = []
+        for distance, match_end in sorted(candidates):
+            match_start = self._match_start(folded_pattern, match_end, distance, k)
+            if any(match_start < other_end and other_start < match_end for other_start, other_end in taken):
+                continue
+            taken.append((match_start, match_end))
+            results.append((match_start, match_end, distance))
+            if len(results) >= max_results:
+                break
+        return results
+
+    def _candidate_regions(self, folded_pattern: str, k: int, threshold: int) -> List[Tuple[int, int]]:
+        """Régions du texte où une occurrence à au plus k erreurs est possible."""
+        m = len(folded_pattern)
+        keys = self._pattern_gram_keys(folded_pattern)
+        starts = [self._gram_positions(int(key)).astype(np.int64) - offset for offset, key in enumerate(keys)]
+        starts = np.sort(np.concatenate(starts)) if starts else np.empty(0, dtype=np.int64)
+        if len(starts) < threshold:
+            return []
+
+        # Nombre de trigrammes partagés dont la diagonale tombe dans [s, s + k]
+        votes = np.searchsorted(starts, starts + k, side="right") - np.arange(len(starts))
+        anchors = np.unique(starts[votes >= threshold])
+
+        regions: List[Tuple[int, int]] = []
+        for anchor in anchors:
+            region_start = max(0, int(anchor) - k)
+            region_end = min(len(self.text), int(anchor) + m + 2 * k)
+            if regions and region_start <= regions[-1][1]:
+                regions[-1] = (regions[-1][0], max(regions[-1][1], region_end))
+            else:
+                regions.append((region_start, region_end))
+        return regions
+
+    def _match_start(self, folded_pattern: str, match_end: int, distance: int, k: int) -> int:
+        """Début d'une occurrence de distance `distance` se terminant en `match_end`."""
+        m = len(folded_pattern)
+        window_start = max(0, match_end - m - k)
+        reversed_window = self.folded[window_start:match_end][::-1]
+        reversed_distances = _myers_distances(folded_pattern[::-1], reversed_window, anchored=True)
+        # Début le plus proche de match_end - m atteignant la distance
+        best_start, best_gap = match_end - m, None
+        for offset, reversed_distance in enumerate(reversed_distances):
+            if reversed_distance == distance:
+                start = match_end - offset - 1
+                gap = abs(start - (match_end - m))
+                if best_gap is None or gap < best_gap:
+                    best_start, best_gap = start, gap
+        return max(0, best_start)
@@ -119,6 +119,9 @@ class FrameworkOptions(BaseModel):
     semantics: str = Field(default="preferred", description="Sémantique à utiliser")
     include_visualization: bool = Field(default=True, description="Inclure la visualisation")
     max_arguments: int = Field(default=100, ge=1, le=1000, description="Nombre maximum d'arguments")
+    max_extensions: int = Field(default=50, ge=1, le=1000, description="Nombre maximum d'extensions retournées")
+    extension_offset: int = Field(default=0, ge=0, description="Nombre d'extensions à sauter (pagination)")
+    time_budget: float = Field(default=5.0, gt=0, le=60, description="Durée maximale du calcul des extensions (secondes)")
     
     @field_validator('semantics')
     def validate_semantics(cls, v: str) -> str:
@@ -149,6 +149,13 @@ class FrameworkResponse(BaseModel):
     support_count: int = Field(default=0, ge=0, description="Nombre de supports")
     extension_count: int = Field(default=0, ge=0, description="Nombre d'extensions")
     
+    # Pagination des extensions
+    extension_offset: int = Field(default=0, ge=0, description="Position de la première extension retournée")
+    next_extension_offset: Optional[int] = Field(default=None, description="Position de la page suivante, s'il en reste")
+    extensions_truncated: bool = Field(default=False, description="Extensions limitées par max_extensions ou par le budget de temps")
+    extensions_timed_out: bool = Field(default=False, description="Énumération interrompue par le budget de temps (reprendre à next_extension_offset)")
+    argument_status_from_page: bool = Field(default=False, description="Statuts des arguments calculés sur la seule page retournée, et non sur toutes les extensions")
+    
     # Visualisation
     visualization: Optional[FrameworkVisualization] = Field(default=None, description="Données de visualisation")
     
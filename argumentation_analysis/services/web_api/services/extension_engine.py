@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Moteur d'énumération des extensions de Dung pour `FrameworkService`.
+
+Le moteur part du graphe d'attaque du service (cible -> ensemble des
+attaquants) et travaille en interne sur des bitsets (entiers Python, bit
+``i`` = argument ``i``) :
+
+- la sémantique fondée est un point fixe calculé par propagation ;
+- les sémantiques complète, préférée et stable sont énumérées composante
+  fortement connexe par composante, dans l'ordre topologique : chaque SCC
+  n'est résolue qu'à partir des labels déjà fixés en amont, et ses
+  labellings locaux sont mémorisés selon les labels de ses attaquants
+  externes ;
+- dans une SCC, la recherche est un backtracking sur les labels IN/OUT avec
+  propagation (un argument défendu est forcé IN, les voisins d'un argument
+  IN sont exclus, un attaquant qui n'a plus qu'un contre-attaquant possible
+  force celui-ci) et élagage (branches incluses dans une extension préférée
+  déjà trouvée, arguments qui ne pourront plus être OUT en sémantique
+  stable) ;
+- les extensions sont produites à la demande (générateurs sans récursion
+  Python), ce qui permet de paginer sans tout énumérer ;
+- une échéance optionnelle interrompt l'énumération par
+  :class:`ExtensionSearchTimeout`.
+"""
+
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+# Labelling d'un ensemble d'arguments : bitsets (IN, OUT, UNDEC)
+Labelling = Tuple[int, int, int]
+
+
+class ExtensionSearchTimeout(RuntimeError):
+    """Levée quand l'énumération dépasse l'échéance qui lui est allouée."""
+
+
+class ExtensionPage(NamedTuple):
+    """Page d'extensions produite par :meth:`ExtensionEngine.page`."""
+    extensions: List[List[str]]
+    preferred: List[bool]
+    offset: int
+    has_more: bool
+    timed_out: bool
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Itère sur les indices des bits à 1 d'un bitset."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class ExtensionEngine:
+    """
+    Énumère les extensions d'un framework d'argumentation abstraite.
+
+    :param attack_graph: Graphe d'attaque au format de
+                         `FrameworkService._build_attack_graph`
+                         (cible -> ensemble des attaquants).
+    :param deadline: Instant limite (`time.monotonic()`) de l'énumération, ou None.
+    """
+
+    def __init__(self, attack_graph: Dict[str, Set[str]], deadline: Optional[float] = None):
+        self.arguments: List[str] = list(attack_graph)
+        self._index = {arg: i for i, arg in enumerate(self.arguments)}
+        self.deadline = deadline
+        n = len(self.arguments)
+        self._attackers = [0] * n
+        self._targets = [0] * n
+        for target, attackers in attack_graph.items():
+            t = self._index[target]
+            for attacker in attackers:
+                s = self._index.get(attacker)
+                if s is None:
+                    continue
+                self._attackers[t] |= 1 << s
+                self._targets[s] |= 1 << t
+        self._sccs: Optional[List[int]] = None
+        self._scc_external: List[int] = []
+        # (SCC, mode, IN externes, UNDEC externes) -> labellings locaux
+        self._local_cache: Dict[Tuple[int, str, int, int], List[Labelling]] = {}
+
+    # --- Conversions ---
+
+    def names(self, mask: int) -> List[str]:
+        """Arguments d'un bitset, dans l'ordre du framework."""
+        return [self.arguments[i] for i in sorted(_bits(mask))]
+
+    def mask(self, arguments) -> int:
+        """Bitset d'un ensemble d'identifiants d'arguments."""
+        result = 0
+        for arg in arguments:
+            result |= 1 << self._index[arg]
+        return result
+
+    def _range(self, mask: int) -> int:
+        attacked = 0
+        for i in _bits(mask):
+            attacked |= self._targets[i]
+        return attacked
+
+    def _check_deadline(self) -> None:
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise ExtensionSearchTimeout("Échéance dépassée lors du calcul des extensions")
+
+    # --- Structure ---
+
+    def sccs(self) -> List[int]:
+        """Bitsets des SCC du graphe d'attaque, en ordre topologique (amont d'abord)."""
+        if self._sccs is not None:
+            return self._sccs
+        n = len(self.arguments)
+        index, low = [-1] * n, [0] * n
+        on_stack, stack, order = [False] * n, [], []
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, _bits(self._targets[root]))]
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if index[child] == -1:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack[child] = True
+                        work.append((child, _bits(self._targets[child])))
+                        break
+                    if on_stack[child]:
+                        low[node] = min(low[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = 0
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component |= 1 << member
+                            if member == node:
+                                break
+                        order.append(component)
+        # Tarjan produit les SCC de l'aval vers l'amont
+        order.reverse()
+        self._sccs = order
+        self._scc_external = []
+        for scc in order:
+            external = 0
+            for arg in _bits(scc):
+                external |= self._attackers[arg]
+            self._scc_external.append(external & ~scc)
+        return order
+
+    # --- Sémantique fondée ---
+
+    def grounded(self) -> int:
+        """Extension fondée : plus petit point fixe de la fonction caractéristique."""
+        n = len(self.arguments)
+        live_attackers = [bin(self._attackers[i]).count("1") for i in range(n)]
+        accepted, rejected = 0, 0
+        queue = [i for i in range(n) if live_attackers[i] == 0]
+        while queue:
+            arg = queue.pop()
+            bit = 1 << arg
+            if accepted & bit:
+                continue
+            accepted |= bit
+            for target in _bits(self._targets[arg] & ~rejected):
+                rejected |= 1 << target
+                for victim in _bits(self._targets[target]):
+                    live_attackers[victim] -= 1
+                    if live_attackers[victim] == 0:
+                        queue.append(victim)
+        return accepted
+
+    # --- Vérification ---
+
+    def is_complete(self, mask: int) -> bool:
+        """Indique si un bitset est sans conflit, se défend et contient tout ce qu'il défend."""
+        attacked = self._range(mask)
+        if attacked & mask:
+            return False
+        for arg in range(len(self.arguments)):
+            defended = not self._attackers[arg] & ~attacked
+            if defended != bool(mask >> arg & 1):
+                return False
+        return True
+
+    # --- Labellings locaux d'une SCC ---
+
+    def _local_search(self, scc: int, upstream_in: int, upstream_undec: int, mode: str) -> Iterator[Labelling]:
+        """
+        Labellings locaux d'une SCC (complets, stables ou préférés selon `mode`),
+        étant donnés les labels des attaquants externes.
+        """
+        attackers = self._attackers
+        forced_out = 0
+        candidates = 0
+        for arg in _bits(scc):
+            external = attackers[arg] & ~scc
+            if external & upstream_in:
+                forced_out |= 1 << arg
+            elif not external & upstream_undec and not attackers[arg] & (1 << arg):
+                candidates |= 1 << arg
+        stable = mode == "stable"
+        maximal = mode == "preferred"
+
+        def propagate(accepted: int, excluded: int):
+            while True:
+                out = (self._range(accepted) & scc) | forced_out
+                neighbours = out
+                for arg in _bits(accepted):
+                    neighbours |= attackers[arg]
+                if neighbours & accepted:
+                    return None
+                undecided = candidates & ~accepted & ~excluded
+                forced = 0
+                excluded |= neighbours & undecided
+                undecided &= ~neighbours
+                # Un attaquant d'un argument IN doit pouvoir être mis OUT
+                for arg in _bits(accepted):
+                    for attacker in _bits(attackers[arg] & scc & ~out):
+                        counter = attackers[attacker] & undecided
+                        if not counter:
+                            return None
+                        if not counter & (counter - 1):
+                            forced |= counter
+                # Un candidat dont tous les attaquants internes sont OUT est défendu
+                for arg in _bits(candidates & ~accepted):
+                    if not attackers[arg] & scc & ~out:
+                        if excluded & (1 << arg):
+                            return None
+                        forced |= 1 << arg
+                if stable:
+                    # Un argument qui ne peut plus être IN doit encore pouvoir être attaqué par IN
+                    for arg in _bits(scc & ~accepted & ~out & ~undecided):
+                        if not attackers[arg] & (accepted | undecided):
+                            return None
+                if not forced:
+                    return accepted, excluded, out
+                accepted |= forced
+                excluded &= ~forced
+
+        found: List[int] = []
+        # Pile explicite : les SCC de plusieurs centaines d'arguments ne doivent pas
+        # dépendre de la limite de récursion
+        stack = [(0, 0)]
+        while stack:
+            self._check_deadline()
+            state = propagate(*stack.pop())
+            if state is None:
+                continue
+            accepted, excluded, out = state
+            undecided = candidates & ~accepted & ~excluded
+            reachable = accepted | undecided
+            if maximal and any(previous & reachable == reachable for previous in found):
+                continue
+            if not undecided:
+                undec = scc & ~accepted & ~out
+                if stable and undec:
+                    continue
+                if maximal:
+                    found.append(accepted)
+                else:
+                    yield accepted, out, undec
+                continue
+            low = undecided & -undecided
+            stack.append((accepted, excluded | low))
+            stack.append((accepted | low, excluded))
+
+        if maximal:
+            for accepted in found:
+                if not any(other != accepted and other & accepted == accepted for other in found):
+                    out = (self._range(accepted) & scc) | forced_out
+                    yield accepted, out, scc & ~accepted & ~out
+
+    def _local(self, position: int, labelling: Labelling, mode: str) -> Iterator[Labelling]:
+        """Labellings locaux de la SCC `position`, mémorisés une fois entièrement énumérés."""
+        scc = self._sccs[position]
+        external = self._scc_external[position]
+        key = (scc, mode, labelling[0] & external, labelling[2] & external)
+        cached = self._local_cache.get(key)
+        if cached is not None:
+            yield from cached
+            return
+        collected = []
+        for local in self._local_search(scc, key[2], key[3], mode):
+            collected.append(local)
+            yield local
+        self._local_cache[key] = collected
+
+    def _is_local_preferred(self, position: int, upstream: Labelling, local_in: int) -> bool:
+        # Énumération complète, pour que les labellings préférés soient mémorisés
+        return any(lab[0] == local_in for lab in list(self._local(position, upstream, "preferred")))
+
+    # --- Énumération ---
+
+    def iter_labellings(self, mode: str, flag_preferred: bool = False) -> Iterator[Tuple[int, bool]]:
+        """
+        Produit à la demande les extensions de la sémantique `mode`
+        ('complete', 'preferred' ou 'stable'), sous forme de bitsets IN.
+
+        L'énumération parcourt les SCC en profondeur avec une pile explicite :
+        la première extension est disponible sans avoir résolu les autres.
+
+        :param flag_preferred: Indiquer, pour chaque extension, si elle est aussi
+                               préférée (chaque SCC porte un labelling local préféré).
+        :return: Des couples (bitset IN, extension préférée ou non).
+        """
+        sccs = self.sccs()
+        if not sccs:
+            yield 0, True
+            return
+        states: List[Labelling] = [(0, 0, 0)]
+        flags: List[bool] = [True]
+        iterators = [self._local(0, states[0], mode)]
+        while iterators:
+            depth = len(iterators) - 1
+            local = next(iterators[-1], None)
+            if local is None:
+                iterators.pop()
+                states.pop()
+                flags.pop()
+                continue
+            upstream = states[depth]
+            combined = (upstream[0] | local[0], upstream[1] | local[1], upstream[2] | local[2])
+            preferred = flags[depth]
+            if flag_preferred:
+                preferred = preferred and (mode == "preferred" or self._is_local_preferred(depth, upstream, local[0]))
+            if depth + 1 == len(sccs):
+                yield combined[0], preferred if flag_preferred else mode in ("preferred", "stable")
+                continue
+            states.append(combined)
+            flags.append(preferred)
+            iterators.append(self._local(depth + 1, combined, mode))
+
+    def iter_extensions(self, semantics: str) -> Iterator[Tuple[int, bool]]:
+        """
+        Produit les extensions d'une sémantique du service
+        ('grounded', 'complete', 'preferred', 'stable' ou 'semi-stable').
+
+        :return: Des couples (bitset IN, extension préférée ou non).
+        """
+        if semantics == "grounded":
+            # Comme auparavant, l'extension fondée sert de référence au statut des arguments
+            yield self.grounded(), True
+        elif semantics in ("complete", "preferred", "stable"):
+            yield from self.iter_labellings(semantics, flag_preferred=semantics == "complete")
+        elif semantics == "semi-stable":
+            yield from self._iter_semi_stable()
+        else:
+            raise ValueError(f"Sémantique non supportée : {semantics}")
+
+    def _iter_semi_stable(self) -> Iterator[Tuple[int, bool]]:
+        """Extensions préférées dont le range (S ∪ S+) est maximal pour l'inclusion."""
+        stable = self.iter_labellings("stable")
+        first = next(stable, None)
+        if first is not None:
+            # S'il existe des extensions stables, ce sont exactement les semi-stables
+            yield first
+            yield from stable
+            return
+        preferred = [mask for mask, _ in self.iter_labellings("preferred")]
+        ranges = [mask | self._range(mask) for mask in preferred]
+        for mask, reach in zip(preferred, ranges):
+            if not any(other != reach and other & reach == reach for other in ranges):
+                yield mask, True
+
+    def page(self, semantics: str, offset: int = 0, limit: Optional[int] = None) -> ExtensionPage:
+        """
+        Retourne une page d'extensions, sans énumérer au-delà de `offset + limit + 1`.
+
+        Une échéance dépassée rend les extensions déjà obtenues, avec `timed_out`.
+
+        :param semantics: La sémantique demandée.
+        :param offset: Nombre d'extensions à sauter.
+        :param limit: Taille maximale de la page (None : pas de limite).
+        """
+        extensions: List[List[str]] = []
+        preferred: List[bool] = []
+        has_more, timed_out = False, False
+        stop = None if limit is None else offset + limit
+        try:
+            for position, (mask, is_preferred) in enumerate(self.iter_extensions(semantics)):
+                if position < offset:
+                    continue
+                if stop is not None and position >= stop:
+                    has_more = True
+                    break
+                extensions.append(self.names(mask))
+                preferred.append(is_preferred)
+        except ExtensionSearchTimeout:
+            timed_out = True
+        return ExtensionPage(extensions, preferred, offset, has_more, timed_out)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Moteur de patterns précompilé pour la détection de sophismes.
+
+Construit une seule fois à partir de la base de patterns de `FallacyService`:
+
+- chaque regex est compilée une fois (les regex invalides sont remplacées,
+  comme auparavant, par une recherche de sous-chaîne) ;
+- les littéraux obligatoires de chaque regex (ex. "parce que", "condamné"
+  pour 'parce que.*auteur.*condamné') alimentent un automate
+  d'Aho–Corasick : un seul passage sur le texte indique quelles regex
+  peuvent correspondre, et seules celles-ci sont évaluées ;
+- chaque analyse retourne les correspondances avec leurs positions réelles
+  et les durées des deux étapes.
+"""
+
+import re
+import time
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from argumentation_analysis.nlp.aho_corasick import AhoCorasick
+
+PATTERN_FLAGS = re.IGNORECASE | re.DOTALL
+# Les littéraux plus courts n'apportent aucun filtrage utile
+MIN_LITERAL_LENGTH = 2
+
+
+class PatternMatch(NamedTuple):
+    """Correspondance d'un pattern de sophisme dans le texte."""
+    fallacy_type: str
+    pattern: str
+    start: int
+    end: int
+
+
+class _CompiledPattern(NamedTuple):
+    source: str
+    regex: re.Pattern
+    literals: Tuple[str, ...]
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Retourne l'indice qui suit la classe de caractères ouverte en `i` ('[')."""
+    i += 1
+    if i < len(pattern) and pattern[i] == '^':
+        i += 1
+    if i < len(pattern) and pattern[i] == ']':
+        i += 1
+    while i < len(pattern) and pattern[i] != ']':
+        i += 2 if pattern[i] == '\\' else 1
+    return i + 1
+
+
+# Nombre de chiffres hexadécimaux suivant \x, \u et \U
+_HEX_ESCAPE_LENGTHS = {'x': 2, 'u': 4, 'U': 8}
+_OCTAL_DIGITS = '01234567'
+
+
+def _skip_escape(pattern: str, i: int) -> int:
+    """Retourne l'indice qui suit l'échappement alphanumérique ouvert en `i` ('\\')."""
+    escaped = pattern[i + 1]
+    i += 2
+    if escaped in _HEX_ESCAPE_LENGTHS:
+        return i + _HEX_ESCAPE_LENGTHS[escaped]
+    if escaped == 'N' and pattern.startswith('{', i):
+        closing = pattern.find('}', i)
+        return closing + 1 if closing >= 0 else len(pattern)
+    if escaped == '0':
+        # Octal : jusqu'à deux chiffres après le zéro
+        end = i
+        while end < min(i + 2, len(pattern)) and pattern[end] in _OCTAL_DIGITS:
+            end += 1
+        return end
+    if escaped.isdigit():
+        # Trois chiffres octaux forment un caractère ; sinon, référence arrière (deux chiffres au plus)
+        following = pattern[i:i + 2]
+        if escaped in _OCTAL_DIGITS and len(following) == 2 and all(c in _OCTAL_DIGITS for c in following):
+            return i + 2
+        return i + 1 if following[:1].isdigit() else i
+    return i
+
+
+def required_literals(pattern: str) -> List[str]:
+    """
+    Extrait les séquences littérales présentes dans toute correspondance de `pattern`.
+
+    L'analyse est volontairement conservatrice : seules les suites de
+    caractères littéraux au premier niveau sont retenues (un groupe, une
+    classe, `.`, `\\s`, `\\x41`... interrompent la suite ; un caractère suivi de `?`, `*`
+    ou `{` est retiré). Une alternative `|` au premier niveau rend le pattern
+    sans littéral obligatoire.
+
+    :param pattern: La regex source.
+    :return: Les littéraux obligatoires, en minuscules.
+    """
+    literals: List[str] = []
+    current: List[str] = []
+
+    def flush() -> None:
+        if len(current) >= MIN_LITERAL_LENGTH:
+            literals.append(''.join(current).lower())
+        current.clear()
+
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escaped = pattern[i + 1] if i + 1 < len(pattern) else ''
+            if not escaped or not escaped.isalnum():
+                if depth == 0 and escaped:
+                    current.append(escaped)
+                i += 2
+                continue
+            # Classe (\s, \w...), ancre, code de caractère (\x41, \0...) ou référence
+            # arrière : la suite littérale s'interrompt et l'échappement est sauté en entier
+            if depth == 0:
+                flush()
+            i = _skip_escape(pattern, i)
+            continue
+        if char == '[':
+            if depth == 0:
+                flush()
+            i = _skip_class(pattern, i)
+            continue
+        if char == '(':
+            if depth == 0:
+                flush()
+            depth += 1
+        elif char == ')':
+            depth = max(depth - 1, 0)
+        elif depth > 0:
+            pass
+        elif char == '|':
+            return []
+        elif char in '*?{':
+            # Le caractère précédent devient optionnel
+            if current:
+                current.pop()
+            flush()
+            if char == '{':
+                closing = pattern.find('}', i)
+                i = closing if closing >= 0 else i
+        elif char in '+.^$':
+            flush()
+        else:
+            current.append(char)
+        i += 1
+    flush()
+    return literals
+
+
+def compile_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile un pattern de sophisme (insensible à la casse, `.` couvrant les sauts de ligne).
+
+    Une regex invalide est remplacée par la recherche de la sous-chaîne
+    obtenue en retirant ses métacaractères.
+    """
+    try:
+        return re.compile(pattern, PATTERN_FLAGS)
+    except re.error:
+        cleaned_pattern = re.sub(r'[\\()\[\]{}.*+?^$|]', '', pattern)
+        return re.compile(re.escape(cleaned_pattern), PATTERN_FLAGS)
+
+
+class FallacyPatternEngine:
+    """
+    Détection précompilée des patterns de sophismes.
+
+    :param fallacy_patterns: Base de patterns au format de `FallacyService.fallacy_patterns`
+                             (type -> {'patterns': [...], ...}).
+    """
+
+    def __init__(self, fallacy_patterns: Dict[str, Dict[str, Any]]):
+        self._entries: List[Tuple[str, List[_CompiledPattern]]] = []
+        self._by_source: Dict[str, re.Pattern] = {}
+        self._automaton = AhoCorasick()
+
+        for fallacy_type, fallacy_info in fallacy_patterns.items():
+            compiled = []
+            for source in fallacy_info.get('patterns', []):
+                regex = self._by_source.get(source) or compile_pattern(source)
+                self._by_source[source] = regex
+                # Pour un pattern invalide, regex.pattern est la sous-chaîne échappée
+                literals = tuple(required_literals(regex.pattern))
+                for literal in literals:
+                    self._automaton.add(literal)
+                compiled.append(_CompiledPattern(source, regex, literals))
+            self._entries.append((fallacy_type, compiled))
+        self._automaton.build()
+        self.pattern_count = sum(len(compiled) for _, compiled in self._entries)
+
+    def matches(self, pattern: str, text: str) -> bool:
+        """Indique si `pattern` (compilé une seule fois) correspond à `text`."""
+        regex = self._by_source.get(pattern)
+        if regex is None:
+            regex = self._by_source[pattern] = compile_pattern(pattern)
+        return regex.search(text) is not None
+
+    def scan(self, text: str) -> Tuple[List[PatternMatch], Dict[str, float]]:
+        """
+        Analyse `text` en un passage de pré-filtrage puis évalue les regex candidates.
+
+        Pour chaque type de sophisme, retient le premier de ses patterns (dans
+        l'ordre de la base) qui correspond, avec la position de la correspondance.
+
+        :param text: Le texte à analyser.
+        :return: Les correspondances, et les métriques de l'analyse (durées en
+                 secondes, nombre de patterns évalués).
+        """
+        start_time = time.perf_counter()
+        text_lower = text.lower()
+        present = self._automaton.find_all(text_lower)
+        prefilter_done = time.perf_counter()
+
+        found: List[PatternMatch] = []
+        evaluated = 0
+        for fallacy_type, compiled in self._entries:
+            for entry in compiled:
+                if not all(literal in present for literal in entry.literals):
+                    continue
+                evaluated += 1
+                match = entry.regex.search(text_lower)
+                if match:
+                    found.append(PatternMatch(fallacy_type, entry.source, match.start(), match.end()))
+                    break
+        end_time = time.perf_counter()
+
+        metrics = {
+            'prefilter_time': prefilter_done - start_time,
+            'regex_time': end_time - prefilter_done,
+            'total_time': end_time - start_time,
+            'patterns_total': self.pattern_count,
+            'patterns_evaluated': evaluated,
+            'matches': len(found),
+        }
+        return found, metrics
@@ -7,6 +7,7 @@ Service de détection de sophismes.
 
 import time
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
@@ -24,6 +25,7 @@ except ImportError as e:
 # Imports des modèles (style relatif)
 from ..models.request_models import FallacyRequest, FallacyOptions
 from ..models.response_models import FallacyResponse, FallacyDetection
+from .fallacy_pattern_engine import FallacyPatternEngine
 
 logger = logging.getLogger("FallacyService")
 
@@ -40,6 +42,8 @@ class FallacyService:
         """Initialise le service de détection de sophismes."""
         self.logger = logger
         self.is_initialized = False
+        self._metrics_lock = threading.Lock()
+        self.pattern_metrics = {'requests': 0, 'total_time': 0.0, 'max_time': 0.0, 'last': {}}
         self._initialize_analyzers()
         self._load_fallacy_database()
     
@@ -81,7 +85,7 @@ class FallacyService:
             self.is_initialized = False
     
     def _load_fallacy_database(self) -> None:
-        """Charge la base de données des sophismes."""
+        """Charge la base de données des sophismes et compile son moteur de patterns."""
         self.fallacy_patterns = {
             # Sophismes logiques formels
             'affirming_consequent': {
@@ -288,6 +292,8 @@ class FallacyService:
                 'severity': 0.6
             }
         }
+        self.pattern_engine = FallacyPatternEngine(self.fallacy_patterns)
+        self.logger.info(f"Moteur de patterns compilé: {self.pattern_engine.pattern_count} patterns")
     
     def is_healthy(self) -> bool:
         """Vérifie si le service de détection de sophismes est opérationnel.
@@ -443,9 +449,12 @@ class FallacyService:
         return fallacies
     
     def _detect_with_patterns(self, text: str, options: Optional[FallacyOptions]) -> List[FallacyDetection]:
-        """Détecte les sophismes en utilisant une base de données interne de patterns.
+        """Détecte les sophismes en utilisant la base de données interne de patterns.
 
-        :param text: Le texte à analyser (converti en minuscules pour la recherche).
+        Le moteur précompilé (`self.pattern_engine`) analyse le texte en minuscules
+        et retient, pour chaque type de sophisme, le premier pattern qui correspond.
+
+        :param text: Le texte à analyser.
         :type text: str
         :param options: Les options de détection (non utilisées directement ici).
         :type options: Optional[FallacyOptions]
@@ -453,54 +462,66 @@ class FallacyService:
         :rtype: List[FallacyDetection]
         """
         fallacies = []
-        text_lower = text.lower()
-        
-        print(f"[DEBUG] Détection patterns - Texte: '{text}'")
-        print(f"[DEBUG] Texte normalisé: '{text_lower}'")
-        print(f"[DEBUG] Nombre de patterns dans fallacy_patterns: {len(self.fallacy_patterns)}")
-        print(f"[DEBUG] Nombre de patterns dans fallacy_patterns: {len(self.fallacy_patterns)}")
         
         try:
-            # CORRECTION: Utiliser uniquement self.fallacy_patterns
-            patterns_source = self.fallacy_patterns
-            print(f"[DEBUG] Source utilisée: self.fallacy_patterns")
+            matches, metrics = self.pattern_engine.scan(text)
+            self._record_pattern_metrics(metrics)
             
-            for fallacy_type, fallacy_info in patterns_source.items():
-                print(f"[DEBUG] Test sophisme: {fallacy_type}")
-                for i, pattern in enumerate(fallacy_info['patterns']):
-                    print(f"[DEBUG] Test pattern {i+1}: '{pattern}'")
-                    if self._pattern_matches(pattern, text_lower):
-                        print(f"[DEBUG] MATCH trouvé pour {fallacy_type} avec pattern: {pattern}")
-                        position = text_lower.find(pattern.split('.*')[0] if '.*' in pattern else pattern)
-                        
-                        fallacy = FallacyDetection(
-                            type=fallacy_type,
-                            name=fallacy_info['name'],
-                            description=fallacy_info['description'],
-                            severity=fallacy_info['severity'],
-                            confidence=0.6,
-                            location={'start': position, 'end': position + len(pattern)} if position >= 0 else None,
-                            context=self._extract_context(text, position) if position >= 0 else None,
-                            explanation=f"Pattern détecté: {pattern}"
-                        )
-                        fallacies.append(fallacy)
-                        print(f"[DEBUG] Sophisme ajouté: {fallacy_type}")
-                        break
-                    else:
-                        print(f"[DEBUG] Pas de match pour pattern {i+1}")
+            for match in matches:
+                fallacy_info = self.fallacy_patterns[match.fallacy_type]
+                fallacy = FallacyDetection(
+                    type=match.fallacy_type,
+                    name=fallacy_info['name'],
+                    description=fallacy_info['description'],
+                    severity=fallacy_info['severity'],
+                    confidence=0.6,
+                    location={'start': match.start, 'end': match.end},
+                    context=self._extract_context(text, match.start),
+                    explanation=f"Pattern détecté: {match.pattern}"
+                )
+                fallacies.append(fallacy)
         
         except Exception as e:
-            print(f"[DEBUG] Erreur détection patterns: {e}")
             self.logger.error(f"Erreur détection patterns: {e}")
         
-        print(f"[DEBUG] Total sophismes détectés: {len(fallacies)}")
         return fallacies
     
+    def _record_pattern_metrics(self, metrics: Dict[str, Any]) -> None:
+        """Enregistre les métriques d'une analyse par patterns (cumul et dernière requête).
+
+        :param metrics: Les métriques retournées par `FallacyPatternEngine.scan`.
+        :type metrics: Dict[str, Any]
+        :return: None
+        :rtype: None
+        """
+        with self._metrics_lock:
+            self.pattern_metrics['requests'] += 1
+            self.pattern_metrics['total_time'] += metrics['total_time']
+            self.pattern_metrics['max_time'] = max(self.pattern_metrics['max_time'], metrics['total_time'])
+            self.pattern_metrics['last'] = metrics
+        self.logger.debug(
+            "Patterns: %d/%d évalués, %d correspondance(s) en %.2f ms (pré-filtrage %.2f ms)",
+            metrics['patterns_evaluated'], metrics['patterns_total'], metrics['matches'],
+            metrics['total_time'] * 1000, metrics['prefilter_time'] * 1000
+        )
+    
+    def get_pattern_metrics(self) -> Dict[str, Any]:
+        """Retourne les métriques cumulées de la détection par patterns.
+
+        :return: Nombre de requêtes, temps total, moyen et maximal (secondes),
+                 et les métriques de la dernière requête.
+        :rtype: Dict[str, Any]
+        """
+        with self._metrics_lock:
+            metrics = dict(self.pattern_metrics)
+        metrics['average_time'] = metrics['total_time'] / metrics['requests'] if metrics['requests'] else 0.0
+        return metrics
+    
     def _pattern_matches(self, pattern: str, text: str) -> bool:
         """Vérifie si un pattern regex correspond à un texte (insensible à la casse).
 
-        Traite les patterns comme des expressions régulières complètes.
-        En cas d'échec de la regex, effectue une simple recherche de sous-chaîne.
+        Le pattern est compilé une seule fois par le moteur de patterns. Une
+        regex invalide est traitée comme une simple recherche de sous-chaîne.
 
         :param pattern: Le pattern regex à rechercher.
         :type pattern: str
@@ -509,26 +530,7 @@ class FallacyService:
         :return: True si le pattern est trouvé, False sinon.
         :rtype: bool
         """
-        import re
-        
-        print(f"[DEBUG] Pattern à tester: '{pattern}'")
-        print(f"[DEBUG] Texte à analyser: '{text}'")
-        
-        try:
-            # Traiter le pattern comme une regex complète
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            result = bool(match)
-            print(f"[DEBUG] Résultat regex: {result}")
-            if match:
-                print(f"[DEBUG] Match trouvé: '{match.group(0)}'")
-            return result
-        except Exception as e:
-            print(f"[DEBUG] Erreur regex: {e}, fallback vers recherche sous-chaîne")
-            # Fallback: recherche de sous-chaîne simple (sans regex)
-            cleaned_pattern = re.sub(r'[\\()\[\]{}.*+?^$|]', '', pattern)
-            result = cleaned_pattern.lower() in text.lower()
-            print(f"[DEBUG] Résultat fallback: {result}")
-            return result
+        return self.pattern_engine.matches(pattern, text)
     
     def _extract_context(self, text: str, position: int, context_size: int = 50) -> Optional[str]:
         """Extrait une portion de texte (contexte) autour d'une position donnée.
@@ -13,6 +13,7 @@ from argumentation_analysis.services.web_api.models.request_models import Framew
 from argumentation_analysis.services.web_api.models.response_models import (
     FrameworkResponse, ArgumentNode, Extension, FrameworkVisualization
 )
+from argumentation_analysis.services.web_api.services.extension_engine import ExtensionEngine, ExtensionPage
 
 logger = logging.getLogger("FrameworkService")
 
@@ -21,8 +22,8 @@ class FrameworkService:
     """
     Service pour la construction et l'analyse de frameworks de Dung.
     
-    Ce service implémente les algorithmes de base pour calculer
-    les extensions selon différentes sémantiques.
+    Les extensions sont énumérées par `ExtensionEngine` (décomposition en
+    SCC, backtracking avec propagation), page par page.
     """
     
     def __init__(self):
@@ -58,11 +59,13 @@ class FrameworkService:
             
             # Calcul des extensions si demandé
             extensions = []
+            page = None
             if request.options and request.options.compute_extensions:
-                extensions = self._compute_extensions(
+                extensions, page = self._compute_extensions(
                     argument_nodes, 
                     attack_relations, 
-                    request.options.semantics
+                    request.options.semantics,
+                    request.options
                 )
                 
                 # Mise à jour du statut des arguments
@@ -91,6 +94,11 @@ class FrameworkService:
                 attack_count=stats['attack_count'],
                 support_count=stats['support_count'],
                 extension_count=stats['extension_count'],
+                extension_offset=page.offset if page else 0,
+                next_extension_offset=page.offset + len(page.extensions) if page and (page.has_more or page.timed_out) else None,
+                extensions_truncated=bool(page and (page.has_more or page.timed_out)),
+                extensions_timed_out=bool(page and page.timed_out),
+                argument_status_from_page=bool(page and (page.offset > 0 or page.has_more or page.timed_out)),
                 visualization=visualization,
                 processing_time=processing_time,
                 framework_options=request.options.dict() if request.options else {}
@@ -194,10 +202,13 @@ class FrameworkService:
         
         return relations
     
-    def _compute_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]], semantics: str) -> List[Extension]:
+    def _compute_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]], semantics: str,
+                            options: Optional[FrameworkOptions] = None) -> Tuple[List[Extension], Optional[ExtensionPage]]:
         """Calcule les extensions sémantiques d'un framework d'argumentation.
 
         Route vers la méthode de calcul appropriée en fonction de la sémantique demandée.
+        Seule la page demandée (`extension_offset`, `max_extensions`) est énumérée,
+        dans la limite de `time_budget`.
 
         :param nodes: Liste des nœuds d'argument du framework.
         :type nodes: List[ArgumentNode]
@@ -205,192 +216,148 @@ class FrameworkService:
         :type attacks: List[Dict[str, str]]
         :param semantics: La sémantique à utiliser pour le calcul (par exemple, "grounded", "preferred").
         :type semantics: str
-        :return: Une liste d'objets `Extension`.
-        :rtype: List[Extension]
+        :param options: Les options du framework (pagination et budget de temps).
+        :type options: Optional[FrameworkOptions]
+        :return: La liste des objets `Extension` de la page, et la page brute
+                 (None si la sémantique est inconnue ou en cas d'erreur).
+        :rtype: Tuple[List[Extension], Optional[ExtensionPage]]
         """
         try:
             if semantics == "grounded":
-                return self._compute_grounded_extension(nodes, attacks)
+                page = self._compute_grounded_extension(nodes, attacks, options)
             elif semantics == "complete":
-                return self._compute_complete_extensions(nodes, attacks)
+                page = self._compute_complete_extensions(nodes, attacks, options)
             elif semantics == "preferred":
-                return self._compute_preferred_extensions(nodes, attacks)
+                page = self._compute_preferred_extensions(nodes, attacks, options)
             elif semantics == "stable":
-                return self._compute_stable_extensions(nodes, attacks)
+                page = self._compute_stable_extensions(nodes, attacks, options)
             elif semantics == "semi-stable":
-                return self._compute_semi_stable_extensions(nodes, attacks)
+                page = self._compute_semi_stable_extensions(nodes, attacks, options)
             else:
                 self.logger.warning(f"Sémantique inconnue: {semantics}")
-                return []
+                return [], None
+            
+            if page.timed_out:
+                self.logger.warning(
+                    f"Budget de temps dépassé pour la sémantique {semantics}: "
+                    f"{len(page.extensions)} extension(s) retournée(s)"
+                )
+            
+            extensions = [
+                Extension(
+                    type=semantics,
+                    arguments=arguments,
+                    is_complete=True,
+                    is_preferred=is_preferred
+                )
+                for arguments, is_preferred in zip(page.extensions, page.preferred)
+            ]
+            return extensions, page
         
         except Exception as e:
             self.logger.error(f"Erreur calcul extensions: {e}")
-            return []
+            return [], None
+    
+    def _enumerate_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]], semantics: str,
+                              options: Optional[FrameworkOptions] = None) -> ExtensionPage:
+        """Énumère une page d'extensions avec le moteur SCC-récursif.
+
+        :param nodes: Liste des nœuds d'argument.
+        :type nodes: List[ArgumentNode]
+        :param attacks: Liste des relations d'attaque.
+        :type attacks: List[Dict[str, str]]
+        :param semantics: La sémantique à énumérer.
+        :type semantics: str
+        :param options: Les options du framework (valeurs par défaut si None).
+        :type options: Optional[FrameworkOptions]
+        :return: La page d'extensions demandée.
+        :rtype: ExtensionPage
+        """
+        options = options or FrameworkOptions()
+        engine = ExtensionEngine(
+            self._build_attack_graph(nodes, attacks),
+            deadline=time.monotonic() + options.time_budget
+        )
+        return engine.page(semantics, offset=options.extension_offset, limit=options.max_extensions)
     
-    def _compute_grounded_extension(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
+    def _compute_grounded_extension(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]],
+                                    options: Optional[FrameworkOptions] = None) -> ExtensionPage:
         """Calcule l'extension grounded (fondée) unique d'un framework d'argumentation.
 
         :param nodes: Liste des nœuds d'argument.
         :type nodes: List[ArgumentNode]
         :param attacks: Liste des relations d'attaque.
         :type attacks: List[Dict[str, str]]
-        :return: Une liste contenant l'unique extension grounded.
-        :rtype: List[Extension]
+        :param options: Les options du framework.
+        :type options: Optional[FrameworkOptions]
+        :return: Une page contenant l'unique extension grounded.
+        :rtype: ExtensionPage
         """
-        # Construction du graphe d'attaque
-        attack_graph = self._build_attack_graph(nodes, attacks)
-        
-        # Algorithme de l'extension grounded
-        in_set = set()
-        out_set = set()
-        undecided = {node.id for node in nodes}
-        
-        changed = True
-        while changed:
-            changed = False
-            
-            # Arguments sans attaquants -> IN
-            for arg_id in list(undecided):
-                attackers = attack_graph.get(arg_id, set())
-                if not attackers or attackers.issubset(out_set):
-                    in_set.add(arg_id)
-                    undecided.remove(arg_id)
-                    changed = True
-            
-            # Arguments attaqués par IN -> OUT
-            for arg_id in list(undecided):
-                attackers = attack_graph.get(arg_id, set())
-                if attackers.intersection(in_set):
-                    out_set.add(arg_id)
-                    undecided.remove(arg_id)
-                    changed = True
-        
-        return [Extension(
-            type="grounded",
-            arguments=list(in_set),
-            is_complete=True,
-            is_preferred=True
-        )]
+        return self._enumerate_extensions(nodes, attacks, "grounded", options)
     
-    def _compute_complete_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule toutes les extensions complètes d'un framework d'argumentation.
-        (Implémentation simplifiée/heuristique actuelle).
+    def _compute_complete_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]],
+                                     options: Optional[FrameworkOptions] = None) -> ExtensionPage:
+        """Calcule les extensions complètes d'un framework d'argumentation.
+
+        Chaque extension indique si elle est aussi préférée.
 
         :param nodes: Liste des nœuds d'argument.
         :type nodes: List[ArgumentNode]
         :param attacks: Liste des relations d'attaque.
         :type attacks: List[Dict[str, str]]
-        :return: Une liste d'objets `Extension` représentant les extensions complètes.
-        :rtype: List[Extension]
+        :param options: Les options du framework.
+        :type options: Optional[FrameworkOptions]
+        :return: Une page d'extensions complètes.
+        :rtype: ExtensionPage
         """
-        attack_graph = self._build_attack_graph(nodes, attacks)
-        all_args = {node.id for node in nodes}
-        
-        # Génération de tous les sous-ensembles possibles
-        extensions = []
-        
-        # Pour simplifier, on utilise une approche heuristique
-        # Dans un vrai système, il faudrait implémenter l'algorithme complet
-        
-        # Extension vide (toujours complète)
-        if self._is_complete_extension(set(), attack_graph, all_args):
-            extensions.append(Extension(
-                type="complete",
-                arguments=[],
-                is_complete=True,
-                is_preferred=False
-            ))
-        
-        # Extension grounded
-        grounded = self._compute_grounded_extension(nodes, attacks)
-        if grounded:
-            extensions.append(Extension(
-                type="complete",
-                arguments=grounded[0].arguments,
-                is_complete=True,
-                is_preferred=len(grounded[0].arguments) > 0
-            ))
-        
-        return extensions
+        return self._enumerate_extensions(nodes, attacks, "complete", options)
     
-    def _compute_preferred_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule les extensions préférées d'un framework d'argumentation.
-        (Implémentation simplifiée actuelle : retourne l'extension grounded).
+    def _compute_preferred_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]],
+                                      options: Optional[FrameworkOptions] = None) -> ExtensionPage:
+        """Calcule les extensions préférées (complètes maximales pour l'inclusion).
 
         :param nodes: Liste des nœuds d'argument.
         :type nodes: List[ArgumentNode]
         :param attacks: Liste des relations d'attaque.
         :type attacks: List[Dict[str, str]]
-        :return: Une liste d'objets `Extension` représentant les extensions préférées.
-        :rtype: List[Extension]
+        :param options: Les options du framework.
+        :type options: Optional[FrameworkOptions]
+        :return: Une page d'extensions préférées.
+        :rtype: ExtensionPage
         """
-        # Pour simplifier, on retourne l'extension grounded comme préférée
-        grounded = self._compute_grounded_extension(nodes, attacks)
-        
-        if grounded:
-            return [Extension(
-                type="preferred",
-                arguments=grounded[0].arguments,
-                is_complete=True,
-                is_preferred=True
-            )]
-        
-        return []
+        return self._enumerate_extensions(nodes, attacks, "preferred", options)
     
-    def _compute_stable_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule les extensions stables d'un framework d'argumentation.
-        (Implémentation simplifiée actuelle : vérifie si l'extension grounded est stable).
+    def _compute_stable_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]],
+                                   options: Optional[FrameworkOptions] = None) -> ExtensionPage:
+        """Calcule les extensions stables (qui attaquent tout argument qu'elles ne contiennent pas).
 
         :param nodes: Liste des nœuds d'argument.
         :type nodes: List[ArgumentNode]
         :param attacks: Liste des relations d'attaque.
         :type attacks: List[Dict[str, str]]
-        :return: Une liste d'objets `Extension` représentant les extensions stables.
-        :rtype: List[Extension]
+        :param options: Les options du framework.
+        :type options: Optional[FrameworkOptions]
+        :return: Une page d'extensions stables (éventuellement vide).
+        :rtype: ExtensionPage
         """
-        attack_graph = self._build_attack_graph(nodes, attacks)
-        all_args = {node.id for node in nodes}
-        
-        # Une extension stable attaque tous les arguments qu'elle ne contient pas
-        extensions = []
-        
-        # Vérification de l'extension grounded
-        grounded = self._compute_grounded_extension(nodes, attacks)
-        if grounded and grounded[0].arguments:
-            in_set = set(grounded[0].arguments)
-            out_set = all_args - in_set
-            
-            # Vérifier si tous les arguments OUT sont attaqués par IN
-            is_stable = True
-            for out_arg in out_set:
-                attackers = attack_graph.get(out_arg, set())
-                if not attackers.intersection(in_set):
-                    is_stable = False
-                    break
-            
-            if is_stable:
-                extensions.append(Extension(
-                    type="stable",
-                    arguments=list(in_set),
-                    is_complete=True,
-                    is_preferred=True
-                ))
-        
-        return extensions
+        return self._enumerate_extensions(nodes, attacks, "stable", options)
     
-    def _compute_semi_stable_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> List[Extension]:
-        """Calcule les extensions semi-stables d'un framework d'argumentation.
-        (Implémentation simplifiée actuelle : retourne les extensions préférées).
+    def _compute_semi_stable_extensions(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]],
+                                        options: Optional[FrameworkOptions] = None) -> ExtensionPage:
+        """Calcule les extensions semi-stables (préférées dont le range est maximal).
+
+        Ce sont les extensions stables lorsqu'il en existe.
 
         :param nodes: Liste des nœuds d'argument.
         :type nodes: List[ArgumentNode]
         :param attacks: Liste des relations d'attaque.
         :type attacks: List[Dict[str, str]]
-        :return: Une liste d'objets `Extension` représentant les extensions semi-stables.
-        :rtype: List[Extension]
+        :param options: Les options du framework.
+        :type options: Optional[FrameworkOptions]
+        :return: Une page d'extensions semi-stables.
+        :rtype: ExtensionPage
         """
-        # Pour simplifier, on retourne les extensions préférées
-        return self._compute_preferred_extensions(nodes, attacks)
+        return self._enumerate_extensions(nodes, attacks, "semi-stable", options)
     
     def _build_attack_graph(self, nodes: List[ArgumentNode], attacks: List[Dict[str, str]]) -> Dict[str, Set[str]]:
         """Construit une représentation du graphe d'attaque.
@@ -415,7 +382,6 @@ class FrameworkService:
     
     def _is_complete_extension(self, extension: Set[str], attack_graph: Dict[str, Set[str]], all_args: Set[str]) -> bool:
         """Vérifie si un ensemble d'arguments donné est une extension complète.
-        (Implémentation simplifiée actuelle : vérifie uniquement l'absence de conflit).
 
         Une extension complète doit être sans conflit, défendre tous ses arguments,
         et contenir tous les arguments qu'elle défend.
@@ -426,27 +392,23 @@ class FrameworkService:
         :type attack_graph: Dict[str, Set[str]]
         :param all_args: L'ensemble de tous les IDs d'arguments dans le framework.
         :type all_args: Set[str]
-        :return: True si l'ensemble est (partiellement) considéré comme complet, False sinon.
+        :return: True si l'ensemble est une extension complète, False sinon.
         :rtype: bool
         """
-        # Un ensemble S est complet si :
-        # 1. S est sans conflit (conflict-free)
-        # 2. S défend tous ses éléments
-        # 3. S contient tous les arguments qu'il défend
-        
-        # Vérification sans conflit
-        for arg in extension:
-            attackers = attack_graph.get(arg, set())
-            if attackers.intersection(extension):
-                return False
-        
-        # Vérification défense (simplifié)
-        return True
+        graph = {arg: attack_graph.get(arg, set()) for arg in all_args}
+        if not extension.issubset(graph):
+            return False
+        engine = ExtensionEngine(graph)
+        return engine.is_complete(engine.mask(extension))
     
     def _update_argument_status(self, nodes: List[ArgumentNode], extensions: List[Extension]) -> None:
         """Met à jour le statut ('accepted', 'rejected', 'undecided') de chaque nœud d'argument
         en fonction des extensions calculées (principalement les extensions préférées).
 
+        Seules les extensions de la page retournée sont prises en compte : si la
+        page ne couvre pas toute l'énumération, la réponse l'indique par
+        `argument_status_from_page`.
+
         :param nodes: La liste des `ArgumentNode` à mettre à jour.
         :type nodes: List[ArgumentNode]
         :param extensions: La liste des `Extension` calculées.
@@ -282,7 +282,44 @@ class TestFallacyService:
         
         assert response is not None
         assert response.detection_options == options.dict()
-    
+
+    def test_pattern_detection_positions_and_metrics(self, fallacy_service):
+        """Test du moteur de patterns précompilé : positions réelles et métriques."""
+        text = "Tu ne peux pas être d'accord, tu n'es qu'un étudiant sans expérience."
+
+        fallacies = fallacy_service._detect_with_patterns(text, None)
+
+        ad_hominem = [f for f in fallacies if f.type == 'ad_hominem']
+        assert len(ad_hominem) == 1
+        location = ad_hominem[0].location
+        assert text.lower()[location['start']:location['end']].startswith("tu ne peux pas")
+        metrics = fallacy_service.get_pattern_metrics()
+        assert metrics['requests'] == 1
+        assert 0 < metrics['last']['patterns_evaluated'] < metrics['last']['patterns_total']
+
+    def test_pattern_prefilter_literals(self):
+        """Test de l'extraction des littéraux obligatoires utilisés pour le pré-filtrage."""
+        from ..services.fallacy_pattern_engine import required_literals
+
+        assert required_literals('parce que.*auteur.*condamné') == ['parce que', 'auteur', 'condamné']
+        assert required_literals(r"(.+)\s*parce qu[e\'].*\1") == ['parce qu']
+        assert required_literals('tu es (juste|seulement)') == ['tu es ']
+        assert required_literals('abc?d') == ['ab']
+        assert required_literals('soit|ou') == []
+
+    def test_pattern_prefilter_character_escapes(self):
+        """Les échappements de code de caractère interrompent le littéral sans y laisser leurs chiffres."""
+        from ..services.fallacy_pattern_engine import FallacyPatternEngine, required_literals
+
+        assert required_literals(r'\x41bc') == ['bc']
+        assert required_literals(r'ab\u00e9cd') == ['ab', 'cd']
+        assert required_literals(r'ab\101cd\0xy') == ['ab', 'cd', 'xy']
+        assert required_literals(r'\N{LATIN SMALL LETTER E}té') == ['té']
+
+        engine = FallacyPatternEngine({'test': {'patterns': [r'\x41bc']}})
+        matches, _ = engine.scan("Texte contenant Abc")
+        assert [(match.start, match.end) for match in matches] == [(16, 19)]
+
     def test_fallacy_options_validation(self):
         """Test de validation des options de détection."""
         with pytest.raises(ValueError):
@@ -375,6 +412,78 @@ class TestFrameworkService:
         with pytest.raises(ValueError):
             FrameworkOptions(max_arguments=2000)
 
+    def test_extensions_by_semantics(self, framework_service):
+        """Test des extensions calculées : a et b s'attaquent, b attaque c."""
+        arguments = [
+            Argument(id="a", content="A", attacks=["b"]),
+            Argument(id="b", content="B", attacks=["a", "c"]),
+            Argument(id="c", content="C")
+        ]
+        expected = {
+            "grounded": [[]],
+            "complete": [["a", "c"], ["b"], []],
+            "preferred": [["a", "c"], ["b"]],
+            "stable": [["a", "c"], ["b"]],
+            "semi-stable": [["a", "c"], ["b"]]
+        }
+        for semantics, extensions in expected.items():
+            request = FrameworkRequest(arguments=arguments, options=FrameworkOptions(semantics=semantics))
+            response = framework_service.build_framework(request)
+            assert sorted(ext.arguments for ext in response.extensions) == sorted(extensions), semantics
+
+        complete = framework_service.build_framework(
+            FrameworkRequest(arguments=arguments, options=FrameworkOptions(semantics="complete"))
+        )
+        assert {tuple(ext.arguments): ext.is_preferred for ext in complete.extensions} == {
+            ("a", "c"): True, ("b",): True, (): False
+        }
+        assert framework_service._is_complete_extension({"a", "c"}, {"a": {"b"}, "b": {"a"}, "c": {"b"}}, {"a", "b", "c"})
+        assert not framework_service._is_complete_extension({"a"}, {"a": {"b"}, "b": {"a"}, "c": {"b"}}, {"a", "b", "c"})
+
+    def test_extension_pagination(self, framework_service):
+        """Test de la pagination : 40 paires en conflit mutuel donnent 2^40 extensions stables."""
+        arguments = []
+        for i in range(40):
+            arguments.append(Argument(id=f"x{i}", content=f"X{i}", attacks=[f"y{i}"]))
+            arguments.append(Argument(id=f"y{i}", content=f"Y{i}", attacks=[f"x{i}"]))
+
+        first = framework_service.build_framework(FrameworkRequest(
+            arguments=arguments, options=FrameworkOptions(semantics="stable", max_extensions=3)
+        ))
+        assert first.success and first.extension_count == 3
+        assert first.extensions_truncated and first.next_extension_offset == 3
+
+        second = framework_service.build_framework(FrameworkRequest(
+            arguments=arguments,
+            options=FrameworkOptions(semantics="stable", max_extensions=3, extension_offset=first.next_extension_offset)
+        ))
+        assert second.extension_offset == 3 and second.extension_count == 3
+        seen = [tuple(ext.arguments) for ext in first.extensions + second.extensions]
+        assert len(set(seen)) == 6
+        assert all(len(ext) == 40 for ext in seen)
+        assert first.argument_status_from_page and second.argument_status_from_page
+
+        complete = framework_service.build_framework(FrameworkRequest(
+            arguments=arguments[:4], options=FrameworkOptions(semantics="stable")
+        ))
+        assert complete.extension_count == 4 and complete.next_extension_offset is None
+        assert not complete.extensions_truncated and not complete.argument_status_from_page
+
+    def test_extension_timeout_reports_resume_offset(self, framework_service):
+        """Test du budget de temps : la réponse indique où reprendre l'énumération."""
+        arguments = []
+        for i in range(40):
+            arguments.append(Argument(id=f"x{i}", content=f"X{i}", attacks=[f"y{i}"]))
+            arguments.append(Argument(id=f"y{i}", content=f"Y{i}", attacks=[f"x{i}"]))
+
+        response = framework_service.build_framework(FrameworkRequest(
+            arguments=arguments,
+            options=FrameworkOptions(semantics="stable", extension_offset=10 ** 9, time_budget=0.05)
+        ))
+        assert response.success and response.extensions_timed_out and response.extensions_truncated
+        assert response.next_extension_offset == 10 ** 9 + response.extension_count
+        assert response.argument_status_from_page
+
 
 class TestServiceIntegration:
     """Tests d'intégration entre services."""
@@ -11,7 +11,7 @@ import logging
 import gzip
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional, Union
+from typing import List, Dict, Any, Iterable, Tuple, Optional, Union
 
 # Imports depuis les modules du projet
 # Imports depuis les modules du projet (chemins absolus pour la robustesse)
@@ -20,6 +20,8 @@ from argumentation_analysis.services.fetch_service import FetchService
 from argumentation_analysis.models.extract_definition import ExtractDefinitions, SourceDefinition
 from argumentation_analysis.ui.config import ENCRYPTION_KEY, CONFIG_FILE, CONFIG_FILE_JSON, CACHE_DIR
 from argumentation_analysis.services.crypto_service import CryptoService
+from argumentation_analysis.core.corpus_container import is_chunked_corpus, open_chunked_corpus
+from argumentation_analysis.core.io_manager import select_definitions
 from argumentation_analysis.services.cache_service import CacheService
 
 
@@ -178,7 +180,9 @@ def highlight_search_results(
 def load_extract_definitions_safely(
     config_file: Union[str, Path], 
     encryption_key: Optional[str], 
-    fallback_json_file: Optional[Union[str, Path]] = None
+    fallback_json_file: Optional[Union[str, Path]] = None,
+    source_names: Optional[Iterable[str]] = None,
+    with_full_text: bool = True
 ) -> Tuple[List[Dict[str, Any]], str]:
     """
     Charge les définitions d'extraits de manière sécurisée, en essayant d'abord
@@ -194,6 +198,12 @@ def load_extract_definitions_safely(
     :param fallback_json_file: Chemin optionnel vers un fichier JSON non chiffré
                                de secours.
     :type fallback_json_file: Optional[Union[str, Path]]
+    :param source_names: Si fourni, seules ces sources sont retournées (avec un
+                         conteneur par blocs, seules elles sont déchiffrées).
+    :type source_names: Optional[Iterable[str]]
+    :param with_full_text: Si False, les textes complets embarqués ne sont ni
+                           déchiffrés (conteneur par blocs) ni retournés.
+    :type with_full_text: bool
     :return: Un tuple contenant la liste des définitions d'extraits (List[Dict[str, Any]])
              et un message de statut (str). Retourne une liste vide et un message d'erreur
              si tout échoue.
@@ -202,18 +212,25 @@ def load_extract_definitions_safely(
     # TODO: L'encryption_key devrait être de type bytes pour CryptoService.
     #       Une conversion ou une adaptation de CryptoService pourrait être nécessaire.
     #       Pour l'instant, on suppose que CryptoService gère la conversion si besoin.
+    if source_names is not None:
+        source_names = set(source_names)
     try:
         # Essayer d'abord de charger depuis le fichier chiffré
         if encryption_key:
             try:
                 config_path = Path(config_file)
+                if config_path.exists() and is_chunked_corpus(config_path):
+                    # Conteneur par blocs : seuls les blocs demandés sont déchiffrés
+                    with open_chunked_corpus(config_path, encryption_key) as reader:
+                        extract_definitions = reader.load_sources(source_names, with_full_text=with_full_text)
+                    return extract_definitions, f"Définitions chargées depuis {config_path}"
                 if config_path.exists():
                     # Déchiffrer le fichier
                     decrypted_data = crypto_service.decrypt_file(config_path, encryption_key)
                     if decrypted_data:
                         # Décompresser les données
                         json_data = gzip.decompress(decrypted_data).decode('utf-8')
-                        extract_definitions = json.loads(json_data)
+                        extract_definitions = select_definitions(json.loads(json_data), source_names, with_full_text)
                         return extract_definitions, f"Définitions chargées depuis {config_path}"
             except Exception as e:
                 logger.error(f"Erreur lors du déchiffrement: {e}")
@@ -224,7 +241,7 @@ def load_extract_definitions_safely(
             json_path = Path(fallback_json_file)
             if json_path.exists():
                 with open(json_path, 'r', encoding='utf-8') as f:
-                    extract_definitions = json.load(f)
+                    extract_definitions = select_definitions(json.load(f), source_names, with_full_text)
                 return extract_definitions, f"Définitions chargées depuis {json_path}"
         
         # Si tout échoue, retourner une liste vide
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_belief_set_cache.py
+"""
+Tests unitaires pour le cache des ensembles de croyances et les requêtes groupées de PLHandler/FOLHandler.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from argumentation_analysis.agents.core.logic.belief_set_cache import BeliefSetCache
+from argumentation_analysis.agents.core.logic.pl_handler import PLHandler
+from argumentation_analysis.agents.core.logic.fol_handler import FOLHandler
+
+
+class FakeJException(Exception):
+    def getMessage(self):
+        return str(self)
+
+
+@pytest.fixture
+def mock_jpype():
+    """jpype factice : chaque JClass retourne une classe MagicMock distincte par nom."""
+    classes = {}
+    fake = MagicMock()
+    fake.JException = FakeJException
+    fake.JClass.side_effect = lambda name: classes.setdefault(name, MagicMock(name=name))
+    fake.JString.side_effect = lambda value: value
+    fake.classes = classes
+    with patch('argumentation_analysis.agents.core.logic.pl_handler.jpype', fake), \
+         patch('argumentation_analysis.agents.core.logic.fol_handler.jpype', fake):
+        yield fake
+
+
+def test_lru_eviction_by_entries():
+    cache = BeliefSetCache(max_entries=2)
+    cache.put("a", "A", 10)
+    cache.put("b", "B", 10)
+    assert cache.get("a") == "A"  # "b" devient la moins récente
+    cache.put("c", "C", 10)
+    assert "b" not in cache
+    assert cache.stats() == {"entries": 2, "estimated_bytes": 20, "hits": 1, "misses": 0, "evictions": 1}
+
+
+def test_eviction_by_memory_budget():
+    cache = BeliefSetCache(max_entries=10, max_bytes=100)
+    cache.put("a", "A", 60)
+    cache.put("b", "B", 60)
+    assert "a" not in cache and cache.current_bytes == 60
+    cache.put("huge", "H", 1000)
+    assert "huge" not in cache and "b" in cache
+
+
+def test_builder_errors_are_not_cached():
+    cache = BeliefSetCache()
+    builder = MagicMock(side_effect=ValueError("parse"))
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cache.get_or_build("k", builder)
+    assert builder.call_count == 2 and len(cache) == 0
+
+
+def test_pl_queries_reuse_parsed_belief_set(mock_jpype):
+    initializer = MagicMock()
+    handler = PLHandler(initializer)
+    parser = initializer.get_pl_parser.return_value
+    handler._pl_reasoner.query.return_value = True
+
+    kb = "a\na => b\n```"
+    for query in ["b", "a", "!b"]:
+        assert handler.pl_query(kb, query) is True
+    # Même base à l'espacement près : toujours un hit
+    handler.pl_check_consistency("a \n a=>b %")
+
+    belief_set_class = mock_jpype.classes["org.tweetyproject.logics.pl.syntax.PlBeliefSet"]
+    assert belief_set_class.call_count == 1
+    # 2 formules de la base (une seule fois) + 3 requêtes
+    assert parser.parseFormula.call_count == 5
+    assert handler._belief_set_cache.stats()["hits"] == 3
+
+
+def test_pl_signature_is_part_of_the_key(mock_jpype):
+    handler = PLHandler(MagicMock())
+    handler._pl_reasoner.query.return_value = False
+    handler.pl_query("a", "a")
+    handler.pl_query("a", "a", constants=["a"])
+    assert len(handler._belief_set_cache) == 2
+
+
+def test_fol_belief_set_from_string_is_cached(mock_jpype):
+    cache = BeliefSetCache()
+    handler = FOLHandler(MagicMock(), belief_set_cache=cache)
+    parser_class = mock_jpype.JClass("org.tweetyproject.logics.fol.parser.FolParser")
+    parser_class.return_value.parseBeliefBase.return_value.size.return_value = 2
+    first = handler.create_belief_set_from_string("thing = {a}\ntype(p(thing))\n\np(a)\n")
+    second = handler.create_belief_set_from_string("  thing = {a}\ntype(p(thing))\np(a)")
+    assert first is second
+    assert parser_class.return_value.parseBeliefBase.call_count == 1
+    assert len(cache) == 1
+
+
+def test_pl_query_batch_parses_kb_once_and_isolates_errors(mock_jpype):
+    initializer = MagicMock()
+    handler = PLHandler(initializer)
+    parser = initializer.get_pl_parser.return_value
+
+    def parse(formula, *args):
+        if formula == "( bad":
+            raise FakeJException("syntax")
+        return f"F[{formula}]"
+
+    parser.parseFormula.side_effect = parse
+    handler._pl_reasoner.query.side_effect = lambda kb, formula: formula == "F[b]"
+
+    results = handler.pl_query_batch("a\na => b", ["b", "a %", "(bad", "b"])
+
+    assert [entailed for entailed, _ in results] == [True, False, None, True]
+    assert "syntax" in results[2][1]
+    # 2 formules de la base + 3 requêtes distinctes
+    assert parser.parseFormula.call_count == 5
+    assert handler._pl_reasoner.query.call_count == 2
@@ -179,36 +179,46 @@ class TestQueryExecutor:
     
     @pytest.mark.asyncio
     async def test_execute_queries(self):
-        """Test de l'exécution de plusieurs requêtes."""
-        self.mock_tweety_bridge.validate_formula.side_effect = [
-            (True, "OK"),
-            (True, "OK"),
-            (False, "Syntax Error in c")
-        ]
-        self.mock_tweety_bridge.execute_pl_query.side_effect = [
+        """Test de l'exécution de plusieurs requêtes propositionnelles en un seul lot."""
+        self.mock_tweety_bridge.execute_pl_queries.return_value = [
             "Tweety Result: Query 'a' is ACCEPTED (True).",
-            "Tweety Result: Query 'b' is REJECTED (False)."
+            "Tweety Result: Query 'b' is REJECTED (False).",
+            "FUNC_ERROR: Syntax Error in c",
         ]
         
         belief_set = PropositionalBeliefSet("a => b")
         results = self.query_executor.execute_queries(belief_set, ["a", "b", "c"])
         
-        assert self.mock_tweety_bridge.validate_formula.call_count == 3
-        assert self.mock_tweety_bridge.execute_pl_query.call_count == 2
+        # Un seul appel au pont pour tout le lot, sans validation séparée
+        self.mock_tweety_bridge.execute_pl_queries.assert_called_once_with("a => b", ["a", "b", "c"])
+        self.mock_tweety_bridge.validate_formula.assert_not_called()
+        self.mock_tweety_bridge.execute_pl_query.assert_not_called()
+        
+        assert results == [
+            ("a", True, "Tweety Result: Query 'a' is ACCEPTED (True)."),
+            ("b", False, "Tweety Result: Query 'b' is REJECTED (False)."),
+            ("c", None, "FUNC_ERROR: Syntax Error in c"),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_execute_queries_first_order_batch_error(self):
+        """Une exception du pont marque toutes les requêtes du lot en erreur."""
+        self.mock_tweety_bridge.execute_fol_queries.side_effect = RuntimeError("JVM crash")
         
-        assert len(results) == 3
+        belief_set = FirstOrderBeliefSet("forall X: (P(X) => Q(X))")
+        results = self.query_executor.execute_queries(belief_set, ["P(a)", "Q(a)"])
         
-        query1, result1, message1 = results[0]
-        assert query1 == "a"
-        assert result1 is True
-        assert message1 == "Tweety Result: Query 'a' is ACCEPTED (True)."
+        assert [r[1] for r in results] == [None, None]
+        assert all("FUNC_ERROR" in r[2] and "JVM crash" in r[2] for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_execute_queries_modal_falls_back_to_single_queries(self):
+        """La logique modale n'a pas de lot : une requête à la fois."""
+        self.mock_tweety_bridge.validate_modal_formula.return_value = (True, "OK")
+        self.mock_tweety_bridge.execute_modal_query.return_value = "Tweety Result: Modal Query is ACCEPTED (True)."
         
-        query2, result2, message2 = results[1]
-        assert query2 == "b"
-        assert result2 is False
-        assert message2 == "Tweety Result: Query 'b' is REJECTED (False)."
+        belief_set = ModalBeliefSet("[]p => <>q")
+        results = self.query_executor.execute_queries(belief_set, ["[]p", "<>q"])
         
-        query3, result3, message3 = results[2]
-        assert query3 == "c"
-        assert result3 is None
-        assert message3 == "FUNC_ERROR: Requête invalide: Syntax Error in c"
\ No newline at end of file
+        assert self.mock_tweety_bridge.execute_modal_query.call_count == 2
+        assert [r[1] for r in results] == [True, True]
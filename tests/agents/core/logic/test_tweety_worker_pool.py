@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# tests/agents/core/logic/test_tweety_worker_pool.py
+"""
+Tests unitaires pour TweetyWorkerPool, avec des workers factices (sans JVM).
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from argumentation_analysis.agents.core.logic.tweety_worker_pool import TweetyWorkerPool
+
+# "fork" évite de réimporter le paquet dans chaque worker factice ; les vrais
+# workers (JVM) utilisent "spawn".
+START_METHOD = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class FakeHandlers:
+    """Opérations factices exécutées dans les workers."""
+
+    OPERATIONS = ("pl_query", "sleep", "pid", "parse_error")
+
+    def pl_query(self, knowledge_base, query):
+        return query in knowledge_base.split("\n")
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+        return os.getpid()
+
+    def pid(self):
+        return os.getpid()
+
+    def parse_error(self):
+        raise ValueError("Error parsing formula")
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("handlers_factory", FakeHandlers)
+        kwargs.setdefault("start_method", START_METHOD)
+        kwargs.setdefault("startup_timeout", 30.0)
+        pool = TweetyWorkerPool(**kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close()
+
+
+def test_call_returns_worker_result(make_pool):
+    pool = make_pool(num_workers=1)
+    assert pool.call("pl_query", "a\nb", "b") is True
+    assert pool.call("pl_query", "a\nb", "c") is False
+
+
+def test_errors_are_propagated_with_their_type(make_pool):
+    pool = make_pool(num_workers=1)
+    with pytest.raises(ValueError, match="parsing"):
+        pool.call("parse_error")
+    with pytest.raises(ValueError, match="inconnue"):
+        pool.call("shutdown_everything")
+    # Le worker reste utilisable après une erreur applicative
+    assert pool.call("pl_query", "a", "a") is True
+    assert pool.recycled == 0
+
+
+def test_unpicklable_argument_does_not_leak_the_worker(make_pool):
+    pool = make_pool(num_workers=1)
+    for _ in range(3):
+        with pytest.raises(TypeError, match="pickle"):
+            pool.call("pl_query", "a", threading.Lock())
+    # Le seul worker est rendu au pool : l'appel suivant n'attend pas indéfiniment
+    result = []
+    caller = threading.Thread(target=lambda: result.append(pool.call("pl_query", "a", "a")), daemon=True)
+    caller.start()
+    caller.join(30)
+    assert result == [True]
+    assert pool.recycled == 0
+
+
+def test_timeout_recycles_the_worker(make_pool):
+    pool = make_pool(num_workers=1, query_timeout=0.5)
+    first_pid = pool.call("pid")
+    with pytest.raises(TimeoutError):
+        pool.call("sleep", 30)
+    assert pool.recycled == 1
+    assert pool.call("pid") != first_pid
+
+
+def test_concurrent_calls_use_all_workers(make_pool):
+    pool = make_pool(num_workers=3)
+    pool.wait_until_ready()
+    pids = []
+    start = time.perf_counter()
+    threads = [threading.Thread(target=lambda: pids.append(pool.call("sleep", 0.5))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.perf_counter() - start < 1.4
+    assert len(set(pids)) == 3
+
+
+def test_workers_are_recycled_after_max_requests(make_pool):
+    pool = make_pool(num_workers=1, max_requests_per_worker=2)
+    pids = [pool.call("pid") for _ in range(4)]
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+    assert pool.recycled == 2
+
+
+@pytest.mark.asyncio
+async def test_call_async(make_pool):
+    pool = make_pool(num_workers=1)
+    assert await pool.call_async("pl_query", "a", "a") is True
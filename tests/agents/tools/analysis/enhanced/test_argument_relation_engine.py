@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le moteur de relations entre arguments.
+"""
+
+import pytest
+
+from argumentation_analysis.agents.tools.analysis.enhanced.argument_relation_engine import ArgumentRelationEngine
+
+
+@pytest.fixture
+def arguments():
+    return [
+        "Les experts affirment que ce produit est sûr.",
+        "Ce produit est utilisé par des millions de personnes.",
+        "Par conséquent, vous devriez faire confiance aux experts et utiliser ce produit.",
+        "Mais ce produit coûte cher, par exemple deux fois plus que les autres.",
+    ]
+
+
+def jaccard(text1, text2):
+    words1, words2 = set(text1.lower().split()), set(text2.lower().split())
+    return len(words1 & words2) / len(words1 | words2)
+
+
+def test_similarity_matches_pairwise_jaccard(arguments):
+    engine = ArgumentRelationEngine(arguments + [""])
+    for i, text1 in enumerate(arguments + [""]):
+        for j, text2 in enumerate(arguments + [""]):
+            expected = jaccard(text1, text2) if (text1 or text2) else 0.0
+            assert engine.similarity(i, j) == pytest.approx(expected)
+
+
+def test_keywords_are_tagged_once_per_argument(arguments):
+    engine = ArgumentRelationEngine(arguments)
+    assert engine.keywords_by_argument[0] == {}
+    assert engine.keywords_by_argument[2] == {"support": ["par conséquent"]}
+    assert engine.keywords_by_argument[3] == {"contradiction": ["mais"], "example": ["par exemple"]}
+
+
+def test_relations_are_ordered_and_scored(arguments):
+    relations = ArgumentRelationEngine(arguments).relations(top_k=None)
+    keys = [(r["source_argument_index"], r["target_argument_index"], r["relation_type"]) for r in relations]
+    assert keys == [
+        (0, 2, "support"), (0, 3, "contradiction"), (0, 3, "example"),
+        (1, 2, "support"), (1, 3, "contradiction"), (1, 3, "example"),
+        (2, 3, "contradiction"), (2, 3, "example"),
+        (3, 2, "support"),
+    ]
+    assert relations[0]["confidence"] == pytest.approx(0.5 + jaccard(arguments[0], arguments[2]) * 0.4)
+
+
+def test_top_k_keeps_most_similar_sources():
+    arguments = [
+        "le chat dort sur le canapé",
+        "le chien aboie dans le jardin",
+        "le chat dort sur le lit",
+        "donc le chat dort",
+    ]
+    engine = ArgumentRelationEngine(arguments)
+    assert engine.top_sources(3, top_k=2) == [0, 2]
+    relations = engine.relations(top_k=1)
+    assert [(r["source_argument_index"], r["target_argument_index"]) for r in relations] == [(0, 3)]
+    assert ArgumentRelationEngine(["un seul argument, donc"]).relations() == []
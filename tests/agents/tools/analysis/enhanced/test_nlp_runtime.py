@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le runtime NLP partagé (chargement paresseux, micro-batching).
+"""
+
+import threading
+
+import pytest
+
+from argumentation_analysis.agents.tools.analysis.enhanced.nlp_runtime import (
+    MicroBatcher, NLPModelRuntime, RuntimeSettings
+)
+
+
+class FakePipeline:
+    """Pipeline factice : enregistre la taille des lots reçus."""
+
+    def __init__(self, task):
+        self.task = task
+        self.batch_sizes = []
+
+    def __call__(self, texts, batch_size=None, **kwargs):
+        self.batch_sizes.append(len(texts))
+        if self.task == "ner":
+            return [[{"entity": "B-PER", "word": word}] for word in texts]
+        return [{"label": "POSITIVE", "score": len(text) / 100} for text in texts]
+
+
+@pytest.fixture
+def runtime():
+    created = {}
+
+    def factory(task, model=None, **kwargs):
+        created[model] = FakePipeline(task)
+        return created[model]
+
+    runtime = NLPModelRuntime(RuntimeSettings(max_batch_size=8, max_wait=0.05), pipeline_factory=factory)
+    runtime.register("sentiment", "sentiment-analysis", "fake-sst2")
+    runtime.register("ner", "ner", "fake-ner")
+    runtime.created = created
+    yield runtime
+    runtime.shutdown()
+
+
+def test_models_are_loaded_lazily(runtime):
+    handle = runtime.handle("sentiment")
+    assert not runtime.is_loaded("sentiment")
+
+    assert handle("abcd") == [{"label": "POSITIVE", "score": 0.04}]
+    assert runtime.is_loaded("sentiment") and not runtime.is_loaded("ner")
+    assert runtime.handle("ner")("Marie") == [{"entity": "B-PER", "word": "Marie"}]
+    with pytest.raises(KeyError):
+        runtime.handle("inconnu")
+
+
+def test_list_inputs_are_batched(runtime):
+    results = runtime.handle("sentiment")(["a" * i for i in range(20)])
+    assert [r["score"] for r in results] == [i / 100 for i in range(20)]
+    assert runtime.created["fake-sst2"].batch_sizes == [8, 8, 4]
+    assert runtime.stats()["sentiment"]["batches"] == 3
+
+
+def test_concurrent_requests_are_coalesced():
+    calls = []
+    release = threading.Event()
+
+    def batch_fn(items):
+        calls.append(list(items))
+        release.wait(1)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=16, max_wait=0.01)
+    first = batcher.submit(0)
+    # Pendant le traitement du premier lot, les requêtes suivantes s'accumulent
+    others = [batcher.submit(i) for i in range(1, 6)]
+    release.set()
+    assert first.result(1) == 0
+    assert [future.result(1) for future in others] == [2, 4, 6, 8, 10]
+    assert len(calls) <= 2 and sum(len(c) for c in calls) == 6
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit(7)
+
+
+def test_batch_errors_are_propagated():
+    def failing(items):
+        raise ValueError("modèle indisponible")
+
+    batcher = MicroBatcher(failing)
+    with pytest.raises(ValueError):
+        batcher.map(["x", "y"], timeout=1)
+    batcher.close()
+
+
+def test_settings_from_env(monkeypatch):
+    monkeypatch.setenv("NLP_NUM_THREADS", "2")
+    monkeypatch.setenv("NLP_BACKEND", "onnx")
+    monkeypatch.setenv("NLP_QUANTIZE", "true")
+    monkeypatch.setenv("NLP_MAX_WAIT_MS", "20")
+    settings = RuntimeSettings.from_env()
+    assert (settings.num_threads, settings.backend, settings.quantize) == (2, "onnx", True)
+    assert settings.max_wait == pytest.approx(0.02)
+    monkeypatch.setenv("NLP_BACKEND", "tpu")
+    assert RuntimeSettings.from_env().backend == "pytorch"
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour l'index compilé de la taxonomie (détection en un passage,
+groupes de frères) et son utilisation par TaxonomySophismDetector.
+"""
+
+import pandas as pd
+import pytest
+
+from argumentation_analysis.agents.core.informal.taxonomy_index import TaxonomyIndex
+from argumentation_analysis.agents.core.informal.taxonomy_sophism_detector import TaxonomySophismDetector
+
+pytestmark = pytest.mark.use_real_numpy
+
+
+@pytest.fixture
+def taxonomy_df():
+    df = pd.DataFrame([
+        {'PK': 1, 'path': '1', 'depth': 1, 'Famille': 'Insuffisance', 'nom_vulgarisé': None,
+         'text_fr': 'Insuffisance'},
+        {'PK': 2, 'path': '1.1', 'depth': 2, 'Famille': 'Insuffisance', 'nom_vulgarisé': 'généralisation hâtive',
+         'text_fr': 'Conclusion générale tirée de quelques anecdotes isolées.'},
+        {'PK': 3, 'path': '1.2', 'depth': 2, 'Famille': 'Insuffisance', 'nom_vulgarisé': 'pente glissante',
+         'text_fr': 'Enchaînement de conséquences catastrophiques supposées.'},
+        {'PK': 4, 'path': '1.2.1', 'depth': 3, 'Famille': 'Insuffisance', 'nom_vulgarisé': 'effet domino',
+         'text_fr': 'Chaque étape entraîne inévitablement la suivante.'},
+        {'PK': 5, 'path': '2', 'depth': 1, 'Famille': 'Influence', 'nom_vulgarisé': 'ad hominem',
+         'text_fr': "Attaque contre la personne plutôt que contre l'argument."},
+    ])
+    return df.set_index('PK')
+
+
+@pytest.fixture
+def detector(taxonomy_df):
+    detector = TaxonomySophismDetector(taxonomy_file_path="mock/path.csv")
+    detector._taxonomy_cache = taxonomy_df
+    return detector
+
+
+def test_match_scores_names_and_keywords_in_one_pass(taxonomy_df):
+    index = TaxonomyIndex(taxonomy_df)
+    results = {pk: (score, matches) for pk, score, matches in index.match(
+        "C'est une PENTE GLISSANTE : un enchaînement de conséquences, puis l'effet domino.")}
+    score, matches = results[3]
+    assert score == pytest.approx(0.7 + 0.1 + 0.1)
+    assert matches == ["Nom vulgarisé: 'pente glissante'", "Mot-clé: 'enchaînement'", "Mot-clé: 'conséquences'"]
+    assert results[4][1] == ["Nom vulgarisé: 'effet domino'"]
+    # Une valeur manquante ne produit pas de terme "nan" (ex. dans "financement")
+    assert 1 not in dict((pk, s) for pk, s, _ in index.match("financement"))
+
+
+def test_siblings_from_path(taxonomy_df):
+    index = TaxonomyIndex(taxonomy_df)
+    assert index.parent_path(4) == "1.2"
+    assert index.siblings(2) == [3]
+    assert index.siblings(4) == []
+    assert index.siblings(5) == []
+
+
+def test_detector_uses_index_for_detection_and_search(detector):
+    detected = detector.detect_sophisms_from_taxonomy("Attention à la pente glissante !")
+    assert [s['taxonomy_key'] for s in detected] == [3]
+    assert detected[0]['confidence'] == pytest.approx(0.7)
+    assert [s['taxonomy_key'] for s in detected[0]['related_sophisms']] == [2]
+
+    results = detector.search_sophisms_by_pattern("insuffisance")
+    assert [r['taxonomy_key'] for r in results] == [1, 2, 3, 4]
+    assert results[0]['match_score'] == pytest.approx(0.7)
+    assert detector._get_taxonomy_index() is detector._get_taxonomy_index()
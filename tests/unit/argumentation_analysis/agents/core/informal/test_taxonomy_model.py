@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour le modèle immuable de la taxonomie et son utilisation
+par InformalAnalysisPlugin.
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from argumentation_analysis.agents.core.informal.informal_definitions import InformalAnalysisPlugin
+from argumentation_analysis.agents.core.informal.taxonomy_model import TaxonomyModel
+
+pytestmark = pytest.mark.use_real_numpy
+
+
+@pytest.fixture
+def path_only_data():
+    """Taxonomie sans colonnes de clé étrangère : la hiérarchie vient de `path`."""
+    return pd.DataFrame({
+        'PK': [1, 2, 3, 4, 5],
+        'path': ['1', '1.1', '1.2', '1.1.1', '2'],
+        'depth': ['1', '2', '2', '3', '1'],
+        'nom_vulgarise': ['Insuffisance', 'Argument bâclé', 'Pente glissante', 'Anecdote', 'Influence'],
+        'Famille': ['Insuffisance'] * 4 + ['Influence'],
+        'text_fr': ['Desc 1', 'Desc 1.1', 'Desc 1.2', None, 'Desc 2'],
+    })
+
+
+@pytest.fixture
+def plugin(path_only_data):
+    with patch('argumentation_analysis.agents.core.informal.informal_definitions.load_csv_file',
+               return_value=path_only_data.copy()):
+        plugin = InformalAnalysisPlugin(taxonomy_file_path="mock/path.csv")
+        plugin._get_taxonomy_dataframe()
+    return plugin
+
+
+def test_model_hierarchy_from_path(path_only_data):
+    model = TaxonomyModel(path_only_data.set_index('PK'))
+    assert model.children == {1: (2, 3), 2: (4,), 3: (), 4: (), 5: ()}
+    assert model.parent == {1: None, 2: 1, 3: 1, 4: 2, 5: None}
+    assert model.depth(4) == 3
+    assert dict(model.non_null_items(4)) == {'path': '1.1.1', 'depth': '3', 'nom_vulgarise': 'Anecdote',
+                                             'Famille': 'Insuffisance'}
+
+
+def test_model_columns_are_read_only(path_only_data):
+    model = TaxonomyModel(path_only_data.set_index('PK'))
+    with pytest.raises(ValueError):
+        model.column('nom_vulgarise')[0] = 'modifié'
+
+
+def test_plugin_shares_dataframe_and_model(plugin):
+    df = plugin._get_taxonomy_dataframe()
+    assert plugin._get_taxonomy_dataframe() is df
+    assert plugin._get_taxonomy_model() is plugin._get_taxonomy_model(df)
+    assert pd.api.types.is_numeric_dtype(df['depth'])
+
+
+def test_plugin_hierarchy_uses_model(plugin):
+    df = plugin._get_taxonomy_dataframe()
+    with patch.object(pd.DataFrame, 'copy', side_effect=AssertionError("copie inattendue")):
+        hierarchy = plugin._internal_explore_hierarchy(1, df, max_children=1)
+        details = plugin._internal_get_node_details(4, df)
+
+    assert hierarchy['current_node']['depth'] == 1
+    assert [child['pk'] for child in hierarchy['children']] == [2]
+    assert hierarchy['children_truncated'] is True and hierarchy['total_children'] == 2
+    assert details['parent']['nom_vulgarise'] == 'Argument bâclé'
+    assert 'text_fr' not in details and 'children' not in details
+    assert details['depth'] == 3
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Tests pour le cache des corpus déchiffrés."""
+
+import copy
+import gzip
+import json
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from argumentation_analysis.core import io_manager
+from argumentation_analysis.core.corpus_cache import DecryptedCorpusCache
+from argumentation_analysis.core.io_manager import load_extract_definitions
+
+DEFINITIONS = [{
+    "source_name": "Discours", "source_type": "direct_download", "schema": "https",
+    "host_parts": ["example", "org"], "path": "/d",
+    "extracts": [{"extract_name": "Début", "start_marker": "A", "end_marker": "B"}]
+}]
+
+
+def write_corpus(path, key, definitions):
+    path.write_bytes(Fernet(key).encrypt(gzip.compress(json.dumps(definitions).encode("utf-8"))))
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    key = Fernet.generate_key()
+    path = tmp_path / "corpus.json.gz.enc"
+    write_corpus(path, key, DEFINITIONS)
+    return path, key
+
+
+def test_decryption_is_paid_once(corpus):
+    path, key = corpus
+    cache = DecryptedCorpusCache()
+    with patch.object(io_manager, "decrypt_data_with_fernet", wraps=io_manager.decrypt_data_with_fernet) as decrypt:
+        first = load_extract_definitions(path, key, cache=cache)
+        first[0]["source_name"] = "modifié par l'appelant"
+        second = load_extract_definitions(path, key, cache=cache)
+
+    assert decrypt.call_count == 1
+    assert second == DEFINITIONS
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_or_other_key_is_not_served(corpus):
+    path, key = corpus
+    cache = DecryptedCorpusCache()
+    load_extract_definitions(path, key, cache=cache)
+
+    updated = [dict(DEFINITIONS[0], source_name="Nouveau discours")]
+    write_corpus(path, key, updated)
+    os.utime(path, ns=(1, 1))
+    assert load_extract_definitions(path, key, cache=cache) == updated
+
+    other_key = Fernet.generate_key()
+    assert cache.get(path, other_key) is None
+    assert load_extract_definitions(path, other_key, cache=cache, fallback_definitions=[]) == []
+    assert cache.get(path, other_key) is None
+
+
+def test_directory_backed_cache_is_shared(corpus, tmp_path):
+    path, key = corpus
+    cache_dir = tmp_path / "shm"
+    load_extract_definitions(path, key, cache=DecryptedCorpusCache(cache_dir=cache_dir))
+
+    cached_files = list(cache_dir.glob("*.json"))
+    assert len(cached_files) == 1
+    assert stat.S_IMODE(cached_files[0].stat().st_mode) == 0o600
+
+    # Un autre processus (un autre cache) réutilise l'entrée sans déchiffrer
+    other = DecryptedCorpusCache(cache_dir=cache_dir)
+    with patch.object(io_manager, "decrypt_data_with_fernet") as decrypt:
+        assert load_extract_definitions(path, key, cache=other) == DEFINITIONS
+    decrypt.assert_not_called()
+
+    other.clear()
+    assert list(cache_dir.glob("*.json")) == []
+
+
+def test_source_lookup_copies_only_that_source(tmp_path):
+    key = Fernet.generate_key()
+    path = tmp_path / "corpus.json.gz.enc"
+    definitions = [
+        dict(DEFINITIONS[0], source_name=name, full_text=f"Texte de {name}. " * 1000)
+        for name in ("Discours", "Débat", "Tribune")
+    ]
+    write_corpus(path, key, definitions)
+    cache = DecryptedCorpusCache()
+    load_extract_definitions(path, key, cache=cache)
+
+    with patch("argumentation_analysis.core.corpus_cache.copy.deepcopy", wraps=copy.deepcopy) as deepcopy:
+        text = io_manager.load_source_full_text(path, key, "Débat", cache=cache)
+    assert text == definitions[1]["full_text"]
+    assert [[d["source_name"] for d in call.args[0]] for call in deepcopy.call_args_list] == [["Débat"]]
+
+    without_text = cache.get(path, key, source_names=["Tribune"], with_full_text=False)
+    assert without_text == [{k: v for k, v in definitions[2].items() if k != "full_text"}]
+    without_text[0]["extracts"].clear()
+    assert cache.get(path, key, source_names=["Tribune"])[0]["extracts"] == DEFINITIONS[0]["extracts"]
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Tests pour le conteneur chiffré par blocs des corpus."""
+
+from unittest.mock import patch
+
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+from argumentation_analysis.core.corpus_container import (
+    MAGIC, is_chunked_corpus, open_chunked_corpus
+)
+from argumentation_analysis.core import source_management
+from argumentation_analysis.core.io_manager import (
+    load_extract_definitions, load_source_full_text, save_extract_definitions
+)
+from argumentation_analysis.core.source_management import (
+    UnifiedSourceConfig, UnifiedSourceManager, UnifiedSourceType
+)
+
+
+def make_definitions(count):
+    return [
+        {
+            "source_name": f"Source {i}", "source_type": "direct_download", "schema": "https",
+            "host_parts": ["example", "org"], "path": f"/{i}",
+            "extracts": [{"extract_name": f"Extrait {i}", "start_marker": "A", "end_marker": "B"}],
+            "full_text": f"Texte complet de la source {i}. " * 50,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def key():
+    return Fernet.generate_key().decode("utf-8")
+
+
+@pytest.fixture
+def chunked_file(tmp_path, key):
+    path = tmp_path / "corpus.enc"
+    definitions = make_definitions(5)
+    definitions[3]["full_text"] = None
+    assert save_extract_definitions(definitions, path, key, embed_full_text=True, container_format="chunked")
+    return path, definitions
+
+
+def test_loader_detects_the_chunked_format(chunked_file, key, tmp_path):
+    path, definitions = chunked_file
+    assert path.read_bytes().startswith(MAGIC) and is_chunked_corpus(path)
+    assert load_extract_definitions(path, key) == definitions
+
+    legacy_path = tmp_path / "legacy.enc"
+    assert save_extract_definitions(definitions, legacy_path, key, embed_full_text=True)
+    assert not is_chunked_corpus(legacy_path)
+    assert load_extract_definitions(legacy_path, key) == definitions
+
+
+def test_sources_are_decrypted_on_demand(chunked_file, key):
+    path, definitions = chunked_file
+    with patch.object(Fernet, "decrypt", autospec=True, side_effect=Fernet.decrypt) as decrypt:
+        with open_chunked_corpus(path, key) as reader:
+            assert decrypt.call_count == 1  # index seul
+            assert reader.source_names == [d["source_name"] for d in definitions]
+
+            source = reader.load_source("Source 2")
+            assert "full_text" not in source and source["path"] == "/2"
+            assert reader.read_full_text(2) == definitions[2]["full_text"]
+            assert decrypt.call_count == 3
+
+    with open_chunked_corpus(path, key) as reader:
+        assert not reader.has_full_text(3) and reader.read_full_text(3) is None
+        assert reader.load_source(3, with_full_text=True)["full_text"] is None
+        with pytest.raises(KeyError):
+            reader.load_source("Source inconnue")
+
+
+def test_wrong_key_and_unknown_format(chunked_file, tmp_path):
+    path, definitions = chunked_file
+    other_key = Fernet.generate_key()
+    with pytest.raises(InvalidToken):
+        open_chunked_corpus(path, other_key)
+    assert load_extract_definitions(path, other_key, fallback_definitions=[]) == []
+    with pytest.raises(InvalidToken):
+        load_extract_definitions(path, other_key, raise_on_decrypt_error=True)
+
+    assert not save_extract_definitions(definitions, tmp_path / "x.enc", other_key, container_format="zip")
+
+
+def test_selective_loading_decrypts_only_requested_blocks(chunked_file, key):
+    path, definitions = chunked_file
+    with patch.object(Fernet, "decrypt", autospec=True, side_effect=Fernet.decrypt) as decrypt:
+        selected = load_extract_definitions(path, key, source_names=["Source 2"], with_full_text=False)
+        assert decrypt.call_count == 2  # index + définition de la source 2
+        assert selected == [{k: v for k, v in definitions[2].items() if k != "full_text"}]
+
+        decrypt.reset_mock()
+        assert load_source_full_text(path, key, "Source 4") == definitions[4]["full_text"]
+        assert decrypt.call_count == 2  # index + texte de la source 4
+    assert load_source_full_text(path, key, "Source inconnue") is None
+
+
+def test_source_manager_reads_enc_texts_on_demand(chunked_file, key):
+    path, definitions = chunked_file
+    config = UnifiedSourceConfig(source_type=UnifiedSourceType.ENC_FILE, enc_file_path=str(path),
+                                 passphrase="phrase", source_index=2)
+    manager = UnifiedSourceManager(config)
+    with patch.object(source_management, "derive_encryption_key", return_value=key), \
+            patch.object(Fernet, "decrypt", autospec=True, side_effect=Fernet.decrypt) as decrypt:
+        extract_definitions, _ = manager.load_sources()
+        assert decrypt.call_count == 1 + len(definitions)  # index + définitions, aucun texte
+
+        decrypt.reset_mock()
+        text, description = manager.select_text_for_analysis(extract_definitions)
+        assert text == definitions[2]["full_text"].strip() and description.endswith("Source 2")
+        assert decrypt.call_count == 2
+
+        texts = [t for d, t in manager.iter_texts_for_analysis(extract_definitions) if "/" not in d]
+        assert texts == [d["full_text"].strip() for d in definitions if d["full_text"]]
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour l'instrumentation du démarrage JVM, l'archive CDS et
+l'import paresseux des classes Tweety.
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from argumentation_analysis.core import jvm_setup
+from argumentation_analysis.agents.core.logic.tweety_initializer import TweetyInitializer
+
+
+def _fake_jdk(tmp_path, version):
+    (tmp_path / "release").write_text(f'JAVA_VERSION="{version}"\n', encoding="utf-8")
+    return str(tmp_path)
+
+
+def test_startup_phases_are_accumulated():
+    with jvm_setup.startup_phase("test_phase"):
+        pass
+    first = jvm_setup.get_startup_timings()["test_phase"]
+    with jvm_setup.startup_phase("test_phase"):
+        pass
+    assert jvm_setup.get_startup_timings()["test_phase"] >= first
+
+
+@pytest.mark.parametrize("version,major", [("17.0.2", 17), ("1.8.0_392", 8), ("21", 21)])
+def test_java_major_version_from_release_file(tmp_path, version, major):
+    assert jvm_setup.get_java_major_version(_fake_jdk(tmp_path, version)) == major
+
+
+def test_cds_options_dump_then_reuse(tmp_path, monkeypatch):
+    monkeypatch.setattr(jvm_setup, "LIBS_DIR", tmp_path / "libs")
+    monkeypatch.setattr(jvm_setup.settings.jvm, "use_cds_archive", True)
+    java_home = _fake_jdk(tmp_path, "17.0.2")
+    jar = tmp_path / "tweety-full.jar"
+    jar.write_bytes(b"jar")
+
+    options = jvm_setup.get_cds_options([str(jar)], java_home)
+    archive = jvm_setup.get_cds_archive_path([str(jar)], java_home)
+    dump = archive.with_name(f"{archive.stem}.{os.getpid()}.jsa.tmp")
+    assert options == [f"-XX:ArchiveClassesAtExit={dump}"]
+
+    # La JVM écrit l'archive du processus à son arrêt, puis elle est renommée en place
+    dump.write_bytes(b"archive")
+    jvm_setup.promote_cds_archive()
+    assert archive.read_bytes() == b"archive" and not dump.exists()
+    assert jvm_setup.get_cds_options([str(jar)], java_home) == [f"-XX:SharedArchiveFile={archive}", "-Xshare:auto"]
+
+    # Un JAR modifié invalide l'archive (nouveau nom)
+    jar.write_bytes(b"new jar content")
+    assert jvm_setup.get_cds_archive_path([str(jar)], java_home) != archive
+
+
+def test_cds_dump_is_discarded_when_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr(jvm_setup, "LIBS_DIR", tmp_path / "libs")
+    monkeypatch.setattr(jvm_setup.settings.jvm, "use_cds_archive", True)
+    java_home = _fake_jdk(tmp_path, "21")
+    archive = jvm_setup.get_cds_archive_path([], java_home)
+    stale = archive.with_name(f"{archive.stem}.1.jsa.tmp")
+    archive.parent.mkdir(parents=True)
+    stale.write_bytes(b"")
+    os.utime(stale, (0, 0))
+
+    jvm_setup.get_cds_options([], java_home)
+    assert not stale.exists()
+    jvm_setup.promote_cds_archive()
+    assert not archive.exists()
+
+
+def test_cds_options_disabled_or_unsupported(tmp_path, monkeypatch):
+    monkeypatch.setattr(jvm_setup, "LIBS_DIR", tmp_path / "libs")
+    assert jvm_setup.get_cds_options([], _fake_jdk(tmp_path, "21")) == []
+    monkeypatch.setattr(jvm_setup.settings.jvm, "use_cds_archive", True)
+    assert jvm_setup.get_cds_options([], _fake_jdk(tmp_path, "11.0.2")) == []
+
+
+def test_logic_classes_are_loaded_on_first_use(monkeypatch):
+    fake_jpype = MagicMock()
+    monkeypatch.setattr("argumentation_analysis.agents.core.logic.tweety_initializer.jpype", fake_jpype)
+    monkeypatch.setattr("argumentation_analysis.agents.core.logic.tweety_initializer.is_jvm_started", lambda: True)
+    monkeypatch.setattr(TweetyInitializer, "_loaded_logics", set())
+    monkeypatch.setattr(TweetyInitializer, "_modal_parser", None)
+
+    parser = TweetyInitializer.get_modal_parser()
+
+    loaded = [call.args[0] for call in fake_jpype.JClass.call_args_list]
+    assert "org.tweetyproject.logics.ml.reasoner.SimpleMlReasoner" in loaded
+    assert not any(".fol." in name or ".pl." in name for name in loaded)
+    assert TweetyInitializer.get_modal_parser() is parser
+    assert TweetyInitializer._loaded_logics == {"modal"}
+    assert "import_classes:modal" in jvm_setup.get_startup_timings()
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests unitaires pour le module aho_corasick.py.
+"""
+
+from argumentation_analysis.nlp.aho_corasick import AhoCorasick
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick()
+    for pattern in ["he", "she", "his", "hers", "absent"]:
+        automaton.add(pattern)
+    automaton.build()
+    assert automaton.find_all("ushers") == {"she", "he", "hers"}
+    assert automaton.find_all("") == set()
+
+
+def test_aho_corasick_builds_lazily_after_new_patterns():
+    automaton = AhoCorasick()
+    automaton.add("parce que")
+    assert automaton.find_all("c'est vrai parce que je le dis") == {"parce que"}
+    automaton.add("vrai")
+    assert automaton.find_all("c'est vrai parce que je le dis") == {"parce que", "vrai"}
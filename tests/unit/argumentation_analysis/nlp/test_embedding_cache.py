@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests unitaires pour le module embedding_cache.py.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from argumentation_analysis.nlp.embedding_cache import EmbeddingCache, chunk_hash, INDEX_FILENAME, JOURNAL_FILENAME
+
+
+def _fake_encoder():
+    """Encodeur factice : vecteur dérivé de la longueur du texte."""
+    return MagicMock(side_effect=lambda chunks, model, **kwargs: [[float(len(c)), 1.0, 2.0] for c in chunks])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EmbeddingCache(tmp_path / "cache")
+
+
+def test_only_missing_chunks_are_encoded(cache):
+    encoder = _fake_encoder()
+    first = cache.get_embeddings(["a", "bb"], "model-x", encoder)
+    second = cache.get_embeddings(["a", "bb", "ccc"], "model-x", encoder)
+
+    assert encoder.call_count == 2
+    assert encoder.call_args_list[1].args[0] == ["ccc"]
+    assert first.dtype == np.float32
+    assert second[:, 0].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_cache_persists_across_instances(tmp_path):
+    encoder = _fake_encoder()
+    EmbeddingCache(tmp_path).get_embeddings(["texte", "autre"], "model-x", encoder)
+
+    reopened = EmbeddingCache(tmp_path)
+    vectors = reopened.get_embeddings(["texte", "autre"], "model-x", encoder)
+
+    assert encoder.call_count == 1
+    assert ("model-x", "texte") in reopened
+    # Lignes contiguës : vue memmap, sans copie
+    assert isinstance(vectors.base, np.memmap) or isinstance(vectors, np.memmap)
+
+
+def test_models_are_isolated(cache):
+    encoder = _fake_encoder()
+    cache.get_embeddings(["a"], "model/one", encoder)
+    cache.get_embeddings(["a"], "model/two", encoder)
+    cache.get_embeddings(["a"], "model_two", encoder)
+    assert encoder.call_count == 3
+
+
+def test_non_contiguous_rows_and_duplicates(cache):
+    encoder = _fake_encoder()
+    cache.get_embeddings(["a", "bb", "ccc"], "m", encoder)
+    vectors = cache.get_embeddings(["ccc", "a", "ccc"], "m", encoder)
+    assert encoder.call_count == 1
+    assert vectors[:, 0].tolist() == [3.0, 1.0, 3.0]
+
+
+def test_interrupted_append_is_overwritten(tmp_path):
+    encoder = _fake_encoder()
+    first = EmbeddingCache(tmp_path)
+    first.get_embeddings(["a"], "m", encoder)
+    # Simule des octets écrits sans mise à jour de l'index
+    with open(first._store("m").vectors_path, "ab") as f:
+        f.write(b"\x00" * 12)
+
+    vectors = EmbeddingCache(tmp_path).get_embeddings(["a", "bb"], "m", encoder)
+    assert vectors[:, 0].tolist() == [1.0, 2.0]
+    assert EmbeddingCache(tmp_path)._store("m").rows == {chunk_hash("a"): 0, chunk_hash("bb"): 1}
+
+
+def test_appends_go_to_the_journal(tmp_path):
+    encoder = _fake_encoder()
+    cache = EmbeddingCache(tmp_path)
+    held = cache.get_embeddings(["a"], "m", encoder)
+    directory = cache._store("m").directory
+    index_before = (directory / INDEX_FILENAME).read_bytes()
+
+    cache.get_embeddings(["bb", "ccc"], "m", encoder)
+    assert (directory / INDEX_FILENAME).read_bytes() == index_before
+    assert (directory / JOURNAL_FILENAME).read_text(encoding="utf-8").splitlines() == [
+        f"1 {chunk_hash('bb')}", f"2 {chunk_hash('ccc')}"
+    ]
+    assert held[:, 0].tolist() == [1.0]
+
+    # Une ligne de journal incomplète (interruption) est écartée à la relecture
+    with open(directory / JOURNAL_FILENAME, "a", encoding="utf-8") as f:
+        f.write("3 abc")
+    reopened = EmbeddingCache(tmp_path)
+    assert reopened._store("m").count == 3
+    assert not (directory / JOURNAL_FILENAME).exists()
+    with open(directory / INDEX_FILENAME, encoding="utf-8") as f:
+        assert len(json.load(f)["rows"]) == 3
+    assert reopened.get_embeddings(["ccc", "dddd"], "m", encoder)[:, 0].tolist() == [3.0, 4.0]
+
+
+def test_dimension_mismatch_raises(cache):
+    cache.get_embeddings(["a"], "m", _fake_encoder())
+    with pytest.raises(ValueError):
+        cache.get_embeddings(["b"], "m", MagicMock(return_value=[[1.0, 2.0]]))
@@ -27,7 +27,7 @@ MKDIR_PATH = "pathlib.Path.mkdir" # Patching de la méthode mkdir de l'instance
 OPEN_BUILTIN_PATH = "builtins.open" # Pour mocker l'ouverture de fichier
 
 # Importation des fonctions à tester
-from argumentation_analysis.nlp.embedding_utils import get_embeddings_for_chunks, save_embeddings_data
+from argumentation_analysis.nlp.embedding_utils import get_embeddings_for_chunks, save_embeddings_data, clear_embedding_pool
 
 # Fixtures pour les données de test
 @pytest.fixture
@@ -84,6 +84,76 @@ def test_get_embeddings_sentence_transformer_model(sample_text_chunks, mock_sent
         mock_sentence_transformer_model.encode.assert_called_once_with(sample_text_chunks)
         assert embeddings == [[0.7, 0.8, 0.9], [1.0, 1.1, 1.2]]
 
+def test_sentence_transformer_model_is_pooled(sample_text_chunks, mock_sentence_transformer_model):
+    """Le modèle n'est chargé qu'une fois pour des appels successifs."""
+    with patch(SENTENCE_TRANSFORMER_PATH, return_value=mock_sentence_transformer_model) as mock_st_constructor:
+        get_embeddings_for_chunks(sample_text_chunks, "pooled-model")
+        get_embeddings_for_chunks(sample_text_chunks, "pooled-model")
+        mock_st_constructor.assert_called_once_with("pooled-model")
+
+        clear_embedding_pool()
+        get_embeddings_for_chunks(sample_text_chunks, "pooled-model")
+        assert mock_st_constructor.call_count == 2
+
+def test_slow_model_load_does_not_block_other_models():
+    """Le chargement d'un modèle ne bloque ni les autres chargements ni les autres clés."""
+    import threading
+    from argumentation_analysis.nlp.embedding_utils import get_sentence_transformer
+    loading_started, release_loading = threading.Event(), threading.Event()
+
+    def factory(name):
+        if name == "slow-model":
+            loading_started.set()
+            assert release_loading.wait(5)
+        return MagicMock(name=name)
+
+    with patch(SENTENCE_TRANSFORMER_PATH, side_effect=factory) as mock_st_constructor:
+        slow_results = []
+        threads = [threading.Thread(target=lambda: slow_results.append(get_sentence_transformer("slow-model")))
+                   for _ in range(2)]
+        threads[0].start()
+        assert loading_started.wait(5)
+        threads[1].start()
+        # Le modèle lent est en cours de chargement : un autre modèle reste disponible
+        fast_model = get_sentence_transformer("fast-model")
+        assert get_sentence_transformer("fast-model") is fast_model
+        release_loading.set()
+        for thread in threads:
+            thread.join(5)
+
+    assert len(slow_results) == 2 and slow_results[0] is slow_results[1]
+    assert [c.args for c in mock_st_constructor.call_args_list].count(("slow-model",)) == 1
+    clear_embedding_pool()
+
+@pytest.mark.use_real_numpy
+def test_get_embeddings_batches_and_numpy():
+    """Les lots sont encodés séparément et assemblés dans l'ordre en float32."""
+    import numpy as np
+    model_mock = MagicMock()
+    model_mock.encode.side_effect = lambda batch: np.array([[float(len(text))] * 2 for text in batch])
+    chunks = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    with patch(SENTENCE_TRANSFORMER_PATH, return_value=model_mock):
+        embeddings = get_embeddings_for_chunks(chunks, "batched-model", batch_size=2, max_in_flight=2, as_numpy=True)
+
+    assert model_mock.encode.call_count == 3
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (5, 2)
+    assert embeddings[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+def test_get_embeddings_openai_batches(mock_openai_response):
+    """Chaque lot donne lieu à un appel API, avec un client partagé."""
+    mock_client_instance = MagicMock()
+    mock_client_instance.embeddings.create.return_value = mock_openai_response
+    chunks = ["un", "deux", "trois", "quatre"]
+
+    with patch(OPENAI_CLIENT_PATH, return_value=mock_client_instance) as mock_openai_constructor:
+        embeddings = get_embeddings_for_chunks(chunks, "text-embedding-3-small", batch_size=2)
+
+    mock_openai_constructor.assert_called_once()
+    assert mock_client_instance.embeddings.create.call_count == 2
+    assert len(embeddings) == 4
+
 def test_get_embeddings_openai_import_error(sample_text_chunks):
     """Teste ImportError si OpenAI n'est pas installé et qu'un modèle OpenAI est demandé."""
     with patch(OPENAI_CLIENT_PATH, None): # Simule l'échec de l'import d'OpenAI
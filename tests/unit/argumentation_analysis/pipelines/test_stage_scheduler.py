@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Tests pour l'ordonnanceur d'étapes du pipeline unifié."""
+
+import asyncio
+import time
+
+import pytest
+
+from argumentation_analysis.pipelines.stage_scheduler import StageScheduler
+
+
+def sleeper(value, delay, log=None):
+    async def run():
+        if log is not None:
+            log.append(("start", value))
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(("end", value))
+        return value
+    return run
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently():
+    scheduler = StageScheduler()
+    for name in ("informal", "formal", "unified"):
+        scheduler.add(name, sleeper(name, 0.2))
+
+    start = time.perf_counter()
+    results = await scheduler.run()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.4
+    assert list(results) == ["informal", "formal", "unified"]
+    assert all(result.succeeded and result.value == name for name, result in results.items())
+    assert all(result.wall_time >= 0.19 for result in results.values())
+
+
+@pytest.mark.asyncio
+async def test_dependencies_and_concurrency_limit_are_respected():
+    log = []
+    scheduler = StageScheduler(max_concurrency=1)
+    scheduler.add("informal", sleeper("informal", 0.05, log))
+    scheduler.add("orchestration", sleeper("orchestration", 0.01, log), depends_on=("informal",))
+    results = await scheduler.run()
+
+    assert log == [("start", "informal"), ("end", "informal"),
+                   ("start", "orchestration"), ("end", "orchestration")]
+    assert results["orchestration"].started_at >= results["informal"].wall_time
+    with pytest.raises(ValueError):
+        scheduler.add("formal", sleeper("formal", 0), depends_on=("inconnue",))
+    with pytest.raises(ValueError):
+        StageScheduler(max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_timeouts_and_errors_are_recorded_per_stage():
+    async def failing():
+        raise ValueError("JVM indisponible")
+
+    scheduler = StageScheduler()
+    scheduler.add("informal", sleeper("informal", 5), timeout=0.05)
+    scheduler.add("formal", failing)
+    scheduler.add("unified", sleeper("unified", 0.01))
+    scheduler.add("orchestration", sleeper("orchestration", 0.01), depends_on=("informal",))
+    results = await scheduler.run()
+
+    assert results["informal"].status == "timeout"
+    assert results["informal"].wall_time < 1
+    assert (results["formal"].status, results["formal"].error) == ("error", "JVM indisponible")
+    assert results["unified"].succeeded
+    # Une dépendance exprime un ordre : l'étape suivante s'exécute malgré le délai dépassé
+    assert results["orchestration"].succeeded
+
+
+@pytest.mark.asyncio
+async def test_cancelling_run_cancels_running_stages():
+    cancelled = []
+
+    async def long_stage():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    scheduler = StageScheduler()
+    scheduler.add("formal", long_stage)
+    task = asyncio.ensure_future(scheduler.run())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancelled == [True]
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Tests pour l'exécution parallèle des étapes et le mode corpus du pipeline unifié d'analyse textuelle."""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from argumentation_analysis.pipelines.unified_text_analysis import (
+    UnifiedAnalysisConfig, UnifiedTextAnalysisPipeline
+)
+
+MODULE_PATH = "argumentation_analysis.pipelines.unified_text_analysis.UnifiedTextAnalysisPipeline"
+
+
+def slow_stage(status, delay):
+    async def perform(self, text):
+        await asyncio.sleep(delay)
+        return {"status": status, "text_length": len(text)}
+    return perform
+
+
+@pytest.mark.asyncio
+async def test_stages_run_concurrently_with_timings_in_metadata():
+    config = UnifiedAnalysisConfig(analysis_modes=["informal", "formal", "unified"])
+    pipeline = UnifiedTextAnalysisPipeline(config)
+
+    with patch(f"{MODULE_PATH}._perform_informal_analysis", slow_stage("informal", 0.2)), \
+         patch(f"{MODULE_PATH}._perform_formal_analysis", slow_stage("formal", 0.2)), \
+         patch(f"{MODULE_PATH}._perform_unified_analysis", slow_stage("unified", 0.2)):
+        start = time.perf_counter()
+        results = await pipeline.analyze_text_unified("Un texte.")
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.4
+    assert results["informal_analysis"]["status"] == "informal"
+    assert results["formal_analysis"]["status"] == "formal"
+    assert results["unified_analysis"]["status"] == "unified"
+    assert results["orchestration_analysis"] == {}
+    assert set(results["metadata"]["stage_timings"]) == {"informal", "formal", "unified"}
+    assert all(timing >= 0.19 for timing in results["metadata"]["stage_timings"].values())
+    assert set(results["metadata"]["stage_status"].values()) == {"success"}
+
+
+@pytest.mark.asyncio
+async def test_stage_timeout_does_not_block_other_stages():
+    config = UnifiedAnalysisConfig(analysis_modes=["informal", "formal"],
+                                   stage_timeout=10, stage_timeouts={"formal": 0.05})
+    pipeline = UnifiedTextAnalysisPipeline(config)
+
+    with patch(f"{MODULE_PATH}._perform_informal_analysis", slow_stage("informal", 0.01)), \
+         patch(f"{MODULE_PATH}._perform_formal_analysis", slow_stage("formal", 5)):
+        results = await pipeline.analyze_text_unified("Un texte.")
+
+    assert results["informal_analysis"]["status"] == "informal"
+    assert results["formal_analysis"]["status"] == "Timeout"
+    assert results["metadata"]["stage_status"] == {"informal": "success", "formal": "timeout"}
+    assert results["execution_time"] < 1
+    assert "error" not in results
+
+
+@pytest.mark.asyncio
+async def test_corpus_is_streamed_to_jsonl_with_bounded_concurrency(tmp_path):
+    config = UnifiedAnalysisConfig(analysis_modes=["informal"])
+    pipeline = UnifiedTextAnalysisPipeline(config)
+    state = {"running": 0, "peak": 0, "read": 0, "ahead": 0}
+
+    async def perform(self, text):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        if text == "texte 3":
+            raise RuntimeError("analyse impossible")
+        return {"status": "success", "text": text}
+
+    def documents():
+        for i in range(20):
+            state["read"] += 1
+            state["ahead"] = max(state["ahead"], state["read"] - len(lines_written()))
+            yield (f"doc-{i}", f"texte {i}") if i % 2 else f"texte {i}"
+
+    output_path = tmp_path / "corpus" / "results.jsonl"
+
+    def lines_written():
+        return output_path.read_text(encoding="utf-8").splitlines() if output_path.exists() else []
+
+    with patch(f"{MODULE_PATH}._perform_informal_analysis", perform):
+        summary = await pipeline.analyze_corpus(documents(), output_path, max_concurrency=2)
+
+    records = [json.loads(line) for line in lines_written()]
+    assert summary["documents"] == 20 and state["peak"] == 2
+    # Contre-pression : file de 2 * 2 documents, 2 en cours d'analyse, 1 en attente d'insertion
+    assert state["ahead"] <= 2 * 2 + 2 + 1
+    assert {record["document_id"] for record in records} == {
+        f"doc-{i}" if i % 2 else f"document_{i}" for i in range(20)
+    }
+    # Un document dont toutes les étapes ont échoué est compté en échec
+    assert {r["document_id"] for r in records if r["status"] != "success"} == {"doc-3"}
+    failed = next(r for r in records if r["document_id"] == "doc-3")
+    assert failed["status"] == "failed" and failed["result"]["metadata"]["stage_status"] == {"informal": "error"}
+    assert (summary["succeeded"], summary["partial"], summary["failed"]) == (19, 0, 1)
+    with pytest.raises(ValueError):
+        await pipeline.analyze_corpus([], output_path, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_corpus_reports_partially_analysed_documents(tmp_path):
+    config = UnifiedAnalysisConfig(analysis_modes=["informal", "formal"], stage_timeouts={"formal": 0.05})
+    pipeline = UnifiedTextAnalysisPipeline(config)
+
+    async def formal(self, text):
+        await asyncio.sleep(5 if text == "lent" else 0)
+        return {"status": "success"}
+
+    async def informal(self, text):
+        if text != "correct":
+            raise RuntimeError("analyse impossible")
+        return {"status": "success"}
+
+    output_path = tmp_path / "results.jsonl"
+    with patch(f"{MODULE_PATH}._perform_informal_analysis", informal), \
+         patch(f"{MODULE_PATH}._perform_formal_analysis", formal):
+        summary = await pipeline.analyze_corpus(
+            [("ok", "correct"), ("partiel", "erreur"), ("echec", "lent")], output_path)
+
+    statuses = {record["document_id"]: record["status"]
+                for record in map(json.loads, output_path.read_text(encoding="utf-8").splitlines())}
+    assert statuses == {"ok": "success", "partiel": "partial", "echec": "failed"}
+    assert (summary["succeeded"], summary["partial"], summary["failed"]) == (1, 1, 1)
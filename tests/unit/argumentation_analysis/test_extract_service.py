@@ -178,6 +178,35 @@ class TestExtractService:
         assert position >= 0
         assert len(context) > 0
 
+    def test_find_similar_text_long_marker_with_typos(self, extract_service):
+        """Test de recherche approchée d'un marqueur long mal recopié."""
+        text = "Introduction. " * 500 + "Le gouvernement du peuple, par le peuple, pour le peuple. " + "Fin. " * 500
+        marker = "le gouvernement du peupl, par le peuple pour le peuple"
+        
+        results = extract_service.find_similar_text(text, marker)
+        
+        context, position, found_text = results[0]
+        assert found_text.startswith("Le gouvernement du peuple")
+        assert text[position:position + len(found_text)] == found_text
+        assert found_text in context
+
+    def test_search_index_is_reused(self, extract_service, sample_text):
+        """Test de réutilisation de l'index de recherche d'un même texte."""
+        index = extract_service.get_search_index(sample_text)
+        extract_service.search_in_text(sample_text, "exemple")
+        extract_service.find_similar_text(sample_text, "marqueur")
+        assert extract_service.get_search_index(sample_text) is index
+
+    def test_search_index_cache_is_bounded_by_size(self, extract_service):
+        """Test d'éviction des index lorsque leur taille cumulée dépasse la limite."""
+        texts = ["Texte numéro %d. " % i * 500 for i in range(3)]
+        first_index = extract_service.get_search_index(texts[0])
+        with patch("argumentation_analysis.services.extract_service.SEARCH_INDEX_CACHE_MAX_BYTES",
+                   2 * first_index.nbytes + 1):
+            for text in texts[1:]:
+                extract_service.get_search_index(text)
+        assert list(extract_service._search_indexes) == texts[1:]
+
     def test_highlight_text(self, extract_service, sample_text):
         """Test de mise en évidence des marqueurs dans le texte."""
         start_marker = "DEBUT_EXTRAIT"
@@ -282,6 +311,16 @@ class TestExtractService:
         assert "context" in results[0]
         assert "position" in results[0]
 
+    def test_search_text_dichotomically_blocks(self, extract_service):
+        """Test du rattachement des occurrences aux blocs chevauchants."""
+        text = "x" * 40 + "Terme" + "x" * 100 + "terme"
+        
+        results = extract_service.search_text_dichotomically(text, "terme", block_size=60, overlap=20)
+        
+        # Blocs [0, 60), [40, 100), [80, 140), [120, 150) : seules les occurrences entières comptent
+        assert [(r["position"], r["block_start"]) for r in results] == [(40, 0), (40, 40), (145, 120)]
+        assert {r["match"] for r in results} == {"Terme", "terme"}
+
     def test_search_text_dichotomically_empty(self, extract_service):
         """Test de recherche dichotomique avec des entrées vides."""
         # Cas 1: Texte vide
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Tests des lots d'opérations JTMS (JTMSService.apply_batch et POST /jtms/batch)."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from argumentation_analysis.api import jtms_endpoints
+from argumentation_analysis.services.jtms_service import JTMSService
+from argumentation_analysis.services.jtms_session_manager import JTMSSessionManager
+
+OPERATIONS = [
+    {"type": "add_belief", "belief_name": "A"},
+    {"type": "add_belief", "belief_name": "B"},
+    {"type": "add_justification", "in_beliefs": ["A"], "out_beliefs": [], "conclusion": "B"},
+    {"type": "set_validity", "belief_name": "A", "validity": True},
+]
+
+
+@pytest.fixture
+def jtms_service():
+    return JTMSService()
+
+
+@pytest.fixture
+def client(jtms_service, tmp_path):
+    session_manager = JTMSSessionManager(jtms_service, storage_path=str(tmp_path))
+    app = FastAPI()
+    app.include_router(jtms_endpoints.jtms_router)
+    app.dependency_overrides[jtms_endpoints.get_jtms_service] = lambda: jtms_service
+    app.dependency_overrides[jtms_endpoints.get_session_manager] = lambda: session_manager
+    return TestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_apply_batch_propagates_once_at_the_end(jtms_service):
+    instance_id = await jtms_service.create_jtms_instance("session")
+
+    result = await jtms_service.apply_batch(instance_id, OPERATIONS)
+
+    jtms = jtms_service.instances[instance_id]
+    assert result["operations_applied"] == 4 and result["total_beliefs"] == 2
+    assert jtms.beliefs["B"].valid is True
+    assert {belief["name"] for belief in result["changed_beliefs"]} == {"A", "B"}
+    metadata = jtms_service.metadata[instance_id]
+    assert metadata["beliefs_count"] == 2 and metadata["justifications_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_apply_batch_failing_partway_keeps_applied_operations(jtms_service):
+    instance_id = await jtms_service.create_jtms_instance("session")
+    last_updated = jtms_service.metadata[instance_id]["last_updated"]
+
+    with pytest.raises(ValueError, match="Croyance non trouvée"):
+        await jtms_service.apply_batch(instance_id, OPERATIONS + [
+            {"type": "set_validity", "belief_name": "Z", "validity": True},
+            {"type": "add_belief", "belief_name": "C"},
+        ])
+
+    # Les opérations précédant l'erreur sont propagées et les métadonnées à jour
+    jtms = jtms_service.instances[instance_id]
+    assert set(jtms.beliefs) == {"A", "B"} and jtms.beliefs["B"].valid is True
+    metadata = jtms_service.metadata[instance_id]
+    assert metadata["beliefs_count"] == 2 and metadata["justifications_count"] == 1
+    assert metadata["last_updated"] >= last_updated
+
+
+def test_batch_endpoint(client, jtms_service):
+    response = client.post("/jtms/batch", json={"operations": OPERATIONS})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["operations_applied"] == 4 and body["total_beliefs"] == 2
+    assert {belief["name"]: belief["valid"] for belief in body["changed_beliefs"]} == {"A": True, "B": True}
+    assert jtms_service.metadata[body["instance_id"]]["beliefs_count"] == 2
+
+
+def test_batch_endpoint_failing_partway(client, jtms_service):
+    created = client.post("/jtms/batch", json={"operations": OPERATIONS[:1]}).json()
+
+    response = client.post("/jtms/batch", json={
+        "session_id": created["session_id"],
+        "instance_id": created["instance_id"],
+        "operations": OPERATIONS[1:] + [{"type": "unknown"}],
+    })
+
+    assert response.status_code == 400
+    metadata = jtms_service.metadata[created["instance_id"]]
+    assert metadata["beliefs_count"] == 2 and metadata["justifications_count"] == 1
+    assert jtms_service.instances[created["instance_id"]].beliefs["B"].valid is True
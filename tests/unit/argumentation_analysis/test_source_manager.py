@@ -258,6 +258,26 @@ class TestSourceManager:
         assert text == "Texte d'analyse depuis source simple"
         assert "Source simple: Source de test" in description
     
+    def test_iter_texts_for_analysis_yields_every_extract(self, source_manager_simple):
+        """Test le parcours de tous les extraits non vides (mode corpus)."""
+        definitions = ExtractDefinitions.from_dict_list([
+            {"source_name": "Discours", "source_type": "direct_download", "schema": "https",
+             "host_parts": ["example", "org"], "path": "/d",
+             "extracts": [
+                 {"extract_name": "Début", "start_marker": "", "end_marker": "", "full_text": " Premier texte. "},
+                 {"extract_name": "Vide", "start_marker": "", "end_marker": "", "full_text": ""},
+                 {"extract_name": "Fin", "start_marker": "", "end_marker": "", "full_text": "Second texte."},
+             ]},
+        ])
+
+        texts = list(source_manager_simple.iter_texts_for_analysis(definitions))
+
+        assert texts == [
+            ("Source simple: Discours / Début", "Premier texte."),
+            ("Source simple: Discours / Fin", "Second texte."),
+        ]
+        assert list(source_manager_simple.iter_texts_for_analysis(None)) == []
+    
     def test_select_text_for_analysis_complex_sources(self, mocker, source_manager_complex):
         """Test la sélection de texte depuis sources complexes."""
         long_text = "x" * 250
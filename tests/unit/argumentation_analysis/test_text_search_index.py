@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Tests pour l'index de recherche textuelle utilisé par ExtractService."""
+
+import random
+import re
+
+import pytest
+
+from argumentation_analysis.services.text_search_index import (
+    TextSearchIndex,
+    _REGEX_INCOMPATIBLE_CHARACTERS,
+    _compute_regex_incompatible_characters,
+    _myers_distances,
+)
+
+
+def edit_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def test_exact_search_matches_regex():
+    rng = random.Random(0)
+    for _ in range(100):
+        text = "".join(rng.choice("aAbBé ") for _ in range(rng.randint(0, 300)))
+        term = "".join(rng.choice("abé") for _ in range(rng.randint(1, 5)))
+        index = TextSearchIndex(text)
+        expected = [m.start() for m in re.finditer(re.escape(term), text, re.IGNORECASE)]
+        assert index.find_non_overlapping(term) == expected
+        assert index.find_all(term) == [i for i in range(len(text)) if text.lower().startswith(term, i)]
+
+
+@pytest.mark.parametrize("text, term", [
+    ("ſ s S", "s"),
+    ("ΑΣ σ", "σ"),
+    ("İstanbul", "i"),
+    ("ı i I", "I"),
+    ("K k", "k"),
+    ("µ μ Μ", "μ"),
+])
+def test_exact_search_matches_regex_special_case_mappings(text, term):
+    index = TextSearchIndex(text * 3)
+    expected = [m.start() for m in re.finditer("(?=" + re.escape(term) + ")", text * 3, re.IGNORECASE)]
+    assert index.find_all(term) == expected
+
+
+def test_regex_incompatible_characters_are_up_to_date():
+    assert _REGEX_INCOMPATIBLE_CHARACTERS == _compute_regex_incompatible_characters()
+
+
+def test_exact_search_matches_regex_on_mixed_alphabets():
+    rng = random.Random(2)
+    for _ in range(100):
+        text = "".join(rng.choice("sSſiIİıσςΣkKΑα ") for _ in range(rng.randint(0, 200)))
+        term = "".join(rng.choice("sſiIıσςk") for _ in range(rng.randint(1, 4)))
+        index = TextSearchIndex(text)
+        expected = [m.start() for m in re.finditer(re.escape(term), text, re.IGNORECASE)]
+        assert index.find_non_overlapping(term) == expected
+
+
+def test_index_uses_compact_arrays():
+    text = "Le chat dort sur le tapis. " * 10000
+    index = TextSearchIndex(text)
+    # Alphabet réduit : clés et positions sur 32 bits (4 + 4 octets par caractère)
+    assert index.nbytes < 8 * len(text) + len(index.folded) + 1024
+    assert index.find_all("TAPIS")[:2] == [20, 47]
+    assert index.find_all("tapiz") == []
+
+
+def test_myers_distances_match_dynamic_programming():
+    rng = random.Random(1)
+    for _ in range(50):
+        pattern = "".join(rng.choice("abc") for _ in range(rng.randint(1, 70)))
+        text = "".join(rng.choice("abc") for _ in range(rng.randint(1, 30)))
+        assert _myers_distances(pattern, text, anchored=True) == [
+            edit_distance(pattern, text[:j + 1]) for j in range(len(text))
+        ]
+        assert _myers_distances(pattern, text) == [
+            min(edit_distance(pattern, text[s:j + 1]) for s in range(j + 2)) for j in range(len(text))
+        ]
+
+
+def test_approximate_search_finds_marker_with_typos():
+    text = "Préambule. " * 2000 + "Mesdames et Messieurs, la République vous appelle. " + "Suite. " * 2000
+    marker = "mesdames et mesieurs, la Republique vous apelle"
+    index = TextSearchIndex(text)
+
+    results = index.find_approximate(marker, max_distance=8)
+
+    start, end, distance = results[0]
+    assert text[start:end].startswith("Mesdames et Messieurs")
+    assert distance == edit_distance(marker.lower(), text[start:end].lower()) <= 4
+    assert index.find_approximate("Introuvable dans ce texte", max_distance=3) == []
+
+
+@pytest.mark.parametrize("text", ["", "ab"])
+def test_short_texts(text):
+    index = TextSearchIndex(text)
+    assert index.find_all("abc") == []
+    assert index.find_approximate("abc", 1) == ([] if not text else [(0, 2, 1)])
@@ -4,11 +4,14 @@
 import pytest
 import os
 from unittest.mock import patch
+from argumentation_analysis.core.utils import crypto_utils
 from argumentation_analysis.core.utils.crypto_utils import (
     derive_encryption_key,
     load_encryption_key,
     encrypt_data_with_fernet,
-    decrypt_data_with_fernet
+    decrypt_data_with_fernet,
+    derive_key_aes,
+    clear_derived_key_cache
 )
 
 # FIXED_SALT est défini dans crypto_utils, pas besoin de le redéfinir ici.
@@ -33,6 +36,24 @@ def test_derive_encryption_key_type():
     key = derive_encryption_key("une_passphrase_valide")
     assert isinstance(key, bytes)
 
+def test_derived_keys_are_cached_per_passphrase_and_salt():
+    """Vérifie que PBKDF2 n'est exécuté qu'une fois par couple (phrase secrète, sel)."""
+    clear_derived_key_cache()
+    with patch.object(crypto_utils, "PBKDF2HMAC", wraps=crypto_utils.PBKDF2HMAC) as kdf:
+        key1 = derive_encryption_key("phrase_pour_le_cache")
+        key2 = derive_encryption_key("phrase_pour_le_cache")
+        assert key1 == key2 and kdf.call_count == 1
+
+        derive_encryption_key("autre_phrase_pour_le_cache")
+        aes_key = derive_key_aes("phrase_pour_le_cache", b"un_autre_sel_16o")
+        assert aes_key == derive_key_aes("phrase_pour_le_cache", b"un_autre_sel_16o")
+        assert kdf.call_count == 3
+
+        clear_derived_key_cache()
+        assert derive_encryption_key("phrase_pour_le_cache") == key1
+        assert kdf.call_count == 4
+    assert all(b"phrase_pour_le_cache" not in cache_id for cache_id in crypto_utils._derived_key_cache)
+
 # Tests pour load_encryption_key
 @patch.dict(os.environ, {}, clear=True) # Assure un environnement propre pour chaque test de variable d'env
 def test_load_encryption_key_from_arg():